@@ -47,12 +47,14 @@ try:
     BytesIO = StringIO
     import cPickle
     import httplib
+    import Queue as queue
 except ImportError:
     import builtins
     from io import StringIO, BytesIO
     cStringIO = StringIO
     import pickle as cPickle
     import http.client as httplib
+    import queue
 
 from pandas.compat.chainmap import DeepChainMap
 
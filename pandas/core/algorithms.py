@@ -117,6 +117,9 @@ def factorize(values, sort=False, order=None, na_sentinel=-1):
     """
     from pandas.tseries.period import PeriodIndex
     vals = np.asarray(values)
+    if com._is_fixed_string_dtype(vals):
+        return _factorize_fixed_strings(vals, sort=sort)
+
     is_datetime = com.is_datetime64_dtype(vals)
     (hash_klass, vec_klass), vals = _get_data_algo(vals, _hashtables)
 
@@ -160,6 +163,24 @@ def factorize(values, sort=False, order=None, na_sentinel=-1):
     return labels, uniques
 
 
+def _factorize_fixed_strings(values, sort=False):
+    """
+    factorize fixed-width strings (which cannot be null) by sorting them,
+    rather than hashing each as a Python object; the uniques are objects
+    """
+    uniques, first, labels = np.unique(values, return_index=True,
+                                       return_inverse=True)
+    if not sort:
+        # in the order of their first appearance
+        sorter = first.argsort()
+        reverse_indexer = np.empty(len(sorter), dtype=np.int_)
+        reverse_indexer.put(sorter, np.arange(len(sorter)))
+        labels = reverse_indexer.take(labels)
+        uniques = uniques.take(sorter)
+
+    return com._ensure_platform_int(labels), uniques.astype(np.object_)
+
+
 def value_counts(values, sort=True, ascending=False, normalize=False,
                  bins=None):
     """
@@ -184,8 +205,13 @@ def value_counts(values, sort=True, ascending=False, normalize=False,
 
     """
     from pandas.core.series import Series
+    from pandas.core.categorical import Categorical
     from pandas.tools.tile import cut
 
+    if isinstance(values, Categorical) and bins is None:
+        return values.value_counts(sort=sort, ascending=ascending,
+                                   normalize=normalize)
+
     values = Series(values).values
 
     if bins is not None:
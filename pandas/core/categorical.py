@@ -142,6 +142,9 @@ class Categorical(PandasObject):
     def __len__(self):
         return len(self.labels)
 
+    def __iter__(self):
+        return iter(np.asarray(self))
+
     def _tidy_repr(self, max_vals=20):
         num = max_vals // 2
         head = self[:num]._get_repr(length=False, name=False, footer=False)
@@ -220,6 +223,40 @@ class Categorical(PandasObject):
         return (self.levels.equals(other.levels) and
                 np.array_equal(self.labels, other.labels))
 
+    def value_counts(self, sort=True, ascending=False, normalize=False):
+        """
+        Returns the counts of each level, counting the labels (rather than
+        hashing the values)
+
+        Parameters
+        ----------
+        sort : boolean, default True
+            Sort by the counts
+        ascending : boolean, default False
+            Sort in ascending order
+        normalize : boolean, default False
+            If True then compute a relative histogram
+
+        Returns
+        -------
+        counts : Series
+        """
+        from pandas.core.series import Series
+        labels = self.labels
+        counts = np.bincount(labels[labels != -1],
+                             minlength=len(self.levels))
+        result = Series(counts, index=self.levels)
+
+        if sort:
+            result.sort()
+            if not ascending:
+                result = result[::-1]
+
+        if normalize:
+            result = result / float(len(labels))
+
+        return result
+
     def describe(self):
         """
         Returns a dataframe with frequency and counts by level.
@@ -234,3 +271,24 @@ class Categorical(PandasObject):
             'freqs': freqs,
             'levels': self.levels
         }).set_index('levels')
+
+
+def _concat_categoricals(to_concat, name=None):
+    """
+    Concatenate Categoricals, with the union of their levels; the labels are
+    recoded rather than the values factorized again
+    """
+    levels = to_concat[0].levels
+    for cat in to_concat[1:]:
+        if not cat.levels.equals(levels):
+            levels = levels.union(cat.levels)
+
+    labels = []
+    for cat in to_concat:
+        if cat.levels.equals(levels):
+            labels.append(cat.labels)
+        else:
+            recode = levels.get_indexer(cat.levels)
+            labels.append(com.take_1d(recode, cat.labels, fill_value=-1))
+
+    return Categorical(np.concatenate(labels), levels, name=name)
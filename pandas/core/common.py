@@ -469,10 +469,12 @@ _take_1d_dict = {
     ('int8', 'int8'): algos.take_1d_int8_int8,
     ('int8', 'int32'): algos.take_1d_int8_int32,
     ('int8', 'int64'): algos.take_1d_int8_int64,
+    ('int8', 'float32'): algos.take_1d_int8_float32,
     ('int8', 'float64'): algos.take_1d_int8_float64,
     ('int16', 'int16'): algos.take_1d_int16_int16,
     ('int16', 'int32'): algos.take_1d_int16_int32,
     ('int16', 'int64'): algos.take_1d_int16_int64,
+    ('int16', 'float32'): algos.take_1d_int16_float32,
     ('int16', 'float64'): algos.take_1d_int16_float64,
     ('int32', 'int32'): algos.take_1d_int32_int32,
     ('int32', 'int64'): algos.take_1d_int32_int64,
@@ -496,10 +498,12 @@ _take_2d_axis0_dict = {
     ('int8', 'int8'): algos.take_2d_axis0_int8_int8,
     ('int8', 'int32'): algos.take_2d_axis0_int8_int32,
     ('int8', 'int64'): algos.take_2d_axis0_int8_int64,
+    ('int8', 'float32'): algos.take_2d_axis0_int8_float32,
     ('int8', 'float64'): algos.take_2d_axis0_int8_float64,
     ('int16', 'int16'): algos.take_2d_axis0_int16_int16,
     ('int16', 'int32'): algos.take_2d_axis0_int16_int32,
     ('int16', 'int64'): algos.take_2d_axis0_int16_int64,
+    ('int16', 'float32'): algos.take_2d_axis0_int16_float32,
     ('int16', 'float64'): algos.take_2d_axis0_int16_float64,
     ('int32', 'int32'): algos.take_2d_axis0_int32_int32,
     ('int32', 'int64'): algos.take_2d_axis0_int32_int64,
@@ -524,10 +528,12 @@ _take_2d_axis1_dict = {
     ('int8', 'int8'): algos.take_2d_axis1_int8_int8,
     ('int8', 'int32'): algos.take_2d_axis1_int8_int32,
     ('int8', 'int64'): algos.take_2d_axis1_int8_int64,
+    ('int8', 'float32'): algos.take_2d_axis1_int8_float32,
     ('int8', 'float64'): algos.take_2d_axis1_int8_float64,
     ('int16', 'int16'): algos.take_2d_axis1_int16_int16,
     ('int16', 'int32'): algos.take_2d_axis1_int16_int32,
     ('int16', 'int64'): algos.take_2d_axis1_int16_int64,
+    ('int16', 'float32'): algos.take_2d_axis1_int16_float32,
     ('int16', 'float64'): algos.take_2d_axis1_int16_float64,
     ('int32', 'int32'): algos.take_2d_axis1_int32_int32,
     ('int32', 'int64'): algos.take_2d_axis1_int32_int64,
@@ -552,10 +558,12 @@ _take_2d_multi_dict = {
     ('int8', 'int8'): algos.take_2d_multi_int8_int8,
     ('int8', 'int32'): algos.take_2d_multi_int8_int32,
     ('int8', 'int64'): algos.take_2d_multi_int8_int64,
+    ('int8', 'float32'): algos.take_2d_multi_int8_float32,
     ('int8', 'float64'): algos.take_2d_multi_int8_float64,
     ('int16', 'int16'): algos.take_2d_multi_int16_int16,
     ('int16', 'int32'): algos.take_2d_multi_int16_int32,
     ('int16', 'int64'): algos.take_2d_multi_int16_int64,
+    ('int16', 'float32'): algos.take_2d_multi_int16_float32,
     ('int16', 'float64'): algos.take_2d_multi_int16_float64,
     ('int32', 'int32'): algos.take_2d_multi_int32_int32,
     ('int32', 'int64'): algos.take_2d_multi_int32_int64,
@@ -636,6 +644,10 @@ def take_nd(arr, indexer, axis=0, out=None, fill_value=np.nan,
         will be done.  This short-circuits computation of a mask.  Result is
         undefined if allow_fill == False and -1 is present in indexer.
     """
+    if isinstance(arr, np.ma.MaskedArray):
+        return _take_nd_masked(arr, indexer, axis=axis, fill_value=fill_value,
+                               mask_info=mask_info, allow_fill=allow_fill)
+
     if indexer is None:
         indexer = np.arange(arr.shape[axis], dtype=np.int64)
         dtype, fill_value = arr.dtype, arr.dtype.type()
@@ -689,6 +701,41 @@ def take_nd(arr, indexer, axis=0, out=None, fill_value=np.nan,
 take_1d = take_nd
 
 
+def _take_nd_masked(arr, indexer, axis=0, fill_value=np.nan, mask_info=None,
+                    allow_fill=True):
+    """
+    take_nd for a masked array (values with a validity mask): the -1 entries
+    of the indexer are masked, so the values keep their dtype; a non-null
+    fill_value fills the (upcast) values instead
+    """
+    if allow_fill and notnull(fill_value):
+        return take_nd(_filled_upcast(arr), indexer, axis=axis,
+                       fill_value=fill_value, mask_info=mask_info)
+
+    data = np.ma.getdata(arr)
+    mask = np.ma.getmaskarray(arr)
+    new_data = take_nd(data, indexer, axis=axis, fill_value=data.dtype.type(),
+                       mask_info=mask_info, allow_fill=allow_fill)
+    new_mask = take_nd(mask, indexer, axis=axis, fill_value=True,
+                       mask_info=mask_info, allow_fill=allow_fill)
+    return np.ma.MaskedArray(new_data, mask=new_mask)
+
+
+def _filled_upcast(arr):
+    """
+    the values of a masked array, upcast (if needed) to hold nulls and with
+    the masked values set to null
+    """
+    data = np.ma.getdata(arr)
+    mask = np.ma.getmaskarray(arr)
+    if not mask.any():
+        return data
+    dtype, fill_value = _maybe_promote(data.dtype)
+    result = data.astype(dtype)
+    np.putmask(result, mask, fill_value)
+    return result
+
+
 def take_2d_multi(arr, indexer, out=None, fill_value=np.nan,
                   mask_info=None, allow_fill=True):
     """
@@ -914,6 +961,17 @@ def _maybe_cast_scalar(dtype, value):
     return value
 
 
+# the mode.preserve_small_dtypes option, set by its callback rather than
+# looked up by every integer promotion
+_preserve_small_dtypes = False
+
+
+def _set_preserve_small_dtypes(key):
+    """ option change callback of 'mode.preserve_small_dtypes' """
+    global _preserve_small_dtypes
+    _preserve_small_dtypes = get_option(key)
+
+
 def _maybe_promote(dtype, fill_value=np.nan):
 
     # if we passed an array here, determine the fill value by dtype
@@ -949,7 +1007,12 @@ def _maybe_promote(dtype, fill_value=np.nan):
         if issubclass(dtype.type, np.bool_):
             dtype = np.object_
         elif issubclass(dtype.type, np.integer):
-            dtype = np.float64
+            # float32 holds the 8 and 16 bit integers exactly
+            if (dtype.itemsize <= 2 and isnull(fill_value) and
+                    _preserve_small_dtypes):
+                dtype = np.float32
+            else:
+                dtype = np.float64
     elif is_bool(fill_value):
         if not issubclass(dtype.type, np.bool_):
             dtype = np.object_
@@ -1167,6 +1230,52 @@ def _possibly_downcast_to_dtype(result, dtype):
     return result
 
 
+def _downcast_to_smallest(values, kind=None):
+    """ the values in the smallest dtype of kind which holds them exactly
+
+    Parameters
+    ----------
+    values : ndarray
+    kind : {'integer', 'float'}, default None
+        'integer' casts integers (and floats which are all integers) to the
+        smallest integer dtype, unsigned for unsigned integers; 'float' casts
+        float64 to float32; None either
+    """
+    if not values.size:
+        return values
+
+    if kind in (None, 'integer'):
+        if is_float_dtype(values):
+            with np.errstate(invalid='ignore'):
+                integral = (np.isfinite(values).all() and
+                            (np.floor(values) == values).all())
+        else:
+            integral = is_integer_dtype(values)
+
+        if integral:
+            if values.dtype.kind == 'u':
+                candidates = [np.uint8, np.uint16, np.uint32, np.uint64]
+            else:
+                candidates = [np.int8, np.int16, np.int32, np.int64]
+            lo, hi = values.min(), values.max()
+            for dtype in candidates:
+                dtype = np.dtype(dtype)
+                if dtype.itemsize >= values.dtype.itemsize:
+                    break
+                info = np.iinfo(dtype)
+                if info.min <= lo and hi <= info.max:
+                    return values.astype(dtype)
+
+    if kind in (None, 'float') and values.dtype == np.float64:
+        small = values.astype(np.float32)
+        with np.errstate(invalid='ignore'):
+            exact = (small == values) | (np.isnan(small) & np.isnan(values))
+        if exact.all():
+            return small
+
+    return values
+
+
 def _lcd_dtypes(a_dtype, b_dtype):
     """ return the lcd dtype to hold these types """
 
@@ -1802,12 +1911,8 @@ def _is_bool_indexer(key):
 
 
 def _default_index(n):
-    from pandas.core.index import Int64Index
-    values = np.arange(n, dtype=np.int64)
-    result = values.view(Int64Index)
-    result.name = None
-    result.is_unique = True
-    return result
+    from pandas.core.index import RangeIndex
+    return RangeIndex(0, n)
 
 
 def ensure_float(arr):
@@ -2172,6 +2277,15 @@ def is_complex_dtype(arr_or_dtype):
     return issubclass(tipo, np.complexfloating)
 
 
+def _is_fixed_string_dtype(arr_or_dtype):
+    """ numpy fixed-width strings (not object); False for a scalar """
+    if isinstance(arr_or_dtype, np.dtype):
+        tipo = arr_or_dtype
+    else:
+        tipo = getattr(arr_or_dtype, 'dtype', None)
+    return isinstance(tipo, np.dtype) and tipo.kind in ('S', 'U')
+
+
 def is_re(obj):
     return isinstance(obj, re._pattern_type)
 
@@ -2190,6 +2304,14 @@ def is_list_like(arg):
             not isinstance(arg, compat.string_and_binary_types))
 
 
+def _is_hashable(arg):
+    try:
+        hash(arg)
+    except TypeError:
+        return False
+    return True
+
+
 def _is_sequence(x):
     try:
         iter(x)
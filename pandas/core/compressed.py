@@ -0,0 +1,194 @@
+"""
+Values held compressed in memory, for rarely used columns: the values are
+compressed in chunks (with zlib, or blosc if installed), which are
+decompressed on access through a small LRU of decompressed chunks
+"""
+
+import zlib
+
+import numpy as np
+
+from pandas.compat import OrderedDict, u
+from pandas.core.base import PandasObject
+import pandas.core.common as com
+
+try:
+    import blosc
+    _BLOSC = True
+except ImportError:  # pragma: no cover
+    _BLOSC = False
+
+
+# the number of values compressed together
+_CHUNKSIZE = 1 << 16
+
+
+class _ChunkCache(object):
+
+    """
+    An LRU of decompressed chunks (as bytes), keyed by the compressor and the
+    compressed bytes of the chunk
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._chunks = OrderedDict()
+
+    def __len__(self):
+        return len(self._chunks)
+
+    def get(self, key):
+        value = self._chunks.pop(key, None)
+        if value is not None:
+            self._chunks[key] = value
+        return value
+
+    def put(self, key, value):
+        self._chunks[key] = value
+        while len(self._chunks) > self.maxsize:
+            self._chunks.popitem(last=False)
+
+    def clear(self):
+        self._chunks.clear()
+
+
+# the decompressed chunks of all of the compressed arrays
+_chunk_cache = _ChunkCache(64)
+
+
+def _compress_bytes(data, compress, typesize):
+    if compress == 'zlib':
+        return zlib.compress(data)
+    return blosc.compress(data, typesize=typesize)
+
+
+def _decompress_bytes(data, compress):
+    if compress == 'zlib':
+        return zlib.decompress(data)
+    return blosc.decompress(data)
+
+
+class CompressedArray(PandasObject):
+
+    """
+    An immutable array of numeric, boolean or datetime values, held as
+    chunks of compressed bytes
+
+    Parameters
+    ----------
+    values : ndarray
+        values of a non-object dtype
+    compress : {'zlib', 'blosc'}, default None
+        the compressor; None is blosc if installed, else zlib
+    chunksize : int, default None
+        the number of values in a chunk
+
+    Notes
+    -----
+    The chunks are decompressed on access, through an LRU of the last
+    decompressed chunks (of all of the arrays)
+    """
+
+    def __init__(self, values, compress=None, chunksize=None):
+        values = np.asarray(values)
+        if values.dtype == np.object_:
+            raise TypeError('cannot compress values of dtype object')
+
+        if compress is None:
+            compress = 'blosc' if _BLOSC else 'zlib'
+        if compress not in ('zlib', 'blosc'):
+            raise ValueError("compress must be 'zlib' or 'blosc', got %r"
+                             % (compress,))
+        if compress == 'blosc' and not _BLOSC:
+            raise ImportError('blosc is required to compress with blosc')
+        if chunksize is None:
+            chunksize = _CHUNKSIZE
+
+        self.dtype = values.dtype
+        self.shape = values.shape
+        self.compress = compress
+        self.chunksize = chunksize
+
+        flat = np.ascontiguousarray(values).ravel()
+        self._chunks = [
+            _compress_bytes(flat[i:i + chunksize].tostring(), compress,
+                            self.dtype.itemsize)
+            for i in range(0, len(flat), chunksize)]
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def nbytes(self):
+        """ the bytes of the compressed values """
+        return sum(len(chunk) for chunk in self._chunks)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __unicode__(self):
+        return u('CompressedArray(%s, dtype=%s, %d bytes compressed with %s)'
+                 % (self.shape, self.dtype, self.nbytes, self.compress))
+
+    def _get_chunk(self, i):
+        """ the (read-only) values of chunk i """
+        chunk = self._chunks[i]
+        key = self.compress, chunk
+        data = _chunk_cache.get(key)
+        if data is None:
+            data = _decompress_bytes(chunk, self.compress)
+            _chunk_cache.put(key, data)
+        return np.frombuffer(data, dtype=self.dtype)
+
+    def flat_slice(self, start, stop):
+        """ the values (flat) from start to stop, decompressing only the
+        chunks holding them """
+        start, stop, _ = slice(start, stop).indices(self.size)
+        if start >= stop:
+            return np.empty(0, dtype=self.dtype)
+
+        chunksize = self.chunksize
+        first, last = start // chunksize, (stop - 1) // chunksize
+        if first == last:
+            offset = first * chunksize
+            return self._get_chunk(first)[start - offset:stop - offset].copy()
+
+        result = np.concatenate([self._get_chunk(i)
+                                 for i in range(first, last + 1)])
+        offset = first * chunksize
+        return result[start - offset:stop - offset]
+
+    def get_values(self):
+        """ the values, as an ndarray """
+        if not self._chunks:
+            return np.empty(self.shape, dtype=self.dtype)
+        if len(self._chunks) == 1:
+            values = self._get_chunk(0).copy()
+        else:
+            values = np.concatenate([self._get_chunk(i)
+                                     for i in range(len(self._chunks))])
+        return values.reshape(self.shape)
+
+    def __getitem__(self, key):
+        return self.get_values()[key]
+
+    def __array__(self, dtype=None):
+        values = self.get_values()
+        if dtype is not None:
+            values = values.astype(dtype)
+        return values
+
+    def equals(self, other):
+        """ if the values of other (a CompressedArray) are the same """
+        if (self.dtype != other.dtype or self.shape != other.shape):
+            return False
+        if (self.compress == other.compress and
+                self.chunksize == other.chunksize and
+                self._chunks == other._chunks):
+            return True
+        return com.array_equivalent(self.get_values(), other.get_values())
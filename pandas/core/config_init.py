@@ -175,6 +175,13 @@ pc_max_info_rows_doc = """
     limit this null check only to frames with smaller dimensions then specified.
 """
 
+pc_memory_usage_doc = """
+: bool or 'deep'
+    df.info() will show the total memory usage of the frame, with
+    memory_usage(deep=True) if 'deep' (counting the Python objects of object
+    columns, and the cached structures of the index)
+"""
+
 pc_large_repr_doc = """
 : 'truncate'/'info'
 
@@ -232,6 +239,9 @@ with cf.config_prefix('display'):
                        validator=is_one_of_factory(['truncate', 'info']))
     cf.register_option('max_info_columns', 100, pc_max_info_cols_doc,
                        validator=is_int)
+    cf.register_option('memory_usage', True, pc_memory_usage_doc,
+                       validator=is_one_of_factory([None, True, False,
+                                                    'deep']))
     cf.register_option('colheader_justify', 'right', colheader_justify_doc,
                        validator=is_text)
     cf.register_option('notebook_repr_html', True, pc_nb_repr_h_doc,
@@ -296,6 +306,137 @@ with cf.config_prefix('mode'):
                        cb=use_inf_as_null_cb)
 
 
+consolidation_doc = """
+: string
+    When to consolidate the blocks of a frame (copy the columns of each dtype
+    into a single 2-D block). 'eager' consolidates after most operations,
+    'lazy' only when an operation needs a single block, or when there are
+    many small blocks to merge; 'never' only when an operation needs a single
+    block. The default is eager
+"""
+
+
+def consolidation_cb(key):
+    from pandas.core.internals import _set_consolidation_mode
+    _set_consolidation_mode(key)
+
+with cf.config_prefix('mode'):
+    cf.register_option('consolidation', 'eager', consolidation_doc,
+                       validator=is_one_of_factory(['eager', 'lazy',
+                                                    'never']),
+                       cb=consolidation_cb)
+
+
+copy_on_write_doc = """
+: boolean
+    Whether copying a frame shares the memory of its blocks with the copy,
+    until either of them is modified (copy-on-write). The arrays of a frame
+    whose memory is shared (e.g. its values) are read-only. The default is
+    False
+"""
+
+
+def copy_on_write_cb(key):
+    from pandas.core.internals import _set_copy_on_write
+    _set_copy_on_write(key)
+
+with cf.config_prefix('mode'):
+    cf.register_option('copy_on_write', False, copy_on_write_doc,
+                       validator=is_bool, cb=copy_on_write_cb)
+
+
+compact_strings_doc = """
+: boolean
+    Whether the string columns of a new frame (with no nulls, all of the
+    same string type) are stored as fixed-width strings (the numpy str
+    dtype) where that takes less memory than objects. Such columns are
+    compared within the frame without boxing, and become objects when they
+    need to hold a null, a non-string or a longer string; they are handed
+    out (e.g. as a column) as objects. The default is False
+"""
+
+
+def compact_strings_cb(key):
+    from pandas.core.internals import _set_compact_strings
+    _set_compact_strings(key)
+
+with cf.config_prefix('mode'):
+    cf.register_option('compact_strings', False, compact_strings_doc,
+                       validator=is_bool, cb=compact_strings_cb)
+
+
+integer_na_doc = """
+: string
+    How the integer and boolean columns of a frame hold the missing values
+    introduced by reindexing. 'upcast' converts them to float (or object for
+    booleans), 'mask' keeps their dtype with a mask of the missing values;
+    the values are upcast when a column is extracted as a Series. The
+    default is 'upcast'
+"""
+
+
+def integer_na_cb(key):
+    from pandas.core.internals import _set_integer_na
+    _set_integer_na(key)
+
+with cf.config_prefix('mode'):
+    cf.register_option('integer_na', 'upcast', integer_na_doc,
+                       validator=is_one_of_factory(['upcast', 'mask']),
+                       cb=integer_na_cb)
+
+
+preserve_small_dtypes_doc = """
+: boolean
+    Whether the 8 and 16 bit integers upcast to float32 (which holds them
+    exactly) rather than float64 to hold a missing value, e.g. when
+    reindexing or by the moving (and expanding) maximum and minimum. The
+    default is False
+"""
+
+
+def preserve_small_dtypes_cb(key):
+    from pandas.core.common import _set_preserve_small_dtypes
+    _set_preserve_small_dtypes(key)
+
+with cf.config_prefix('mode'):
+    cf.register_option('preserve_small_dtypes', False,
+                       preserve_small_dtypes_doc, validator=is_bool,
+                       cb=preserve_small_dtypes_cb)
+
+
+cache_null_mask_doc = """
+: boolean
+    Whether the blocks of a frame (or series) keep the null mask of their
+    values, computed by isnull, count, dropna, fillna and the reductions,
+    until the values are modified through pandas; modifying the values in
+    place through a numpy array (e.g. .values) is not tracked. The default
+    is False
+"""
+
+
+def cache_null_mask_cb(key):
+    from pandas.core.internals import _set_cache_null_mask
+    _set_cache_null_mask(key)
+
+with cf.config_prefix('mode'):
+    cf.register_option('cache_null_mask', False, cache_null_mask_doc,
+                       validator=is_bool, cb=cache_null_mask_cb)
+
+
+share_index_engines_doc = """
+: boolean
+    Whether the equal indexes (e.g. copies, views, or indexes constructed
+    from the same values) share their engine, i.e. the hash table of the
+    values and the unique and monotonic flags, rather than each building
+    its own on the first lookup. Only the indexes of 10000 values or more
+    are shared. The default is True
+"""
+
+with cf.config_prefix('mode'):
+    cf.register_option('share_index_engines', True,
+                       share_index_engines_doc, validator=is_bool)
+
+
 # user warnings
 chained_assignment = """
 : string
@@ -28,6 +28,7 @@ from pandas.core.common import (isnull, notnull, PandasError, _try_sort,
                                 is_list_like)
 from pandas.core.generic import NDFrame, _shared_docs
 from pandas.core.index import Index, MultiIndex, _ensure_index
+from pandas.core.categorical import Categorical
 from pandas.core.indexing import (_maybe_droplevels,
                                   _convert_to_index_sliceable,
                                   _check_bool_indexer, _maybe_convert_indices)
@@ -51,6 +52,7 @@ from pandas.tseries.index import DatetimeIndex
 import pandas.core.algorithms as algos
 import pandas.core.common as com
 import pandas.core.format as fmt
+import pandas.core.internals as internals
 import pandas.core.nanops as nanops
 import pandas.core.ops as ops
 
@@ -160,7 +162,13 @@ class DataFrame(NDFrame):
     dtype : dtype, default None
         Data type to force, otherwise infer
     copy : boolean, default False
-        Copy data from inputs. Only affects DataFrame / 2d ndarray input
+        Copy data from inputs. Only affects DataFrame / 2d ndarray input, and
+        dict input if not consolidate
+    consolidate : boolean, default True
+        Only affects dict input. If False, each of the arrays is kept as a
+        block of its own (a view of the array, unless copy), rather than
+        copied into a block with the other columns of its dtype; the frame is
+        then consolidated lazily (see the mode.consolidation option)
 
     Examples
     --------
@@ -187,7 +195,7 @@ class DataFrame(NDFrame):
     _constructor_sliced = Series
 
     def __init__(self, data=None, index=None, columns=None, dtype=None,
-                 copy=False):
+                 copy=False, consolidate=True):
         if data is None:
             data = {}
         if dtype is not None:
@@ -200,7 +208,10 @@ class DataFrame(NDFrame):
             mgr = self._init_mgr(data, axes=dict(index=index, columns=columns),
                                  dtype=dtype, copy=copy)
         elif isinstance(data, dict):
-            mgr = self._init_dict(data, index, columns, dtype=dtype)
+            mgr = self._init_dict(data, index, columns, dtype=dtype,
+                                  consolidate=consolidate)
+            if copy and not consolidate:
+                mgr = mgr.copy()
         elif isinstance(data, ma.MaskedArray):
             import numpy.ma.mrecords as mrecords
             # masked recarray
@@ -276,7 +287,7 @@ class DataFrame(NDFrame):
 
         NDFrame.__init__(self, mgr, fastpath=True)
 
-    def _init_dict(self, data, index, columns, dtype=None):
+    def _init_dict(self, data, index, columns, dtype=None, consolidate=True):
         """
         Segregate Series based on type and coerce into matrices.
         Needs to handle a lot of exceptional cases.
@@ -322,7 +333,7 @@ class DataFrame(NDFrame):
             arrays = [data[k] for k in columns]
 
         return _arrays_to_mgr(arrays, data_names, index, columns,
-                              dtype=dtype)
+                              dtype=dtype, consolidate=consolidate)
 
     def _init_ndarray(self, values, index, columns, dtype=None,
                       copy=False):
@@ -1042,7 +1053,7 @@ class DataFrame(NDFrame):
         shape = len(major_axis), len(minor_axis)
 
         new_blocks = []
-        for block in selfsorted._data.blocks:
+        for block in selfsorted._data.unmask().blocks:
             newb = block2d_to_blocknd(block.values.T, block.items, shape,
                                       [major_labels, minor_labels],
                                       ref_items=selfsorted.columns)
@@ -1068,7 +1079,8 @@ class DataFrame(NDFrame):
                mode='w', nanRep=None, encoding=None, quoting=None,
                quotechar='"', line_terminator='\n', chunksize=None,
                tupleize_cols=False, date_format=None, doublequote=True,
-               escapechar=None, **kwds):
+               escapechar=None, partition_on=None, threads=None,
+               manifest=None, **kwds):
         r"""Write DataFrame to a comma-separated values (csv) file
 
         Parameters
@@ -1120,6 +1132,15 @@ class DataFrame(NDFrame):
             or new (expanded format) if False)
         date_format : string, default None
             Format string for datetime objects
+        partition_on : column name or list of column names, optional
+            Write the rows of each distinct value of these columns to a
+            separate file; path_or_buf is then a pattern formatted with the
+            values, by position or column name (e.g. 'out/{symbol}.csv')
+        threads : int, optional
+            With partition_on, write up to this many files concurrently
+        manifest : string, optional
+            With partition_on, write a JSON manifest of the files written to
+            this path
         cols : kwarg only alias of columns [deprecated]
         """
         if nanRep is not None:  # pragma: no cover
@@ -1127,6 +1148,31 @@ class DataFrame(NDFrame):
                           FutureWarning)
             na_rep = nanRep
 
+        if partition_on is not None:
+            from pandas.io.partition import write_partitions, ensure_dirname
+
+            if not isinstance(path_or_buf, compat.string_types):
+                raise ValueError("path_or_buf must be a path pattern to "
+                                 "write partitions")
+
+            def writer(frame, path):
+                ensure_dirname(path)
+                frame.to_csv(path, sep=sep, na_rep=na_rep,
+                             float_format=float_format, columns=columns,
+                             header=header, index=index,
+                             index_label=index_label, mode=mode,
+                             encoding=encoding, quoting=quoting,
+                             quotechar=quotechar,
+                             line_terminator=line_terminator,
+                             chunksize=chunksize, tupleize_cols=tupleize_cols,
+                             date_format=date_format, doublequote=doublequote,
+                             escapechar=escapechar, **kwds)
+
+            write_partitions(self, partition_on, writer,
+                             dict(path=path_or_buf), threads=threads,
+                             manifest=manifest)
+            return
+
         formatter = fmt.CSVFormatter(self, path_or_buf,
                                      line_terminator=line_terminator,
                                      sep=sep, encoding=encoding,
@@ -1266,6 +1312,21 @@ class DataFrame(NDFrame):
                              write_index=write_index)
         writer.write_file()
 
+    def to_mmap(self, path):
+        """
+        Write the DataFrame to a directory in a memory-mappable columnar
+        format: a JSON schema, one raw file per block, and the strings of
+        object columns as offsets into a heap of utf-8 encoded bytes. Read it
+        with ``pandas.read_mmap``, which maps the blocks without reading them
+
+        Parameters
+        ----------
+        path : string
+            Directory path, created if it does not exist
+        """
+        from pandas.io.memmap import to_mmap
+        to_mmap(path, self)
+
     @Appender(fmt.docstring_to_string, indents=1)
     def to_string(self, buf=None, columns=None, col_space=None, colSpace=None,
                   header=True, index=True, na_rep='NaN', formatters=None,
@@ -1403,7 +1464,7 @@ class DataFrame(NDFrame):
         if buf is None:
             return formatter.buf.getvalue()
 
-    def info(self, verbose=True, buf=None, max_cols=None):
+    def info(self, verbose=True, buf=None, max_cols=None, memory_usage=None):
         """
         Concise summary of a DataFrame.
 
@@ -1414,6 +1475,10 @@ class DataFrame(NDFrame):
         buf : writable buffer, defaults to sys.stdout
         max_cols : int, default None
             Determines whether full summary or short summary is printed
+        memory_usage : boolean or 'deep', default None
+            Whether to print the total memory usage of the frame (with
+            ``memory_usage(deep=True)`` if 'deep'), default is the
+            display.memory_usage option
         """
         from pandas.core.format import _put_lines
 
@@ -1472,8 +1537,97 @@ class DataFrame(NDFrame):
         counts = self.get_dtype_counts()
         dtypes = ['%s(%d)' % k for k in sorted(compat.iteritems(counts))]
         lines.append('dtypes: %s' % ', '.join(dtypes))
+
+        if memory_usage is None:
+            memory_usage = get_option('display.memory_usage')
+        if memory_usage:
+            deep = memory_usage == 'deep'
+            total = self.memory_usage(index=True, deep=deep).sum()
+            lines.append('memory usage: %s' % _sizeof_fmt(total))
         _put_lines(buf, lines)
 
+    def memory_usage(self, index=True, deep=False):
+        """
+        Memory usage of each column, in bytes
+
+        Parameters
+        ----------
+        index : boolean, default True
+            Include the memory usage of the index, as the first element
+            (labeled 'Index')
+        deep : boolean, default False
+            Also count the Python objects of object columns (and index), and
+            the cached structures of the index (e.g. the hash table of its
+            engine)
+
+        Returns
+        -------
+        sizes : Series of the bytes of each column
+
+        See Also
+        --------
+        Index.memory_usage, Series.memory_usage
+        """
+        result = Series(self._data.memory_usage(deep=deep),
+                        index=self.columns)
+        if index:
+            result = Series(self.index.memory_usage(deep=deep),
+                            index=['Index']).append(result)
+        return result
+
+    def compress(self, columns=None, compress=None, chunksize=None):
+        """
+        Hold the values of columns compressed in memory, for the rarely used
+        columns of a frame kept resident. The values are decompressed (in
+        chunks, through a cache of the last decompressed chunks) on access;
+        any operation on a compressed column gives back decompressed values
+
+        Parameters
+        ----------
+        columns : list-like, default None
+            The columns to compress, default all. Only numeric, boolean and
+            datetime columns are compressed
+        compress : {'zlib', 'blosc'}, default None
+            The compressor, blosc if it is installed, else zlib
+        chunksize : int, default None
+            The number of values compressed together (and decompressed on
+            access)
+
+        Returns
+        -------
+        compressed : DataFrame
+
+        See Also
+        --------
+        DataFrame.decompress, DataFrame.memory_usage
+        """
+        if columns is not None and not com.is_list_like(columns):
+            columns = [columns]
+        new_data = self._data.compress(items=columns, compress=compress,
+                                       chunksize=chunksize)
+        return self._constructor(new_data).__finalize__(self)
+
+    def decompress(self, columns=None):
+        """
+        Decompress the compressed values of columns (default all)
+
+        Parameters
+        ----------
+        columns : list-like, default None
+
+        Returns
+        -------
+        decompressed : DataFrame
+
+        See Also
+        --------
+        DataFrame.compress
+        """
+        if columns is not None and not com.is_list_like(columns):
+            columns = [columns]
+        new_data = self._data.decompress(items=columns)
+        return self._constructor(new_data).__finalize__(self)
+
     def transpose(self):
         """Transpose index and columns"""
         return super(DataFrame, self).transpose(1, 0)
@@ -1561,9 +1715,11 @@ class DataFrame(NDFrame):
         """
         try:
             if takeable is True:
+                self._copy_on_write()
                 series = self._iget_item_cache(col)
                 return series.set_value(index, value, takeable=True)
 
+            self._copy_on_write(col)
             series = self._get_item_cache(col)
             engine = self.index._engine
             engine.set_value(series.values, index, value)
@@ -1969,7 +2125,7 @@ class DataFrame(NDFrame):
         ensure homogeneity.
         """
 
-        is_existing = key in self.columns
+        is_existing = key in self._data
         self._ensure_valid_index(value)
         value = self._sanitize_column(key, value)
         NDFrame._set_item(self, key, value)
@@ -2003,6 +2159,15 @@ class DataFrame(NDFrame):
         # Need to make sure new columns (which go into the BlockManager as new
         # blocks) are always copied
 
+        # a Categorical keeps its codes and levels, as a categorical column
+        if (isinstance(value, Categorical) and self.columns.is_unique and
+                not isinstance(self.columns, MultiIndex)):
+            if len(value) != len(self.index):
+                raise ValueError('Length of values does not match length of '
+                                 'index')
+            return Categorical(value.labels.copy(), value.levels,
+                               name=value.name)
+
         if isinstance(value, (Series, DataFrame)):
             is_frame = isinstance(value, DataFrame)
             if value.index.equals(self.index) or not len(self.index):
@@ -2044,7 +2209,7 @@ class DataFrame(NDFrame):
             value = com._possibly_cast_to_datetime(value, dtype)
 
         # broadcast across multiple columns if necessary
-        if key in self.columns and value.ndim == 1:
+        if key in self._data and value.ndim == 1:
             if not self.columns.is_unique or isinstance(self.columns,
                                                         MultiIndex):
                 existing_piece = self[key]
@@ -2319,7 +2484,7 @@ class DataFrame(NDFrame):
 
             return values
 
-        new_index = np.arange(len(new_obj))
+        new_index = _default_index(len(new_obj))
         if isinstance(self.index, MultiIndex):
             if level is not None:
                 if not isinstance(level, (tuple, list)):
@@ -2763,13 +2928,17 @@ class DataFrame(NDFrame):
             if fill_value is not None:
                 left_mask = isnull(left)
                 right_mask = isnull(right)
-                left = left.copy()
-                right = right.copy()
 
-                # one but not both
+                # one but not both; copy only the sides which are filled
                 mask = left_mask ^ right_mask
-                left[left_mask & mask] = fill_value
-                right[right_mask & mask] = fill_value
+                left_mask &= mask
+                right_mask &= mask
+                if left_mask.any():
+                    left = left.copy()
+                    left[left_mask] = fill_value
+                if right_mask.any():
+                    right = right.copy()
+                    right[right_mask] = fill_value
 
             return func(left, right)
 
@@ -3890,6 +4059,11 @@ class DataFrame(NDFrame):
         # GH #423
         if len(frame._get_axis(axis)) == 0:
             result = Series(0, index=frame._get_agg_axis(axis))
+        elif frame.columns.is_unique:
+            # from the (cached) null masks and counts of the blocks
+            nulls = frame._data.null_counts(axis=axis)
+            result = Series(len(frame._get_axis(axis)) - nulls,
+                            index=frame._get_agg_axis(axis))
         else:
             if axis == 1:
                 counts = notnull(frame.values).sum(1)
@@ -4004,8 +4178,17 @@ class DataFrame(NDFrame):
 
         if numeric_only is None:
             try:
-                values = self.values
-                result = f(values)
+                # the values of a masked block are reduced with their mask
+                self._maybe_consolidate_inplace(view=True)
+                values = self._data.as_matrix(masked=True).T
+                if internals._cache_null_mask:
+                    mask = self._data.null_mask()
+                    if mask is not None:
+                        mask = mask.T
+                    result = op(values, axis=axis, skipna=skipna, mask=mask,
+                                **kwds)
+                else:
+                    result = f(values)
             except Exception as e:
 
                 # try by-column first
@@ -4492,7 +4675,8 @@ def factor_agg(factor, vec, func):
     return group_agg(ordered_vec, bounds, func)
 
 
-def _arrays_to_mgr(arrays, arr_names, index, columns, dtype=None):
+def _arrays_to_mgr(arrays, arr_names, index, columns, dtype=None,
+                   consolidate=True):
     """
     Segregate Series based on type and coerce into matrices.
     Needs to handle a lot of exceptional cases.
@@ -4509,7 +4693,8 @@ def _arrays_to_mgr(arrays, arr_names, index, columns, dtype=None):
     # from BlockManager perspective
     axes = [_ensure_index(columns), _ensure_index(index)]
 
-    return create_block_manager_from_arrays(arrays, arr_names, axes)
+    return create_block_manager_from_arrays(arrays, arr_names, axes,
+                                            consolidate=consolidate)
 
 
 def extract_index(data):
@@ -4559,7 +4744,7 @@ def extract_index(data):
                            % (lengths[0], len(index)))
                     raise ValueError(msg)
             else:
-                index = Index(np.arange(lengths[0]))
+                index = _default_index(lengths[0])
 
     return _ensure_index(index)
 
@@ -4795,7 +4980,11 @@ def _homogenize(data, index, dtype=None):
     homogenized = []
 
     for v in data:
-        if isinstance(v, Series):
+        if (isinstance(v, Categorical) and dtype is None and
+                len(v) == len(index)):
+            # kept as a categorical column
+            pass
+        elif isinstance(v, Series):
             if dtype is not None:
                 v = v.astype(dtype)
             if v.index is not index:
@@ -4834,6 +5023,15 @@ def _put_str(s, space):
     return ('%s' % s)[:space].ljust(space)
 
 
+def _sizeof_fmt(num):
+    # returns size in human readable format
+    for x in ['bytes', 'KB', 'MB', 'GB']:
+        if num < 1024.0:
+            return '%3.1f %s' % (num, x)
+        num /= 1024.0
+    return '%3.1f %s' % (num, 'TB')
+
+
 #----------------------------------------------------------------------
 # Add plotting methods to DataFrame
 
@@ -554,7 +554,7 @@ class NDFrame(PandasObject):
 
             return f
 
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
         result = self if inplace else self.copy(deep=copy)
 
         # start in the axis order to eliminate too many copies
@@ -882,6 +882,17 @@ class NDFrame(PandasObject):
             in the store wherever possible
         fletcher32 : bool, default False
             If applying compression use the fletcher32 checksum
+        partition_on : column name or list of column names, optional
+            Store the rows of each distinct value of these columns
+            separately; key (and path_or_buf, if a path) are then patterns
+            formatted with the values, by position or column name
+            (e.g. 'df_{symbol}')
+        threads : int, optional
+            With partition_on, prepare up to this many partitions
+            concurrently (the writes to the files are serialized)
+        manifest : string, optional
+            With partition_on, write a JSON manifest of the partitions
+            written to this path
 
         """
 
@@ -1112,6 +1123,27 @@ class NDFrame(PandasObject):
         else:
             self._item_cache.clear()
 
+    def _copy_on_write(self, item=None):
+        """
+        copy the data (of item, if passed) if its memory is shared
+        (copy-on-write), before modifying it outside of the block manager
+        """
+        cacher = getattr(self, '_cacher', None)
+        ref = cacher[1]() if cacher is not None else None
+
+        # a cached series is a view of its parent, whose null masks change
+        if ref is not None:
+            ref._data._clear_null_masks()
+
+        if self._data._copy_if_shared(item):
+            self._clear_item_cache()
+
+            # a cached series is no longer a view of its parent
+            if cacher is not None:
+                if ref is not None:
+                    ref._clear_item_cache(cacher[0])
+                del self._cacher
+
     def _slice(self, slobj, axis=0, typ=None):
         """
         Construct a slice of this container.
@@ -1341,7 +1373,8 @@ class NDFrame(PandasObject):
                 data = data.copy()
             return data
 
-        self._consolidate_inplace()
+        # a row of a frame of a single dtype is a view
+        self._maybe_consolidate_inplace(view=True)
 
         index = self.index
         if isinstance(index, MultiIndex):
@@ -1602,7 +1635,7 @@ class NDFrame(PandasObject):
         limit = kwargs.get('limit')
         fill_value = kwargs.get('fill_value', np.nan)
 
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         # if all axes that are requested to reindex are equal, then only copy
         # if indicated must have index names equal here as well as values
@@ -1695,7 +1728,7 @@ class NDFrame(PandasObject):
     @Appender(_shared_docs['reindex_axis'] % _shared_doc_kwargs)
     def reindex_axis(self, labels, axis=0, method=None, level=None, copy=True,
                      limit=None, fill_value=np.nan):
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         axis_name = self._get_axis_name(axis)
         axis_values = self._get_axis(axis_name)
@@ -1879,6 +1912,15 @@ class NDFrame(PandasObject):
         f = lambda: self._data.consolidate()
         self._data = self._protect_consolidate(f)
 
+    def _maybe_consolidate_inplace(self, view=False):
+        """
+        consolidate inplace if the consolidation policy (the
+        'mode.consolidation' option) calls for it; if view, the operation
+        needs a single block when the data is of a single dtype
+        """
+        f = lambda: self._data._maybe_consolidate(view=view)
+        self._data = self._protect_consolidate(f)
+
     def consolidate(self, inplace=False):
         """
         Compute NDFrame with "consolidated" internals (data of each dtype
@@ -1957,7 +1999,7 @@ class NDFrame(PandasObject):
             If the caller is heterogeneous and contains booleans or objects,
             the result will be of dtype=object
         """
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace(view=True)
         if self._AXIS_REVERSED:
             return self._data.as_matrix(columns).T
         return self._data.as_matrix(columns)
@@ -2023,7 +2065,7 @@ class NDFrame(PandasObject):
         -------
         values : a list of Object
         """
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         bd = {}
         for b in self._data.blocks:
@@ -2062,6 +2104,28 @@ class NDFrame(PandasObject):
             dtype=dtype, copy=copy, raise_on_error=raise_on_error)
         return self._constructor(mgr).__finalize__(self)
 
+    def downcast(self, kind=None):
+        """
+        Cast the integer and float values to the smallest dtype of their kind
+        which holds them exactly, to take less memory
+
+        Parameters
+        ----------
+        kind : {'integer', 'float'}, default None
+            'integer' casts integers (and floats which are all integers) to
+            the smallest integer dtype, 'float' casts float64 to float32
+            where that keeps the values; None does both
+
+        Returns
+        -------
+        downcast : type of caller
+        """
+        if kind not in (None, 'integer', 'float'):
+            raise ValueError("kind must be 'integer', 'float' or None, "
+                             "got %r" % (kind,))
+        mgr = self._data.downcast_numeric(kind=kind)
+        return self._constructor(mgr).__finalize__(self)
+
     def copy(self, deep=True):
         """
         Make a copy of this object
@@ -2151,7 +2215,7 @@ class NDFrame(PandasObject):
         if isinstance(value, (list, tuple)):
             raise TypeError('"value" parameter must be a scalar or dict, but '
                             'you passed a "{0}"'.format(type(value).__name__))
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         axis = self._get_axis_number(axis)
         method = com._clean_fill_method(method)
@@ -2352,7 +2416,7 @@ class NDFrame(PandasObject):
             warn('the "axis" argument is deprecated and will be removed in'
                  'v0.13; this argument has no effect')
 
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         if value is None:
             # passing a single value that is scalar like
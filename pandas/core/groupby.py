@@ -1260,6 +1260,10 @@ class BaseGrouper(object):
 
     _name_functions = {}
 
+    # functions whose result is one of the input values; small ints and bools
+    # are exactly representable in float32, so these use the float32 kernels
+    _float32_exact_functions = set(['min', 'max', 'first', 'last', 'ohlc'])
+
     _filter_empty_groups = True
 
     def _get_aggregate_function(self, how, values):
@@ -1317,7 +1321,12 @@ class BaseGrouper(object):
             out_shape = (self.ngroups,) + values.shape[1:]
 
         if is_numeric_dtype(values.dtype):
-            values = com.ensure_float(values)
+            if (how in self._float32_exact_functions and
+                    not issubclass(values.dtype.type, np.floating) and
+                    values.dtype.itemsize <= 2):
+                values = values.astype(np.float32)
+            else:
+                values = com.ensure_float(values)
             is_numeric = True
         else:
             if issubclass(values.dtype.type, np.datetime64):
@@ -1870,7 +1879,13 @@ def _get_grouper(obj, key=None, axis=0, level=None, sort=True):
         if _is_label_like(gpr) or in_axis:
             exclusions.append(gpr)
             name = gpr
-            gpr = obj[gpr]
+
+            # a categorical column groups by its codes
+            categorical = None
+            if (in_axis and isinstance(obj, DataFrame) and
+                    obj.columns.is_unique):
+                categorical = obj._data.get_categorical(gpr)
+            gpr = obj[gpr] if categorical is None else categorical
 
         if isinstance(gpr, Categorical) and len(gpr) != len(obj):
             errmsg = "Categorical grouper must have len(grouper) == len(data)"
@@ -2207,14 +2222,15 @@ class NDFrameGroupBy(GroupBy):
         for block in data.blocks:
             values = block.values
 
+            # the aggregations skip the nulls, which are masked
+            if block.is_masked:
+                values = block.get_values()
+
             is_numeric = is_numeric_dtype(values.dtype)
 
             if numeric_only and not is_numeric:
                 continue
 
-            if is_numeric:
-                values = com.ensure_float(values)
-
             result, _ = self.grouper.aggregate(values, how, axis=agg_axis)
 
             # see if we can cast the block back to the original dtype
@@ -1,5 +1,7 @@
 # pylint: disable=E1101,E1103,W0232
+import sys
 import datetime
+import weakref
 from functools import partial
 from pandas.compat import range, zip, lrange, lzip, u, reduce
 from pandas import compat
@@ -57,6 +59,78 @@ def _shouldbe_timestamp(obj):
 _Identity = object
 
 
+# the length from which the engines are shared by the equal indexes
+_SHARE_ENGINE_CUTOFF = 10000
+
+
+class _EngineCache(object):
+
+    """
+    The engines (hash tables) of the indexes, shared by the equal indexes: a
+    registry of weak references to the indexes with an engine, keyed by the
+    class, dtype, length and end values of the index. The values of a
+    candidate are compared (or its identity, for a view) before its engine
+    is shared, which is much cheaper than hashing them again
+    """
+
+    def __init__(self):
+        self._refs = {}
+
+    def __len__(self):
+        return sum(len(refs) for refs in self._refs.values())
+
+    def _key(self, index):
+        values = index.view(np.ndarray)
+        try:
+            key = (type(index), values.dtype.str, len(values),
+                   values[0], values[-1])
+            hash(key)
+        except (TypeError, IndexError):
+            return None
+        return key
+
+    def get(self, index):
+        """ the engine of an index equal to index, or None """
+        key = self._key(index)
+        for ref in self._refs.get(key, ()):
+            other = ref()
+            if other is None or other is index:
+                continue
+            cache = getattr(other, '_cache', None) or {}
+            engine = cache.get('_engine')
+            if engine is None:
+                continue
+            if other.is_(index) or array_equivalent(other.view(np.ndarray),
+                                                    index.view(np.ndarray)):
+                return engine
+        return None
+
+    def put(self, index):
+        """ register index (which holds its engine) """
+        key = self._key(index)
+        if key is None:
+            return
+
+        def _remove(ref, key=key, refs=self._refs):
+            lst = refs.get(key)
+            if lst is not None:
+                try:
+                    lst.remove(ref)
+                except ValueError:
+                    pass
+                if not lst:
+                    del refs[key]
+
+        self._refs.setdefault(key, []).append(weakref.ref(index, _remove))
+
+    def clear(self):
+        self._refs.clear()
+
+
+# the engines of all of the indexes
+_engine_cache = _EngineCache()
+
+
 class Index(IndexOpsMixin, FrozenNDArray):
 
     """
@@ -403,6 +477,44 @@ class Index(IndexOpsMixin, FrozenNDArray):
             name = type(self).__name__
         return '%s: %s entries%s' % (name, len(self), index_summary)
 
+    def memory_usage(self, deep=False):
+        """
+        Memory usage of the index, in bytes
+
+        Parameters
+        ----------
+        deep : boolean, default False
+            Also count the Python objects of an object index, and the cached
+            structures (the hash table of the engine, cached values)
+
+        Returns
+        -------
+        bytes : int
+        """
+        values = self.view(np.ndarray)
+        result = values.nbytes
+        if deep:
+            if values.dtype == np.object_:
+                result += lib.memory_usage_of_objects(values)
+            result += self._cache_memory_usage()
+        return result
+
+    def _cache_memory_usage(self):
+        """ the bytes of the cache_readonly values (e.g. the engine) """
+        result = 0
+        for value in compat.itervalues(getattr(self, '_cache', None) or {}):
+            if isinstance(value, Index):
+                result += value.memory_usage(deep=True)
+            elif isinstance(value, np.ndarray):
+                result += value.nbytes
+                if value.dtype == np.object_:
+                    result += lib.memory_usage_of_objects(value.ravel())
+            elif isinstance(value, (_index.IndexEngine, _MultiEngine)):
+                result += sys.getsizeof(value) + value.sizeof()
+            else:
+                result += sys.getsizeof(value)
+        return result
+
     def _mpl_repr(self):
         # how to represent ourselves to matplotlib
         return self.values
@@ -599,6 +711,13 @@ class Index(IndexOpsMixin, FrozenNDArray):
     @cache_readonly
     def _engine(self):
         # property, for now, slow to look up
+        share = (len(self) >= _SHARE_ENGINE_CUTOFF and
+                 get_option('mode.share_index_engines'))
+        if share:
+            engine = _engine_cache.get(self)
+            if engine is not None:
+                return engine
+            _engine_cache.put(self)
         return self._engine_type(lambda: self.values, len(self))
 
     def _get_level_number(self, level):
@@ -1870,6 +1989,349 @@ class Int64Index(Index):
         return Int64Index(joined, name=name)
 
 
+class _RangeEngine(object):
+
+    """
+    The engine of a RangeIndex: the lookups of an Int64Engine, computed from
+    the range (start, start + n * step, step) instead of a hash table
+    """
+
+    is_unique = True
+    mapping = None
+
+    def __init__(self, vgetter, start, step, n):
+        self.vgetter = vgetter
+        self.start = start
+        self.step = step if n > 1 else 1
+        self.n = n
+
+    @property
+    def is_monotonic(self):
+        return self.step > 0
+
+    def clear_mapping(self):
+        pass
+
+    def sizeof(self):
+        return 0
+
+    def _get_loc(self, val):
+        """ the location of val, -1 if not found """
+        if isinstance(val, (bool, np.bool_)):
+            return -1
+        if not is_integer(val):
+            if not (is_float(val) and float(val).is_integer()):
+                return -1
+        loc, rem = divmod(int(val) - self.start, self.step)
+        if rem or not 0 <= loc < self.n:
+            return -1
+        return loc
+
+    def __contains__(self, val):
+        hash(val)
+        return self._get_loc(val) != -1
+
+    def get_loc(self, val):
+        if (isinstance(val, (slice, np.ndarray, list)) or
+                hasattr(val, '_data')):
+            raise TypeError
+        hash(val)
+        loc = self._get_loc(val)
+        if loc == -1:
+            raise KeyError(val)
+        return loc
+
+    def get_value(self, arr, key):
+        return _index.get_value_at(arr, self.get_loc(key))
+
+    def set_value(self, arr, key, value):
+        loc = self.get_loc(key)
+        _index.set_value_at(arr, loc, _index.convert_scalar(arr, value))
+
+    def get_indexer(self, values):
+        values = np.asarray(values)
+        if issubclass(values.dtype.type, np.floating):
+            # only the integral floats (within the int64 bounds) can match
+            result = np.empty(len(values), dtype=np.int64)
+            result.fill(-1)
+            with np.errstate(invalid='ignore'):
+                mask = ((np.abs(values) < 2. ** 63) &
+                        (np.floor(values) == values))
+            result[mask] = self.get_indexer(values[mask].astype(np.int64))
+            return result
+
+        if not issubclass(values.dtype.type, np.integer):
+            return np.array([self._get_loc(val) for val in values],
+                            dtype=np.int64)
+
+        offset = com._ensure_int64(values) - self.start
+        result = offset // self.step
+        result[(offset % self.step != 0) | (result < 0) |
+               (result >= self.n)] = -1
+        return result
+
+    def get_indexer_non_unique(self, targets):
+        indexer = self.get_indexer(targets)
+        return indexer, (indexer == -1).nonzero()[0]
+
+    def get_pad_indexer(self, other, limit=None):
+        other = com._ensure_int64(other)
+        if limit is not None:
+            return _algos.pad_int64(com._ensure_int64(self.vgetter()), other,
+                                    limit=limit)
+        result = (other - self.start) // self.step
+        result[result >= self.n] = self.n - 1
+        result[result < 0] = -1
+        return result
+
+    def get_backfill_indexer(self, other, limit=None):
+        other = com._ensure_int64(other)
+        if limit is not None:
+            return _algos.backfill_int64(com._ensure_int64(self.vgetter()),
+                                         other, limit=limit)
+        result = -((self.start - other) // self.step)
+        result[result < 0] = 0
+        result[result >= self.n] = -1
+        return result
+
+
+def _view_range(view, obj):
+    """
+    The (start, step) of the values of view, a view of the RangeIndex obj;
+    None if they are not a range (e.g. the result of a ufunc or of take)
+    """
+    if view.ndim != 1 or obj.ndim != 1 or view.dtype != obj.dtype:
+        return None
+
+    start, step = obj._range
+    n = len(obj)
+    if len(view) == 0:
+        return start, step
+
+    ptr = view.__array_interface__['data'][0]
+    optr = obj.__array_interface__['data'][0]
+    if n <= 1:
+        if ptr == optr and len(view) == n:
+            return start, step
+        return None
+
+    offset, rem = divmod(ptr - optr, obj.strides[0])
+    if rem or not 0 <= offset < n:
+        return None
+    ratio = 1
+    if len(view) > 1:
+        ratio, rem = divmod(view.strides[0], obj.strides[0])
+        if rem or ratio == 0:
+            return None
+    return start + offset * step, step * ratio
+
+
+class RangeIndex(Int64Index):
+
+    """
+    Immutable Int64Index of the integers range(start, stop, step), the
+    default index of pandas objects. Lookups, slicing and take are computed
+    from the range, as are the set operations with another RangeIndex, so no
+    hash table is built for it
+
+    Parameters
+    ----------
+    start : int, default 0
+    stop : int, default None
+        If None, the range is range(0, start)
+    step : int, default 1
+    name : object
+        Name to be stored in the index
+
+    Notes
+    -----
+    The values are an int64 array like for an Int64Index (an index is an
+    ndarray); a view of them, e.g. a slice, is still a RangeIndex, other
+    results (e.g. of a ufunc) are an Int64Index
+    """
+
+    _range = None
+
+    def __new__(cls, start=0, stop=None, step=1, name=None):
+        if stop is None:
+            start, stop = 0, start
+        for value in (start, stop, step):
+            if not is_integer(value):
+                raise TypeError('RangeIndex(...) must be called with '
+                                'integers, %r was passed' % (value,))
+        if step == 0:
+            raise ValueError('step must not be zero')
+
+        values = np.arange(start, stop, step, dtype=np.int64)
+        return cls._simple_new(values, start, step, name=name)
+
+    @classmethod
+    def _simple_new(cls, values, start, step, name=None):
+        """ values must be the int64 range(start, ..., step) """
+        # not a view as cls, which would be an Int64Index without a range
+        result = values.view(Int64Index)
+        result.__class__ = cls
+        result._range = int(start), int(step)
+        result.name = name
+        return result
+
+    def __array_finalize__(self, obj):
+        super(RangeIndex, self).__array_finalize__(obj)
+        rng = None
+        if getattr(obj, '_range', None) is not None:
+            rng = _view_range(self, obj)
+
+        if rng is None:
+            # e.g. the result of a ufunc, take or repeat
+            self.__class__ = Int64Index
+        else:
+            self._range = rng
+
+    def __reduce__(self):
+        """Necessary for making this object picklable"""
+        return RangeIndex, (self._start, self._stop, self._step, self.name)
+
+    @property
+    def _start(self):
+        return self._range[0]
+
+    @property
+    def _step(self):
+        return self._range[1]
+
+    @property
+    def _stop(self):
+        return self._start + len(self) * self._step
+
+    @property
+    def _constructor(self):
+        return Int64Index
+
+    @cache_readonly
+    def _engine(self):
+        return _RangeEngine(lambda: self.values, self._start, self._step,
+                            len(self))
+
+    def copy(self, names=None, name=None, dtype=None, deep=False):
+        """
+        Make a copy of this object.  Name and dtype sets those attributes on
+        the new object.
+
+        Parameters
+        ----------
+        name : string, optional
+        dtype : numpy dtype or pandas type
+
+        Returns
+        -------
+        copy : Index
+        """
+        if dtype is not None and np.dtype(dtype) != np.int64:
+            return super(RangeIndex, self).copy(names=names, name=name,
+                                                dtype=dtype, deep=deep)
+        if names is not None and name is not None:
+            raise TypeError("Can only provide one of `names` and `name`")
+        if deep and name is None:
+            from copy import deepcopy
+            name = deepcopy(self.name)
+
+        new_index = self._simple_new(self.view(np.ndarray).copy(),
+                                     self._start, self._step, name=self.name)
+        if name is not None:
+            names = [name]
+        if names:
+            new_index = new_index.set_names(names)
+        return new_index
+
+    def take(self, indexer, axis=0):
+        """
+        Analogous to ndarray.take
+        """
+        indexer = com._ensure_int64(indexer)
+        n = len(self)
+        if len(indexer) and (indexer.max() >= n or indexer.min() < -n):
+            raise IndexError('index out of bounds')
+        taken = np.where(indexer < 0, indexer + n, indexer)
+        taken *= self._step
+        taken += self._start
+        return Int64Index(taken, name=self.name)
+
+    def equals(self, other):
+        """
+        Determines if two Index objects contain the same elements.
+        """
+        if isinstance(other, RangeIndex):
+            if len(self) != len(other):
+                return False
+            if len(self) == 0:
+                return True
+            return (self._start == other._start and
+                    (len(self) == 1 or self._step == other._step))
+        return super(RangeIndex, self).equals(other)
+
+    def _wrap_union_result(self, other, result):
+        name = self.name if self.name == other.name else None
+        return Int64Index(result, name=name)
+
+    def _bounds(self, step=1):
+        """ the (first, last, step) of the sorted values, step is used for
+        a range of one value """
+        first, last = self._start, self._stop - self._step
+        if len(self) > 1:
+            step = self._step
+        if step < 0:
+            first, last = last, first
+        return first, last, abs(step)
+
+    def union(self, other):
+        """
+        Form the union of two Index objects and sorts if possible
+
+        Parameters
+        ----------
+        other : Index or array-like
+
+        Returns
+        -------
+        union : Index
+        """
+        if (isinstance(other, RangeIndex) and len(self) > 0 and
+                len(other) > 0 and not self.equals(other)):
+            first, last, step = self._bounds(other._step)
+            ofirst, olast, ostep = other._bounds(step)
+            if (step == ostep and (ofirst - first) % step == 0 and
+                    ofirst <= last + step and first <= olast + step):
+                name = self.name if self.name == other.name else None
+                return RangeIndex(min(first, ofirst), max(last, olast) + step,
+                                  step, name=name)
+        return super(RangeIndex, self).union(other)
+
+    def intersection(self, other):
+        """
+        Form the intersection of two Index objects. Sortedness of the result is
+        not guaranteed
+
+        Parameters
+        ----------
+        other : Index or array-like
+
+        Returns
+        -------
+        intersection : Index
+        """
+        if (isinstance(other, RangeIndex) and len(self) > 0 and
+                len(other) > 0 and not self.equals(other)):
+            first, last, step = self._bounds(other._step)
+            ofirst, olast, ostep = other._bounds(step)
+            if step == ostep:
+                name = self.name if self.name == other.name else None
+                if (ofirst - first) % step:
+                    return RangeIndex(0, name=name)
+                return RangeIndex(max(first, ofirst), min(last, olast) + step,
+                                  step, name=name)
+        return super(RangeIndex, self).intersection(other)
+
+
 class Float64Index(Index):
 
     """
@@ -1993,6 +2455,182 @@ class Float64Index(Index):
             return False
 
 
+def _packed_sizes(levels):
+    """
+    The number of codes of each level (the labels, and -1 for NaN), None if
+    the packed codes of a row would not fit in an int64
+    """
+    sizes = [len(lev) + 1 for lev in levels]
+    if reduce(lambda x, y: x * y, sizes, 1) >= 2 ** 63:
+        return None
+    return sizes
+
+
+def _pack_codes(labels, sizes):
+    """ the labels of each row, packed in an int64 """
+    codes = np.zeros(len(labels[0]), dtype=np.int64)
+    for lab, size in zip(labels, sizes):
+        codes *= size
+        codes += lab
+        codes += 1
+    return codes
+
+
+class _MultiEngine(object):
+
+    """
+    The engine of a MultiIndex: the labels of each row are packed in an
+    int64, which is looked up with an Int64Engine, so the tuples of the rows
+    are not built (they are only hashed for the fill methods)
+    """
+
+    def __init__(self, index, sizes):
+        self.index = index
+        self.sizes = sizes
+        self._codes = None
+        self._ordered = None
+        self._tuple_engine = None
+        self._engine = _index.Int64Engine(self._get_codes, len(index))
+
+    def _get_codes(self):
+        if self._codes is None:
+            self._codes = _pack_codes(self.index.labels, self.sizes)
+        return self._codes
+
+    def _get_tuple_engine(self):
+        if self._tuple_engine is None:
+            index = self.index
+            self._tuple_engine = _index.ObjectEngine(lambda: index.values,
+                                                     len(index))
+        return self._tuple_engine
+
+    @property
+    def is_unique(self):
+        return self._engine.is_unique
+
+    @property
+    def is_monotonic(self):
+        # the codes are in the order of the tuples if the levels are sorted
+        # and there is no NaN
+        if self._ordered is None:
+            self._ordered = all(lev.is_monotonic and
+                                (len(lab) == 0 or lab.min() >= 0)
+                                for lev, lab in zip(self.index.levels,
+                                                    self.index.labels))
+        if self._ordered:
+            return self._engine.is_monotonic
+        return self._get_tuple_engine().is_monotonic
+
+    def clear_mapping(self):
+        self._engine.clear_mapping()
+        if self._tuple_engine is not None:
+            self._tuple_engine.clear_mapping()
+
+    def sizeof(self):
+        """ the bytes of the codes and of the hash tables """
+        result = self._engine.sizeof()
+        if self._codes is not None:
+            result += self._codes.nbytes
+        if self._tuple_engine is not None:
+            result += self._tuple_engine.sizeof()
+        return result
+
+    def _get_code(self, key):
+        """ the packed code of the tuple key """
+        if not isinstance(key, tuple) or len(key) != len(self.sizes):
+            raise KeyError(key)
+
+        code = 0
+        for k, lev, size in zip(key, self.index.levels, self.sizes):
+            if lib.checknull(k):
+                loc = -1
+            else:
+                try:
+                    loc = lev.get_loc(k)
+                except (TypeError, ValueError):
+                    raise KeyError(key)
+                if not is_integer(loc):
+                    raise KeyError(key)
+            code = code * size + loc + 1
+        return code
+
+    def _get_target_codes(self, target):
+        """
+        The packed codes of the rows of the MultiIndex target, with the
+        labels of this index (-1 if a value is not in its levels)
+        """
+        codes = np.zeros(len(target), dtype=np.int64)
+        missing = np.zeros(len(target), dtype=bool)
+        for lev, tlev, tlab, size in zip(self.index.levels, target.levels,
+                                         target.labels, self.sizes):
+            tlab = tlab.view(np.ndarray)
+            lab = com.take_nd(lev.get_indexer(tlev), tlab, fill_value=-1)
+            missing |= (lab == -1) & (tlab != -1)
+            codes *= size
+            codes += lab
+            codes += 1
+        codes[missing] = -1
+        return codes
+
+    def __contains__(self, val):
+        hash(val)
+        try:
+            self.get_loc(val)
+            return True
+        except KeyError:
+            return False
+
+    def get_loc(self, val):
+        if (isinstance(val, (slice, np.ndarray, list)) or
+                hasattr(val, '_data')):
+            raise TypeError
+        hash(val)
+        try:
+            return self._engine.get_loc(self._get_code(val))
+        except KeyError:
+            raise KeyError(val)
+
+    def get_value(self, arr, key):
+        loc = self.get_loc(key)
+        if isinstance(loc, (slice, np.ndarray)):
+            return arr[loc]
+        return _index.get_value_at(arr, loc)
+
+    def set_value(self, arr, key, value):
+        loc = self.get_loc(key)
+        value = _index.convert_scalar(arr, value)
+        if isinstance(loc, (slice, np.ndarray)):
+            arr[loc] = value
+        else:
+            _index.set_value_at(arr, loc, value)
+
+    def get_indexer(self, target):
+        """ target is a MultiIndex or an array of tuples """
+        nlevels = len(self.sizes)
+        if not isinstance(target, MultiIndex):
+            target = np.asarray(target)
+            if len(target) == 0:
+                return np.empty(0, dtype=np.int64)
+            if not all(isinstance(t, tuple) and len(t) == nlevels
+                       for t in target):
+                return self._get_tuple_engine().get_indexer(target)
+            target = MultiIndex.from_tuples(target)
+
+        if target.nlevels != nlevels:
+            return np.repeat(-1, len(target)).astype(np.int64)
+        return self._engine.get_indexer(self._get_target_codes(target))
+
+    def get_indexer_non_unique(self, targets):
+        return self._get_tuple_engine().get_indexer_non_unique(targets)
+
+    def get_pad_indexer(self, other, limit=None):
+        return self._get_tuple_engine().get_pad_indexer(other, limit=limit)
+
+    def get_backfill_indexer(self, other, limit=None):
+        return self._get_tuple_engine().get_backfill_indexer(other,
+                                                             limit=limit)
+
+
 class MultiIndex(Index):
 
     """
@@ -2393,6 +3031,14 @@ class MultiIndex(Index):
         # to disable groupby tricks
         return True
 
+    @cache_readonly
+    def _engine(self):
+        sizes = _packed_sizes(self.levels)
+        if sizes is None:
+            # too many labels to pack them, hash the tuples
+            return _index.ObjectEngine(lambda: self.values, len(self))
+        return _MultiEngine(self, sizes)
+
     @property
     def has_duplicates(self):
         """
@@ -2746,6 +3392,30 @@ class MultiIndex(Index):
         return MultiIndex.from_arrays(product, sortorder=sortorder,
                                       names=names)
 
+    def memory_usage(self, deep=False):
+        """
+        Memory usage of the index (of its levels and labels), in bytes
+
+        Parameters
+        ----------
+        deep : boolean, default False
+            Also count the Python objects of the levels, and the cached
+            structures (the tuples of the values, the hash table of the
+            engine, cached values)
+
+        Returns
+        -------
+        bytes : int
+        """
+        result = sum(lev.memory_usage(deep=deep) for lev in self.levels)
+        result += sum(lab.nbytes for lab in self.labels)
+        if deep:
+            if self._tuples is not None:
+                result += (self._tuples.nbytes +
+                           lib.memory_usage_of_objects(self._tuples))
+            result += self._cache_memory_usage()
+        return result
+
     @property
     def nlevels(self):
         return len(self.levels)
@@ -3066,17 +3736,22 @@ class MultiIndex(Index):
 
         target = _ensure_index(target)
 
-        target_index = target
-        if isinstance(target, MultiIndex):
-            target_index = target._tuple_index
-
-        if target_index.dtype != object:
-            return np.ones(len(target_index)) * -1
+        if not isinstance(target, MultiIndex) and target.dtype != object:
+            return np.ones(len(target)) * -1
 
         if not self.is_unique:
             raise Exception('Reindexing only valid with uniquely valued Index '
                             'objects')
 
+        if method is None and isinstance(self._engine, _MultiEngine):
+            # on the labels, without the tuples
+            indexer = self._engine.get_indexer(target)
+            return com._ensure_platform_int(indexer)
+
+        target_index = target
+        if isinstance(target, MultiIndex):
+            target_index = target._tuple_index
+
         self_index = self._tuple_index
 
         if method == 'pad':
@@ -3719,6 +4394,30 @@ class MultiIndex(Index):
 
         return self.__bounds
 
+    def _join_monotonic(self, other, how='left', return_indexers=False):
+        if (not isinstance(other, MultiIndex) or how == 'outer' or
+                not (self.is_unique and other.is_unique) or
+                self.equals(other)):
+            return super(MultiIndex, self)._join_monotonic(
+                other, how=how, return_indexers=return_indexers)
+
+        # the indexers from the labels, without the tuples
+        if how == 'right':
+            join_index, ridx, lidx = other._join_monotonic(
+                self, how='left', return_indexers=True)
+        else:
+            join_index, lidx = self, None
+            ridx = other.get_indexer(self)
+            if how == 'inner':
+                lidx = (ridx != -1).nonzero()[0]
+                join_index = self.take(lidx)
+                ridx = ridx.take(lidx)
+
+        if return_indexers:
+            return join_index, lidx, ridx
+        else:
+            return join_index
+
     def _wrap_joined_index(self, joined, other):
         names = self.names if self.names == other.names else None
         return MultiIndex.from_tuples(joined, names=names)
@@ -1,8 +1,10 @@
 import itertools
 import re
+import bisect
 import operator
 from datetime import datetime, timedelta
 import copy
+import weakref
 from collections import defaultdict
 
 import numpy as np
@@ -12,20 +14,35 @@ from pandas.core.common import (_possibly_downcast_to_dtype, isnull, notnull,
                                 _NS_DTYPE, _TD_DTYPE, ABCSeries, is_list_like,
                                 ABCSparseSeries, _infer_dtype_from_scalar,
                                 _values_from_object, _is_null_datelike_scalar)
-from pandas.core.index import (Index, MultiIndex, _ensure_index,
+from pandas.core.index import (Index, Int64Index, MultiIndex, _ensure_index,
                                _handle_legacy_indexes)
 from pandas.core.indexing import (_maybe_convert_indices, _length_of_indexer)
 import pandas.core.common as com
 from pandas.sparse.array import _maybe_to_sparse, SparseArray
+from pandas.core.categorical import Categorical
+from pandas.core.compressed import CompressedArray
 import pandas.lib as lib
 import pandas.tslib as tslib
 import pandas.computation.expressions as expressions
+from pandas.core.config import get_option
 
 from pandas.tslib import Timestamp
 from pandas import compat
 from pandas.compat import range, lrange, lmap, callable, map, zip, u
 from pandas.tseries.timedeltas import _coerce_scalar_to_timedelta_type
 
+
+# the mode.cache_null_mask option, set by its callback rather than looked
+# up by every null mask request and reduction
+_cache_null_mask = False
+
+
+def _set_cache_null_mask(key):
+    """ option change callback of 'mode.cache_null_mask' """
+    global _cache_null_mask
+    _cache_null_mask = get_option(key)
+
+
 class Block(PandasObject):
 
     """
@@ -34,7 +51,8 @@ class Block(PandasObject):
 
     Index-ignorant; let the container take care of that
     """
-    __slots__ = ['items', 'ref_items', '_ref_locs', 'values', 'ndim']
+    __slots__ = ['items', 'ref_items', '_ref_locs', 'values', 'ndim',
+                 '_null_mask', '__weakref__']
     is_numeric = False
     is_float = False
     is_integer = False
@@ -43,6 +61,10 @@ class Block(PandasObject):
     is_timedelta = False
     is_bool = False
     is_object = False
+    is_string = False
+    is_masked = False
+    is_categorical = False
+    is_compressed = False
     is_sparse = False
     _can_hold_na = False
     _downcast_dtype = None
@@ -66,6 +88,7 @@ class Block(PandasObject):
         self.set_ref_locs(placement)
         self.values = values
         self.ndim = ndim
+        self._null_mask = None
 
         if fastpath:
             self.items = items
@@ -200,6 +223,7 @@ class Block(PandasObject):
         self.ref_items = _ensure_index(ref_items)
         self.values = values
         self.ndim = values.ndim
+        self._null_mask = None
 
     def _slice(self, slicer):
         """ return a slice of my values """
@@ -248,12 +272,25 @@ class Block(PandasObject):
         if fill_value is None:
             fill_value = self.fill_value
 
-        new_values = com.take_nd(self.values, indexer, axis,
+        values = self.values
+        if self._can_mask_missing(fill_value):
+            values = np.ma.MaskedArray(values)
+
+        new_values = com.take_nd(values, indexer, axis,
                                  fill_value=fill_value, mask_info=mask_info)
         return make_block(new_values, self.items, self.ref_items,
                           ndim=self.ndim, fastpath=True,
                           placement=self._ref_locs)
 
+    def _can_mask_missing(self, fill_value):
+        """
+        whether the missing values of a reindex are masked, rather than
+        upcasting (integer and boolean frame blocks, mode.integer_na='mask')
+        """
+        return ((self.is_integer or self.is_bool) and not self.is_timedelta
+                and self.ndim > 1 and isnull(fill_value) and
+                _integer_na == 'mask')
+
     def reindex_items_from(self, new_ref_items, indexer=None, method=None,
                            fill_value=None, limit=None, copy=True):
         """
@@ -323,6 +360,7 @@ class Block(PandasObject):
         None
         """
         loc = self.items.get_loc(item)
+        self._copy_if_shared()
         self.values[loc] = value
 
     def delete(self, item):
@@ -374,10 +412,11 @@ class Block(PandasObject):
             else:
                 return [self.copy()]
 
-        mask = isnull(self.values)
+        mask = self.null_mask()
         if limit is not None:
             if self.ndim > 2:
                 raise NotImplementedError
+            mask = mask.copy()
             mask[mask.cumsum(self.ndim-1)>limit]=False
 
         value = self._try_fill(value)
@@ -448,6 +487,13 @@ class Block(PandasObject):
 
         return blocks
 
+    def downcast_numeric(self, kind=None):
+        """
+        the blocks of my values in the smallest integer or float dtype which
+        holds them exactly (only numeric blocks are cast)
+        """
+        return [self]
+
     def astype(self, dtype, copy=False, raise_on_error=True, values=None):
         return self._astype(dtype, copy=copy, raise_on_error=raise_on_error,
                             values=values)
@@ -581,16 +627,103 @@ class Block(PandasObject):
         values[mask] = na_rep
         return values.tolist()
 
+    def memory_usage(self, deep=False):
+        """
+        the bytes of the values of each item (an array), or of all of the
+        values of a 1-dim block (an int); if deep, also the Python objects
+        held by an object block
+        """
+        values = self.values
+        if self.ndim == 1:
+            return values.nbytes
+        return np.repeat(values[:1].nbytes, len(values))
+
+    def _isnull(self):
+        """ the null mask of my values, of my shape """
+        return isnull(self.values)
+
+    def null_mask(self):
+        """
+        the null mask of my values; with the mode.cache_null_mask option set
+        it is kept (read-only) until my values are replaced or modified in
+        place by the block
+        """
+        cached = getattr(self, '_null_mask', None)
+        if (cached is not None and cached[0] is self.values and
+                cached[1] is com._isnull):
+            return cached[2]
+
+        mask = self._isnull()
+        if _cache_null_mask:
+            mask.flags.writeable = False
+            self._null_mask = (self.values, com._isnull, mask, None)
+        return mask
+
+    def null_counts(self):
+        """
+        the number of null values of each item (of all of them if 1-dim),
+        kept with the null mask
+        """
+        mask = self.null_mask()
+        cached = getattr(self, '_null_mask', None)
+        if cached is not None and cached[2] is mask:
+            if cached[3] is not None:
+                return cached[3]
+        if self.ndim == 1:
+            counts = int(mask.sum())
+        else:
+            counts = mask.reshape(len(mask), -1).sum(1)
+        if cached is not None and cached[2] is mask:
+            self._null_mask = cached[:3] + (counts,)
+        return counts
+
+    def isnull(self, **kwargs):
+        """ a block of my null mask """
+        mask = self.null_mask()
+        if not mask.flags.writeable:
+            mask = mask.copy()
+        return self.as_block(mask)
+
     # block actions ####
     def copy(self, deep=True, ref_items=None):
         values = self.values
-        if deep:
+
+        # copy-on-write shares the values until one of the blocks modifies
+        # them; not for a series, whose values are modified directly
+        share = (deep and self.ndim > 1 and not self.is_sparse and
+                 _copy_on_write)
+        if deep and not share:
             values = values.copy()
         if ref_items is None:
             ref_items = self.ref_items
-        return make_block(values, self.items, ref_items, ndim=self.ndim,
-                          klass=self.__class__, fastpath=True,
-                          placement=self._ref_locs)
+        block = make_block(values, self.items, ref_items, ndim=self.ndim,
+                           klass=self.__class__, fastpath=True,
+                           placement=self._ref_locs)
+        if share:
+            _share_values(self, block)
+        return block
+
+    def _copy_if_shared(self):
+        """
+        copy the values before modifying them in place, if their memory is
+        shared with other blocks (copy-on-write) or they are a read-only view
+        of such memory; return if they were copied
+        """
+        self._null_mask = None
+        values = self.values
+        if (isinstance(values, np.ndarray) and not values.flags.writeable or
+                _count_sharers(values, exclude=self)):
+            _unshare_values(self)
+            self.values = self.values.copy()
+            return True
+        return False
+
+    def _get_values_to_modify(self, inplace):
+        """ the values if inplace (copied if they are shared), else a copy """
+        if inplace:
+            self._copy_if_shared()
+            return self.values
+        return self.values.copy()
 
     def replace(self, to_replace, value, inplace=False, filter=None,
                 regex=False):
@@ -619,6 +752,7 @@ class Block(PandasObject):
         """
 
         # coerce args
+        self._copy_if_shared()
         values, value = self._try_coerce_args(self.values, value)
         arr_value = np.array(value)
 
@@ -701,7 +835,7 @@ class Block(PandasObject):
         a new block(s), the result of the putmask
         """
 
-        new_values = self.values if inplace else self.values.copy()
+        new_values = self._get_values_to_modify(inplace)
 
         # may need to align the new
         if hasattr(new, 'reindex_axis'):
@@ -882,7 +1016,7 @@ class Block(PandasObject):
                     return [self.copy()]
 
         fill_value = self._try_fill(fill_value)
-        values = self.values if inplace else self.values.copy()
+        values = self._get_values_to_modify(inplace)
         values = self._try_operate(values)
         values = com.interpolate_2d(values,
                                     method=method,
@@ -902,7 +1036,7 @@ class Block(PandasObject):
                      inplace=False, downcast=None, **kwargs):
         """ interpolate using scipy wrappers """
 
-        data = self.values if inplace else self.values.copy()
+        data = self._get_values_to_modify(inplace)
 
         # only deal with floats
         if not self.is_float:
@@ -1207,6 +1341,26 @@ class NumericBlock(Block):
     is_numeric = True
     _can_hold_na = True
 
+    def downcast_numeric(self, kind=None):
+        if self.is_timedelta or not (self.is_integer or self.is_float):
+            return [self]
+
+        values = self.values
+        if self.ndim == 1:
+            nv = com._downcast_to_smallest(values, kind=kind)
+            return [make_block(nv, self.items, self.ref_items,
+                               ndim=self.ndim, fastpath=True)]
+
+        # item-by-item, as each may take a different dtype
+        blocks = []
+        for i, item in enumerate(self.items):
+            nv = com._downcast_to_smallest(values[i], kind=kind)
+            blocks.append(make_block(_block_shape(nv, ndim=self.ndim),
+                                     Index([item]), self.ref_items,
+                                     ndim=self.ndim, fastpath=True))
+
+        return blocks
+
 
 class FloatOrComplexBlock(NumericBlock):
 
@@ -1407,6 +1561,244 @@ class BoolBlock(NumericBlock):
                                               inplace=inplace, filter=filter,
                                               regex=regex)
 
+
+class MaskedBlock(Block):
+
+    """
+    Integer or boolean values with a mask of their missing values (a numpy
+    masked array), rather than upcast to float or object to hold nulls;
+    created by reindexing the rows of a frame with the mode.integer_na
+    option set to 'mask'
+
+    Taking, reindexing, filling, shifting, setting (or putting) a value of
+    the dtype or a null, and arithmetic with (or comparisons to) a scalar act
+    on the values and the mask. The block reports the dtype the values upcast
+    to, which they are for any other operation, and when a column (or a row)
+    is extracted
+    """
+    is_masked = True
+    _can_hold_na = True
+    _can_consolidate = False
+    _ftype = 'masked'
+    _upcast_dtype = None
+
+    def __init__(self, values, items, ref_items, ndim=None, fastpath=False,
+                 placement=None):
+        if (not isinstance(values, np.ma.MaskedArray) or
+                values.mask is np.ma.nomask):
+            values = np.ma.MaskedArray(values,
+                                       mask=np.ma.getmaskarray(values))
+        super(MaskedBlock, self).__init__(values, items, ref_items, ndim=ndim,
+                                          fastpath=fastpath,
+                                          placement=placement)
+
+    @property
+    def dtype(self):
+        return self._upcast_dtype
+
+    @property
+    def mask(self):
+        return np.ma.getmaskarray(self.values)
+
+    def _upcast(self, values):
+        """ values (masked), upcast and with nulls where masked """
+        result = np.ma.getdata(values).astype(self._upcast_dtype)
+        np.putmask(result, np.ma.getmaskarray(values), np.nan)
+        return result
+
+    def _isnull(self):
+        return np.ma.getmaskarray(self.values).copy()
+
+    def _as_upcast(self):
+        """ a block of my upcast values """
+        return make_block(self.get_values(), self.items, self.ref_items,
+                          ndim=self.ndim, fastpath=True,
+                          placement=self._ref_locs)
+
+    def _holds_fill(self, value):
+        """ if value fills the missing values in the dtype of the values """
+        return False
+
+    def _holds_scalar(self, value):
+        """ if value is a null, or a scalar of the dtype of the values """
+        return (not is_list_like(value) and
+                (isnull(value) or self._holds_fill(value)))
+
+    def _make_masked(self, data, mask):
+        """ a block of the data with the mask (of the dtype of the data if
+        nothing is masked) """
+        return make_block(np.ma.MaskedArray(data, mask=mask), self.items,
+                          self.ref_items, ndim=self.ndim, fastpath=True,
+                          placement=self._ref_locs)
+
+    def get_values(self, dtype=None):
+        return self._upcast(self.values)
+
+    def get(self, item):
+        return self.iget(self.items.get_loc(item))
+
+    def iget(self, i):
+        value = self.values[i]
+        if isinstance(value, np.ndarray):
+            return self._upcast(value)
+        elif value is np.ma.masked:
+            return np.nan
+        return self._upcast_dtype.type(value)
+
+    def _try_operate(self, values):
+        return self._upcast(values)
+
+    def should_store(self, value):
+        return False
+
+    def prepare_for_merge(self, **kwargs):
+        return self._as_upcast()
+
+    def memory_usage(self, deep=False):
+        result = super(MaskedBlock, self).memory_usage(deep=deep)
+        if self.ndim == 1:
+            return result + self.mask.nbytes
+        return result + self.mask[:1].nbytes
+
+    def equals(self, other):
+        if self.dtype != other.dtype or self.shape != other.shape:
+            return False
+        return com.array_equivalent(self.get_values(), other.get_values())
+
+    def delete(self, item):
+        loc = self.items.get_loc(item)
+        keep = np.ones(len(self.items), dtype=bool)
+        keep[loc] = False
+        return make_block(self.values[keep], self.items[keep], self.ref_items,
+                          ndim=self.ndim, klass=self.__class__, fastpath=True)
+
+    def fillna(self, value, limit=None, inplace=False, downcast=None):
+        # filling with a value of the dtype of the values drops the mask
+        if limit is None and self._holds_fill(value):
+            return [make_block(self.values.filled(value), self.items,
+                               self.ref_items, ndim=self.ndim, fastpath=True,
+                               placement=self._ref_locs)]
+        return self._as_upcast().fillna(value, limit=limit, inplace=True,
+                                        downcast=downcast)
+
+    def eval(self, func, other, raise_on_error=True, try_cast=False):
+        # a scalar is combined with the values, keeping the mask; a
+        # comparison is boolean, with the nulls compared as a nan is
+        if np.isscalar(other) and notnull(other):
+            try:
+                with np.errstate(all='ignore'):
+                    result = func(self.values, other)
+            except Exception:
+                result = None
+            if (isinstance(result, np.ma.MaskedArray) and
+                    result.shape == self.shape):
+                if result.dtype == np.bool_:
+                    try:
+                        result = result.filled(bool(func(np.nan, other)))
+                    except Exception:
+                        result = None
+                if result is not None:
+                    return [make_block(result, self.items, self.ref_items,
+                                       ndim=self.ndim, fastpath=True,
+                                       placement=self._ref_locs)]
+        return self._as_upcast().eval(func, other,
+                                      raise_on_error=raise_on_error,
+                                      try_cast=try_cast)
+
+    def setitem(self, indexer, value):
+        if not self._holds_scalar(value):
+            return self._as_upcast().setitem(indexer, value)
+
+        # the indexer is of the (rows x items) layout
+        data = np.ma.getdata(self.values).copy()
+        mask = self.mask.copy()
+        transf = (lambda x: x.T) if self.ndim == 2 else (lambda x: x)
+        if isnull(value):
+            transf(mask)[indexer] = True
+        else:
+            transf(data)[indexer] = value
+            transf(mask)[indexer] = False
+        return [self._make_masked(data, mask)]
+
+    def putmask(self, mask, new, align=True, inplace=False):
+        if not self._holds_scalar(new):
+            return self._as_upcast().putmask(mask, new, align=align,
+                                            inplace=True)
+
+        if hasattr(mask, 'reindex_axis'):
+            if align:
+                axis = getattr(mask, '_info_axis_number', 0)
+                mask = mask.reindex_axis(
+                    self.items, axis=axis, copy=False).values.T
+            else:
+                mask = mask.values.T
+        mask = np.asarray(mask, dtype=bool)
+
+        data = np.ma.getdata(self.values).copy()
+        new_mask = self.mask.copy()
+        if isnull(new):
+            new_mask[mask] = True
+        else:
+            data[mask] = new
+            new_mask[mask] = False
+        return [self._make_masked(data, new_mask)]
+
+    def where(self, other, cond, align=True, raise_on_error=True,
+              try_cast=False):
+        return self._as_upcast().where(other, cond, align=align,
+                                       raise_on_error=raise_on_error,
+                                       try_cast=try_cast)
+
+    def replace(self, *args, **kwargs):
+        kwargs['inplace'] = True
+        return self._as_upcast().replace(*args, **kwargs)
+
+    def interpolate(self, *args, **kwargs):
+        kwargs['inplace'] = True
+        return self._as_upcast().interpolate(*args, **kwargs)
+
+    def shift(self, periods, axis=0):
+        # the vacated values are masked
+        data = np.roll(np.ma.getdata(self.values), periods, axis=axis)
+        mask = np.roll(self.mask, periods, axis=axis)
+        if periods:
+            indexer = [slice(None)] * self.ndim
+            if periods > 0:
+                indexer[axis] = slice(None, periods)
+            else:
+                indexer[axis] = slice(periods, None)
+            mask[tuple(indexer)] = True
+        return [self._make_masked(data, mask)]
+
+    def diff(self, *args, **kwargs):
+        return self._as_upcast().diff(*args, **kwargs)
+
+    def astype(self, *args, **kwargs):
+        return self._as_upcast().astype(*args, **kwargs)
+
+    def downcast(self, *args, **kwargs):
+        return self._as_upcast().downcast(*args, **kwargs)
+
+    def to_native_types(self, *args, **kwargs):
+        return self._as_upcast().to_native_types(*args, **kwargs)
+
+
+class MaskedIntBlock(MaskedBlock):
+    is_numeric = True
+    _upcast_dtype = np.dtype(np.float64)
+
+    def _holds_fill(self, value):
+        return (com.is_integer(value) and
+                np.asarray(value).astype(self.values.dtype) == value)
+
+
+class MaskedBoolBlock(MaskedBlock):
+    _upcast_dtype = np.dtype(np.object_)
+
+    def _holds_fill(self, value):
+        return com.is_bool(value)
+
+
 class ObjectBlock(Block):
     is_object = True
     _can_hold_na = True
@@ -1427,6 +1819,17 @@ class ObjectBlock(Block):
         """
         return lib.is_bool_array(self.values.ravel())
 
+    def memory_usage(self, deep=False):
+        result = super(ObjectBlock, self).memory_usage(deep=deep)
+        if deep:
+            if self.ndim == 1:
+                result += lib.memory_usage_of_objects(self.values)
+            else:
+                result = result + np.array([lib.memory_usage_of_objects(v)
+                                            for v in self.values],
+                                           dtype=np.int64)
+        return result
+
     def convert(self, convert_dates=True, convert_numeric=True, convert_timedeltas=True,
                 copy=True, by_item=True):
         """ attempt to coerce any object types to better types
@@ -1485,6 +1888,7 @@ class ObjectBlock(Block):
                     return
             except:
                 pass
+        self._copy_if_shared()
         try:
             self.values[loc] = value
         except (ValueError):
@@ -1593,7 +1997,7 @@ class ObjectBlock(Block):
                 result = [result]
             return result
 
-        new_values = self.values if inplace else self.values.copy()
+        new_values = self._get_values_to_modify(inplace)
 
         # deal with replacing values with objects (strings) that match but
         # whose replacement is not a string (numeric, nan, object)
@@ -1625,6 +2029,119 @@ class ObjectBlock(Block):
                                                 self.ref_items, fastpath=True)]
 
 
+class StringBlock(Block):
+
+    """
+    Fixed-width strings (the numpy str dtype), which take less memory than
+    objects and are compared without boxing; created for the
+    string columns of a frame with the mode.compact_strings option
+
+    Like an IntBlock, it cannot hold nulls; an operation which would store
+    a null, a wider string or a non-string operates on (and returns) an
+    ObjectBlock instead. The values are handed out (as a column, a row or
+    the values of the frame) as objects, as the other strings are
+    """
+    is_string = True
+
+    def get_values(self, dtype=None):
+        return self.values.astype(np.object_)
+
+    def get(self, item):
+        return self.iget(self.items.get_loc(item))
+
+    def iget(self, i):
+        value = self.values[i]
+        if isinstance(value, np.ndarray):
+            return value.astype(np.object_)
+        return value
+
+    def _can_hold_element(self, element):
+        element = np.asarray(element)
+        return (element.dtype.kind == self.dtype.kind and
+                element.dtype.itemsize <= self.dtype.itemsize)
+
+    def _try_cast(self, element):
+        return element
+
+    def _try_cast_result(self, result, dtype=None):
+        return result
+
+    def should_store(self, value):
+        return self._as_strings(value) is not None
+
+    def _as_strings(self, value):
+        """
+        value as my fixed-width strings, or None if it does not fit; the
+        columns handed out as objects are stored back without boxing
+        """
+        if (value.dtype == np.object_ and len(value) and
+                lib.infer_dtype(value) == 'string'):
+            value = value.astype(str)
+        if (value.dtype.kind == self.dtype.kind and
+                value.dtype.itemsize <= self.dtype.itemsize):
+            return value
+        return None
+
+    def _as_object(self):
+        """ an ObjectBlock of my values """
+        return make_block(self.values.astype(np.object_), self.items,
+                          self.ref_items, ndim=self.ndim, klass=ObjectBlock,
+                          fastpath=True, placement=self._ref_locs)
+
+    def set(self, item, value, check=False):
+        value = self._as_strings(value)
+        if value is None:
+            raise AssertionError('cannot set a value which is not a string '
+                                 'of at most %d characters in a %s block'
+                                 % (self._width, self.dtype))
+        super(StringBlock, self).set(item, value, check=check)
+
+    @property
+    def _width(self):
+        # 4 bytes per character of unicode
+        if self.dtype.kind == 'U':
+            return self.dtype.itemsize // 4
+        return self.dtype.itemsize
+
+    def setitem(self, indexer, value):
+        if self._can_hold_element(value):
+            return super(StringBlock, self).setitem(indexer, value)
+        return self._as_object().setitem(indexer, value)
+
+    def putmask(self, mask, new, align=True, inplace=False):
+        if self._can_hold_element(getattr(new, 'values', new)):
+            return super(StringBlock, self).putmask(mask, new, align=align,
+                                                    inplace=inplace)
+        return self._as_object().putmask(mask, new, align=align,
+                                         inplace=True)
+
+    def where(self, other, cond, align=True, raise_on_error=True,
+              try_cast=False):
+        if self._can_hold_element(getattr(other, 'values', other)):
+            return super(StringBlock, self).where(
+                other, cond, align=align, raise_on_error=raise_on_error,
+                try_cast=try_cast)
+        return self._as_object().where(other, cond, align=align,
+                                       raise_on_error=raise_on_error,
+                                       try_cast=try_cast)
+
+    def eval(self, func, other, raise_on_error=True, try_cast=False):
+        # compare with strings without boxing, otherwise as objects
+        values = getattr(other, 'values', other)
+        if not (isinstance(values, compat.string_types) or
+                com._is_fixed_string_dtype(values)):
+            return self._as_object().eval(func, other,
+                                          raise_on_error=raise_on_error,
+                                          try_cast=try_cast)
+        return super(StringBlock, self).eval(func, other,
+                                             raise_on_error=raise_on_error,
+                                             try_cast=try_cast)
+
+    def replace(self, *args, **kwargs):
+        kwargs['inplace'] = True
+        return self._as_object().replace(*args, **kwargs)
+
+
 class DatetimeBlock(Block):
     is_datetime = True
     _can_hold_na = True
@@ -1696,7 +2213,7 @@ class DatetimeBlock(Block):
                inplace=False, downcast=None):
 
         # straight putmask here
-        values = self.values if inplace else self.values.copy()
+        values = self._get_values_to_modify(inplace)
         mask = isnull(self.values)
         value = self._try_fill(value)
         if limit is not None:
@@ -1759,6 +2276,7 @@ class DatetimeBlock(Block):
         if value.dtype != _NS_DTYPE:
             value = tslib.cast_to_nanoseconds(value)
 
+        self._copy_if_shared()
         self.values[loc] = value
 
     def get_values(self, dtype=None):
@@ -1839,6 +2357,27 @@ class SparseBlock(Block):
     def sp_index(self):
         return self.values.sp_index
 
+    def null_mask(self):
+        # not cached, as the fill value may be set in place
+        mask = isnull(self.values.to_dense())
+        if self.ndim > 1:
+            mask = mask.reshape(self.shape)
+        return mask
+
+    def memory_usage(self, deep=False):
+        # the sparse values and the locations of the values
+        sp_index = self.sp_index
+        result = self.sp_values.nbytes
+        for name in ['indices', 'blocs', 'blengths']:
+            locations = getattr(sp_index, name, None)
+            if locations is not None:
+                result += locations.nbytes
+        if deep and self.sp_values.dtype == np.object_:
+            result += lib.memory_usage_of_objects(self.sp_values)
+        if self.ndim == 1:
+            return result
+        return np.array([result])
+
     @property
     def kind(self):
         return self.values.kind
@@ -2020,55 +2559,823 @@ class SparseBlock(Block):
         return result
 
 
-def make_block(values, items, ref_items, klass=None, ndim=None, dtype=None,
-               fastpath=False, placement=None):
-    if klass is None:
-        dtype = dtype or values.dtype
-        vtype = dtype.type
+class CategoricalBlock(Block):
 
-        if isinstance(values, SparseArray):
-            klass = SparseBlock
-        elif issubclass(vtype, np.floating):
-            klass = FloatBlock
-        elif (issubclass(vtype, np.integer) and
-                issubclass(vtype, np.timedelta64)):
-            klass = TimeDeltaBlock
-        elif (issubclass(vtype, np.integer) and
-                not issubclass(vtype, np.datetime64)):
-            klass = IntBlock
-        elif dtype == np.bool_:
-            klass = BoolBlock
-        elif issubclass(vtype, np.datetime64):
-            klass = DatetimeBlock
-        elif issubclass(vtype, np.complexfloating):
-            klass = ComplexBlock
+    """
+    A Categorical (integer codes into a set of levels) as a single item,
+    created for the Categorical columns of a frame
 
-        # try to infer a DatetimeBlock, or set to an ObjectBlock
-        else:
+    Taking, reindexing, shifting and filling act on the codes, and
+    comparisons and arithmetic with a scalar on the levels. The block
+    reports the dtype of its values, which it gives back for any other
+    operation (and when a column is extracted)
+    """
+    is_categorical = True
+    _can_hold_na = True
+    _can_consolidate = False
+    _verify_integrity = False
+    _ftype = 'category'
 
-            if np.prod(values.shape):
-                flat = values.ravel()
+    def __init__(self, values, items, ref_items, ndim=None, fastpath=False,
+                 placement=None):
+        self.ndim = 2
+        self._ref_locs = None
+        self.set_ref_locs(placement)
+        self.values = values
+        self._dtype = None
+        self._null_mask = None
+        if fastpath:
+            self.items = items
+            self.ref_items = ref_items
+        else:
+            self.items = _ensure_index(items)
+            self.ref_items = _ensure_index(ref_items)
 
-                # try with just the first element; we just need to see if
-                # this is a datetime or not
-                inferred_type = lib.infer_dtype(flat[0:1])
-                if inferred_type in ['datetime', 'datetime64']:
+        if len(self.items) != 1:
+            raise ValueError('a categorical block holds a single item, '
+                             'got %d' % len(self.items))
 
-                    # we have an object array that has been inferred as
-                    # datetime, so convert it
-                    try:
-                        values = tslib.array_to_datetime(
-                            flat).reshape(values.shape)
-                        if issubclass(values.dtype.type, np.datetime64):
-                            klass = DatetimeBlock
-                    except:  # it already object, so leave it
-                        pass
+    @property
+    def codes(self):
+        return self.values.labels
 
-            if klass is None:
-                klass = ObjectBlock
+    @property
+    def levels(self):
+        return self.values.levels
 
-    return klass(values, items, ref_items, ndim=ndim, fastpath=fastpath,
-                 placement=placement)
+    @property
+    def dtype(self):
+        # the dtype of the levels, which a missing value may upcast
+        if getattr(self, '_dtype', None) is None:
+            dtype = self.levels.dtype
+            if (self.codes == -1).any():
+                dtype, _ = com._maybe_promote(dtype)
+            self._dtype = np.dtype(dtype)
+        return self._dtype
+
+    @property
+    def shape(self):
+        return (len(self.items), len(self.values))
+
+    @property
+    def itemsize(self):
+        return self.dtype.itemsize
+
+    def __len__(self):
+        return len(self.items)
+
+    def make_block(self, labels, levels=None, items=None, ref_items=None,
+                   placement=None):
+        """ return a new block of labels into levels (default mine) """
+        if levels is None:
+            levels = self.levels
+        if items is None:
+            items = self.items
+        if ref_items is None:
+            ref_items = self.ref_items
+        values = Categorical(labels, levels, name=self.values.name)
+        return make_block(values, items, ref_items, klass=CategoricalBlock,
+                          fastpath=True, placement=placement)
+
+    def _isnull(self):
+        # the missing codes, and the codes of any null levels (infs, with
+        # mode.use_inf_as_null set)
+        codes = self.codes
+        mask = codes == -1
+        if len(self.levels):
+            mask |= isnull(self.levels.values).take(codes)
+        return mask.reshape(1, -1)
+
+    def _as_dense(self):
+        """ a block of my values """
+        return make_block(self.get_values(), self.items, self.ref_items,
+                          ndim=self.ndim, fastpath=True,
+                          placement=self._ref_locs)
+
+    def get_values(self, dtype=None):
+        values = np.asarray(self.values)
+        if dtype == object and values.dtype == _NS_DTYPE:
+            values = lib.map_infer(values, lib.Timestamp)
+        return values.reshape((1, len(values)))
+
+    def get(self, item):
+        return np.asarray(self.values)
+
+    def iget(self, i):
+        if isinstance(i, tuple):
+            value = self.values[i[-1]]
+            if isinstance(value, Categorical):
+                return np.asarray(value)
+            return value
+        return self.get_values()[i]
+
+    def _slice(self, slicer):
+        """ the Categorical of a slice of my rows """
+        if isinstance(slicer, tuple):
+            return self.values[slicer[-1]]
+        return self.values
+
+    def _try_operate(self, values):
+        return np.asarray(values)
+
+    def should_store(self, value):
+        return isinstance(value, Categorical)
+
+    def set(self, item, value, check=False):
+        self.values = value
+        self._dtype = None
+
+    def copy(self, deep=True, ref_items=None):
+        labels = self.codes
+        if deep:
+            labels = labels.copy()
+        return self.make_block(labels, ref_items=ref_items,
+                               placement=self._ref_locs)
+
+    def get_merge_length(self):
+        return 1
+
+    def memory_usage(self, deep=False):
+        # the codes and the (shared) levels
+        return np.array([self.codes.nbytes +
+                         self.levels.memory_usage(deep=deep)])
+
+    def equals(self, other):
+        if self.dtype != other.dtype or self.shape != other.shape:
+            return False
+        if getattr(other, 'is_categorical', False):
+            return self.values.equals(other.values)
+        return com.array_equivalent(self.get_values(), other.get_values())
+
+    def take(self, indexer, ref_items, new_axis, axis=1):
+        if axis < 1:
+            raise AssertionError('axis must be at least 1, got %d' % axis)
+
+        labels = com.take_1d(self.codes, indexer, allow_fill=False)
+
+        # GH6121
+        ref_locs = None
+        if not new_axis.is_unique:
+            ref_locs = self._ref_locs
+
+        return [self.make_block(labels, ref_items=ref_items,
+                                placement=ref_locs)]
+
+    def reindex_axis(self, indexer, method=None, axis=1, fill_value=None,
+                     limit=None, mask_info=None):
+        if axis < 1:
+            raise AssertionError('axis must be at least 1, got %d' % axis)
+
+        # a fill value other than a null may not be one of the levels
+        if fill_value is not None and notnull(fill_value):
+            return self._as_dense().reindex_axis(indexer, method=method,
+                                                 axis=axis,
+                                                 fill_value=fill_value,
+                                                 limit=limit,
+                                                 mask_info=mask_info)
+
+        labels = com.take_1d(self.codes, indexer, fill_value=-1,
+                             mask_info=mask_info)
+        return self.make_block(labels, placement=self._ref_locs)
+
+    def reindex_items_from(self, new_ref_items, indexer=None, method=None,
+                           fill_value=None, limit=None, copy=True):
+        """
+        Reindex to only those items contained in the input set of items
+
+        Returns
+        -------
+        reindexed : Block, or None if my item is not in new_ref_items
+        """
+        new_items = self.items & new_ref_items
+        if not len(new_items):
+            return None
+
+        labels = self.codes
+        if copy:
+            labels = labels.copy()
+        return self.make_block(labels, items=new_items,
+                               ref_items=new_ref_items)
+
+    def split_block_at(self, item):
+        if item == self.items[0]:
+            return []
+        return [self]
+
+    def fillna(self, value, limit=None, inplace=False, downcast=None):
+        # filling with a scalar is filling the codes, adding it as a level
+        # if it is not one already
+        if limit is not None or not np.isscalar(value) or isnull(value):
+            return self._as_dense().fillna(value, limit=limit, inplace=True,
+                                           downcast=downcast)
+
+        levels = self.levels
+        try:
+            code = levels.get_loc(value)
+        except (KeyError, TypeError):
+            code = len(levels)
+            levels = levels.append(Index([value]))
+        if not isinstance(code, (int, np.integer)):
+            return self._as_dense().fillna(value, inplace=True,
+                                           downcast=downcast)
+
+        labels = np.where(self.codes == -1, code, self.codes)
+        return [self.make_block(labels, levels=levels,
+                                placement=self._ref_locs)]
+
+    def shift(self, periods, axis=0):
+        if axis != self.ndim - 1:
+            return self._as_dense().shift(periods, axis=axis)
+
+        codes = self.codes
+        labels = np.empty_like(codes)
+        if periods > 0:
+            labels[:periods] = -1
+            labels[periods:] = codes[:-periods]
+        elif periods < 0:
+            labels[periods:] = -1
+            labels[:periods] = codes[-periods:]
+        else:
+            labels[:] = codes
+        return [self.make_block(labels, placement=self._ref_locs)]
+
+    def eval(self, func, other, raise_on_error=True, try_cast=False):
+        # a scalar is combined with each of the levels (and a null for the
+        # missing values), and the results taken by the codes
+        levels = self.levels
+        if (np.isscalar(other) and not
+                issubclass(levels.dtype.type, (np.datetime64,
+                                               np.timedelta64))):
+            codes = self.codes
+            lvalues = levels.values
+            missing = codes == -1
+            if missing.any():
+                lvalues = com.take_1d(lvalues, np.append(
+                    np.arange(len(lvalues)), -1))
+                codes = np.where(missing, len(levels), codes)
+            try:
+                with np.errstate(all='ignore'):
+                    lresult = func(lvalues, other)
+            except Exception:
+                lresult = None
+            if (isinstance(lresult, np.ndarray) and
+                    lresult.shape == lvalues.shape):
+                result = com.take_1d(lresult, codes, allow_fill=False)
+                return [make_block(result.reshape(self.shape), self.items,
+                                   self.ref_items, ndim=self.ndim,
+                                   fastpath=True, placement=self._ref_locs)]
+        return self._as_dense().eval(func, other,
+                                     raise_on_error=raise_on_error,
+                                     try_cast=try_cast)
+
+    def setitem(self, indexer, value):
+        return self._as_dense().setitem(indexer, value)
+
+    def putmask(self, mask, new, align=True, inplace=False):
+        return self._as_dense().putmask(mask, new, align=align, inplace=True)
+
+    def where(self, other, cond, align=True, raise_on_error=True,
+              try_cast=False):
+        return self._as_dense().where(other, cond, align=align,
+                                      raise_on_error=raise_on_error,
+                                      try_cast=try_cast)
+
+    def replace(self, *args, **kwargs):
+        kwargs['inplace'] = True
+        return self._as_dense().replace(*args, **kwargs)
+
+    def interpolate(self, *args, **kwargs):
+        kwargs['inplace'] = True
+        return self._as_dense().interpolate(*args, **kwargs)
+
+    def diff(self, *args, **kwargs):
+        return self._as_dense().diff(*args, **kwargs)
+
+    def astype(self, *args, **kwargs):
+        return self._as_dense().astype(*args, **kwargs)
+
+    def downcast(self, *args, **kwargs):
+        return self._as_dense().downcast(*args, **kwargs)
+
+    def to_native_types(self, *args, **kwargs):
+        return self._as_dense().to_native_types(*args, **kwargs)
+
+    def _try_cast_result(self, result, dtype=None):
+        return result
+
+
+def _dense_flag(name):
+    """ the flag of the block of the dtype of my values """
+    def f(self):
+        return getattr(self._dense_class, name)
+    f.__name__ = name
+    return property(f)
+
+
+class CompressedBlock(Block):
+
+    """
+    The values of a single item held compressed in memory (a
+    CompressedArray), created by DataFrame.compress for rarely used columns
+
+    The values are decompressed on access (slicing the rows and getting a
+    value only decompress the chunks holding them), through an LRU of the
+    decompressed chunks; any operation acts on, and gives back, the
+    decompressed values
+    """
+    is_compressed = True
+    _can_consolidate = False
+    _ftype = 'compressed'
+
+    is_numeric = _dense_flag('is_numeric')
+    is_float = _dense_flag('is_float')
+    is_integer = _dense_flag('is_integer')
+    is_complex = _dense_flag('is_complex')
+    is_datetime = _dense_flag('is_datetime')
+    is_timedelta = _dense_flag('is_timedelta')
+    is_bool = _dense_flag('is_bool')
+    _can_hold_na = _dense_flag('_can_hold_na')
+
+    def __init__(self, values, items, ref_items, ndim=None, fastpath=False,
+                 placement=None):
+        self.ndim = 2
+        self._ref_locs = None
+        self.set_ref_locs(placement)
+        self.values = values
+        self._null_mask = None
+        if fastpath:
+            self.items = items
+            self.ref_items = ref_items
+        else:
+            self.items = _ensure_index(items)
+            self.ref_items = _ensure_index(ref_items)
+
+        if len(self.items) != 1:
+            raise ValueError('a compressed block holds a single item, '
+                             'got %d' % len(self.items))
+        if values.shape != (1,) + values.shape[1:]:
+            raise ValueError('the compressed values must be of shape '
+                             '(1, length), got %s' % (values.shape,))
+
+    @property
+    def _dense_class(self):
+        """ the class of a block of my decompressed values """
+        return make_block(np.empty((1, 0), dtype=self.dtype), self.items,
+                          self.ref_items, fastpath=True).__class__
+
+    @property
+    def dtype(self):
+        return self.values.dtype
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    @property
+    def itemsize(self):
+        return self.dtype.itemsize
+
+    def __len__(self):
+        return len(self.items)
+
+    def make_block(self, values, items=None, ref_items=None, placement=None):
+        """ return a new block of the (compressed) values """
+        if items is None:
+            items = self.items
+        if ref_items is None:
+            ref_items = self.ref_items
+        return make_block(values, items, ref_items, klass=CompressedBlock,
+                          fastpath=True, placement=placement)
+
+    def _as_dense(self):
+        """ a block of my decompressed values """
+        return make_block(self.values.get_values(), self.items,
+                          self.ref_items, ndim=self.ndim, fastpath=True,
+                          placement=self._ref_locs)
+
+    def _isnull(self):
+        return isnull(self.values.get_values())
+
+    def get_values(self, dtype=None):
+        values = self.values.get_values()
+        if dtype == object and values.dtype == _NS_DTYPE:
+            values = lib.map_infer(values.ravel(), lib.Timestamp)\
+                        .reshape(values.shape)
+        return values
+
+    def get(self, item):
+        return self.values.get_values()[0]
+
+    def iget(self, i):
+        if isinstance(i, tuple) and len(i) == 2:
+            loc = i[-1]
+            if com.is_integer(loc):
+                if loc < 0:
+                    loc += self.shape[1]
+                if not 0 <= loc < self.shape[1]:
+                    raise IndexError('index %d is out of bounds' % i[-1])
+                return self.values.flat_slice(loc, loc + 1)[0]
+        return self.get_values()[i]
+
+    def _slice(self, slicer):
+        """ my values of a slice of my rows, decompressing only those """
+        if isinstance(slicer, tuple) and len(slicer) == 2:
+            slobj = slicer[-1]
+            if isinstance(slobj, slice) and slobj.step in (None, 1):
+                return self.values.flat_slice(slobj.start,
+                                              slobj.stop).reshape(1, -1)
+        return self.get_values()[slicer]
+
+    def _try_operate(self, values):
+        return np.asarray(values)
+
+    def should_store(self, value):
+        return False
+
+    def apply(self, func, **kwargs):
+        return self._as_dense().apply(func, **kwargs)
+
+    def copy(self, deep=True, ref_items=None):
+        # the compressed values are not modified, so are shared
+        return self.make_block(self.values, ref_items=ref_items,
+                               placement=self._ref_locs)
+
+    def prepare_for_merge(self, **kwargs):
+        return self._as_dense()
+
+    def get_merge_length(self):
+        return 1
+
+    def memory_usage(self, deep=False):
+        return np.array([self.values.nbytes])
+
+    def equals(self, other):
+        if self.dtype != other.dtype or self.shape != other.shape:
+            return False
+        if getattr(other, 'is_compressed', False):
+            return self.values.equals(other.values)
+        return com.array_equivalent(self.get_values(), other.get_values())
+
+    def reindex_items_from(self, new_ref_items, indexer=None, method=None,
+                           fill_value=None, limit=None, copy=True):
+        """
+        Reindex to only those items contained in the input set of items
+
+        Returns
+        -------
+        reindexed : Block, or None if my item is not in new_ref_items
+        """
+        new_items = self.items & new_ref_items
+        if not len(new_items):
+            return None
+        return self.make_block(self.values, items=new_items,
+                               ref_items=new_ref_items)
+
+    def split_block_at(self, item):
+        if item == self.items[0]:
+            return []
+        return [self]
+
+    def take(self, *args, **kwargs):
+        return self._as_dense().take(*args, **kwargs)
+
+    def reindex_axis(self, *args, **kwargs):
+        return self._as_dense().reindex_axis(*args, **kwargs)
+
+    def fillna(self, *args, **kwargs):
+        kwargs['inplace'] = True
+        return self._as_dense().fillna(*args, **kwargs)
+
+    def shift(self, *args, **kwargs):
+        return self._as_dense().shift(*args, **kwargs)
+
+    def eval(self, *args, **kwargs):
+        return self._as_dense().eval(*args, **kwargs)
+
+    def setitem(self, indexer, value):
+        return self._as_dense().setitem(indexer, value)
+
+    def putmask(self, mask, new, align=True, inplace=False):
+        return self._as_dense().putmask(mask, new, align=align, inplace=True)
+
+    def where(self, *args, **kwargs):
+        return self._as_dense().where(*args, **kwargs)
+
+    def replace(self, *args, **kwargs):
+        kwargs['inplace'] = True
+        return self._as_dense().replace(*args, **kwargs)
+
+    def interpolate(self, *args, **kwargs):
+        kwargs['inplace'] = True
+        return self._as_dense().interpolate(*args, **kwargs)
+
+    def diff(self, *args, **kwargs):
+        return self._as_dense().diff(*args, **kwargs)
+
+    def astype(self, *args, **kwargs):
+        return self._as_dense().astype(*args, **kwargs)
+
+    def downcast(self, *args, **kwargs):
+        return self._as_dense().downcast(*args, **kwargs)
+
+    def downcast_numeric(self, *args, **kwargs):
+        return self._as_dense().downcast_numeric(*args, **kwargs)
+
+    def to_native_types(self, *args, **kwargs):
+        return self._as_dense().to_native_types(*args, **kwargs)
+
+    def _try_cast_result(self, result, dtype=None):
+        return result
+
+
+# the 'mode.compact_strings' option, set by its callback so that it is not
+# looked up by every make_block
+_compact_strings = False
+
+
+def _set_compact_strings(key):
+    """ option change callback of 'mode.compact_strings' """
+    global _compact_strings
+    _compact_strings = get_option(key)
+
+
+def make_block(values, items, ref_items, klass=None, ndim=None, dtype=None,
+               fastpath=False, placement=None):
+    if isinstance(values, np.ma.MaskedArray) and klass is None:
+        values, klass = _masked_block_values(values)
+    elif isinstance(values, Categorical) and klass is None:
+        klass = CategoricalBlock
+    elif isinstance(values, CompressedArray) and klass is None:
+        klass = CompressedBlock
+    elif klass is CompressedBlock and not isinstance(values, CompressedArray):
+        # e.g. a slice of compressed values, which is decompressed
+        klass = None
+
+    if klass is None:
+        dtype = dtype or values.dtype
+        vtype = dtype.type
+
+        if isinstance(values, SparseArray):
+            klass = SparseBlock
+        elif issubclass(vtype, np.floating):
+            klass = FloatBlock
+        elif (issubclass(vtype, np.integer) and
+                issubclass(vtype, np.timedelta64)):
+            klass = TimeDeltaBlock
+        elif (issubclass(vtype, np.integer) and
+                not issubclass(vtype, np.datetime64)):
+            klass = IntBlock
+        elif dtype == np.bool_:
+            klass = BoolBlock
+        elif issubclass(vtype, np.datetime64):
+            klass = DatetimeBlock
+        elif issubclass(vtype, np.complexfloating):
+            klass = ComplexBlock
+        elif (issubclass(values.dtype.type, compat.string_types) and
+                _compact_strings):
+            klass = StringBlock
+
+        # try to infer a DatetimeBlock, or set to an ObjectBlock
+        else:
+
+            if np.prod(values.shape):
+                flat = values.ravel()
+
+                # try with just the first element; we just need to see if
+                # this is a datetime or not
+                inferred_type = lib.infer_dtype(flat[0:1])
+                if inferred_type in ['datetime', 'datetime64']:
+
+                    # we have an object array that has been inferred as
+                    # datetime, so convert it
+                    try:
+                        values = tslib.array_to_datetime(
+                            flat).reshape(values.shape)
+                        if issubclass(values.dtype.type, np.datetime64):
+                            klass = DatetimeBlock
+                    except:  # it already object, so leave it
+                        pass
+
+            if klass is None:
+                klass = ObjectBlock
+
+    return klass(values, items, ref_items, ndim=ndim, fastpath=fastpath,
+                 placement=placement)
+
+
+# the 'mode.integer_na' option, set by its callback so that it is not looked
+# up by every reindex
+_integer_na = 'upcast'
+
+
+def _set_integer_na(key):
+    """ option change callback of 'mode.integer_na' """
+    global _integer_na
+    _integer_na = get_option(key)
+
+
+def _masked_block_values(values):
+    """
+    the values and block class (None to infer it) for a masked array:
+    integer and boolean values with a masked value keep their mask, other
+    values are upcast with nulls where masked
+    """
+    mask = np.ma.getmaskarray(values)
+    if not mask.any():
+        return np.ma.getdata(values), None
+
+    vtype = values.dtype.type
+    if (issubclass(vtype, np.integer) and
+            not issubclass(vtype, (np.datetime64, np.timedelta64))):
+        return values, MaskedIntBlock
+    elif vtype == np.bool_:
+        return values, MaskedBoolBlock
+    return com._filled_upcast(values), None
+
+
+# copy-on-write: the blocks sharing the memory of an array,
+# id(base array) -> (ref to the base array, [refs to the blocks])
+_shared_values = dict()
+
+# the 'mode.copy_on_write' option, set by its callback so that it is not
+# looked up by every copy
+_copy_on_write = False
+
+
+def _set_copy_on_write(key):
+    """ option change callback of 'mode.copy_on_write' """
+    global _copy_on_write
+    _copy_on_write = get_option(key)
+
+
+def _values_base(values):
+    """ the array owning the memory of values """
+    while isinstance(values.base, np.ndarray):
+        values = values.base
+    return values
+
+
+def _share_values(*blocks):
+    """ record that the blocks share the memory of their values """
+    base = _values_base(blocks[0].values)
+    key = id(base)
+    entry = _shared_values.get(key)
+    if entry is None or entry[0]() is not base:
+
+        def remove(ref):
+            if _shared_values.get(key, (None,))[0] is ref:
+                del _shared_values[key]
+
+        entry = weakref.ref(base, remove), []
+        _shared_values[key] = entry
+
+    refs = entry[1]
+    for block in blocks:
+        if not any(ref() is block for ref in refs):
+            refs.append(weakref.ref(block))
+
+
+def _count_sharers(values, exclude=None):
+    """
+    the number of blocks (other than exclude) sharing the memory of values;
+    0 if it is not shared
+    """
+    if not _shared_values or not isinstance(values, np.ndarray):
+        return 0
+    base = _values_base(values)
+    entry = _shared_values.get(id(base))
+    if entry is None or entry[0]() is not base:
+        return 0
+
+    # forget the blocks which are gone or no longer hold this memory
+    blocks = [ref() for ref in entry[1]]
+    refs = [ref for ref, block in zip(entry[1], blocks)
+            if block is not None and _values_base(block.values) is base]
+    if len(refs) <= 1:
+        del _shared_values[id(base)]
+        return 0
+    entry[1][:] = refs
+    return sum(1 for ref in refs if ref() is not exclude)
+
+
+def _unshare_values(block):
+    entry = _shared_values.get(id(_values_base(block.values)))
+    if entry is not None:
+        entry[1][:] = [ref for ref in entry[1] if ref() is not block]
+
+
+def _readonly_if_shared(values):
+    """
+    a read-only view of values if their memory is shared (copy-on-write),
+    so they cannot be modified without copying
+    """
+    if _count_sharers(values):
+        values = values.view()
+        values.flags.writeable = False
+    return values
+
+
+class _Placement(object):
+
+    """
+    The placement of the (unique) items of a BlockManager,
+    item -> (block, location of the item in the block)
+
+    Splitting a block records the ranges of the block that moved to each of
+    the new blocks, rather than placing all of their items again; the
+    location of an item is brought up to date when it is looked up.
+
+    The position of an item in the items of the manager is kept likewise:
+    appending an item records its position, deleting one records the deleted
+    position, and the position of an item is its recorded position less the
+    deleted positions before it. Inserting an item elsewhere drops the
+    positions, which are computed again when needed.
+    """
+    __slots__ = ['locations', 'moved', 'positions', 'deleted']
+
+    def __init__(self, blocks):
+        self.locations = dict()
+        self.moved = dict()
+        self.positions = None
+        self.deleted = []
+        for block in blocks:
+            self.place(block)
+
+    def __contains__(self, item):
+        return item in self.locations
+
+    @property
+    def is_stale(self):
+        """ whether the recorded moves and deletions outnumber the items, so
+        placing the items again is cheaper than keeping them """
+        return (len(self.moved) + len(self.deleted) >
+                max(len(self.locations), _LAZY_MIN_BLOCKS))
+
+    def get_position(self, item, items):
+        """ the position of item in items, the items of the manager """
+        if self.positions is None:
+            self.positions = dict(zip(items, range(len(items))))
+            self.deleted = []
+        position = self.positions[item]
+        return position - bisect.bisect_left(self.deleted, position)
+
+    def insert_position(self, item, loc, n):
+        """ item is inserted at loc of the n items """
+        if self.positions is not None:
+            if loc == n:
+                self.positions[item] = n + len(self.deleted)
+            else:
+                self.positions = None
+
+    def delete_position(self, item):
+        if self.positions is not None:
+            bisect.insort(self.deleted, self.positions.pop(item))
+
+    def place(self, block):
+        """ place all of the items of block """
+        self.locations.update(zip(block.items, [(block, j) for j in
+                                                range(len(block.items))]))
+
+    def split(self, block, ranges):
+        """ ranges is a list of (start, stop, new block) of block """
+        self.moved[block] = ranges
+
+    def locate(self, item):
+        block, j = self.locations[item]
+        if block in self.moved:
+            while block in self.moved:
+                for start, stop, new_block in self.moved[block]:
+                    if start <= j < stop:
+                        block, j = new_block, j - start
+                        break
+                else:
+                    raise AssertionError('item [%s] was not moved from its '
+                                         'block' % com.pprint_thing(item))
+            self.locations[item] = block, j
+        return block, j
+
+    def remove(self, item):
+        location = self.locate(item)
+        del self.locations[item]
+        return location
+
+
+# the 'lazy' consolidation policy merges the blocks of a dtype when there are
+# more than _LAZY_MIN_BLOCKS to merge, and operating on them separately
+# (costing about _BLOCK_OVERHEAD values per block) costs more than copying
+# them into one block
+_LAZY_MIN_BLOCKS = 100
+_BLOCK_OVERHEAD = 10000
+
+# the 'mode.consolidation' option, set by its callback so that the policy
+# is not looked up by every operation
+_consolidation_mode = 'eager'
+
+
+def _set_consolidation_mode(key):
+    """ option change callback of 'mode.consolidation' """
+    global _consolidation_mode
+    _consolidation_mode = get_option(key)
 
 
 # TODO: flexible with index=None and/or items=None
@@ -2092,11 +3399,13 @@ class BlockManager(PandasObject):
     This is *not* a public API class
     """
     __slots__ = ['axes', 'blocks', '_ndim', '_shape', '_known_consolidated',
-                 '_is_consolidated', '_has_sparse', '_ref_locs', '_items_map']
+                 '_is_consolidated', '_has_sparse', '_ref_locs', '_items_map',
+                 '_placement', '_consolidation']
 
     def __init__(self, blocks, axes, do_integrity_check=True, fastpath=True):
         self.axes = [_ensure_index(ax) for ax in axes]
         self.blocks = blocks
+        self._placement = None
 
         ndim = self.ndim
         for block in blocks:
@@ -2176,6 +3485,68 @@ class BlockManager(PandasObject):
             # set/reset ref_locs based on the new index
             self._set_ref_locs(labels=value, do_refs=True)
 
+            # the items are relabeled, insert/delete maintain the placement
+            # themselves
+            if maybe_rename and maybe_rename != 'clear':
+                self._placement = None
+            elif getattr(self, '_placement', None):
+                self._placement.positions = None
+
+    def _shift_items(self, new_items, loc, shift):
+        """
+        set the items to new_items, which have an item inserted (shift=1) or
+        deleted (shift=-1) at loc; only the ref_locs which the blocks have
+        computed are shifted, rather than computing them again from the
+        items
+        """
+        self.axes[0] = new_items
+        self._shape = None
+        self._ref_locs = None
+        self._items_map = None
+        for block in self.blocks:
+            block.ref_items = new_items
+            ref_locs = block._ref_locs
+            if ref_locs is not None:
+                if shift > 0:
+                    block._ref_locs = ref_locs + (ref_locs >= loc)
+                else:
+                    block._ref_locs = ref_locs - (ref_locs > loc)
+
+    def _get_placement(self):
+        """
+        return the placement of the items (a _Placement), or None
+
+        the placement is built once, then maintained incrementally by set,
+        insert and delete (rather than searching the blocks for each item);
+        it is only kept for unique, non-null items of an Index or Int64Index
+        (other indexes have lookup semantics that a dict does not have)
+        """
+        placement = getattr(self, '_placement', None)
+        if placement is None:
+            items = self.items
+            if (type(items) not in (Index, Int64Index) or
+                    not items.is_unique or isnull(items.values).any()):
+                placement = False
+            else:
+                placement = _Placement(self.blocks)
+            self._placement = placement
+        return placement or None
+
+    def _locate(self, item):
+        """
+        return the (block, location in the block) of item, or None if the
+        placement is not maintained; raise KeyError if item is not contained
+        """
+        placement = self._get_placement()
+        if placement is None:
+            return None
+        try:
+            return placement.locate(item)
+        except TypeError:
+            return None
+        except KeyError:
+            raise KeyError('no item named %s' % com.pprint_thing(item))
+
     def _reset_ref_locs(self):
         """ take the current _ref_locs and reset ref_locs on the blocks
             to correctly map, ignoring Nones;
@@ -2296,12 +3667,10 @@ class BlockManager(PandasObject):
         # we have a non-duplicative index
         if rl is None:
 
-            axis = self.axes[0]
             for block in self.blocks:
 
                 m = maybe_create_block_in_items_map(im, block)
-                for i, item in enumerate(block.items):
-                    m[i] = axis.get_loc(item)
+                m[:] = block.ref_locs.tolist()
 
         # use the ref_locs to construct the map
         else:
@@ -2321,7 +3690,7 @@ class BlockManager(PandasObject):
 
     def _get_counts(self, f):
         """ return a dict of the counts of the function in BlockManager """
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
         counts = dict()
         for b in self.blocks:
             v = f(b)
@@ -2330,7 +3699,7 @@ class BlockManager(PandasObject):
 
     def _get_types(self, f):
         """ return a list of the f per item """
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         # unique
         if self.items.is_unique:
@@ -2375,7 +3744,7 @@ class BlockManager(PandasObject):
         for values, items in zip(bvalues, bitems):
 
             # numpy < 1.7 pickle compat
-            if values.dtype == 'M8[us]':
+            if getattr(values, 'dtype', None) == 'M8[us]':
                 values = values.astype('M8[ns]')
 
             blk = make_block(values, items, self.axes[0])
@@ -2387,6 +3756,7 @@ class BlockManager(PandasObject):
     def _post_setstate(self):
         self._is_consolidated = False
         self._known_consolidated = False
+        self._placement = None
         self._set_has_sparse()
 
     def __len__(self):
@@ -2455,11 +3825,12 @@ class BlockManager(PandasObject):
             return self.make_empty(axes or self.axes)
         bm = self.__class__(result_blocks, axes or self.axes,
                             do_integrity_check=do_integrity_check)
-        bm._consolidate_inplace()
+        bm._consolidation = getattr(self, '_consolidation', None)
+        bm._maybe_consolidate_inplace()
         return bm
 
     def isnull(self, **kwargs):
-        return self.apply('apply', **kwargs)
+        return self.apply('isnull', **kwargs)
 
     def where(self, **kwargs):
         return self.apply('where', **kwargs)
@@ -2488,6 +3859,9 @@ class BlockManager(PandasObject):
     def downcast(self, **kwargs):
         return self.apply('downcast', **kwargs)
 
+    def downcast_numeric(self, **kwargs):
+        return self.apply('downcast_numeric', **kwargs)
+
     def astype(self, dtype, **kwargs):
         return self.apply('astype', dtype=dtype, **kwargs)
 
@@ -2538,15 +3912,16 @@ class BlockManager(PandasObject):
             result_blocks.extend(rb)
 
         bm = self.__class__(result_blocks, self.axes)
-        bm._consolidate_inplace()
+        bm._maybe_consolidate_inplace()
         return bm
 
     def prepare_for_merge(self, **kwargs):
         """ prepare for merging, return a new block manager with
-        Sparse -> Dense
+        Sparse -> Dense, Masked -> Upcast
         """
-        self._consolidate_inplace()
-        if self._has_sparse:
+        self._maybe_consolidate_inplace()
+        if self._has_sparse or any(blk.is_masked or blk.is_compressed
+                                   for blk in self.blocks):
             return self.apply('prepare_for_merge', **kwargs)
         return self
 
@@ -2586,19 +3961,20 @@ class BlockManager(PandasObject):
     @property
     def is_mixed_type(self):
         # Warning, consolidation needs to get checked upstairs
-        self._consolidate_inplace()
+        # (a frame that is not mixed is used as a single block)
+        self._maybe_consolidate_inplace(view=True)
         return len(self.blocks) > 1
 
     @property
     def is_numeric_mixed_type(self):
         # Warning, consolidation needs to get checked upstairs
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
         return all([block.is_numeric for block in self.blocks])
 
     @property
     def is_datelike_mixed_type(self):
         # Warning, consolidation needs to get checked upstairs
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
         return any([block.is_datelike for block in self.blocks])
 
     def get_block_map(self, copy=False, typ=None, columns=None,
@@ -2620,7 +3996,7 @@ class BlockManager(PandasObject):
                 bm[str(b.ftype)].append(b)
             return bm
 
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
 
         if is_numeric:
             filter_blocks = lambda block: block.is_numeric
@@ -2724,7 +4100,7 @@ class BlockManager(PandasObject):
             new_blocks = self._slice_blocks(slobj, axis)
 
         bm = self.__class__(new_blocks, new_axes, do_integrity_check=False)
-        bm._consolidate_inplace()
+        bm._maybe_consolidate_inplace()
         return bm
 
     def _slice_blocks(self, slobj, axis):
@@ -2759,12 +4135,34 @@ class BlockManager(PandasObject):
         return _blocks_to_series_dict(self.blocks, self.axes[1])
 
     def __contains__(self, item):
+        placement = self._get_placement()
+        if placement is not None:
+            try:
+                return item in placement
+            except TypeError:
+                pass
         return item in self.items
 
     @property
     def nblocks(self):
         return len(self.blocks)
 
+    def memory_usage(self, deep=False):
+        """
+        the bytes of the values of each item, as an array in the order of
+        the items; if deep, also the Python objects held by object blocks
+        """
+        result = np.zeros(len(self.items), dtype=np.int64)
+        if self.items.is_unique:
+            for block in self.blocks:
+                result[block.ref_locs] = block.memory_usage(deep=deep)
+        else:
+            usage = dict((id(block), block.memory_usage(deep=deep))
+                         for block in self.blocks)
+            for i, (block, j) in enumerate(self._set_ref_locs()):
+                result[i] = usage[id(block)][j]
+        return result
+
     def copy(self, deep=True):
         """
         Make deep or shallow copy of BlockManager
@@ -2785,14 +4183,82 @@ class BlockManager(PandasObject):
         return self.apply('copy', axes=new_axes, deep=deep,
                           ref_items=new_axes[0], do_integrity_check=False)
 
-    def as_matrix(self, items=None):
+    def _copy_if_shared(self, item=None):
+        """
+        copy the values of the blocks (of the block of item, if passed) whose
+        memory is shared (copy-on-write), before modifying them outside of
+        the blocks; return if any were copied
+        """
+        if not _shared_values:
+            self._clear_null_masks()
+            return False
+        if item is None:
+            blocks = self.blocks
+        else:
+            blocks = [self._find_block(item)[1]]
+        copied = False
+        for block in blocks:
+            copied = block._copy_if_shared() or copied
+        return copied
+
+    def _clear_null_masks(self):
+        """ drop the cached null masks of the blocks, whose values are about
+        to be modified outside of them """
+        for block in self.blocks:
+            block._null_mask = None
+
+    def null_mask(self):
+        """
+        the null mask of the values (as_matrix), from the (possibly cached)
+        null masks of the blocks; None if the items are not unique
+        """
+        if len(self.blocks) == 1:
+            block = self.blocks[0]
+            if block.items.equals(self.items):
+                return block.null_mask()
+        if not self.items.is_unique:
+            return None
+
+        mask = np.empty(self.shape, dtype=bool)
+        for block in self.blocks:
+            mask[self.items.get_indexer(block.items)] = block.null_mask()
+        return mask
+
+    def null_counts(self, axis=0):
+        """
+        the number of null values of each item (axis=0), or along the items
+        for each position of axis; from the null masks of the blocks, which
+        keep their counts when cached; None if the items are not unique
+        """
+        if not self.items.is_unique:
+            return None
+
+        if axis == 0:
+            counts = np.zeros(len(self.items), dtype=np.int64)
+            for block in self.blocks:
+                counts[self.items.get_indexer(block.items)] = \
+                    block.null_counts()
+        else:
+            counts = np.zeros(self.shape[axis], dtype=np.int64)
+            for block in self.blocks:
+                counts += block.null_mask().sum(axis=0)
+        return counts
+
+    def as_matrix(self, items=None, masked=False):
+        """
+        the values of the blocks as a single array; masked returns the
+        values of a single masked block (with their mask) as they are
+        """
         if len(self.blocks) == 0:
             mat = np.empty(self.shape, dtype=float)
         elif len(self.blocks) == 1:
             blk = self.blocks[0]
-            if items is None or blk.items.equals(items):
+            if masked and blk.is_masked and (items is None or
+                                             blk.items.equals(items)):
+                mat = blk.values
+            elif items is None or blk.items.equals(items):
                 # if not, then just call interleave per below
-                mat = blk.get_values()
+                mat = _readonly_if_shared(blk.get_values())
             else:
                 mat = self.reindex_items(items).as_matrix()
         else:
@@ -2894,9 +4360,17 @@ class BlockManager(PandasObject):
         return the result and a flag if a copy was actually made
         """
         if len(self.blocks) == 1:
-            result = self.blocks[0].values[:, loc]
+            blk = self.blocks[0]
+            if blk.is_masked or blk.is_string:
+                # only the row is upcast (or boxed)
+                return blk.iget((slice(None), loc)), True
+            if blk.is_categorical or blk.is_compressed:
+                return blk.get_values()[:, loc], True
+            result = blk.values[:, loc]
             if copy:
                 result = result.copy()
+            else:
+                result = _readonly_if_shared(result)
             return result, copy
 
         items = self.items
@@ -2934,9 +4408,190 @@ class BlockManager(PandasObject):
         bm._consolidate_inplace()
         return bm
 
+    def unmask(self, categorical=True):
+        """
+        Return a BlockManager with the masked blocks (values with a mask of
+        their missing values) upcast, the compressed blocks decompressed and
+        the categorical blocks as blocks of their values, for writing the
+        values of the blocks
+
+        Parameters
+        ----------
+        categorical : boolean, default True
+            also write out the categorical blocks; False keeps them
+
+        Returns
+        -------
+        y : BlockManager
+        """
+        def _dense(blk):
+            if blk.is_masked:
+                return blk._as_upcast()
+            elif blk.is_compressed:
+                return blk._as_dense()
+            elif blk.is_categorical and categorical:
+                return blk._as_dense()
+            return blk
+
+        blocks = [_dense(blk) for blk in self.blocks]
+        if all(new is blk for new, blk in zip(blocks, self.blocks)):
+            return self
+        return self.__class__(blocks, self.axes)
+
+    def compress(self, items=None, compress=None, chunksize=None):
+        """
+        Return a BlockManager with the numeric, boolean and datetime values
+        of items (default all) compressed in memory, a block per item
+
+        Parameters
+        ----------
+        items : list-like, default None
+        compress : {'zlib', 'blosc'}, default None
+            the compressor; None is blosc if installed, else zlib
+        chunksize : int, default None
+            the number of values compressed together
+
+        Returns
+        -------
+        y : BlockManager
+        """
+        if self.ndim != 2:
+            raise NotImplementedError('can only compress the blocks of a '
+                                      'frame')
+        if not self.items.is_unique:
+            raise ValueError('cannot compress the items of a frame with '
+                             'duplicate items')
+        if items is not None:
+            items = _ensure_index(items)
+            missing = items - self.items
+            if len(missing):
+                raise KeyError('%s not in the items' % list(missing))
+
+        new_blocks = []
+        for blk in self.blocks:
+            # the masked (and categorical) values are kept as they are
+            if (not (blk.is_numeric or blk.is_datetime) or blk.is_sparse or
+                    blk.is_compressed or blk.is_masked or
+                    blk.is_categorical):
+                new_blocks.append(blk)
+                continue
+
+            if items is None:
+                selected = np.ones(len(blk.items), dtype=bool)
+            else:
+                selected = blk.items.isin(items)
+            if not selected.any():
+                new_blocks.append(blk)
+                continue
+
+            values = blk.values
+            for i in np.flatnonzero(selected):
+                arr = CompressedArray(values[i:i + 1], compress=compress,
+                                      chunksize=chunksize)
+                new_blocks.append(make_block(arr, blk.items[i:i + 1],
+                                             self.items, fastpath=True))
+            if not selected.all():
+                keep = ~selected
+                new_blocks.append(make_block(values[keep], blk.items[keep],
+                                             self.items, ndim=blk.ndim,
+                                             klass=blk.__class__,
+                                             fastpath=True))
+
+        return self.__class__(new_blocks, self.axes)
+
+    def decompress(self, items=None):
+        """
+        Return a BlockManager with the compressed values of items (default
+        all) decompressed
+        """
+        if items is not None:
+            items = _ensure_index(items)
+
+        def _dense(blk):
+            if blk.is_compressed and (items is None or blk.items[0] in items):
+                return blk._as_dense()
+            return blk
+
+        blocks = [_dense(blk) for blk in self.blocks]
+        if all(new is blk for new, blk in zip(blocks, self.blocks)):
+            return self
+        return self.__class__(blocks, self.axes)
+
+    def get_categorical(self, item):
+        """
+        the Categorical of a categorical item, or None if the item is not
+        categorical
+        """
+        _, blk = self._find_block(item)
+        if blk.is_categorical:
+            return blk.values
+        return None
+
+    def _maybe_consolidate(self, view=False):
+        """ consolidate(), if the consolidation policy calls for it """
+        if self._should_consolidate(view=view):
+            return self.consolidate()
+        return self
+
+    def _maybe_consolidate_inplace(self, view=False):
+        """ _consolidate_inplace(), if the consolidation policy calls for it """
+        if self._should_consolidate(view=view):
+            self._consolidate_inplace()
+
+    def _should_consolidate(self, view=False, mode=None):
+        """
+        whether to consolidate now, according to the consolidation policy
+        (the 'mode.consolidation' option)
+
+        Parameters
+        ----------
+        view : boolean, default False
+            the operation needs a single (2-D) block if the blocks are of a
+            single dtype, so they are consolidated whatever the policy
+        mode : {'eager', 'lazy', 'never'}, default the option
+        """
+        if self.is_consolidated():
+            return False
+        if mode is None:
+            mode = _consolidation_mode
+
+            # a manager created without consolidating its blocks (e.g. a
+            # frame of views of arrays) is consolidated lazily at most
+            if mode == 'eager' and getattr(self, '_consolidation',
+                                           None) == 'lazy':
+                mode = 'lazy'
+        if mode == 'eager':
+            return True
+        if view and len(set(b._consolidate_key for b in self.blocks)) == 1:
+            return True
+        if mode == 'never':
+            return False
+
+        merged, copied = self._fragmentation()
+        return (merged > _LAZY_MIN_BLOCKS and
+                merged * _BLOCK_OVERHEAD >= copied)
+
+    def _fragmentation(self):
+        """
+        return the number of blocks that consolidating would merge away, and
+        the number of values it would copy
+        """
+        sizes = defaultdict(list)
+        for b in self.blocks:
+            if b._can_consolidate:
+                sizes[b._consolidate_key].append(int(np.prod(b.shape)))
+
+        merged, copied = 0, 0
+        for s in sizes.values():
+            if len(s) > 1:
+                merged += len(s) - 1
+                copied += sum(s)
+        return merged, copied
+
     def _consolidate_inplace(self):
         if not self.is_consolidated():
             self.blocks = _consolidate(self.blocks, self.items)
+            self._placement = None
 
             # reset our mappings
             if not self.items.is_unique:
@@ -2955,8 +4610,17 @@ class BlockManager(PandasObject):
                 indexer = np.arange(len(self.items))[isnull(self.items)]
                 return self.get_for_nan_indexer(indexer)
 
+            location = self._locate(item)
+            if location is not None:
+                block, j = location
+                if block.is_sparse:
+                    return block.get(item)
+                return _readonly_if_shared(block.iget(j))
+
             _, block = self._find_block(item)
-            return block.get(item)
+            if block.is_sparse:
+                return block.get(item)
+            return _readonly_if_shared(block.get(item))
         else:
 
             if isnull(item):
@@ -2996,7 +4660,7 @@ class BlockManager(PandasObject):
 
         ref_locs = self._set_ref_locs()
         b, loc = ref_locs[i]
-        return b.iget(loc)
+        return _readonly_if_shared(b.iget(loc))
 
     def get_for_nan_indexer(self, indexer):
 
@@ -3010,7 +4674,7 @@ class BlockManager(PandasObject):
         # take a nan indexer and return the values
         ref_locs = self._set_ref_locs(do_refs='force')
         b, loc = ref_locs[indexer]
-        return b.iget(loc)
+        return _readonly_if_shared(b.iget(loc))
 
     def get_scalar(self, tup):
         """
@@ -3023,10 +4687,30 @@ class BlockManager(PandasObject):
         item_loc = blk.items.get_loc(item),
         full_loc = item_loc + tuple(ax.get_loc(x)
                                     for ax, x in zip(self.axes[1:], tup[1:]))
+        if blk.is_masked or blk.is_categorical or blk.is_compressed:
+            return blk.iget(full_loc)
         return blk.values[full_loc]
 
     def delete(self, item):
 
+        # the placement gives the position of the item, without hashing the
+        # items
+        placement = self._get_placement()
+        if (placement is not None and com._is_hashable(item) and
+                item in placement):
+            loc = placement.get_position(item, self.items)
+            i, _ = self._find_block(item)
+            self._delete_from_block(i, item)
+            placement.delete_position(item)
+
+            new_items = self.items.delete(loc)
+            new_items.is_unique = True
+            self._shift_items(new_items, loc, -1)
+            self._known_consolidated = False
+            if placement.is_stale:
+                self._placement = None
+            return
+
         is_unique = self.items.is_unique
         loc = self.items.get_loc(item)
 
@@ -3036,6 +4720,9 @@ class BlockManager(PandasObject):
 
         # _ref_locs, and _items_map are good here
         new_items = self.items.delete(loc)
+        if is_unique:
+            # no need to hash the new items to know this
+            new_items.is_unique = True
         self.set_items_norename(new_items)
 
         self._known_consolidated = False
@@ -3049,7 +4736,11 @@ class BlockManager(PandasObject):
         contained in the current set of items
         if check, then validate that we are not setting the same data in-place
         """
-        if not isinstance(value, SparseArray):
+        if isinstance(value, Categorical):
+            if len(value) != self.shape[1]:
+                raise AssertionError('Length of new values must be compatible '
+                                     'with manager shape')
+        elif not isinstance(value, SparseArray):
             if value.ndim == self.ndim - 1:
                 value = value.reshape((1,) + value.shape)
             if value.shape[1:] != self.shape[1:]:
@@ -3058,13 +4749,27 @@ class BlockManager(PandasObject):
 
         def _set_item(item, arr):
             i, block = self._find_block(item)
-            if not block.should_store(value):
+            if isinstance(value, Categorical):
+                store = block.is_categorical
+            else:
+                store = block.should_store(value)
+            if not store:
                 # delete from block, create and append new block
                 self._delete_from_block(i, item)
                 self._add_new_block(item, arr, loc=None)
             else:
                 block.set(item, arr, check=check)
 
+        # the placement answers membership without hashing the items
+        placement = self._get_placement()
+        if placement is not None and com._is_hashable(item):
+            if item in placement:
+                _set_item(item, value)
+            else:
+                self.insert(len(self.items), item, value)
+            self._known_consolidated = False
+            return
+
         try:
 
             loc = self.items.get_loc(item)
@@ -3111,12 +4816,28 @@ class BlockManager(PandasObject):
 
     def insert(self, loc, item, value, allow_duplicates=False):
 
-        if not allow_duplicates and item in self.items:
+        if not allow_duplicates and item in self:
             # Should this be a different kind of error??
             raise ValueError('cannot insert %s, already exists' % item)
 
+        placement = self._get_placement()
+        if (placement is not None and com._is_hashable(item) and
+                not lib.checknull(item) and item not in placement):
+            if self._insert_placed(placement, loc, item, value):
+                return
+
         try:
             new_items = self.items.insert(loc, item)
+
+            # keep the placement (and so the uniqueness of the items) if the
+            # new item can be placed
+            if placement is not None:
+                if (type(new_items) not in (Index, Int64Index) or
+                        not com._is_hashable(item) or lib.checknull(item) or
+                        item in placement):
+                    self._placement = None
+                else:
+                    new_items.is_unique = True
             self.set_items_norename(new_items)
 
             # new block
@@ -3127,13 +4848,14 @@ class BlockManager(PandasObject):
             # so our insertion operation failed, so back out of the new items
             # GH 3010
             new_items = self.items.delete(loc)
+            self._placement = None
             self.set_items_norename(new_items)
 
             # re-raise
             raise
 
         if len(self.blocks) > 100:
-            self._consolidate_inplace()
+            self._maybe_consolidate_inplace()
 
         self._known_consolidated = False
 
@@ -3141,6 +4863,34 @@ class BlockManager(PandasObject):
         if loc != len(self.items) - 1 and new_items.is_unique:
             self.set_items_clear(new_items)
 
+    def _insert_placed(self, placement, loc, item, value):
+        """
+        insert a new item which can be placed, shifting the ref_locs of the
+        blocks rather than computing them again; return False if the new
+        items can not keep the placement
+        """
+        n = len(self.items)
+        new_items = self.items.insert(loc, item)
+        if type(new_items) not in (Index, Int64Index):
+            return False
+
+        new_items.is_unique = True
+        self._shift_items(new_items, loc, 1)
+        try:
+            self._add_new_block(item, value, loc=loc)
+        except:
+            # back out of the new items, GH 3010
+            self._placement = None
+            self.set_items_norename(self.items.delete(loc))
+            raise
+        placement.insert_position(item, loc, n)
+
+        if len(self.blocks) > 100:
+            self._maybe_consolidate_inplace()
+
+        self._known_consolidated = False
+        return True
+
     def set_items_norename(self, value):
         self.set_axis(0, value, maybe_rename=False, check_axis=False)
         self._shape = None
@@ -3180,20 +4930,34 @@ class BlockManager(PandasObject):
         prev_items_map = self._items_map.pop(
             block) if ref_locs is not None else None
 
-        # if we can't consolidate, then we are removing this block in its
-        # entirey
-        if block._can_consolidate:
+        # a block which we can't consolidate (e.g. a sparse block) with a
+        # single item is removed in its entirety
+        split = block._can_consolidate or len(block.items) > 1
+
+        placement = getattr(self, '_placement', None)
+        if placement:
+            location = placement.remove(item)
+            if not split:
+                for itm in block.items:
+                    if itm in placement:
+                        placement.remove(itm)
+
+        if split:
 
             # compute the split mask
-            loc = block.items.get_loc(item)
+            if placement:
+                loc = location[1]
+            else:
+                loc = block.items.get_loc(item)
             if type(loc) == slice or com.is_integer(loc):
-                mask = np.array([True] * len(block))
+                mask = np.ones(len(block), dtype=bool)
                 mask[loc] = False
             else:  # already a mask, inverted
                 mask = -loc
 
             # split the block
             counter = 0
+            moved = []
             for s, e in com.split_ranges(mask):
 
                 sblock = make_block(block.values[s:e],
@@ -3203,6 +4967,9 @@ class BlockManager(PandasObject):
                                     fastpath=True)
 
                 self.blocks.append(sblock)
+                moved.append((s, e, sblock))
+                if ref_locs is None and block._ref_locs is not None:
+                    sblock._ref_locs = block._ref_locs[s:e].copy()
 
                 # update the _ref_locs/_items_map
                 if ref_locs is not None:
@@ -3227,6 +4994,9 @@ class BlockManager(PandasObject):
                     # set the ref_locs in this block
                     sblock.set_ref_locs(m)
 
+            if placement:
+                placement.split(block, moved)
+
         # reset the ref_locs to the new structure
         if ref_locs is not None:
 
@@ -3241,10 +5011,17 @@ class BlockManager(PandasObject):
 
         # hm, elaborate hack?
         if loc is None:
-            loc = self.items.get_loc(item)
+            placement = getattr(self, '_placement', None)
+            if placement:
+                loc = placement.get_position(item, self.items)
+            else:
+                loc = self.items.get_loc(item)
         new_block = make_block(value, self.items[loc:loc + 1].copy(),
                                self.items, fastpath=True)
         self.blocks.append(new_block)
+        if getattr(self, '_placement', None):
+            self._placement.place(new_block)
+            new_block.set_ref_locs([loc])
 
         # set ref_locs based on the this new block
         # and add to the ref/items maps
@@ -3267,6 +5044,11 @@ class BlockManager(PandasObject):
             self._set_ref_locs(do_refs=True)
 
     def _find_block(self, item):
+        location = self._locate(item)
+        if location is not None:
+            block = location[0]
+            return self.blocks.index(block), block
+
         self._check_have(item)
         for i, block in enumerate(self.blocks):
             if item in block:
@@ -3324,8 +5106,7 @@ class BlockManager(PandasObject):
         if not allow_dups and not self.axes[axis].is_unique and len(indexer):
             raise ValueError("cannot reindex from a duplicate axis")
 
-        if not self.is_consolidated():
-            self = self.consolidate()
+        self = self._maybe_consolidate()
 
         if axis == 0:
             return self._reindex_indexer_items(new_axis, indexer, fill_value)
@@ -3386,8 +5167,14 @@ class BlockManager(PandasObject):
                     continue
 
                 new_block_items = new_items.take(selector.nonzero()[0])
-                new_values = com.take_nd(blk.values, blk_indexer[selector], axis=0,
-                                         allow_fill=False)
+                if blk.is_categorical and len(new_block_items) == 1:
+                    new_values = blk.values
+                else:
+                    new_values = com.take_nd(blk.get_values()
+                                             if blk.is_categorical
+                                             else blk.values,
+                                             blk_indexer[selector], axis=0,
+                                             allow_fill=False)
                 placement = l[selector] if not is_unique else None
                 new_blocks.append(make_block(new_values,
                                              new_block_items,
@@ -3413,9 +5200,8 @@ class BlockManager(PandasObject):
 
         """
         new_items = _ensure_index(new_items)
-        data = self
-        if not data.is_consolidated():
-            data = data.consolidate()
+        data = self._maybe_consolidate()
+        if data is not self:
             return data.reindex_items(new_items, copy=copy,
                                       fill_value=fill_value)
 
@@ -3490,7 +5276,7 @@ class BlockManager(PandasObject):
         if axis < 1:
             raise AssertionError('axis must be at least 1, got %d' % axis)
 
-        self._consolidate_inplace()
+        self._maybe_consolidate_inplace()
         if isinstance(indexer, list):
             indexer = np.array(indexer)
 
@@ -3714,6 +5500,19 @@ class SingleBlockManager(BlockManager):
         self._block = self.blocks[0]
         self._values = self._block.values
 
+    def _get_placement(self):
+        # the items are the index of the series, a single block
+        return None
+
+    def memory_usage(self, deep=False):
+        return self._block.memory_usage(deep=deep)
+
+    def _copy_if_shared(self, item=None):
+        copied = self._block._copy_if_shared()
+        if copied:
+            self._values = self._block.values
+        return copied
+
     def _get_counts(self, f):
         return { f(self._block) : 1 }
 
@@ -3835,7 +5634,7 @@ class SingleBlockManager(BlockManager):
         """
         fast path for getting a cross-section
         """
-        result = self._block.values[loc]
+        result = _readonly_if_shared(self._block.values[loc])
         return result, False
 
 def construction_error(tot_items, block_shape, axes, e=None):
@@ -3857,7 +5656,7 @@ def create_block_manager_from_blocks(blocks, axes):
                 make_block(blocks[0], axes[0], axes[0], placement=placement)]
 
         mgr = BlockManager(blocks, axes)
-        mgr._consolidate_inplace()
+        mgr._maybe_consolidate_inplace()
         return mgr
 
     except (ValueError) as e:
@@ -3866,11 +5665,18 @@ def create_block_manager_from_blocks(blocks, axes):
         construction_error(tot_items, blocks[0].shape[1:], axes, e)
 
 
-def create_block_manager_from_arrays(arrays, names, axes):
+def create_block_manager_from_arrays(arrays, names, axes, consolidate=True):
+    """
+    if not consolidate, the manager holds a block for each of the arrays (a
+    view of it where its dtype allows), and is consolidated lazily
+    """
     try:
-        blocks = form_blocks(arrays, names, axes)
+        blocks = form_blocks(arrays, names, axes, consolidate=consolidate)
         mgr = BlockManager(blocks, axes)
-        mgr._consolidate_inplace()
+        if consolidate:
+            mgr._maybe_consolidate_inplace()
+        else:
+            mgr._consolidation = 'lazy'
         return mgr
     except (ValueError) as e:
         construction_error(len(arrays), arrays[0].shape[1:], axes, e)
@@ -3885,7 +5691,7 @@ def maybe_create_block_in_items_map(im, block):
     return l
 
 
-def form_blocks(arrays, names, axes):
+def form_blocks(arrays, names, axes, consolidate=True):
 
     # pre-filter out items if we passed it
     items = axes[0]
@@ -3905,8 +5711,15 @@ def form_blocks(arrays, names, axes):
     object_items = []
     sparse_items = []
     datetime_items = []
+    categorical_items = []
 
     for i, (k, v) in enumerate(zip(names, arrays)):
+        if isinstance(v, Categorical):
+            if items.is_unique:
+                categorical_items.append((i, k, v))
+                continue
+            v = np.asarray(v)
+
         if isinstance(v, (SparseArray, ABCSparseSeries)):
             sparse_items.append((i, k, v))
         elif issubclass(v.dtype.type, np.floating):
@@ -3933,8 +5746,34 @@ def form_blocks(arrays, names, axes):
         else:
             object_items.append((i, k, v))
 
+    # strings which take less memory with a fixed width
+    string_items = []
+    if len(object_items) and _compact_strings:
+        other_items = []
+        for i, k, v in object_items:
+            strings = _maybe_compact_strings(v)
+            if strings is None:
+                other_items.append((i, k, v))
+            else:
+                string_items.append((i, k, strings))
+        object_items = other_items
+
     is_unique = items.is_unique
     blocks = []
+
+    # a block for each array, holding a view of it, rather than stacking
+    # the arrays of a dtype (only the unique items can be placed)
+    if not consolidate and is_unique:
+        for item_list, dtype in [(float_items, None),
+                                 (complex_items, np.complex128),
+                                 (int_items, None),
+                                 (datetime_items, _NS_DTYPE),
+                                 (bool_items, np.bool_),
+                                 (object_items, np.object_),
+                                 (string_items, None)]:
+            blocks.extend(_single_blockify(item_list, items, dtype))
+            del item_list[:]
+
     if len(float_items):
         float_blocks = _multi_blockify(float_items, items, is_unique=is_unique)
         blocks.extend(float_blocks)
@@ -3963,10 +5802,19 @@ def form_blocks(arrays, names, axes):
             object_items, items, np.object_, is_unique=is_unique)
         blocks.extend(object_blocks)
 
+    if len(string_items) > 0:
+        string_blocks = _multi_blockify(string_items, items,
+                                        is_unique=is_unique)
+        blocks.extend(string_blocks)
+
     if len(sparse_items) > 0:
         sparse_blocks = _sparse_blockify(sparse_items, items)
         blocks.extend(sparse_blocks)
 
+    if len(categorical_items) > 0:
+        categorical_blocks = _categorical_blockify(categorical_items, items)
+        blocks.extend(categorical_blocks)
+
     if len(extra_items):
         shape = (len(extra_items),) + tuple(len(x) for x in axes[1:])
 
@@ -3982,6 +5830,22 @@ def form_blocks(arrays, names, axes):
     return blocks
 
 
+def _maybe_compact_strings(values):
+    """
+    the strings of an object array as fixed-width strings, or None if they
+    are not all (non-null) strings, or would not take less memory
+    """
+    values = np.asarray(values)
+    if (values.dtype != np.object_ or values.ndim != 1 or not len(values) or
+            lib.infer_dtype(values) != 'string'):
+        return None
+    strings = values.astype(str)
+    if strings.nbytes >= (values.nbytes +
+                          lib.memory_usage_of_objects(values)):
+        return None
+    return strings
+
+
 def _simple_blockify(tuples, ref_items, dtype, is_unique=True):
     """ return a single array of a block that has a single dtype; if dtype is
     not None, coerce to this dtype
@@ -4037,6 +5901,49 @@ def _sparse_blockify(tuples, ref_items, dtype=None):
     return new_blocks
 
 
+def _single_blockify(tuples, ref_items, dtype=None):
+    """ return a block for each of the arrays, of a view of the array; if
+    dtype is not None, the arrays of another dtype are coerced to it (a copy)
+    """
+
+    new_blocks = []
+    for i, name, array in tuples:
+        values = array.values if isinstance(array, ABCSeries) else array
+        values = np.asarray(values)
+        if dtype is not None and values.dtype != dtype:
+            new_blocks.extend(_simple_blockify([(i, name, array)], ref_items,
+                                               dtype))
+            continue
+        items = _array_items(ref_items, i, name)
+        block = make_block(values.reshape((1,) + values.shape), items,
+                           ref_items, fastpath=True)
+        new_blocks.append(block)
+
+    return new_blocks
+
+
+def _categorical_blockify(tuples, ref_items):
+    """ return a block for each of the (unique) categorical items """
+
+    new_blocks = []
+    for i, name, values in tuples:
+        items = _array_items(ref_items, i, name)
+        block = make_block(values, items, ref_items, klass=CategoricalBlock,
+                           fastpath=True)
+        new_blocks.append(block)
+
+    return new_blocks
+
+
+def _array_items(ref_items, i, name):
+    """ the items of a single array, the (length 1) slice of ref_items at
+    its position i in the names, or at the location of name if the names
+    are not all of the items """
+    if i >= len(ref_items) or ref_items[i] != name:
+        i = ref_items.get_loc(name)
+    return ref_items[i:i + 1]
+
+
 def _stack_arrays(tuples, ref_items, dtype):
 
     # fml
@@ -4098,6 +6005,16 @@ def _interleaved_dtype(blocks):
     for x in blocks:
         counts[type(x)].append(x)
 
+    # masked values interleave as their upcast dtype, and categorical and
+    # compressed values as their dtype
+    counts[FloatBlock].extend(counts.pop(MaskedIntBlock, []))
+    counts[ObjectBlock].extend(counts.pop(MaskedBoolBlock, []))
+    for x in (counts.pop(CategoricalBlock, []) +
+              counts.pop(CompressedBlock, [])):
+        klass = make_block(np.empty((1, 0), dtype=x.dtype), x.items,
+                           x.ref_items, fastpath=True).__class__
+        counts[klass].append(x)
+
     def _lcd_dtype(l):
         """ find the lowest dtype that can accomodate the given types """
         m = l[0].dtype
@@ -4114,9 +6031,11 @@ def _interleaved_dtype(blocks):
     have_dt64 = len(counts[DatetimeBlock]) > 0
     have_td64 = len(counts[TimeDeltaBlock]) > 0
     have_sparse = len(counts[SparseBlock]) > 0
+    have_string = len(counts[StringBlock]) > 0
     have_numeric = have_float or have_complex or have_int
 
-    if (have_object or
+    # the fixed-width strings interleave as objects
+    if (have_object or have_string or
         (have_bool and have_numeric) or
             (have_numeric and (have_dt64 or have_td64))):
         return np.dtype(object)
@@ -75,8 +75,11 @@ class bottleneck_switch(object):
                         result.fill(0)
                         return result
 
-                if _USE_BOTTLENECK and skipna and _bn_ok_dtype(values.dtype):
-                    result = bn_func(values, axis=axis, **kwds)
+                if (_USE_BOTTLENECK and skipna and _bn_ok_dtype(values.dtype)
+                        and not isinstance(values, np.ma.MaskedArray)):
+                    bn_kwds = dict((k, v) for k, v in compat.iteritems(kwds)
+                                   if k != 'mask')
+                    result = bn_func(values, axis=axis, **bn_kwds)
 
                     # prefer to treat inf/-inf as NA, but must compute the func
                     # twice :(
@@ -108,8 +111,10 @@ def _has_infs(result):
     return np.isinf(result) or np.isneginf(result)
 
 
-def _get_fill_value(dtype, fill_value=None, fill_value_typ=None):
-    """ return the correct fill value for the dtype of the values """
+def _get_fill_value(dtype, fill_value=None, fill_value_typ=None,
+                    masked=False):
+    """ return the correct fill value for the dtype of the values; masked
+    (integer) values are filled with the extremes of their dtype """
     if fill_value is not None:
         return fill_value
     if _na_ok_dtype(dtype):
@@ -123,6 +128,12 @@ def _get_fill_value(dtype, fill_value=None, fill_value_typ=None):
     else:
         if fill_value_typ is None:
             return tslib.iNaT
+        elif (masked and issubclass(dtype.type, np.integer) and
+                not issubclass(dtype.type, np.timedelta64)):
+            # the extremes of (possibly smaller) integers
+            if fill_value_typ == '+inf':
+                return np.iinfo(dtype).max
+            return np.iinfo(dtype).min
         else:
             if fill_value_typ == '+inf':
                 # need the max int here
@@ -132,15 +143,30 @@ def _get_fill_value(dtype, fill_value=None, fill_value_typ=None):
 
 
 def _get_values(values, skipna, fill_value=None, fill_value_typ=None,
-                isfinite=False, copy=True):
+                isfinite=False, copy=True, mask=None):
     """ utility to get the values view, mask, dtype
         if necessary copy and mask using the specified fill_value
-        copy = True will force the copy """
+        copy = True will force the copy
+        a passed mask (e.g. the cached null mask of a block) is used rather
+        than computing the null mask of the values """
     values = _values_from_object(values)
+
+    # values with a validity mask: skip the masked values of the data, rather
+    # than upcasting to hold nulls
+    masked = None
+    if isinstance(values, np.ma.MaskedArray):
+        if skipna:
+            masked = np.ma.getmaskarray(values)
+            values = np.ma.getdata(values)
+        else:
+            values = com._filled_upcast(values)
+
     if isfinite:
         mask = _isfinite(values)
-    else:
+    elif mask is None:
         mask = isnull(values)
+    if masked is not None:
+        mask = mask | masked
 
     dtype = values.dtype
     dtype_ok = _na_ok_dtype(dtype)
@@ -148,7 +174,8 @@ def _get_values(values, skipna, fill_value=None, fill_value_typ=None,
     # get our fill value (in case we need to provide an alternative
     # dtype for it)
     fill_value = _get_fill_value(dtype, fill_value=fill_value,
-                                 fill_value_typ=fill_value_typ)
+                                 fill_value_typ=fill_value_typ,
+                                 masked=masked is not None)
 
     if skipna:
         if copy:
@@ -168,6 +195,13 @@ def _get_values(values, skipna, fill_value=None, fill_value_typ=None,
     return values, mask, dtype
 
 
+def _unmask(values):
+    """ the values of a masked array, upcast and with nulls where masked """
+    if isinstance(values, np.ma.MaskedArray):
+        return com._filled_upcast(values)
+    return values
+
+
 def _isfinite(values):
     if issubclass(values.dtype.type, (np.timedelta64, np.datetime64)):
         return isnull(values)
@@ -215,20 +249,22 @@ def _wrap_results(result, dtype):
     return result
 
 
-def nanany(values, axis=None, skipna=True):
-    values, mask, dtype = _get_values(values, skipna, False, copy=skipna)
+def nanany(values, axis=None, skipna=True, mask=None):
+    values, mask, dtype = _get_values(values, skipna, False, copy=skipna,
+                                      mask=mask)
     return values.any(axis)
 
 
-def nanall(values, axis=None, skipna=True):
-    values, mask, dtype = _get_values(values, skipna, True, copy=skipna)
+def nanall(values, axis=None, skipna=True, mask=None):
+    values, mask, dtype = _get_values(values, skipna, True, copy=skipna,
+                                      mask=mask)
     return values.all(axis)
 
 
 @disallow('M8')
 @bottleneck_switch(zero_value=0)
-def nansum(values, axis=None, skipna=True):
-    values, mask, dtype = _get_values(values, skipna, 0)
+def nansum(values, axis=None, skipna=True, mask=None):
+    values, mask, dtype = _get_values(values, skipna, 0, mask=mask)
     the_sum = values.sum(axis)
     the_sum = _maybe_null_out(the_sum, axis, mask)
 
@@ -237,8 +273,8 @@ def nansum(values, axis=None, skipna=True):
 
 @disallow('M8')
 @bottleneck_switch()
-def nanmean(values, axis=None, skipna=True):
-    values, mask, dtype = _get_values(values, skipna, 0)
+def nanmean(values, axis=None, skipna=True, mask=None):
+    values, mask, dtype = _get_values(values, skipna, 0, mask=mask)
     the_sum = _ensure_numeric(values.sum(axis))
     count = _get_counts(mask, axis)
 
@@ -255,9 +291,10 @@ def nanmean(values, axis=None, skipna=True):
 
 @disallow('M8')
 @bottleneck_switch()
-def nanmedian(values, axis=None, skipna=True):
+def nanmedian(values, axis=None, skipna=True, mask=None):
+    values = _unmask(values)
 
-    values, mask, dtype = _get_values(values, skipna)
+    values, mask, dtype = _get_values(values, skipna, mask=mask)
 
     def get_median(x):
         mask = notnull(x)
@@ -292,11 +329,13 @@ def nanmedian(values, axis=None, skipna=True):
 
 @disallow('M8')
 @bottleneck_switch(ddof=1)
-def nanvar(values, axis=None, skipna=True, ddof=1):
-    if not isinstance(values.dtype.type, np.floating):
+def nanvar(values, axis=None, skipna=True, ddof=1, mask=None):
+    values = _unmask(values)
+    if not issubclass(values.dtype.type, np.floating):
         values = values.astype('f8')
 
-    mask = isnull(values)
+    if mask is None:
+        mask = isnull(values)
 
     if axis is not None:
         count = (values.shape[axis] - mask.sum(axis)).astype(float)
@@ -319,13 +358,15 @@ def nanvar(values, axis=None, skipna=True, ddof=1):
             np.putmask(d, mask, np.nan)
             np.putmask(count, mask, np.nan)
 
-    X = _ensure_numeric(values.sum(axis))
-    XX = _ensure_numeric((values ** 2).sum(axis))
+    # accumulate in float64 without upcasting float32 values up front
+    X = _ensure_numeric(values.sum(axis, dtype=np.float64))
+    XX = _ensure_numeric(np.square(values, dtype=np.float64).sum(axis))
     return np.fabs((XX - X ** 2 / count) / d)
 
 @bottleneck_switch()
-def nanmin(values, axis=None, skipna=True):
-    values, mask, dtype = _get_values(values, skipna, fill_value_typ='+inf')
+def nanmin(values, axis=None, skipna=True, mask=None):
+    values, mask, dtype = _get_values(values, skipna, fill_value_typ='+inf',
+                                      mask=mask)
 
     # numpy 1.6.1 workaround in Python 3.x
     if (values.dtype == np.object_ and compat.PY3):
@@ -353,8 +394,9 @@ def nanmin(values, axis=None, skipna=True):
 
 
 @bottleneck_switch()
-def nanmax(values, axis=None, skipna=True):
-    values, mask, dtype = _get_values(values, skipna, fill_value_typ='-inf')
+def nanmax(values, axis=None, skipna=True, mask=None):
+    values, mask, dtype = _get_values(values, skipna, fill_value_typ='-inf',
+                                      mask=mask)
 
     # numpy 1.6.1 workaround in Python 3.x
     if (values.dtype == np.object_ and compat.PY3):
@@ -405,11 +447,13 @@ def nanargmin(values, axis=None, skipna=True):
 
 
 @disallow('M8')
-def nanskew(values, axis=None, skipna=True):
+def nanskew(values, axis=None, skipna=True, mask=None):
+    values = _unmask(values)
     if not isinstance(values.dtype.type, np.floating):
         values = values.astype('f8')
 
-    mask = isnull(values)
+    if mask is None:
+        mask = isnull(values)
     count = _get_counts(mask, axis)
 
     if skipna:
@@ -439,11 +483,13 @@ def nanskew(values, axis=None, skipna=True):
 
 
 @disallow('M8')
-def nankurt(values, axis=None, skipna=True):
+def nankurt(values, axis=None, skipna=True, mask=None):
+    values = _unmask(values)
     if not isinstance(values.dtype.type, np.floating):
         values = values.astype('f8')
 
-    mask = isnull(values)
+    if mask is None:
+        mask = isnull(values)
     count = _get_counts(mask, axis)
 
     if skipna:
@@ -473,8 +519,10 @@ def nankurt(values, axis=None, skipna=True):
 
 
 @disallow('M8')
-def nanprod(values, axis=None, skipna=True):
-    mask = isnull(values)
+def nanprod(values, axis=None, skipna=True, mask=None):
+    values = _unmask(values)
+    if mask is None:
+        mask = isnull(values)
     if skipna and not issubclass(values.dtype.type, np.integer):
         values = values.copy()
         values[mask] = 1
@@ -438,6 +438,9 @@ def _arith_method_SERIES(op, name, str_rep=None, fill_zeros=None,
     code duplication.
     """
     def na_op(x, y):
+        if com._is_fixed_string_dtype(x):
+            # the results may not fit the width of the strings
+            x = x.astype(np.object_)
         try:
             result = expressions.evaluate(op, str_rep, x, y,
                                           raise_on_error=True, **eval_kwargs)
@@ -512,6 +515,12 @@ def _comp_method_SERIES(op, name, str_rep=None, masker=False):
     code duplication.
     """
     def na_op(x, y):
+        # fixed-width strings are compared vectorized with strings only
+        if (com._is_fixed_string_dtype(x) and
+                not (isinstance(y, compat.string_types) or
+                     com._is_fixed_string_dtype(y))):
+            x = x.astype(np.object_)
+
         if x.dtype == np.object_:
             if isinstance(y, list):
                 y = lib.list_to_object_array(y)
@@ -45,6 +45,7 @@ import pandas.core.ops as ops
 import pandas.core.common as com
 import pandas.core.datetools as datetools
 import pandas.core.format as fmt
+import pandas.core.internals as internals
 import pandas.core.nanops as nanops
 from pandas.util.decorators import Appender, Substitution, cache_readonly
 
@@ -339,6 +340,32 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
     def base(self):
         return self.values.base
 
+    def memory_usage(self, index=True, deep=False):
+        """
+        Memory usage of the series, in bytes
+
+        Parameters
+        ----------
+        index : boolean, default True
+            Include the memory usage of the index
+        deep : boolean, default False
+            Also count the Python objects of an object series (and index),
+            and the cached structures of the index (e.g. the hash table of
+            its engine)
+
+        Returns
+        -------
+        bytes : int
+
+        See Also
+        --------
+        Index.memory_usage, DataFrame.memory_usage
+        """
+        result = self._data.memory_usage(deep=deep)
+        if index:
+            result += self.index.memory_usage(deep=deep)
+        return int(result)
+
     def ravel(self, order='C'):
         return self.values.ravel(order=order)
 
@@ -357,6 +384,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
         return self.values.nonzero()
 
     def put(self, *args, **kwargs):
+        self._copy_on_write()
         self.values.put(*args, **kwargs)
 
     def __len__(self):
@@ -588,6 +616,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
             return self.values[indexer]
 
     def __setitem__(self, key, value):
+        self._copy_on_write()
         try:
             self._set_with_engine(key, value)
             return
@@ -763,6 +792,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
             If label is contained, will be reference to calling Series,
             otherwise a new object
         """
+        self._copy_on_write()
         try:
             if takeable:
                 self.values[label] = value
@@ -797,7 +827,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
         resetted : DataFrame, or Series if drop == True
         """
         if drop:
-            new_index = pa.arange(len(self))
+            new_index = _default_index(len(self))
             if level is not None and isinstance(self.index, MultiIndex):
                 if not isinstance(level, (tuple, list)):
                     level = [level]
@@ -1964,6 +1994,8 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
     def _reduce(self, op, axis=0, skipna=True, numeric_only=None,
                 filter_type=None, **kwds):
         """ perform a reduction operation """
+        if internals._cache_null_mask:
+            kwds['mask'] = self._data._block.null_mask()
         return op(_values_from_object(self), skipna=skipna, **kwds)
 
     def _reindex_indexer(self, new_index, indexer, copy):
@@ -142,6 +142,13 @@ cdef class HashTable:
     pass
 
 
+cdef inline Py_ssize_t _table_nbytes(khint_t n_buckets, size_t key_size):
+    # the keys, the (size_t) values and the flags, 2 bits per bucket in
+    # 32 bit words
+    return (n_buckets * (key_size + sizeof(size_t)) +
+            (1 if n_buckets < 16 else n_buckets >> 4) * sizeof(uint32_t))
+
+
 cdef class StringHashTable(HashTable):
     cdef kh_str_t *table
 
@@ -157,6 +164,10 @@ cdef class StringHashTable(HashTable):
     def __dealloc__(self):
         kh_destroy_str(self.table)
 
+    def sizeof(self):
+        """ the bytes of the table (not of the strings) """
+        return _table_nbytes(self.table.n_buckets, sizeof(char*))
+
     cdef inline int check_type(self, object val):
         return util.is_string_object(val)
 
@@ -371,6 +382,10 @@ cdef class Int64HashTable: #(HashTable):
     def __dealloc__(self):
         kh_destroy_int64(self.table)
 
+    def sizeof(self):
+        """ the bytes of the table """
+        return _table_nbytes(self.table.n_buckets, sizeof(int64_t))
+
     def __contains__(self, object key):
         cdef khiter_t k
         k = kh_get_int64(self.table, key)
@@ -552,6 +567,10 @@ cdef class Float64HashTable(HashTable):
     def __dealloc__(self):
         kh_destroy_float64(self.table)
 
+    def sizeof(self):
+        """ the bytes of the table """
+        return _table_nbytes(self.table.n_buckets, sizeof(float64_t))
+
     def factorize(self, ndarray[float64_t] values):
         uniques = Float64Vector()
         labels = self.get_labels(values, uniques, 0, -1)
@@ -656,6 +675,12 @@ cdef class PyObjectHashTable(HashTable):
         if self.table is not NULL:
             self.destroy()
 
+    def sizeof(self):
+        """ the bytes of the table (not of the objects) """
+        if self.table is NULL:
+            return 0
+        return _table_nbytes(self.table.n_buckets, sizeof(PyObject*))
+
     def __len__(self):
         return self.table.size
 
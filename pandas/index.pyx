@@ -66,6 +66,10 @@ def set_value_at(ndarray arr, object loc, object val):
 # Don't populate hash tables in monotonic indexes larger than this
 _SIZE_CUTOFF = 1000000
 
+# the cost of hashing a value of the index into its hash table, relative to a
+# step of a binary search of the values
+_HASH_COST = 8
+
 
 cdef class IndexEngine:
 
@@ -77,12 +81,20 @@ cdef class IndexEngine:
     cdef:
         bint unique, monotonic
         bint initialized, monotonic_check, unique_check
+        Py_ssize_t n, depth, searched
 
     def __init__(self, vgetter, n):
         self.vgetter = vgetter
 
         self.over_size_threshold = n >= _SIZE_CUTOFF
 
+        # the steps of a binary search of the values
+        self.n = n
+        self.depth = 1
+        while (1 << self.depth) < n:
+            self.depth += 1
+        self.searched = 0
+
         self.initialized = 0
         self.monotonic_check = 0
 
@@ -90,6 +102,13 @@ cdef class IndexEngine:
         self.monotonic = 0
 
     def __contains__(self, object val):
+        if self._searchable() and self._use_search(1):
+            try:
+                self._search_loc(val)
+                return True
+            except KeyError:
+                return False
+
         self._ensure_mapping_populated()
         hash(val)
         return val in self.mapping
@@ -130,14 +149,8 @@ cdef class IndexEngine:
         if is_definitely_invalid_key(val):
             raise TypeError
 
-        if self.over_size_threshold and self.is_monotonic:
-            if not self.is_unique:
-                return self._get_loc_duplicates(val)
-            values = self._get_index_values()
-            loc = _bin_search(values, val) # .searchsorted(val, side='left')
-            if util.get_value_at(values, loc) != val:
-                raise KeyError(val)
-            return loc
+        if self._use_search(1):
+            return self._search_loc(val)
 
         self._ensure_mapping_populated()
         if not self.unique:
@@ -150,6 +163,43 @@ cdef class IndexEngine:
         except TypeError:
             raise KeyError(val)
 
+    cdef _search_loc(self, object val):
+        """ get_loc by a binary search of the (monotonic) values """
+        if not self.is_unique:
+            return self._get_loc_duplicates(val)
+
+        self._check_type(val)
+
+        values = self._get_index_values()
+        try:
+            loc = _bin_search(values, val) # .searchsorted(val, side='left')
+        except TypeError:
+            raise KeyError(val)
+        if loc == len(values) or util.get_value_at(values, loc) != val:
+            raise KeyError(val)
+        return loc
+
+    cdef bint _searchable(self):
+        """ whether vectors of values are looked up by a sorted search """
+        return 0
+
+    cdef bint _use_search(self, Py_ssize_t m) except -1:
+        """
+        whether to look up m values by a binary search of the values, which
+        are monotonic, rather than through the hash table: a search costs
+        about depth steps per value, and building the hash table (once)
+        about _HASH_COST steps per value of the index. The values looked up
+        are counted until the hash table is worth building
+        """
+        if self.over_size_threshold:
+            return self.is_monotonic
+        if self.initialized or not self._searchable():
+            return 0
+        if not self.is_monotonic:
+            return 0
+        self.searched += m
+        return self.searched * self.depth <= _HASH_COST * self.n
+
     cdef inline _get_loc_duplicates(self, object val):
         cdef:
             Py_ssize_t diff
@@ -231,6 +281,11 @@ cdef class IndexEngine:
         return self.vgetter()
 
     cdef inline _do_unique_check(self):
+        # the monotonic check finds the duplicates of the sorted values
+        if self._searchable() and not self.monotonic_check:
+            self._do_monotonic_check()
+            if self.unique_check:
+                return
         self._ensure_mapping_populated()
 
     def _call_monotonic(self, values):
@@ -262,6 +317,12 @@ cdef class IndexEngine:
         self.mapping = None
         self.initialized = 0
 
+    def sizeof(self):
+        """ the bytes of the hash table, if it is populated """
+        if self.mapping is None:
+            return 0
+        return self.mapping.sizeof()
+
     def get_indexer(self, values):
         self._ensure_mapping_populated()
         return self.mapping.lookup(values)
@@ -337,6 +398,47 @@ cdef class Int64Engine(IndexEngine):
     cdef _get_index_values(self):
         return algos.ensure_int64(self.vgetter())
 
+    cdef bint _searchable(self):
+        return 1
+
+    def get_indexer(self, values):
+        if values.dtype == np.int64 and self._use_search(len(values)):
+            return self._search_indexer(values)
+        self._ensure_mapping_populated()
+        return self.mapping.lookup(values)
+
+    def get_indexer_non_unique(self, targets):
+        targets = np.asarray(targets)
+        if targets.dtype == np.int64 and self._use_search(2 * len(targets)):
+            return self._search_indexer_non_unique(targets)
+        return IndexEngine.get_indexer_non_unique(self, targets)
+
+    cdef _search_indexer(self, ndarray[int64_t] targets):
+        """ the locations of the targets in the (monotonic, unique) values,
+        -1 if missing """
+        values = self._get_index_values()
+        if len(values) == 0:
+            return np.repeat(-1, len(targets)).astype(np.int64)
+        indexer = algos.ensure_int64(values.searchsorted(targets, side='left'))
+        found = values.take(np.minimum(indexer, len(values) - 1))
+        indexer[found != targets] = -1
+        return indexer
+
+    cdef _search_indexer_non_unique(self, ndarray[int64_t] targets):
+        """ get_indexer_non_unique by a search of the (monotonic) values """
+        values = self._get_index_values()
+        left = values.searchsorted(targets, side='left')
+        counts = values.searchsorted(targets, side='right') - left
+
+        # a -1 for each missing target
+        missing = (counts == 0).nonzero()[0]
+        counts[missing] = 1
+
+        starts = counts.cumsum() - counts
+        result = np.arange(counts.sum()) - np.repeat(starts - left, counts)
+        result[starts[missing]] = -1
+        return algos.ensure_int64(result), algos.ensure_int64(missing)
+
     cdef _make_hash_table(self, n):
         return _hash.Int64HashTable(n)
 
@@ -465,13 +567,20 @@ cdef class ObjectEngine(IndexEngine):
 cdef class DatetimeEngine(Int64Engine):
 
     def __contains__(self, object val):
-        if self.over_size_threshold and self.is_monotonic:
+        if self._use_search(1):
+            conv = _to_i8(val)
             if not self.is_unique:
-                return self._get_loc_duplicates(val)
+                try:
+                    self._get_loc_duplicates(conv)
+                    return True
+                except KeyError:
+                    return False
+            if not util.is_integer_object(conv):
+                return False
             values = self._get_index_values()
-            conv = _to_i8(val)
             loc = values.searchsorted(conv, side='left')
-            return util.get_value_at(values, loc) == conv
+            return (loc < len(values) and
+                    util.get_value_at(values, loc) == conv)
 
         self._ensure_mapping_populated()
         return _to_i8(val) in self.mapping
@@ -488,12 +597,14 @@ cdef class DatetimeEngine(Int64Engine):
 
         # Welcome to the spaghetti factory
 
-        if self.over_size_threshold and self.is_monotonic:
+        if self._use_search(1):
             if not self.is_unique:
                 val = _to_i8(val)
                 return self._get_loc_duplicates(val)
             values = self._get_index_values()
             conv = _to_i8(val)
+            if not util.is_integer_object(conv):
+                self._date_check_type(conv)
             loc = values.searchsorted(conv, side='left')
             if loc == len(values) or util.get_value_at(values, loc) != conv:
                 raise KeyError(val)
@@ -524,10 +635,12 @@ cdef class DatetimeEngine(Int64Engine):
             raise KeyError(val)
 
     def get_indexer(self, values):
-        self._ensure_mapping_populated()
         if values.dtype != 'M8[ns]':
             return np.repeat(-1, len(values)).astype('i4')
         values = np.asarray(values).view('i8')
+        if self._use_search(len(values)):
+            return self._search_indexer(values)
+        self._ensure_mapping_populated()
         return self.mapping.lookup(values)
 
     def get_pad_indexer(self, other, limit=None):
@@ -0,0 +1,559 @@
+"""
+Out-of-core evaluation over the rows of an HDFStore table
+
+A ``ChunkedFrame`` is a lazy view of a table: column selections, ``where``
+criteria and elementwise operations only build up the function that is
+applied to each chunk of rows, and nothing is read until the frame is
+reduced, aggregated, iterated or written out. Reductions and group-by
+aggregations are computed as partial results per chunk, which are then
+merged, so the memory used is bounded by the chunksize (and the size of the
+result).
+"""
+
+import operator
+
+import numpy as np
+
+from pandas import compat
+from pandas.compat import u, lrange
+from pandas.core.base import StringMixin
+from pandas.core.frame import DataFrame
+from pandas.core.series import Series
+from pandas.core.common import pprint_thing
+from pandas.io.pytables import HDFStore, _ensure_term
+from pandas.tools.merge import concat
+
+# how each partial aggregate is merged
+_merge_aggs = {'sum': 'sum',
+               'prod': 'prod',
+               'count': 'sum',
+               'size': 'sum',
+               'min': 'min',
+               'max': 'max',
+               'first': 'first',
+               'last': 'last',
+               'mean': None}
+
+
+class ChunkedFrame(StringMixin):
+
+    """
+    A lazy, chunk-by-chunk view of a table in an HDFStore
+
+    Parameters
+    ----------
+    store : HDFStore
+    key : the key of a table in the store
+    where : list of Term (or convertable) objects, optional
+        the criteria are applied when the rows are read
+    columns : list, optional
+        only read these columns
+    chunksize : int, optional
+        the number of rows of the table to read at a time, default 100000
+    prefetch : int, optional
+        read up to this many chunks ahead in a background thread, while the
+        current chunk is computed on
+
+    Examples
+    --------
+    >>> cf = ChunkedFrame(store, 'df', where='index>20130101')
+    >>> cf[cf['A'] > 0]['B'].mean()
+    >>> cf.groupby('key')['A'].sum()
+    >>> (cf['A'] * 2).to_hdf(store, 'result')
+    """
+
+    def __init__(self, store, key, where=None, columns=None, chunksize=None,
+                 prefetch=None):
+        if not isinstance(store, HDFStore):
+            raise TypeError("a ChunkedFrame must wrap an HDFStore, not "
+                            "[%s]" % type(store).__name__)
+        storer = store.get_storer(key)
+        if not storer.is_table:
+            raise TypeError("a ChunkedFrame can only wrap a table, [%s] is "
+                            "in the fixed format" % key)
+
+        if chunksize is None:
+            chunksize = 100000
+
+        self.store = store
+        self.key = key
+        self.where = _ensure_term(where, scope_level=1)
+        self.columns = None if columns is None else list(columns)
+        self.chunksize = int(chunksize)
+        self.prefetch = prefetch
+        self._func = None
+
+    def _view(self, func, columns, where=None):
+        """ a ChunkedFrame of the same table computing func of each chunk
+        (which is read with columns and our, or the passed, where) """
+        result = object.__new__(ChunkedFrame)
+        result.store = self.store
+        result.key = self.key
+        result.where = self.where if where is None else where
+        result.columns = columns
+        result.chunksize = self.chunksize
+        result.prefetch = self.prefetch
+        result._func = func
+        return result
+
+    def __unicode__(self):
+        output = u('%s: %s (chunksize->%d)') % (type(self).__name__,
+                                                pprint_thing(self.key),
+                                                self.chunksize)
+        if self.columns is not None:
+            output += u('\ncolumns: %s') % pprint_thing(self.columns)
+        if self.where is not None:
+            output += u('\nwhere: %s') % pprint_thing(self.where)
+        if self._func is not None:
+            output += u('\n[lazily evaluated]')
+        return output
+
+    #----------------------------------------------------------------------
+    # evaluation
+
+    def _evaluate(self, chunk):
+        """ compute the result for a chunk of the table """
+        if self._func is None:
+            return chunk
+        return self._func(chunk)
+
+    def _derive(self, func, columns=None):
+        """ return a new ChunkedFrame computing func of our results """
+        evaluate = self._evaluate
+        if columns is None:
+            columns = self.columns
+        return self._view(lambda chunk: func(evaluate(chunk)), columns)
+
+    def _combine_with(self, other, func):
+        """ return a new ChunkedFrame computing func(ours, theirs) for each
+        chunk; other must be a ChunkedFrame of the same selection """
+        if not self._is_aligned(other):
+            raise ValueError("can only combine ChunkedFrames of the same "
+                             "table, where and chunksize")
+
+        columns = None
+        if self.columns is not None and other.columns is not None:
+            columns = list(self.columns)
+            columns.extend([c for c in other.columns if c not in columns])
+
+        evaluate, other_evaluate = self._evaluate, other._evaluate
+        return self._view(lambda chunk: func(evaluate(chunk),
+                                             other_evaluate(chunk)), columns)
+
+    def _is_aligned(self, other):
+        return (self.store is other.store and self.key == other.key and
+                self.where is other.where and
+                self.chunksize == other.chunksize)
+
+    def __iter__(self):
+        """ iterate over the results of each chunk """
+        for chunk in self.store.select(self.key, where=self.where,
+                                       columns=self.columns,
+                                       chunksize=self.chunksize,
+                                       prefetch=self.prefetch):
+            yield self._evaluate(chunk)
+
+    def _empty(self):
+        """ the result for no rows, for the dtypes and columns """
+        chunk = self.store.select(self.key, where=self.where,
+                                  columns=self.columns, start=0, stop=0)
+        return self._evaluate(chunk)
+
+    def _partials(self, func):
+        """ a list of func of the result of each chunk """
+        partials = [func(result) for result in self]
+        if not len(partials):
+            partials = [func(self._empty())]
+        return partials
+
+    def compute(self):
+        """ return the concatenated results of all of the chunks; this must
+        fit in memory """
+        results = list(self)
+        if not len(results):
+            return self._empty()
+        return concat(results)
+
+    def head(self, n=5):
+        """ return the first n rows of the results, only reading the chunks
+        that are needed """
+        results, nrows = [], 0
+        for result in self:
+            results.append(result)
+            nrows += len(result)
+            if nrows >= n:
+                break
+        if not len(results):
+            return self._empty()
+        return concat(results).iloc[:n]
+
+    #----------------------------------------------------------------------
+    # selection
+
+    def __getitem__(self, key):
+        if isinstance(key, ChunkedFrame):
+            return self._combine_with(key, lambda l, r: l[r])
+
+        columns = self.columns
+        if self._func is None:
+            # we are reading the table directly, so only read the
+            # selected columns
+            if isinstance(key, (list, tuple, np.ndarray)):
+                columns = list(key)
+            else:
+                columns = [key]
+        return self._derive(lambda result: result[key], columns=columns)
+
+    def select(self, where=None, columns=None):
+        """
+        return a new ChunkedFrame restricted to the where criteria (which
+        are combined with our own) and columns
+
+        Parameters
+        ----------
+        where : list of Term (or convertable) objects, optional
+        columns : list, optional
+
+        Returns
+        -------
+        ChunkedFrame
+        """
+        if self._func is not None:
+            raise ValueError("can only select from a ChunkedFrame that reads "
+                             "the table directly")
+
+        where = _ensure_term(where, scope_level=1)
+        if where is None:
+            where = self.where
+        elif self.where is not None:
+            where = _as_list(self.where) + _as_list(where)
+        if columns is None:
+            columns = self.columns
+        return self._view(None, columns, where=where)
+
+    #----------------------------------------------------------------------
+    # elementwise operations
+
+    def apply(self, func):
+        """
+        return a new ChunkedFrame computing func of the result of each chunk
+
+        func should be elementwise (or row-wise), as it only ever sees a
+        chunk of the rows at a time
+        """
+        return self._derive(func)
+
+    def abs(self):
+        return self._derive(lambda result: result.abs())
+
+    def isnull(self):
+        return self._derive(lambda result: result.isnull())
+
+    def notnull(self):
+        return self._derive(lambda result: result.notnull())
+
+    def fillna(self, value):
+        return self._derive(lambda result: result.fillna(value))
+
+    def astype(self, dtype):
+        return self._derive(lambda result: result.astype(dtype))
+
+    def __neg__(self):
+        return self._derive(operator.neg)
+
+    def __invert__(self):
+        return self._derive(operator.inv)
+
+    def __abs__(self):
+        return self.abs()
+
+    #----------------------------------------------------------------------
+    # reductions
+
+    def _reduce(self, how):
+        partials = self._partials(lambda result: getattr(result, how)())
+        return _merge_partials(partials, _merge_aggs[how])
+
+    def sum(self):
+        """ the sum of the values, skipping nulls """
+        return self._reduce('sum')
+
+    def count(self):
+        """ the number of non-null values """
+        return self._reduce('count')
+
+    def min(self):
+        """ the minimum of the values, skipping nulls """
+        return self._reduce('min')
+
+    def max(self):
+        """ the maximum of the values, skipping nulls """
+        return self._reduce('max')
+
+    def mean(self):
+        """ the mean of the (numeric) values, skipping nulls """
+        def f(result):
+            if isinstance(result, DataFrame):
+                result = result._get_numeric_data()
+            return result.sum(), result.count()
+
+        partials = self._partials(f)
+        sums = _merge_partials([p[0] for p in partials], 'sum')
+        counts = _merge_partials([p[1] for p in partials], 'sum')
+        if isinstance(sums, Series):
+            counts = counts.reindex(sums.index)
+        return sums / _as_float(counts)
+
+    def value_counts(self):
+        """ the counts of the unique values (of a single column), in
+        descending order """
+        def f(result):
+            if not isinstance(result, Series):
+                raise TypeError("value_counts is only defined for a single "
+                                "column")
+            return result.value_counts()
+
+        partials = self._partials(f)
+        counts = concat(partials)
+        counts = counts.groupby(level=0).sum()
+        return counts.order(ascending=False)
+
+    #----------------------------------------------------------------------
+    # group by
+
+    def groupby(self, by):
+        """
+        group the rows of each chunk by the column name(s) by, or by a
+        ChunkedFrame of the same selection
+
+        Returns
+        -------
+        ChunkedGroupBy
+        """
+        return ChunkedGroupBy(self, by)
+
+    #----------------------------------------------------------------------
+    # output
+
+    def to_hdf(self, path_or_buf, key, append=False, **kwargs):
+        """
+        write the results of each chunk to a table, chunk by chunk
+
+        Parameters
+        ----------
+        path_or_buf : the path (string) or HDFStore to write to
+        key : string
+        append : boolean, default False
+            append to an existing table, rather than replacing it
+        kwargs : passed to HDFStore.append
+        """
+        if isinstance(path_or_buf, HDFStore):
+            store = path_or_buf
+        else:
+            store = HDFStore(path_or_buf, mode='a')
+
+        try:
+            if store is self.store and _same_key(self.key, key):
+                raise ValueError("cannot write the results of a "
+                                 "ChunkedFrame over its own table")
+
+            if not append and key in store:
+                store.remove(key)
+
+            for result in self:
+                if len(result):
+                    store.append(key, result, **kwargs)
+        finally:
+            if store is not path_or_buf:
+                store.close()
+
+
+def _add_binary_ops(cls):
+    """ add the arithmetic and comparison operators to the class """
+    ops = dict(add=operator.add, sub=operator.sub, mul=operator.mul,
+               truediv=operator.truediv, floordiv=operator.floordiv,
+               mod=operator.mod, pow=operator.pow,
+               eq=operator.eq, ne=operator.ne, lt=operator.lt,
+               le=operator.le, gt=operator.gt, ge=operator.ge,
+               and_=operator.and_, or_=operator.or_, xor=operator.xor)
+    ops['div'] = operator.truediv
+
+    def make(op, reverse=False):
+        def f(self, other):
+            if reverse:
+                func = lambda l, r: op(r, l)
+            else:
+                func = op
+            if isinstance(other, ChunkedFrame):
+                return self._combine_with(other, func)
+            return self._derive(lambda result: func(result, other))
+        return f
+
+    for name, op in compat.iteritems(ops):
+        name = name.rstrip('_')
+        setattr(cls, '__%s__' % name, make(op))
+        if name not in ('eq', 'ne', 'lt', 'le', 'gt', 'ge'):
+            setattr(cls, '__r%s__' % name, make(op, reverse=True))
+
+_add_binary_ops(ChunkedFrame)
+
+
+class ChunkedGroupBy(object):
+
+    """
+    A group by over the chunks of a ChunkedFrame; each chunk is aggregated
+    separately, and the partial aggregates are then merged
+
+    The supported aggregations are sum, prod, count, size, min, max, first,
+    last and mean.
+    """
+
+    def __init__(self, obj, by, selection=None):
+        self.obj = obj
+        self.by = by
+        self.selection = selection
+
+    def __getitem__(self, key):
+        return ChunkedGroupBy(self.obj, self.by, selection=key)
+
+    def aggregate(self, arg):
+        """
+        Parameters
+        ----------
+        arg : string or dict
+            the name of an aggregation, or a dict of column -> name
+
+        Returns
+        -------
+        the aggregated Series or DataFrame
+        """
+        if isinstance(arg, dict):
+            specs = list(compat.iteritems(arg))
+        else:
+            specs = [(self.selection, arg)]
+
+        for column, how in specs:
+            if how not in _merge_aggs:
+                raise ValueError("cannot aggregate chunks with [%s], only "
+                                 "with %s" % (how, sorted(_merge_aggs)))
+
+        obj, by = self.obj, self.by
+        keys = by if isinstance(by, list) else [by]
+        lazy = [k for k in keys if isinstance(k, ChunkedFrame)]
+        for k in lazy:
+            if not obj._is_aligned(k):
+                raise ValueError("can only group by a ChunkedFrame of the "
+                                 "same table, where and chunksize")
+
+        # read the chunks and evaluate the groupers
+        def partial(chunk):
+            result = obj._evaluate(chunk)
+            grouper = [k._evaluate(chunk) if isinstance(k, ChunkedFrame)
+                       else k for k in keys]
+            if not isinstance(by, list):
+                grouper = grouper[0]
+            grouped = result.groupby(grouper)
+
+            partials = []
+            for column, how in specs:
+                g = grouped if column is None else grouped[column]
+                if how == 'mean':
+                    partials.append((g.sum(), g.count()))
+                else:
+                    partials.append(getattr(g, how)())
+            return partials
+
+        columns = obj.columns
+        if obj._func is None and not lazy and all(c is not None
+                                                  for c, h in specs):
+            # only read the groupers and the aggregated columns
+            columns = list(keys)
+            for column, how in specs:
+                if not isinstance(column, list):
+                    column = [column]
+                columns.extend([c for c in column if c not in columns])
+        elif columns is not None and lazy:
+            columns = list(columns)
+            for k in lazy:
+                if k.columns is None:
+                    columns = None
+                    break
+                columns.extend([c for c in k.columns if c not in columns])
+
+        reader = obj._view(None, columns)
+        partials = reader._partials(partial)
+
+        results = []
+        for i, (column, how) in enumerate(specs):
+            if how == 'mean':
+                sums = _merge_groups([p[i][0] for p in partials], 'sum')
+                counts = _merge_groups([p[i][1] for p in partials], 'sum')
+                if isinstance(sums, DataFrame):
+                    counts = counts.reindex(columns=sums.columns)
+                results.append(sums / _as_float(counts))
+            else:
+                results.append(_merge_groups([p[i] for p in partials],
+                                             _merge_aggs[how]))
+
+        if isinstance(arg, dict):
+            return concat(results, axis=1, keys=[c for c, h in specs])
+        return results[0]
+
+    agg = aggregate
+
+    def sum(self):
+        return self.aggregate('sum')
+
+    def prod(self):
+        return self.aggregate('prod')
+
+    def count(self):
+        return self.aggregate('count')
+
+    def size(self):
+        return self.aggregate('size')
+
+    def min(self):
+        return self.aggregate('min')
+
+    def max(self):
+        return self.aggregate('max')
+
+    def first(self):
+        return self.aggregate('first')
+
+    def last(self):
+        return self.aggregate('last')
+
+    def mean(self):
+        return self.aggregate('mean')
+
+
+def _merge_partials(partials, how):
+    """ merge the reductions of each chunk """
+    if isinstance(partials[0], Series):
+        # a row per chunk, so each column keeps its own dtype
+        return getattr(DataFrame(partials), how)()
+    return getattr(Series(partials), how)()
+
+
+def _merge_groups(partials, how):
+    """ merge the group by aggregations of each chunk """
+    merged = concat(partials)
+    return getattr(merged.groupby(level=lrange(merged.index.nlevels)), how)()
+
+
+def _as_float(values):
+    if isinstance(values, (Series, DataFrame)):
+        return values.astype('float64')
+    return np.float64(values)
+
+
+def _as_list(where):
+    if isinstance(where, (list, tuple)):
+        return list(where)
+    return [where]
+
+
+def _same_key(a, b):
+    return a.strip('/') == b.strip('/')
@@ -2,9 +2,10 @@
 
 import sys
 import zipfile
+import threading
 from contextlib import contextmanager, closing
 
-from pandas.compat import StringIO
+from pandas.compat import StringIO, queue
 from pandas import compat
 
 
@@ -136,6 +137,93 @@ def get_filepath_or_buffer(filepath_or_buffer, encoding=None):
     return filepath_or_buffer, None
 
 
+class PrefetchIterator(object):
+
+    """ iterate over an iterator, reading up to prefetch items ahead of
+        the consumer in a background thread, so that the reading (I/O,
+        parsing, decompression) overlaps with the processing of the items
+
+        Parameters
+        ----------
+
+        iterator : the iterator to read; it is only ever advanced (and
+            closed, if it has a close method) by the background thread
+        prefetch : the maximum number of items read ahead (the size of the
+            queue between the threads)
+        """
+
+    _done = object()
+
+    def __init__(self, iterator, prefetch):
+        if not isinstance(prefetch, compat.integer_types) or prefetch < 1:
+            raise ValueError("prefetch must be a positive integer, "
+                             "not [%s]" % prefetch)
+
+        self._queue = queue.Queue(maxsize=prefetch)
+        self._stop = threading.Event()
+        self._finished = False
+        self._thread = threading.Thread(target=self._run, args=(iterator,))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self, iterator):
+        try:
+            try:
+                for item in iterator:
+                    if not self._put((item, None)):
+                        return
+            except Exception:
+                self._put((None, sys.exc_info()))
+                return
+            self._put((self._done, None))
+        finally:
+            close = getattr(iterator, 'close', None)
+            if close is not None:
+                close()
+
+    def _put(self, item):
+        """ put an item on the queue, waiting while it is full unless we
+        are closed; return False if we are """
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._finished:
+            raise StopIteration
+
+        item, exc_info = self._queue.get()
+        if exc_info is not None:
+            self.close()
+            compat.raise_with_traceback(exc_info[1], exc_info[2])
+        if item is self._done:
+            self.close()
+            raise StopIteration
+        return item
+
+    next = __next__
+
+    def close(self):
+        """ stop the background thread, discarding the items that were
+        read ahead """
+        self._finished = True
+        self._stop.set()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+
 def file_path_to_url(path):
     """
     converts an absolute native path to a FILE URL.
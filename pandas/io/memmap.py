@@ -0,0 +1,386 @@
+"""
+A memory-mapped columnar format for DataFrames
+
+A frame is written to a directory holding a JSON schema and one raw file
+per block (in the C-ordered (items x rows) layout of the block), so that
+reading wraps ``np.memmap`` views of the files directly into the blocks and
+only the pages that are accessed are read from disk. Object (string)
+columns are written as an array of offsets into a heap of utf-8 encoded
+bytes; both are memory-mapped when read, and a block of strings is only
+decoded when its values are first accessed.
+"""
+
+import os
+import json
+
+import numpy as np
+
+from pandas import compat
+from pandas.compat import text_type
+from pandas.core.index import Index, MultiIndex, _ensure_index
+from pandas.core.internals import Block, BlockManager, ObjectBlock, make_block
+from pandas.tseries.index import DatetimeIndex
+import pandas.core.common as com
+import pandas.lib as lib
+
+_SCHEMA = '_schema.json'
+_VERSION = 1
+
+
+def to_mmap(path, frame):
+    """
+    Write a DataFrame to the directory path, in a memory-mappable format
+
+    Parameters
+    ----------
+    path : string
+        Directory path, created if it does not exist
+    frame : DataFrame
+    """
+    if not os.path.isdir(path):
+        os.makedirs(path)
+
+    data = frame._data
+    if not data.is_consolidated():
+        data = data.consolidate()
+    data = data.unmask()
+
+    blocks = []
+    for i, b in enumerate(data.blocks):
+        if b.is_sparse:
+            raise TypeError("cannot write a sparse block in the mmap format")
+
+        positions = [int(p) for p in b.ref_locs]
+        if b.is_object:
+            arrays = [_write_values(path, 'block%d_item%d' % (i, j), v)
+                      for j, v in enumerate(b.values)]
+            blocks.append(dict(kind='strings', positions=positions,
+                               arrays=arrays))
+        else:
+            blocks.append(dict(kind='raw', positions=positions,
+                               values=_write_values(path, 'block%d' % i,
+                                                    b.values)))
+
+    schema = dict(version=_VERSION,
+                  nrows=len(frame.index),
+                  columns=_index_to_schema(path, 'columns', frame.columns),
+                  index=_index_to_schema(path, 'index', frame.index),
+                  blocks=blocks)
+
+    # the schema is written last, once all of the data is
+    try:
+        text = json.dumps(schema)
+    except TypeError as detail:
+        raise TypeError("cannot write the axes of this frame in the mmap "
+                        "format -> %s" % detail)
+    with open(os.path.join(path, _SCHEMA), 'w') as fh:
+        fh.write(text)
+
+
+def read_mmap(path, columns=None, mode='c'):
+    """
+    Load a DataFrame written by ``to_mmap``, as memory-mapped blocks
+
+    Parameters
+    ----------
+    path : string
+        Directory path
+    columns : list, optional
+        Only load these columns; the strings of the other object columns are
+        not decoded
+    mode : {'c', 'r'}, default 'c'
+        ``'c'`` maps the files copy-on-write: the frame may be modified
+        without changing the files. ``'r'`` maps the files read-only.
+
+    Returns
+    -------
+    DataFrame
+    """
+    from pandas.core.frame import DataFrame
+
+    if mode not in ['c', 'r']:
+        raise ValueError("mode must be 'c' or 'r'")
+
+    with open(os.path.join(path, _SCHEMA)) as fh:
+        schema = json.load(fh)
+    if schema.get('version') != _VERSION:
+        raise ValueError("unsupported mmap format version [%s]"
+                         % schema.get('version'))
+
+    nrows = schema['nrows']
+    items = _index_from_schema(path, schema['columns'], mode)
+    index = _index_from_schema(path, schema['index'], mode)
+
+    # map the position of each selected item to its new position(s)
+    if columns is None:
+        new_items = items
+        locs = dict([(p, [p]) for p in range(len(items))])
+    else:
+        new_items = _ensure_index(columns)
+        indexer = items.get_indexer(new_items)
+        if (indexer == -1).any():
+            raise KeyError("columns %s are not in the frame"
+                           % list(new_items[indexer == -1]))
+        locs = dict()
+        for new, old in enumerate(indexer):
+            locs.setdefault(old, []).append(new)
+
+    blocks = []
+    for spec in schema['blocks']:
+        positions = spec['positions']
+        selected = [(j, new) for j, p in enumerate(positions)
+                    for new in locs.get(p, [])]
+        if not selected:
+            continue
+
+        if spec['kind'] == 'strings':
+            heaps = [_read_values(path, spec['arrays'][j], mode)
+                     for j, new in selected]
+            placement = [new for j, new in selected]
+            blocks.append(make_block(_StringColumns(heaps, nrows),
+                                     new_items.take(placement), new_items,
+                                     klass=_LazyStringBlock,
+                                     placement=placement))
+            continue
+
+        values = _read_values(path, spec['values'], mode)
+        if len(selected) == len(positions) and columns is None:
+            blocks.append(_make_block(values, positions, new_items))
+        else:
+            # a view of each item, rather than a copy of the selection
+            for j, new in selected:
+                blocks.append(_make_block(values[j:j + 1], [new], new_items))
+
+    # the blocks are built from the schema; checking their shapes would
+    # decode the strings
+    mgr = BlockManager(blocks, [new_items, index], do_integrity_check=False)
+    return DataFrame(mgr)
+
+
+def _make_block(values, placement, items):
+    return make_block(values, items.take(placement), items,
+                      placement=placement)
+
+
+def _write_values(path, name, values):
+    """ write an array to the files of name, returning its spec """
+    if values.dtype == np.object_:
+        return _write_strings(path, name, values)
+
+    values = np.ascontiguousarray(values)
+    values.tofile(os.path.join(path, name + '.dat'))
+    return dict(kind='raw', file=name + '.dat', dtype=values.dtype.str,
+                shape=list(values.shape))
+
+
+def _write_strings(path, name, values):
+    """ write a 1-dim object array of strings as offsets into a heap of
+    utf-8 encoded bytes (and a mask of the nulls, if any) """
+    mask = com.isnull(values)
+    valid = values[~mask]
+    inferred_type = lib.infer_dtype(valid)
+    if inferred_type not in ['string', 'unicode', 'empty']:
+        raise TypeError("cannot write [%s] in the mmap format, only strings "
+                        "(and nulls) are supported for object data, not "
+                        "[%s]" % (name, inferred_type))
+
+    encoded = [v.encode('utf-8') if isinstance(v, text_type) else v
+               for v in valid]
+    lengths = np.zeros(len(values), dtype=np.int64)
+    lengths[~mask] = [len(v) for v in encoded]
+    offsets = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    offsets.tofile(os.path.join(path, name + '_offsets.dat'))
+    with open(os.path.join(path, name + '_heap.dat'), 'wb') as fh:
+        fh.write(compat.binary_type().join(encoded))
+
+    nulls = None
+    if mask.any():
+        nulls = name + '_nulls.dat'
+        mask.astype(np.uint8).tofile(os.path.join(path, nulls))
+
+    return dict(kind='strings', offsets=name + '_offsets.dat',
+                heap=name + '_heap.dat', nulls=nulls, length=len(values))
+
+
+def _read_values(path, spec, mode):
+    """ map (or decode) the array of the spec """
+    if spec['kind'] == 'strings':
+        return _read_strings(path, spec, mode)
+
+    dtype = np.dtype(str(spec['dtype']))
+    shape = tuple(spec['shape'])
+    if not np.prod(shape):
+        return np.empty(shape, dtype=dtype)
+
+    # a plain ndarray view of the map, rather than a memmap
+    return np.asarray(np.memmap(os.path.join(path, spec['file']),
+                                dtype=dtype, mode=mode, shape=shape))
+
+
+def _read_strings(path, spec, mode):
+    """ map the offsets and the heap of a column of strings """
+    return _StringHeap(path, spec)
+
+
+class _StringHeap(object):
+
+    """
+    A column of strings, as the memory-mapped offsets into a heap of their
+    utf-8 encoded bytes (and the mask of the nulls, if any); a string is only
+    decoded when it is accessed
+    """
+
+    def __init__(self, path, spec):
+        length = spec['length']
+        self.offsets = np.zeros(1, dtype=np.int64)
+        if length:
+            self.offsets = np.memmap(os.path.join(path, spec['offsets']),
+                                     dtype=np.int64, mode='r',
+                                     shape=(length + 1,))
+
+        # np.memmap cannot map an empty file
+        nbytes = int(self.offsets[-1])
+        self.heap = np.empty(0, dtype=np.uint8)
+        if nbytes:
+            self.heap = np.memmap(os.path.join(path, spec['heap']),
+                                  dtype=np.uint8, mode='r', shape=(nbytes,))
+
+        self.nulls = None
+        if spec['nulls'] is not None:
+            self.nulls = np.memmap(os.path.join(path, spec['nulls']),
+                                   dtype=np.uint8, mode='r', shape=(length,))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("index %d is out of bounds" % i)
+        if self.nulls is not None and self.nulls[i]:
+            return np.nan
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return self.heap[start:end].tostring().decode('utf-8')
+
+    def __array__(self, dtype=None):
+        result = self.decode()
+        if dtype is not None:
+            result = result.astype(dtype)
+        return result
+
+    def decode(self):
+        """ return an object array of all of the strings """
+        result = np.empty(len(self), dtype=object)
+        heap = self.heap
+        bounds = zip(self.offsets[:-1].tolist(), self.offsets[1:].tolist())
+        result[:] = [heap[s:e].tostring().decode('utf-8') for s, e in bounds]
+
+        if self.nulls is not None:
+            result[np.asarray(self.nulls).astype(bool)] = np.nan
+        return result
+
+
+class _StringColumns(object):
+
+    """ the undecoded values of a block of string columns """
+    ndim = 2
+    dtype = np.dtype(object)
+
+    def __init__(self, heaps, nrows):
+        self.heaps = heaps
+        self.shape = (len(heaps), nrows)
+
+    def __len__(self):
+        return len(self.heaps)
+
+    def decode(self):
+        values = np.empty(self.shape, dtype=object)
+        for k, heap in enumerate(self.heaps):
+            values[k] = heap.decode()
+        return values
+
+
+# the slot of the block values, which the lazy block wraps in a property
+_values_slot = Block.values
+
+
+class _LazyStringBlock(ObjectBlock):
+
+    """
+    An object block of string columns read by ``read_mmap``, which holds the
+    undecoded columns (_StringColumns) until its values are first accessed;
+    the shape and dtype are known without decoding them
+    """
+
+    def _get_values(self):
+        values = _values_slot.__get__(self)
+        if isinstance(values, _StringColumns):
+            values = values.decode()
+            _values_slot.__set__(self, values)
+        return values
+
+    values = property(_get_values, _values_slot.__set__)
+
+    @property
+    def is_decoded(self):
+        return not isinstance(_values_slot.__get__(self), _StringColumns)
+
+    @property
+    def shape(self):
+        return _values_slot.__get__(self).shape
+
+    @property
+    def dtype(self):
+        return _values_slot.__get__(self).dtype
+
+    def __len__(self):
+        return len(self.items)
+
+
+def _index_to_schema(path, name, index):
+    """ write the levels of the index, returning its spec """
+    if isinstance(index, MultiIndex):
+        levels = [index.get_level_values(i) for i in range(index.nlevels)]
+    else:
+        levels = [index]
+
+    spec = dict(names=list(index.names), levels=[])
+    for i, level in enumerate(levels):
+        lspec = dict()
+        if isinstance(level, DatetimeIndex):
+            lspec['type'] = 'datetime'
+            lspec['tz'] = None if level.tz is None else str(level.tz)
+            lspec['freq'] = level.freqstr
+            values = level.asi8
+        else:
+            values = np.asarray(level.values)
+        lspec['values'] = _write_values(path, '%s_level%d' % (name, i),
+                                        values)
+        spec['levels'].append(lspec)
+    return spec
+
+
+def _index_from_schema(path, spec, mode):
+    levels = []
+    for lspec in spec['levels']:
+        values = _read_values(path, lspec['values'], mode)
+        if lspec.get('type') == 'datetime':
+            level = DatetimeIndex(np.asarray(values, dtype=np.int64),
+                                  tz='UTC' if lspec['tz'] else None)
+            if lspec['tz']:
+                level = level.tz_convert(lspec['tz'])
+            if lspec['freq'] is not None:
+                level = DatetimeIndex(level, freq=lspec['freq'])
+        else:
+            level = Index(np.array(values))
+        levels.append(level)
+
+    names = spec['names']
+    if len(levels) > 1:
+        return MultiIndex.from_arrays(levels, names=names)
+    index = levels[0]
+    index.name = names[0]
+    return index
@@ -49,14 +49,14 @@ from pandas import compat
 from pandas.compat import u, PY3
 from pandas import (
     Timestamp, Period, Series, DataFrame, Panel, Panel4D,
-    Index, MultiIndex, Int64Index, PeriodIndex, DatetimeIndex, Float64Index,
-    NaT
+    Index, MultiIndex, Int64Index, RangeIndex, PeriodIndex, DatetimeIndex,
+    Float64Index, NaT, Categorical
 )
 from pandas.sparse.api import SparseSeries, SparseDataFrame, SparsePanel
 from pandas.sparse.array import BlockIndex, IntIndex
 from pandas.core.generic import NDFrame
 from pandas.core.common import needs_i8_conversion
-from pandas.io.common import get_filepath_or_buffer
+from pandas.io.common import get_filepath_or_buffer, PrefetchIterator
 from pandas.core.internals import BlockManager, make_block
 import pandas.core.internals as internals
 
@@ -114,7 +114,7 @@ def to_msgpack(path_or_buf, *args, **kwargs):
         writer(path_or_buf)
 
 
-def read_msgpack(path_or_buf, iterator=False, **kwargs):
+def read_msgpack(path_or_buf, iterator=False, prefetch=None, **kwargs):
     """
     Load msgpack pandas object from the specified
     file path
@@ -127,6 +127,8 @@ def read_msgpack(path_or_buf, iterator=False, **kwargs):
     path_or_buf : string File path, BytesIO like or string
     iterator : boolean, if True, return an iterator to the unpacker
                (default is False)
+    prefetch : int, optional, with an iterator, unpack up to this many
+               objects ahead in a background thread (default is None)
 
     Returns
     -------
@@ -135,7 +137,7 @@ def read_msgpack(path_or_buf, iterator=False, **kwargs):
     """
     path_or_buf, _ = get_filepath_or_buffer(path_or_buf)
     if iterator:
-        return Iterator(path_or_buf)
+        return Iterator(path_or_buf, prefetch=prefetch)
 
     def read(fh):
         l = list(unpack(fh))
@@ -286,6 +288,13 @@ def encode(obj):
                     'data': convert(obj.asi8),
                     'freq': getattr(obj, 'freqstr', None),
                     'tz': tz}
+        elif isinstance(obj, RangeIndex):
+            return {'typ': 'range_index',
+                    'klass': obj.__class__.__name__,
+                    'name': getattr(obj, 'name', None),
+                    'start': obj._start,
+                    'stop': obj._stop,
+                    'step': obj._step}
         elif isinstance(obj, MultiIndex):
             return {'typ': 'multi_index',
                     'klass': obj.__class__.__name__,
@@ -351,18 +360,30 @@ def encode(obj):
             data = obj._data
             if not data.is_consolidated():
                 data = data.consolidate()
+            data = data.unmask(categorical=False)
+
+            def encode_block(b):
+                if b.is_categorical:
+                    # the codes, and the levels they index
+                    return {'items': b.items,
+                            'values': convert(b.codes),
+                            'shape': b.codes.shape,
+                            'dtype': b.codes.dtype.num,
+                            'levels': b.levels,
+                            'klass': b.__class__.__name__,
+                            'compress': compressor}
+                return {'items': b.items,
+                        'values': convert(b.values),
+                        'shape': b.values.shape,
+                        'dtype': b.dtype.num,
+                        'klass': b.__class__.__name__,
+                        'compress': compressor}
 
            # the block manager
             return {'typ': 'block_manager',
                     'klass': obj.__class__.__name__,
                     'axes': data.axes,
-                    'blocks': [{'items': b.items,
-                                'values': convert(b.values),
-                                'shape': b.values.shape,
-                                'dtype': b.dtype.num,
-                                'klass': b.__class__.__name__,
-                                'compress': compressor
-                                } for b in data.blocks]}
+                    'blocks': [encode_block(b) for b in data.blocks]}
 
     elif isinstance(obj, (datetime, date, np.datetime64, timedelta,
                           np.timedelta64)):
@@ -451,6 +472,9 @@ def decode(obj):
         data = unconvert(obj['data'], np.typeDict[obj['dtype']],
                          obj.get('compress'))
         return globals()[obj['klass']](data, dtype=dtype, name=obj['name'])
+    elif typ == 'range_index':
+        return globals()[obj['klass']](obj['start'], obj['stop'],
+                                       obj['step'], name=obj['name'])
     elif typ == 'multi_index':
         data = unconvert(obj['data'], np.typeDict[obj['dtype']],
                          obj.get('compress'))
@@ -482,8 +506,11 @@ def decode(obj):
 
         def create_block(b):
             dtype = dtype_for(b['dtype'])
-            return make_block(unconvert(b['values'], dtype, b['compress'])
-                              .reshape(b['shape']), b['items'], axes[0],
+            values = unconvert(b['values'], dtype, b['compress']).reshape(
+                b['shape'])
+            if 'levels' in b:
+                values = Categorical(values, b['levels'])
+            return make_block(values, b['items'], axes[0],
                               klass=getattr(internals, b['klass']))
 
         blocks = [create_block(b) for b in obj['blocks']]
@@ -600,11 +627,32 @@ class Iterator(object):
     """ manage the unpacking iteration,
         close the file on completion """
 
-    def __init__(self, path, **kwargs):
+    def __init__(self, path, prefetch=None, **kwargs):
         self.path = path
+        self.prefetch = prefetch
         self.kwargs = kwargs
+        self._prefetcher = None
 
     def __iter__(self):
+        objs = self._iter_objects()
+        if self.prefetch:
+            self.close()
+            objs = self._prefetcher = PrefetchIterator(objs, self.prefetch)
+        try:
+            for o in objs:
+                yield o
+        finally:
+            # stop the background thread if the iteration is abandoned
+            if objs is self._prefetcher:
+                self.close()
+
+    def close(self):
+        """ stop unpacking ahead in the background, if we are prefetching """
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+            self._prefetcher = None
+
+    def _iter_objects(self):
 
         needs_closing = True
         try:
@@ -15,7 +15,7 @@ import datetime
 import pandas.core.common as com
 from pandas.core.config import get_option
 from pandas.io.date_converters import generic_parser
-from pandas.io.common import get_filepath_or_buffer
+from pandas.io.common import get_filepath_or_buffer, PrefetchIterator
 from pandas.tseries import tools
 
 from pandas.util.decorators import Appender
@@ -112,6 +112,10 @@ iterator : boolean, default False
     Return TextFileReader object
 chunksize : int, default None
     Return TextFileReader object for iteration
+prefetch : int, default None
+    When iterating over the chunks, read up to this many chunks ahead in a
+    background thread, overlapping the reading and parsing with the
+    processing of the chunks; call ``close`` on the reader to stop it early
 skipfooter : int, default 0
     Number of line at bottom of file to skip
 converters : dict. optional
@@ -261,6 +265,7 @@ _parser_defaults = {
     # 'nrows': None,
     # 'iterator': False,
     'chunksize': None,
+    'prefetch': None,
     'verbose': False,
     'encoding': None,
     'squeeze': False,
@@ -350,6 +355,7 @@ def _make_parser_function(name, sep=','):
                  nrows=None,
                  iterator=False,
                  chunksize=None,
+                 prefetch=None,
 
                  verbose=False,
                  encoding=None,
@@ -396,6 +402,7 @@ def _make_parser_function(name, sep=','):
                     nrows=nrows,
                     iterator=iterator,
                     chunksize=chunksize,
+                    prefetch=prefetch,
                     skipfooter=skipfooter or skip_footer,
                     converters=converters,
                     dtype=dtype,
@@ -493,7 +500,9 @@ class TextFileReader(object):
         options = self._get_options_with_defaults(engine)
 
         self.chunksize = options.pop('chunksize', None)
+        self.prefetch = options.pop('prefetch', None)
         self.squeeze = options.pop('squeeze', False)
+        self._prefetcher = None
 
         # might mutate self.engine
         self.options, self.engine = self._clean_options(options, engine)
@@ -596,6 +605,20 @@ class TextFileReader(object):
         return result, engine
 
     def __iter__(self):
+        chunks = self._iter_chunks()
+        if self.prefetch and self.chunksize:
+            self.close()
+            chunks = self._prefetcher = PrefetchIterator(chunks,
+                                                         self.prefetch)
+        try:
+            for chunk in chunks:
+                yield chunk
+        finally:
+            # stop the background thread if the iteration is abandoned
+            if chunks is self._prefetcher:
+                self.close()
+
+    def _iter_chunks(self):
         try:
             if self.chunksize:
                 while True:
@@ -605,6 +628,12 @@ class TextFileReader(object):
         except StopIteration:
             pass
 
+    def close(self):
+        """ stop reading ahead in the background, if we are prefetching """
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+            self._prefetcher = None
+
     def _make_engine(self, engine='c'):
         if engine == 'c':
             self._engine = CParserWrapper(self.f, **self.options)
@@ -0,0 +1,167 @@
+"""
+Writing the partitions of a DataFrame, by the values of some of its columns,
+to separate files (or keys), concurrently
+"""
+
+import os
+import json
+import string
+from datetime import datetime
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+
+from pandas import compat
+from pandas.compat import string_types
+import pandas.core.common as com
+import pandas.lib as lib
+
+
+def write_partitions(frame, partition_on, writer, patterns, threads=None,
+                     manifest=None):
+    """
+    Write each partition of frame (the rows with the same values of the
+    partition_on columns) with writer
+
+    The group indices are computed once, with ``groupby`` (so the rows with
+    a null partition value are not written). Each pattern is
+    formatted with the values of a partition, by position ({0}, {1}...) and
+    by column name ({symbol}...), e.g. ``'out/{symbol}/{date}.csv'``.
+
+    Parameters
+    ----------
+    frame : DataFrame
+    partition_on : column name or list of column names
+    writer : callable, called as ``writer(partition, **formatted)`` with
+        the formatted patterns
+    patterns : dict of name -> pattern, at least one of which must contain
+        a field
+    threads : int, optional
+        write up to this many partitions concurrently, default is to write
+        them serially
+    manifest : string, optional
+        write a JSON manifest of the partitions (their values, formatted
+        patterns and number of rows) to this path
+
+    Returns
+    -------
+    a list of the partitions written, as dicts of the values (``'values'``),
+    the formatted patterns and the number of rows (``'nrows'``)
+    """
+    if isinstance(partition_on, string_types) or \
+            not com.is_list_like(partition_on):
+        partition_on = [partition_on]
+    partition_on = list(partition_on)
+    if not len(partition_on):
+        raise ValueError("partition_on must name at least one column")
+    missing = [c for c in partition_on if c not in frame.columns]
+    if len(missing):
+        raise KeyError("cannot partition on %s, they are not columns of the "
+                       "frame" % missing)
+    if threads is not None and (not com.is_integer(threads) or threads < 1):
+        raise ValueError("threads must be a positive integer")
+
+    if not any(_has_field(pattern)
+               for pattern in compat.itervalues(patterns)):
+        raise ValueError("the %s must contain a field for the partition "
+                         "values, e.g. '{%s}'"
+                         % (' or '.join(sorted(patterns)), partition_on[0]))
+
+    indices = frame.groupby(partition_on).indices
+    keys = sorted(indices)
+
+    partitions = []
+    for key in keys:
+        values = key if isinstance(key, tuple) else (key,)
+        values = tuple(_box(v) for v in values)
+        formatted = dict((name, _format_pattern(pattern, partition_on,
+                                                values))
+                         for name, pattern in compat.iteritems(patterns))
+        partitions.append((values, formatted, indices[key]))
+
+    # the same target for different partitions would be overwritten
+    targets = set(tuple(sorted(compat.iteritems(f)))
+                  for v, f, i in partitions)
+    if len(targets) != len(partitions):
+        raise ValueError("the patterns do not produce a distinct target for "
+                         "each partition")
+
+    def write(partition):
+        values, formatted, indexer = partition
+        writer(frame.take(indexer), **formatted)
+
+    if threads is None or threads == 1 or len(partitions) <= 1:
+        for partition in partitions:
+            write(partition)
+    else:
+        pool = ThreadPool(min(threads, len(partitions)))
+        try:
+            pool.map(write, partitions)
+        finally:
+            pool.close()
+            pool.join()
+
+    results = []
+    for values, formatted, indexer in partitions:
+        result = dict(formatted)
+        result['values'] = dict(zip(partition_on, values))
+        result['nrows'] = len(indexer)
+        results.append(result)
+
+    if manifest is not None:
+        _write_manifest(manifest, partition_on, results)
+
+    return results
+
+
+def _box(value):
+    """ datetimes as Timestamps, so they can be formatted """
+    if isinstance(value, (np.datetime64, datetime)):
+        return lib.Timestamp(value)
+    return value
+
+
+def _has_field(pattern):
+    """ whether the format pattern has a replacement field """
+    return any(field is not None
+               for _, field, _, _ in string.Formatter().parse(pattern))
+
+
+def _format_pattern(pattern, names, values):
+    named = dict((n, v) for n, v in zip(names, values)
+                 if isinstance(n, string_types))
+    return pattern.format(*values, **named)
+
+
+def ensure_dirname(path):
+    """ create the directory of path, if it does not exist """
+    dirname = os.path.dirname(path)
+    if len(dirname):
+        try:
+            os.makedirs(dirname)
+        except OSError:
+            # another writer may have just created it
+            if not os.path.isdir(dirname):
+                raise
+
+
+def _to_json(value):
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _write_manifest(path, partition_on, partitions):
+    def convert(partition):
+        result = dict(partition)
+        result['values'] = dict((com.pprint_thing(k), _to_json(v)) for k, v
+                                in compat.iteritems(partition['values']))
+        return result
+
+    manifest = dict(partition_on=[com.pprint_thing(c) for c in partition_on],
+                    partitions=[convert(p) for p in partitions])
+    ensure_dirname(path)
+    with open(path, 'w') as fh:
+        json.dump(manifest, fh, indent=2, default=com.pprint_thing)
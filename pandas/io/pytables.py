@@ -11,6 +11,7 @@ import copy
 import itertools
 import warnings
 import os
+import threading
 
 import numpy as np
 from pandas import (Series, TimeSeries, DataFrame, Panel, Panel4D, Index,
@@ -31,7 +32,7 @@ import pandas.core.common as com
 from pandas.tools.merge import concat
 from pandas import compat
 from pandas.compat import u_safe as u, PY3, range, lrange, string_types, filter
-from pandas.io.common import PerformanceWarning
+from pandas.io.common import PerformanceWarning, PrefetchIterator
 from pandas.core.config import get_option
 from pandas.computation.pytables import Expr, maybe_expression
 
@@ -42,9 +43,19 @@ import pandas.tslib as tslib
 from contextlib import contextmanager
 from distutils.version import LooseVersion
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
 # versioning attribute
 _version = '0.10.1'
 
+# an LRU of the metadata snapshots of files opened read-only:
+# (absolute path, file stamp) -> snapshot
+_metadata_snapshots = compat.OrderedDict()
+_MAX_METADATA_SNAPSHOTS = 64
+
 # PY3 encoding if we don't specify
 _default_encoding = 'UTF-8'
 
@@ -135,6 +146,7 @@ _FORMAT_MAP = {
     u('fixed'): 'fixed',
     u('t'): 'table',
     u('table'): 'table',
+    u('ctable'): 'ctable',
 }
 
 format_deprecate_doc = """
@@ -182,6 +194,7 @@ _TABLE_MAP = {
     u('appendable_multiframe'): 'AppendableMultiFrameTable',
     u('appendable_panel'): 'AppendablePanelTable',
     u('appendable_ndim'): 'AppendableNDimTable',
+    u('columnar_frame'): 'ColumnarFrameTable',
     u('worm'): 'WORMTable',
     u('legacy_frame'): 'LegacyFrameTable',
     u('legacy_panel'): 'LegacyPanelTable',
@@ -204,6 +217,7 @@ format_doc = """
 : format
     default format writing format, if None, then
     put will default to 'fixed' and append will default to 'table'
+    ('ctable' stores a DataFrame column-by-column)
 """
 
 with config.config_prefix('io.hdf'):
@@ -211,7 +225,7 @@ with config.config_prefix('io.hdf'):
                            validator=config.is_bool)
     config.register_option(
         'default_format', None, format_doc,
-        validator=config.is_one_of_factory(['fixed', 'table', None])
+        validator=config.is_one_of_factory(['fixed', 'table', 'ctable', None])
     )
 
 # oh the troubles to reduce import time
@@ -271,8 +285,15 @@ def get_store(path, **kwargs):
 # interface to/from ###
 
 def to_hdf(path_or_buf, key, value, mode=None, complevel=None, complib=None,
-           append=None, **kwargs):
+           append=None, partition_on=None, threads=None, manifest=None,
+           **kwargs):
     """ store this object, close it if we opened it """
+    if partition_on is not None:
+        return _to_hdf_partitions(path_or_buf, key, value, partition_on,
+                                  threads=threads, manifest=manifest,
+                                  mode=mode, complevel=complevel,
+                                  complib=complib, append=append, **kwargs)
+
     if append:
         f = lambda store: store.append(key, value, **kwargs)
     else:
@@ -286,6 +307,50 @@ def to_hdf(path_or_buf, key, value, mode=None, complevel=None, complib=None,
         f(path_or_buf)
 
 
+def _to_hdf_partitions(path_or_buf, key, value, partition_on, threads=None,
+                       manifest=None, mode=None, complevel=None,
+                       complib=None, append=None, **kwargs):
+    """ store each partition of the frame value under its own key (and
+    file), formatting the key (and path) patterns with its values
+
+    HDF5 is not thread-safe, so the writes themselves are serialized, and
+    each store is only opened once (thus mode='w' truncates each file once);
+    the threads take the rows of the partitions concurrently """
+    from pandas.io.partition import write_partitions, ensure_dirname
+
+    patterns = dict(key=key)
+    if isinstance(path_or_buf, string_types):
+        patterns['path'] = path_or_buf
+        stores = dict()
+    else:
+        stores = {None: path_or_buf}
+
+    lock = threading.Lock()
+    opened = []
+
+    def writer(frame, key, path=None):
+        with lock:
+            store = stores.get(path)
+            if store is None:
+                ensure_dirname(path)
+                store = stores[path] = HDFStore(path, mode=mode or 'a',
+                                                complevel=complevel,
+                                                complib=complib)
+                opened.append(store)
+
+            if append:
+                store.append(key, frame, **kwargs)
+            else:
+                store.put(key, frame, **kwargs)
+
+    try:
+        return write_partitions(value, partition_on, writer, patterns,
+                                threads=threads, manifest=manifest)
+    finally:
+        for store in opened:
+            store.close()
+
+
 def read_hdf(path_or_buf, key, **kwargs):
     """ read from the store, close it if we opened it
 
@@ -372,6 +437,20 @@ class HDFStore(StringMixin):
             in the store wherever possible
     fletcher32 : bool, default False
             If applying compression use the fletcher32 checksum
+    cache : {False, True, 'coordinates', 'results'}, default False
+            Keep an LRU cache of table selections. ``True`` (or
+            ``'coordinates'``) caches the coordinates selected by a where
+            condition, ``'results'`` also caches the objects returned by
+            ``select``. Entries are invalidated by ``put``, ``append``,
+            ``remove`` and by a modification of the file
+    cache_size : int, default 64MB
+            The maximum number of bytes held by the cache
+    lock : bool, default False
+            Hold an advisory lock on the file (fcntl.flock, where available)
+            for each operation: a shared lock while reading and an exclusive
+            lock while writing, so that readers in other processes never see
+            a partially written append. A read-only store locked in this way
+            reopens the file when it was modified since it was opened
 
     Examples
     --------
@@ -385,7 +464,8 @@ class HDFStore(StringMixin):
     """
 
     def __init__(self, path, mode=None, complevel=None, complib=None,
-                 fletcher32=False, **kwargs):
+                 fletcher32=False, cache=False, cache_size=None, lock=False,
+                 **kwargs):
         try:
             import tables
         except ImportError:  # pragma: no cover
@@ -400,6 +480,19 @@ class HDFStore(StringMixin):
         self._complib = complib
         self._fletcher32 = fletcher32
         self._filters = None
+        self._buffers = {}
+        self._lock = lock
+        self._lock_file = None
+        self._lock_depth = 0
+        self._stamp = None
+        self._open_kwargs = kwargs
+        self._cache = None
+        if cache:
+            if cache not in [True, 'coordinates', 'results']:
+                raise ValueError("cache must be one of False, True, "
+                                 "'coordinates' or 'results'")
+            self._cache = QueryCache(path, max_bytes=cache_size,
+                                     results=cache == 'results')
         self.open(mode=mode, **kwargs)
 
     @property
@@ -435,6 +528,7 @@ class HDFStore(StringMixin):
         """ check for existance of this key
               can match the exact pathname or the pathnm w/o the leading '/'
               """
+        self._flush_buffers(key)
         node = self.get_node(key)
         if node is not None:
             name = node._v_pathname
@@ -479,7 +573,65 @@ class HDFStore(StringMixin):
         objects stored in the HDFStore. These are ABSOLUTE path-names (e.g.
         have the leading '/'
         """
-        return [n._v_pathname for n in self.groups()]
+        if self._mode == 'r':
+            return list(self.metadata().keys())
+        with self._locked():
+            return [n._v_pathname for n in self.groups()]
+
+    def metadata(self):
+        """
+        Return a snapshot of the objects in the store: an ordered dict of
+        key -> dict of the pandas_type, table_type, format and nrows.
+
+        For a store opened read-only, the snapshot is cached (and shared by
+        all of the stores opened on the file) until the file is modified, so
+        that reopening a file does not need to walk its nodes again; the
+        snapshots of the last files read are kept.
+
+        The snapshot answers keys() and the checks for a missing key of get,
+        select and get_storer; the storers of the keys which exist (and so
+        the repr of the store) are still read from their nodes.
+        """
+        key = self._snapshot_key()
+        if key is not None:
+            cached = _get_metadata_snapshot(key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+        snapshot = compat.OrderedDict()
+        with self._locked():
+            for g in self.groups():
+                s = self._create_storer(g)
+                snapshot[g._v_pathname] = dict(
+                    pandas_type=s.pandas_type,
+                    table_type=_ensure_decoded(
+                        getattr(g._v_attrs, 'table_type', None)),
+                    format=s.format_type,
+                    nrows=s.nrows)
+
+        if key is not None:
+            _set_metadata_snapshot(key, snapshot)
+        return copy.deepcopy(snapshot)
+
+    def _snapshot_key(self):
+        """ the key of the metadata snapshot of a read-only store, or None
+        """
+        if self._mode != 'r':
+            return None
+        stamp = _file_stamp(self._path)
+        if stamp is None:
+            return None
+        return os.path.abspath(self._path), stamp
+
+    def _check_snapshot(self, key):
+        """ raise a KeyError if the cached snapshot of a read-only store
+        does not have the key, without looking up the node """
+        skey = self._snapshot_key()
+        if skey is None:
+            return
+        snapshot = _get_metadata_snapshot(skey)
+        if snapshot is not None and _absolute_key(key) not in snapshot:
+            raise KeyError('No object named %s in the file' % key)
 
     def items(self):
         """
@@ -522,6 +674,9 @@ class HDFStore(StringMixin):
         if self.is_open:
             self.close()
 
+        if self._cache is not None:
+            self._cache.clear()
+
         if self._complib is not None:
             if self._complevel is None:
                 self._complevel = 9
@@ -529,6 +684,7 @@ class HDFStore(StringMixin):
                                               self._complib,
                                               fletcher32=self._fletcher32)
 
+        self._open_kwargs = kwargs
         try:
             self._handle = tables.openFile(self._path, self._mode, **kwargs)
         except (IOError) as e:  # pragma: no cover
@@ -561,13 +717,22 @@ class HDFStore(StringMixin):
                 raise IOError(str(e))
             raise
 
+        self._stamp = _file_stamp(self._path)
+        if self._lock and fcntl is not None:
+            self._lock_file = open(self._path, 'rb')
+
     def close(self):
         """
-        Close the PyTables file handle
+        Close the PyTables file handle (writing any buffered appends)
         """
+        if self.is_open:
+            self._flush_buffers()
         if self._handle is not None:
             self._handle.close()
         self._handle = None
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
 
     @property
     def is_open(self):
@@ -593,8 +758,11 @@ class HDFStore(StringMixin):
         to disk. With fsync, the operation will block until the OS claims the
         file has been written; however, other caching layers may still
         interfere.
+
+        Any rows buffered by ``append(..., buffer_rows=N)`` are written first.
         """
         if self._handle is not None:
+            self._flush_buffers()
             self._handle.flush()
             if fsync:
                 try:
@@ -602,6 +770,21 @@ class HDFStore(StringMixin):
                 except:
                     pass
 
+    def cache_info(self):
+        """
+        return a dict of the query cache statistics: the number of hits and
+        misses, the number of entries, and the bytes used by the cache
+        (None if the store was not opened with a cache)
+        """
+        if self._cache is None:
+            return None
+        return self._cache.info()
+
+    def clear_cache(self):
+        """ remove all of the entries of the query cache """
+        if self._cache is not None:
+            self._cache.clear()
+
     def get(self, key):
         """
         Retrieve pandas object stored in file
@@ -614,13 +797,17 @@ class HDFStore(StringMixin):
         -------
         obj : type of object stored in file
         """
-        group = self.get_node(key)
-        if group is None:
-            raise KeyError('No object named %s in the file' % key)
-        return self._read_group(group)
+        self._flush_buffers(key)
+        with self._locked():
+            self._check_snapshot(key)
+            group = self.get_node(key)
+            if group is None:
+                raise KeyError('No object named %s in the file' % key)
+            return self._read_group(group)
 
     def select(self, key, where=None, start=None, stop=None, columns=None,
-               iterator=False, chunksize=None, auto_close=False, **kwargs):
+               iterator=False, chunksize=None, auto_close=False, prefetch=None,
+               **kwargs):
         """
         Retrieve pandas object stored in file, optionally based on where
         criteria
@@ -637,25 +824,41 @@ class HDFStore(StringMixin):
         chunksize : nrows to include in iteration, return an iterator
         auto_close : boolean, should automatically close the store when
             finished, default is False
+        prefetch : integer, optional
+            when iterating, read up to this many chunks ahead in a background
+            thread (the store should not be otherwise used until the
+            iteration is finished, or the iterator closed)
 
         Returns
         -------
         The selected object
 
         """
+        self._flush_buffers(key)
+        where = _ensure_term(where, scope_level=1)
+        with self._locked():
+            return self._select(key, where=where, start=start, stop=stop,
+                                columns=columns, iterator=iterator,
+                                chunksize=chunksize, auto_close=auto_close,
+                                prefetch=prefetch, **kwargs)
+
+    def _select(self, key, where=None, start=None, stop=None, columns=None,
+                iterator=False, chunksize=None, auto_close=False,
+                prefetch=None, **kwargs):
+        self._check_snapshot(key)
         group = self.get_node(key)
         if group is None:
             raise KeyError('No object named %s in the file' % key)
 
         # create the storer and axes
-        where = _ensure_term(where, scope_level=1)
         s = self._create_storer(group)
         s.infer_axes()
 
         # what we are actually going to do for a chunk
         def func(_start, _stop):
-            return s.read(where=where, start=_start, stop=_stop,
-                          columns=columns, **kwargs)
+            with self._locked(refresh=False):
+                return s.read(where=where, start=_start, stop=_stop,
+                              columns=columns, **kwargs)
 
         if iterator or chunksize is not None:
             if not s.is_table:
@@ -663,10 +866,29 @@ class HDFStore(StringMixin):
                     "can only use an iterator or chunksize on a table")
             return TableIterator(self, func, nrows=s.nrows, start=start,
                                  stop=stop, chunksize=chunksize,
-                                 auto_close=auto_close)
-
-        return TableIterator(self, func, nrows=s.nrows, start=start, stop=stop,
-                             auto_close=auto_close).get_values()
+                                 auto_close=auto_close, prefetch=prefetch)
+
+        # see if we have cached this result
+        cache_key = None
+        if self._cache is not None and self._cache.results and s.is_table:
+            cache_key = s.create_selection(where=where, start=start,
+                                           stop=stop).cache_key
+            if cache_key is not None:
+                if columns is not None:
+                    cache_key += (tuple(columns),)
+                result = self._cache.get((u('results'),) + cache_key)
+                if result is not None:
+                    if auto_close:
+                        self.close()
+                    return result.copy()
+
+        result = TableIterator(self, func, nrows=s.nrows, start=start,
+                               stop=stop, auto_close=auto_close).get_values()
+        if cache_key is not None:
+            self._cache.set((u('results'),) + cache_key, result,
+                            _estimate_nbytes(result))
+            result = result.copy()
+        return result
 
     def select_as_coordinates(
             self, key, where=None, start=None, stop=None, **kwargs):
@@ -681,8 +903,11 @@ class HDFStore(StringMixin):
         stop  : integer (defaults to None), row number to stop selection
         """
         where = _ensure_term(where, scope_level=1)
-        return self.get_storer(key).read_coordinates(where=where, start=start,
-                                                     stop=stop, **kwargs)
+        self._flush_buffers(key)
+        with self._locked():
+            return self.get_storer(key).read_coordinates(where=where,
+                                                         start=start,
+                                                         stop=stop, **kwargs)
 
     def unique(self, key, column, **kwargs):
         warnings.warn("unique(key,column) is deprecated\n"
@@ -709,11 +934,14 @@ class HDFStore(StringMixin):
             is part of a data block)
 
         """
-        return self.get_storer(key).read_column(column=column, **kwargs)
+        self._flush_buffers(key)
+        with self._locked():
+            return self.get_storer(key).read_column(column=column, **kwargs)
 
     def select_as_multiple(self, keys, where=None, selector=None, columns=None,
                            start=None, stop=None, iterator=False,
-                           chunksize=None, auto_close=False, **kwargs):
+                           chunksize=None, auto_close=False, prefetch=None,
+                           **kwargs):
         """ Retrieve pandas objects from multiple tables
 
         Parameters
@@ -726,6 +954,9 @@ class HDFStore(StringMixin):
         stop  : integer (defaults to None), row number to stop selection
         iterator : boolean, return an iterator, default False
         chunksize : nrows to include in iteration, return an iterator
+        prefetch : integer, optional
+            when iterating, read up to this many chunks ahead in a background
+            thread
 
         Exceptions
         ----------
@@ -741,7 +972,8 @@ class HDFStore(StringMixin):
         if isinstance(keys, string_types):
             return self.select(key=keys, where=where, columns=columns,
                                start=start, stop=stop, iterator=iterator,
-                               chunksize=chunksize, **kwargs)
+                               chunksize=chunksize, prefetch=prefetch,
+                               **kwargs)
 
         if not isinstance(keys, (list, tuple)):
             raise TypeError("keys must be a list/tuple")
@@ -752,6 +984,18 @@ class HDFStore(StringMixin):
         if selector is None:
             selector = keys[0]
 
+        with self._locked():
+            return self._select_as_multiple(
+                keys, where=where, selector=selector, columns=columns,
+                start=start, stop=stop, iterator=iterator,
+                chunksize=chunksize, auto_close=auto_close,
+                prefetch=prefetch, **kwargs)
+
+    def _select_as_multiple(self, keys, where=None, selector=None,
+                            columns=None, start=None, stop=None,
+                            iterator=False, chunksize=None, auto_close=False,
+                            prefetch=None, **kwargs):
+
         # collect the tables
         tbls = [self.get_storer(k) for k in keys]
         s = self.get_storer(selector)
@@ -777,13 +1021,15 @@ class HDFStore(StringMixin):
         axis = list(set([t.non_index_axes[0][0] for t in tbls]))[0]
 
         def func(_start, _stop):
-            if where is not None:
-                c = s.read_coordinates(where=where, start=_start, stop=_stop, **kwargs)
-            else:
-                c = None
+            with self._locked(refresh=False):
+                if where is not None:
+                    c = s.read_coordinates(where=where, start=_start,
+                                           stop=_stop, **kwargs)
+                else:
+                    c = None
 
-            objs = [t.read(where=c, start=_start, stop=_stop,
-                           columns=columns, **kwargs) for t in tbls]
+                objs = [t.read(where=c, start=_start, stop=_stop,
+                               columns=columns, **kwargs) for t in tbls]
 
             # concat and return
             return concat(objs, axis=axis,
@@ -792,7 +1038,7 @@ class HDFStore(StringMixin):
         if iterator or chunksize is not None:
             return TableIterator(self, func, nrows=nrows, start=start,
                                  stop=stop, chunksize=chunksize,
-                                 auto_close=auto_close)
+                                 auto_close=auto_close, prefetch=prefetch)
 
         return TableIterator(self, func, nrows=nrows, start=start, stop=stop,
                              auto_close=auto_close).get_values()
@@ -805,13 +1051,16 @@ class HDFStore(StringMixin):
         ----------
         key      : object
         value    : {Series, DataFrame, Panel}
-        format   : 'fixed(f)|table(t)', default is 'fixed'
+        format   : 'fixed(f)|table(t)|ctable', default is 'fixed'
             fixed(f) : Fixed format
                        Fast writing/reading. Not-appendable, nor searchable
             table(t) : Table format
                        Write as a PyTables Table structure which may perform
                        worse but allow more flexible operations like searching
                        / selecting subsets of the data
+            ctable   : Columnar Table format (DataFrame only)
+                       Write each column as its own array, selecting a subset
+                       of the columns only reads those columns
         append   : boolean, default False
             This will force Table format, append the input data to the
             existing.
@@ -820,6 +1069,10 @@ class HDFStore(StringMixin):
         if format is None:
             format = get_option("io.hdf.default_format") or 'fixed'
         kwargs = self._validate_format(format, kwargs)
+        if append:
+            self._flush_buffers(key)
+        else:
+            self._buffers.pop(_absolute_key(key), None)
         self._write_to_group(key, value, append=append, **kwargs)
 
     def remove(self, key, where=None, start=None, stop=None):
@@ -844,6 +1097,12 @@ class HDFStore(StringMixin):
 
         """
         where = _ensure_term(where, scope_level=1)
+        self._flush_buffers(key)
+        with self._locked(exclusive=True):
+            return self._remove(key, where=where, start=start, stop=stop)
+
+    def _remove(self, key, where=None, start=None, stop=None):
+        self._invalidate_cache(key)
         try:
             s = self.get_storer(key)
         except:
@@ -873,7 +1132,7 @@ class HDFStore(StringMixin):
             return s.delete(where=where, start=start, stop=stop)
 
     def append(self, key, value, format=None, append=True, columns=None,
-               dropna=None, **kwargs):
+               dropna=None, buffer_rows=None, **kwargs):
         """
         Append to Table in file. Node must already exist and be Table
         format.
@@ -887,6 +1146,9 @@ class HDFStore(StringMixin):
                        Write as a PyTables Table structure which may perform
                        worse but allow more flexible operations like searching
                        / selecting subsets of the data
+            ctable   : columnar table format (DataFrame only)
+                       Write each column as its own array, selecting a subset
+                       of the columns only reads those columns
         append       : boolean, default True, append the input data to the
             existing
         data_columns : list of columns to create as data columns, or True to
@@ -898,6 +1160,11 @@ class HDFStore(StringMixin):
         encoding     : default None, provide an encoding for strings
         dropna       : boolean, default True, do not write an ALL nan row to
             the store settable by the option 'io.hdf.dropna_table'
+        buffer_rows  : int, default None
+            Accumulate the rows of the appended DataFrames in memory and
+            write them to the table in batches of this many rows (see
+            ``AppendBuffer``). The buffered rows are written by ``flush``,
+            ``close``, or by a read of the key.
         Notes
         -----
         Does *not* check if data being appended overlaps with existing
@@ -907,6 +1174,20 @@ class HDFStore(StringMixin):
             raise TypeError("columns is not a supported keyword in append, "
                             "try data_columns")
 
+        if buffer_rows is not None:
+            kwargs.update(format=format, append=append, dropna=dropna)
+            buf = self._buffers.get(_absolute_key(key))
+            if buf is not None and not buf.matches(buffer_rows, kwargs):
+                # the buffered rows are written with their own arguments
+                buf.flush()
+                buf = None
+            if buf is None:
+                buf = AppendBuffer(self, key, buffer_rows, **kwargs)
+                self._buffers[_absolute_key(key)] = buf
+            buf.append(value)
+            return
+
+        self._flush_buffers(key)
         if dropna is None:
             dropna = get_option("io.hdf.dropna_table")
         if format is None:
@@ -1021,14 +1302,16 @@ class HDFStore(StringMixin):
         if not s.is_table:
             raise TypeError(
                 "cannot create table index on a Fixed format store")
-        s.create_index(**kwargs)
+        with self._locked(exclusive=True):
+            s.create_index(**kwargs)
 
     def groups(self):
         """return a list of all the top-level nodes (that are not themselves a
-        pandas storage object)
+        pandas storage object); the buffered appends are written first
         """
         _tables()
         self._check_if_open()
+        self._flush_buffers()
         return [
             g for g in self._handle.walkNodes()
             if (getattr(g._v_attrs, 'pandas_type', None) or
@@ -1049,6 +1332,10 @@ class HDFStore(StringMixin):
 
     def get_storer(self, key):
         """ return the storer object for a key, raise if not in the file """
+        try:
+            self._check_snapshot(key)
+        except KeyError:
+            return None
         group = self.get_node(key)
         if group is None:
             return None
@@ -1098,7 +1385,7 @@ class HDFStore(StringMixin):
                     if propindexes:
                         index = [a.name for a in s.axes if a.is_indexed]
                     new_store.append(
-                        k, data, index=index,
+                        k, data, index=index, format=s.format_type,
                         data_columns=getattr(s, 'data_columns', None),
                         encoding=s.encoding
                     )
@@ -1173,6 +1460,11 @@ class HDFStore(StringMixin):
                 # we are actually a table
                 if format == 'table':
                     pt += u('_table')
+                elif format == 'ctable':
+                    if pt != u('frame'):
+                        raise TypeError("the ctable format is only supported "
+                                        "for a DataFrame")
+                    pt += u('_ctable')
 
         # a storer node
         if u('table') not in pt:
@@ -1201,6 +1493,10 @@ class HDFStore(StringMixin):
                             tt = u('appendable_frame')
                         elif index.nlevels > 1:
                             tt = u('appendable_multiframe')
+                elif pt == u('frame_ctable'):
+                    index = getattr(value, 'index', None)
+                    if index is not None and index.nlevels == 1:
+                        tt = u('columnar_frame')
                 elif pt == u('wide_table'):
                     tt = u('appendable_panel')
                 elif pt == u('ndim_table'):
@@ -1222,8 +1518,66 @@ class HDFStore(StringMixin):
         except:
             error('_TABLE_MAP')
 
-    def _write_to_group(self, key, value, format, index=True, append=False,
-                        complib=None, encoding=None, **kwargs):
+    def _invalidate_cache(self, key):
+        """ drop the cached selections of the key (and its children) """
+        if self._cache is not None:
+            self._cache.invalidate(_absolute_key(key))
+
+    def _flush_buffers(self, key=None):
+        """ write the buffered appends of the key (or of all keys) """
+        if key is None:
+            buffers = list(self._buffers.values())
+        else:
+            buffers = [self._buffers.get(_absolute_key(key))]
+        for buf in buffers:
+            if buf is not None:
+                buf.flush()
+
+    @contextmanager
+    def _locked(self, exclusive=False, refresh=True):
+        """ hold an advisory lock on the file for an operation (a no-op
+        unless the store was opened with lock=True); nested operations are
+        covered by the outermost lock. A read-only store reopens the file
+        (when refresh) if it was modified since it was opened """
+        lock_file = self._lock_file
+        if lock_file is None or self._lock_depth:
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+            return
+
+        fcntl.flock(lock_file.fileno(),
+                    fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        self._lock_depth = 1
+        try:
+            if refresh and self._mode == 'r':
+                self._refresh()
+            yield
+        finally:
+            self._lock_depth = 0
+            if exclusive and self.is_open:
+                self._handle.flush()
+            if not lock_file.closed:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _refresh(self):
+        """ reopen a read-only handle if the file was modified """
+        stamp = _file_stamp(self._path)
+        if stamp != self._stamp and self.is_open:
+            self._handle.close()
+            self._handle = _tables().openFile(self._path, 'r',
+                                              **self._open_kwargs)
+            self._stamp = stamp
+
+    def _write_to_group(self, key, value, format, **kwargs):
+        with self._locked(exclusive=True):
+            self._write_group(key, value, format, **kwargs)
+
+    def _write_group(self, key, value, format, index=True, append=False,
+                     complib=None, encoding=None, **kwargs):
+        self._invalidate_cache(key)
         group = self.get_node(key)
 
         # remove the node if we are not appending
@@ -1233,7 +1587,8 @@ class HDFStore(StringMixin):
 
         # we don't want to store a table node at all if are object is 0-len
         # as there are not dtypes
-        if getattr(value, 'empty', None) and (format == 'table' or append):
+        if getattr(value, 'empty', None) and (format in ['table', 'ctable']
+                                              or append):
             return
 
         if group is None:
@@ -1298,11 +1653,13 @@ class TableIterator(object):
         chunksize : the passed chunking valeu (default is 50000)
         auto_close : boolean, automatically close the store at the end of
             iteration, default is False
+        prefetch : the number of chunks to read ahead in a background thread
+            (default is None, read each chunk when it is asked for)
         kwargs : the passed kwargs
         """
 
     def __init__(self, store, func, nrows, start=None, stop=None,
-                 chunksize=None, auto_close=False):
+                 chunksize=None, auto_close=False, prefetch=None):
         self.store = store
         self.func = func
         self.nrows = nrows or 0
@@ -1317,8 +1674,26 @@ class TableIterator(object):
 
         self.chunksize = chunksize
         self.auto_close = auto_close
+        self.prefetch = prefetch
+        self._prefetcher = None
 
     def __iter__(self):
+        chunks = self._iter_chunks()
+        if self.prefetch:
+            self._stop_prefetching()
+            chunks = self._prefetcher = PrefetchIterator(chunks,
+                                                         self.prefetch)
+        try:
+            for v in chunks:
+                yield v
+        finally:
+            # stop the background thread if the iteration is abandoned
+            if chunks is self._prefetcher:
+                self._stop_prefetching()
+
+        self.close()
+
+    def _iter_chunks(self):
         current = self.start
         while current < self.stop:
             stop = current + self.chunksize
@@ -1330,9 +1705,13 @@ class TableIterator(object):
 
             yield v
 
-        self.close()
+    def _stop_prefetching(self):
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+            self._prefetcher = None
 
     def close(self):
+        self._stop_prefetching()
         if self.auto_close:
             self.store.close()
 
@@ -1342,6 +1721,224 @@ class TableIterator(object):
         return results
 
 
+class AppendBuffer(object):
+
+    """ accumulate the rows of small DataFrames appended to a table in
+        preallocated arrays, and append them to the store in batches
+
+        Parameters
+        ----------
+
+        store : the HDFStore
+        key : the key of the table
+        buffer_rows : the number of rows to accumulate before writing
+        kwargs : passed to HDFStore.append when writing a batch
+
+        The schema (the columns, their dtypes and the index dtype) is taken
+        from the first appended frame, the following frames must match it.
+        An append with other arguments (buffer_rows or kwargs) flushes the
+        buffer, and starts a new one.
+        """
+
+    def __init__(self, store, key, buffer_rows, **kwargs):
+        buffer_rows = int(buffer_rows)
+        if buffer_rows <= 0:
+            raise ValueError("buffer_rows must be a positive integer")
+        self.store = store
+        self.key = key
+        self.buffer_rows = buffer_rows
+        self.kwargs = kwargs
+        self.nrows = 0
+        self.columns = None
+        self.dtypes = None
+        self.index = None
+        self._index_values = None
+        self._values = None
+
+    def __len__(self):
+        return self.nrows
+
+    def matches(self, buffer_rows, kwargs):
+        """ return True if an append with these arguments can be buffered
+        with the rows already buffered """
+        if int(buffer_rows) != self.buffer_rows:
+            return False
+        if sorted(kwargs.keys()) != sorted(self.kwargs.keys()):
+            return False
+        for k, v in compat.iteritems(kwargs):
+            try:
+                if not bool(v == self.kwargs[k]):
+                    return False
+            except ValueError:
+                # e.g. arrays
+                return False
+        return True
+
+    def _create(self, value):
+        """ set the schema and allocate the arrays """
+        if not isinstance(value, DataFrame):
+            raise TypeError("can only buffer the appends of a DataFrame")
+        if value.index.nlevels != 1:
+            raise ValueError("can only buffer the appends of a DataFrame "
+                             "with a single level index")
+        self.columns = value.columns
+        self.dtypes = list(value.dtypes)
+        self.index = value.index[:0]
+        self._index_values = np.empty(self.buffer_rows,
+                                      dtype=value.index.values.dtype)
+        self._values = [np.empty(self.buffer_rows, dtype=dtype)
+                        for dtype in self.dtypes]
+
+    def _validate(self, value):
+        """ raise if the frame does not match the schema """
+        if (not isinstance(value, DataFrame) or
+                value.index.nlevels != 1 or
+                not value.columns.equals(self.columns) or
+                list(value.dtypes) != self.dtypes or
+                value.index.values.dtype != self._index_values.dtype):
+            raise ValueError("cannot buffer an append to [%s], the columns, "
+                             "dtypes or index do not match the buffered rows"
+                             % self.key)
+
+    def append(self, value):
+        if self._values is None:
+            self._create(value)
+        else:
+            self._validate(value)
+
+        nrows = len(value)
+        if self.nrows + nrows > self.buffer_rows:
+            self.flush()
+
+        # too large to buffer
+        if nrows >= self.buffer_rows:
+            self.store.append(self.key, value, **self.kwargs)
+            return
+
+        start, stop = self.nrows, self.nrows + nrows
+        self._index_values[start:stop] = value.index.values
+        for i, v in enumerate(self._values):
+            v[start:stop] = value.iloc[:, i].values
+        self.nrows = stop
+
+        if self.nrows == self.buffer_rows:
+            self.flush()
+
+    def _get_index(self):
+        values = self._index_values[:self.nrows]
+        index = self.index
+        if isinstance(index, DatetimeIndex):
+            result = DatetimeIndex(values, name=index.name)
+            if index.tz is not None:
+                result = result.tz_localize('UTC').tz_convert(index.tz)
+            return result
+        return Index(values, name=index.name)
+
+    def flush(self):
+        """ append the buffered rows to the table """
+        if not self.nrows:
+            return
+
+        nrows = self.nrows
+        obj = DataFrame(dict([(i, v[:nrows])
+                              for i, v in enumerate(self._values)]),
+                        index=self._get_index(),
+                        columns=lrange(len(self._values)))
+        obj.columns = self.columns
+
+        # reset before appending, as the append flushes the buffers
+        self.nrows = 0
+        try:
+            self.store.append(self.key, obj, **self.kwargs)
+        except:
+            self.nrows = nrows
+            raise
+
+
+class QueryCache(object):
+
+    """ an LRU cache of the selections made on the tables of a store
+
+        Parameters
+        ----------
+
+        path : the path of the store file, a change in its modification time
+            or size drops all of the entries
+        max_bytes : the maximum number of bytes to hold (default is 64MB)
+        results : boolean, cache the selected objects as well as the
+            coordinates, default is False
+
+        Entries are keyed by a tuple of (kind, pathname, ...), where kind is
+        either 'coordinates' or 'results'
+        """
+
+    def __init__(self, path, max_bytes=None, results=False):
+        if max_bytes is None:
+            max_bytes = 64 * 1024 * 1024
+        self.path = path
+        self.max_bytes = max_bytes
+        self.results = results
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries = compat.OrderedDict()
+        self._stamp = _file_stamp(self.path)
+
+    def _validate_stamp(self):
+        """ drop everything if the file was modified """
+        stamp = _file_stamp(self.path)
+        if stamp != self._stamp:
+            self.clear()
+            self._stamp = stamp
+
+    def get(self, key):
+        """ return the cached value for the key, or None """
+        self._validate_stamp()
+        try:
+            entry = self._entries.pop(key)
+        except KeyError:
+            self.misses += 1
+            return None
+
+        # mark as most recently used
+        self._entries[key] = entry
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key, value, nbytes):
+        """ cache the value, evicting the least recently used entries to
+        stay within the byte budget """
+        self._validate_stamp()
+        self._discard(key)
+        if nbytes > self.max_bytes:
+            return
+        while self._entries and self.nbytes + nbytes > self.max_bytes:
+            self.nbytes -= self._entries.popitem(last=False)[1][0]
+        self._entries[key] = (nbytes, value)
+        self.nbytes += nbytes
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[0]
+
+    def invalidate(self, pathname):
+        """ drop the entries of this pathname and of any of its children """
+        prefix = pathname.rstrip('/') + '/'
+        for key in list(self._entries.keys()):
+            if key[1] == pathname or key[1].startswith(prefix):
+                self._discard(key)
+
+    def clear(self):
+        self._entries.clear()
+        self.nbytes = 0
+
+    def info(self):
+        return dict(hits=self.hits, misses=self.misses,
+                    entries=len(self._entries), nbytes=self.nbytes,
+                    max_bytes=self.max_bytes)
+
+
 class IndexCol(StringMixin):
 
     """ an index column description class
@@ -1980,6 +2577,22 @@ class DataIndexableCol(DataCol):
         return _tables().Int64Col()
 
 
+class ColumnarDataCol(DataIndexableCol):
+
+    """ a column of a columnar table; strings are stored with variable
+    lengths (as an array of offsets into a heap array), so they are not
+    limited to an itemsize, and their dtype has none """
+
+    def validate_col(self, itemsize=None):
+        return itemsize
+
+    def set_data(self, data, dtype=None):
+        super(ColumnarDataCol, self).set_data(data, dtype=dtype)
+        if (self.dtype is not None and
+                _ensure_decoded(self.kind) == u('string')):
+            self.dtype = u('bytes')
+
+
 class GenericDataIndexableCol(DataIndexableCol):
 
     """ represent a generic pytables data column """
@@ -2204,16 +2817,19 @@ class GenericFixed(Fixed):
         self.set_attrs()
 
     def read_array(self, key):
-        """ read an array for the specified node (off of group """
+        """ read an array for the specified node (off of group
+
+        the values are read directly into a single allocation, which is
+        returned as a view in the final layout (transposed, and as
+        datetime64/timedelta64 where needed) rather than copied """
         import tables
         node = getattr(self.group, key)
-        data = node[:]
         attrs = node._v_attrs
 
         transposed = getattr(attrs, 'transposed', False)
 
         if isinstance(node, tables.VLArray):
-            ret = data[0]
+            ret = node[0]
         else:
             dtype = getattr(attrs, 'value_type', None)
             shape = getattr(attrs, 'shape', None)
@@ -2222,21 +2838,35 @@ class GenericFixed(Fixed):
                 # length 0 axis
                 ret = np.empty(shape, dtype=dtype)
             else:
-                ret = data
+                ret = self.read_node(node)
 
             if dtype == u('datetime64'):
-                ret = np.array(ret, dtype='M8[ns]')
+                ret = _view_as_i8_type(ret, 'M8[ns]')
             elif dtype == u('timedelta64'):
                 if _np_version_under1p7:
                     raise TypeError(
                         "timedelta64 is not supported under under numpy < 1.7")
-                ret = np.array(ret, dtype='m8[ns]')
+                ret = _view_as_i8_type(ret, 'm8[ns]')
 
         if transposed:
             return ret.T
         else:
             return ret
 
+    def read_node(self, node):
+        """ read the values of an array node into a newly allocated
+        array, without an intermediate copy if we can """
+        if len(node.shape):
+            try:
+                out = np.empty(node.shape, dtype=node.atom.dtype)
+                node.read(out=out)
+                return out
+            except (TypeError, ValueError):
+                # PyTables < 3.0 cannot read into an array, nor can it
+                # read a non-native byteorder into one
+                pass
+        return node[:]
+
     def read_index(self, key):
         variety = _ensure_decoded(getattr(self.attrs, '%s_variety' % key))
 
@@ -2656,6 +3286,13 @@ class BlockManagerFixed(GenericFixed):
         for i in range(self.nblocks):
             blk_items = self.read_index('block%d_items' % i)
             values = self.read_array('block%d_values' % i)
+
+            # a categorical block, stored as its codes and levels
+            if getattr(self.attrs, 'block%d_levels_variety' % i,
+                       None) is not None:
+                levels = self.read_index('block%d_levels' % i)
+                values = Categorical(values[0], levels)
+
             blk = make_block(values, blk_items, items)
             blocks.append(blk)
 
@@ -2666,6 +3303,7 @@ class BlockManagerFixed(GenericFixed):
         data = obj._data
         if not data.is_consolidated():
             data = data.consolidate()
+        data = data.unmask(categorical=False)
 
         self.attrs.ndim = data.ndim
         for i, ax in enumerate(data.axes):
@@ -2676,7 +3314,14 @@ class BlockManagerFixed(GenericFixed):
         for i in range(nblocks):
             blk = data.blocks[i]
             # I have no idea why, but writing values before items fixed #2299
-            self.write_array('block%d_values' % i, blk.values, items=blk.items)
+            if blk.is_categorical:
+                self.write_array('block%d_values' % i,
+                                 blk.codes.reshape(blk.shape),
+                                 items=blk.items)
+                self.write_index('block%d_levels' % i, blk.levels)
+            else:
+                self.write_array('block%d_values' % i, blk.values,
+                                 items=blk.items)
             self.write_index('block%d_items' % i, blk.items)
 
 
@@ -2724,6 +3369,7 @@ class Table(Fixed):
     levels = 1
     is_table = True
     is_shape_reversed = False
+    data_column_class = DataIndexableCol
 
     def __init__(self, *args, **kwargs):
         super(Table, self).__init__(*args, **kwargs)
@@ -2961,7 +3607,7 @@ class Table(Fixed):
             def f(i, c):
                 klass = DataCol
                 if c in dc:
-                    klass = DataIndexableCol
+                    klass = self.data_column_class
                 return klass.create_for_block(i=i, name=c, pos=base_pos + i,
                                               version=self.version)
 
@@ -3044,7 +3690,7 @@ class Table(Fixed):
             return False
 
         # create the selection
-        self.selection = Selection(self, where=where, **kwargs)
+        self.selection = self.create_selection(where=where, **kwargs)
         values = self.selection.select()
 
         # convert the data
@@ -3199,6 +3845,7 @@ class Table(Fixed):
 
         # figure out data_columns and get out blocks
         block_obj = self.get_object(obj).consolidate()
+        block_obj = block_obj._constructor(block_obj._data.unmask())
         blocks = block_obj._data.blocks
         if len(self.non_index_axes):
             axis, axis_labels = self.non_index_axes[0]
@@ -3240,7 +3887,7 @@ class Table(Fixed):
             # we have a data_column
             if (data_columns and len(b.items) == 1 and
                     b.items[0] in data_columns):
-                klass = DataIndexableCol
+                klass = self.data_column_class
                 name = b.items[0]
                 self.data_columns.append(name)
 
@@ -3354,17 +4001,26 @@ class Table(Fixed):
         # description from the axes & values
         d['description'] = dict([(a.cname, a.typ) for a in self.axes])
 
+        filters = self.create_filters(complib=complib, complevel=complevel,
+                                      fletcher32=fletcher32)
+        if filters is not None:
+            d['filters'] = filters
+
+        return d
+
+    def create_filters(self, complib=None, complevel=None, fletcher32=False):
+        """ return the compression filters for the data (or None) """
         if complib:
             if complevel is None:
                 complevel = self._complevel or 9
-            filters = _tables().Filters(
+            return _tables().Filters(
                 complevel=complevel, complib=complib,
                 fletcher32=fletcher32 or self._fletcher32)
-            d['filters'] = filters
-        elif self._filters is not None:
-            d['filters'] = self._filters
+        return self._filters
 
-        return d
+    def create_selection(self, where=None, start=None, stop=None, **kwargs):
+        """ return the Selection for this where/start/stop """
+        return Selection(self, where=where, start=start, stop=stop, **kwargs)
 
     def read_coordinates(self, where=None, start=None, stop=None, **kwargs):
         """select coordinates (row numbers) from a table; return the
@@ -3379,8 +4035,8 @@ class Table(Fixed):
             return False
 
         # create the selection
-        self.selection = Selection(
-            self, where=where, start=start, stop=stop, **kwargs)
+        self.selection = self.create_selection(
+            where=where, start=start, stop=stop, **kwargs)
         coords = self.selection.select_coords()
         if self.selection.filter is not None:
             for field, op, filt in self.selection.filter.format():
@@ -3739,7 +4395,8 @@ class AppendableTable(LegacyTable):
 
         # create the selection
         table = self.table
-        self.selection = Selection(self, where, start=start, stop=stop, **kwargs)
+        self.selection = self.create_selection(where=where, start=start,
+                                               stop=stop, **kwargs)
         values = self.selection.select_coords()
 
         # delete the rows in reverse order
@@ -4014,6 +4671,318 @@ class AppendableNDimTable(AppendablePanelTable):
     obj_type = Panel4D
 
 
+class ColumnarFrameTable(Table):
+
+    """ a frame table that is stored column-by-column: the index and each
+        column are written as separate extendable (chunked and possibly
+        compressed) arrays in the group, sharing the row numbering of the
+        index array. Selecting a subset of the columns only reads (and
+        decompresses) the arrays of those columns.
+
+        All of the columns are data columns (and thus queryable). The column
+        names are used as the names of the arrays, so must be strings.
+
+        A string column is stored with variable lengths: its array holds the
+        end offset of each row in a heap array of the encoded bytes, which
+        is named with a '_heap' suffix.
+        """
+    pandas_kind = u('frame_ctable')
+    table_type = u('columnar_frame')
+    ndim = 2
+    obj_type = DataFrame
+    data_column_class = ColumnarDataCol
+    _indexables = None
+
+    @property
+    def format_type(self):
+        return 'ctable'
+
+    @property
+    def is_exists(self):
+        """ has the index array been created """
+        return u('index') in self.group
+
+    @property
+    def storable(self):
+        if self.is_exists:
+            return self.group
+        return None
+
+    @property
+    def table(self):
+        """ the column arrays, presenting the table interface that the
+        column objects use """
+        if self.is_exists:
+            return ColumnarNodes(self.group)
+        return None
+
+    @property
+    def nrows(self):
+        if self.is_exists:
+            return self.group._f_getChild(u('index')).nrows
+        return None
+
+    def create_index(self, columns=None, optlevel=None, kind=None):
+        """ PyTables indexes are only supported on the columns of a Table,
+        so this is a no-op for a columnar table """
+        pass
+
+    def create_selection(self, where=None, start=None, stop=None, **kwargs):
+        return ColumnarSelection(self, where=where, start=start, stop=stop,
+                                 **kwargs)
+
+    def heap_name(self, a):
+        """ the name of the heap array of a (string) column """
+        return u('%s_heap') % a.cname
+
+    def get_heap(self, a):
+        """ return the heap array of the column a, None if the column is
+        not stored with variable lengths """
+        name = self.heap_name(a)
+        if name in self.group:
+            return self.group._f_getChild(name)
+        return None
+
+    def read_values(self, a, start=None, stop=None, coordinates=None):
+        """ read the stored values of the column a, either the rows
+        [start:stop] or the rows at the passed coordinates """
+        node = self.group._f_getChild(a.cname)
+        heap = self.get_heap(a)
+
+        if coordinates is None:
+            if heap is None:
+                return node[start:stop]
+            start, stop, _ = slice(start, stop).indices(node.nrows)
+            ends = node[start:stop]
+            first = node[start - 1] if start > 0 and len(ends) else 0
+            begins = np.empty(len(ends), dtype=np.int64)
+            begins[:1] = first
+            begins[1:] = ends[:-1]
+            return _read_heap(heap, begins, ends)
+
+        if not len(coordinates):
+            if heap is None:
+                return node[0:0]
+            return np.array([], dtype='S1')
+
+        # a point selection must be increasing, so read the unique sorted
+        # coordinates and then expand to the requested order
+        coordinates, inverse = np.unique(coordinates, return_inverse=True)
+        if heap is None:
+            return node[coordinates].take(inverse)
+
+        # the begin of a row is the end of the previous row
+        previous = coordinates - 1
+        points = np.union1d(coordinates, previous[previous >= 0])
+        offsets = node[points]
+        ends = offsets[points.searchsorted(coordinates)]
+        begins = offsets[points.searchsorted(previous)]
+        begins[previous < 0] = 0
+        return _read_heap(heap, begins, ends).take(inverse)
+
+    def write(self, obj, axes=None, append=False, complib=None,
+              complevel=None, fletcher32=None, min_itemsize=None,
+              chunksize=None, expectedrows=None, dropna=True,
+              data_columns=None, **kwargs):
+
+        if not append and self.is_exists:
+            for name in list(self.group._v_children):
+                self._handle.removeNode(self.group, name, recursive=True)
+
+        # the column names are the names of the arrays
+        for c in obj.columns:
+            if not isinstance(c, string_types) or c == u('index'):
+                raise ValueError("the ctable format requires string column "
+                                 "names (other than 'index'), [%s] is "
+                                 "invalid" % pprint_thing(c))
+
+        # create the axes, every column is a data column
+        self.create_axes(axes=axes, obj=obj, validate=append,
+                         min_itemsize=min_itemsize, data_columns=True,
+                         **kwargs)
+
+        # the string columns are stored with a heap array
+        vlstrings = [a for a in self.values_axes
+                     if _ensure_decoded(a.kind) == u('string')]
+        vl_cnames = set([a.cname for a in vlstrings])
+        for a in vlstrings:
+            if self.heap_name(a) in obj.columns:
+                raise ValueError("the ctable format stores the string "
+                                 "column [%s] with a [%s] array, which "
+                                 "conflicts with a column name"
+                                 % (a.cname, self.heap_name(a)))
+
+        if not self.is_exists:
+
+            # set the table attributes
+            self.set_attrs()
+
+            # create an array for each of the indexables and columns
+            filters = self.create_filters(complib=complib,
+                                          complevel=complevel,
+                                          fletcher32=fletcher32)
+            if expectedrows is None:
+                expectedrows = max(self.nrows_expected, 10000)
+            for a in self.axes:
+                if a.cname in vl_cnames:
+                    atom = _tables().Int64Atom()
+                    self._handle.createEArray(
+                        self.group, self.heap_name(a), _tables().UInt8Atom(),
+                        shape=(0,), filters=filters,
+                        expectedrows=expectedrows * a.itemsize)
+                else:
+                    atom = _tables().Atom.from_dtype(a.typ.dtype)
+                self._handle.createEArray(
+                    self.group, a.cname, atom, shape=(0,), filters=filters,
+                    expectedrows=expectedrows)
+
+        # update my info
+        self.set_info()
+
+        # validate the axes and set the kinds
+        table = self.table
+        for a in self.axes:
+            a.validate_and_set(table, append)
+
+        # add the rows
+        self.write_data(chunksize, dropna=dropna)
+
+    def write_data(self, chunksize, dropna=True):
+        """ append the indexes and the values of each column to their
+        arrays, chunk-by-chunk """
+
+        indexes = [a.cvalues for a in self.index_axes]
+        values = [a.take_data().ravel() for a in self.values_axes]
+        nrows = self.nrows_expected
+
+        # if dropna==True, then drop ALL nan rows
+        mask = None
+        if dropna and len(values):
+            mask = com.isnull(values[0])
+            for v in values[1:]:
+                mask &= com.isnull(v)
+            if not mask.any():
+                mask = None
+
+        # write the chunks
+        if chunksize is None:
+            chunksize = 100000
+
+        nodes = [self.group._f_getChild(a.cname) for a in self.axes]
+        heaps = [self.get_heap(a) for a in self.axes]
+        for start_i in range(0, nrows, chunksize):
+            end_i = min(start_i + chunksize, nrows)
+            for node, heap, v in zip(nodes, heaps, indexes + values):
+                v = v[start_i:end_i]
+                if mask is not None:
+                    v = v[~mask[start_i:end_i]]
+                if not len(v):
+                    continue
+
+                # append the encoded bytes to the heap, and their end
+                # offsets to the array
+                if heap is not None:
+                    lengths, data = _encode_heap(v)
+                    v = np.cumsum(lengths) + heap.nrows
+                    if len(data):
+                        heap.append(data)
+                node.append(v)
+
+        for node in nodes + heaps:
+            if node is not None:
+                node.flush()
+
+    def read(self, where=None, columns=None, start=None, stop=None,
+             **kwargs):
+
+        if not self.infer_axes():
+            return None
+
+        # only read the arrays of the selected columns
+        values_axes = self.values_axes
+        if columns is not None:
+            values_axes = [a for a in values_axes if a.name in columns]
+        axes = self.index_axes + values_axes
+
+        self.selection = self.create_selection(where=where, start=start,
+                                               stop=stop, **kwargs)
+        values = self.selection.select(axes)
+        for a in axes:
+            a.set_info(self.info)
+            a.convert(values, nan_rep=self.nan_rep, encoding=self.encoding)
+
+        info = (self.info.get(self.non_index_axes[0][0], dict())
+                if len(self.non_index_axes) else dict())
+        cols = Index([a.name for a in values_axes])
+        names = info.get('names')
+        if names is not None:
+            cols.set_names(names, inplace=True)
+
+        index = self.index_axes[0].take_data()
+        df = DataFrame(dict([(a.name, a.take_data()) for a in values_axes]),
+                       index=index, columns=cols)
+
+        # apply the selection filters & axis orderings
+        return self.process_axes(df, columns=columns)
+
+    def read_column(self, column, where=None, start=None, stop=None,
+                    **kwargs):
+        """return a single column from the table, only reading its array"""
+
+        # infer the data kind
+        if not self.infer_axes():
+            return False
+
+        if where is not None:
+            raise TypeError("read_column does not currently accept a where "
+                            "clause")
+
+        for a in self.axes:
+            if column == a.name:
+                a.set_info(self.info)
+                values = self.read_values(a, start=start, stop=stop)
+                return Series(a.convert(values, nan_rep=self.nan_rep,
+                                        encoding=self.encoding).take_data())
+
+        raise KeyError("column [%s] not found in the table" % column)
+
+    def delete(self, where=None, start=None, stop=None, **kwargs):
+        """ only support deleting the table in its entirety """
+        if where is None and start is None and stop is None:
+            nrows = self.nrows
+            self._handle.removeNode(self.group, recursive=True)
+            return nrows
+
+        raise TypeError("cannot delete rows from a ctable, only the table "
+                        "in its entirety")
+
+
+class ColumnarNodes(object):
+
+    """ the arrays of a columnar table, presenting the subset of the
+        PyTables Table interface used by the column objects: the attributes
+        and a description (the atom of each array, by cname) """
+
+    def __init__(self, group):
+        self._group = group
+
+    @property
+    def _v_attrs(self):
+        return self._group._v_attrs
+
+    @property
+    def description(self):
+        return self
+
+    def __getattr__(self, cname):
+        if cname.startswith('_'):
+            raise AttributeError(cname)
+        try:
+            return self._group._f_getChild(cname).atom
+        except LookupError:
+            raise AttributeError(cname)
+
+
 def _reindex_axis(obj, axis, labels, other=None):
     ax = obj._get_axis(axis)
     labels = _ensure_index(labels)
@@ -4156,6 +5125,60 @@ def _unconvert_index_legacy(data, kind, legacy=False, encoding=None):
     return index
 
 
+def _view_as_i8_type(values, dtype):
+    """ return int64 values as a view of the datetime64/timedelta64 dtype,
+    converting only if they are not int64 """
+    if values.dtype == np.int64:
+        return values.view(dtype)
+    return np.array(values, dtype=dtype)
+
+
+def _encode_heap(data):
+    """ return the lengths and the concatenated bytes (as uint8) of a
+    fixed-width bytes array, dropping the padding """
+    data = np.ascontiguousarray(data)
+    itemsize = data.dtype.itemsize
+    lengths = np.char.str_len(data).astype(np.int64)
+    raw = data.view(np.uint8).reshape(len(data), itemsize)
+    return lengths, raw[np.arange(itemsize) < lengths[:, None]]
+
+
+def _decode_heap(data, begins, ends):
+    """ return the strings [begin:end] of the uint8 data as a fixed-width
+    bytes array; for very unequal lengths (where the padding of a fixed-width
+    array would dwarf the data) return an object array of bytes """
+    lengths = ends - begins
+    if not len(lengths):
+        return np.array([], dtype='S1')
+
+    itemsize = max(int(lengths.max()), 1)
+    if len(lengths) * itemsize > 4 * len(data) + (1 << 20):
+        return np.array([data[b:e].tostring() for b, e in zip(begins, ends)],
+                        dtype=object)
+
+    positions = begins[:, None] + np.arange(itemsize)
+    valid = np.arange(itemsize) < lengths[:, None]
+    raw = np.zeros((len(lengths), itemsize), dtype=np.uint8)
+    raw[valid] = data[positions[valid]]
+    return raw.view('S%d' % itemsize).ravel()
+
+
+def _read_heap(heap, begins, ends):
+    """ read the strings [begin:end] of the heap array, reading the
+    spanned range at once if it is dense enough, otherwise string-by-string
+    """
+    if not len(ends):
+        return np.array([], dtype='S1')
+
+    lo, hi = int(begins.min()), int(ends.max())
+    needed = int((ends - begins).sum())
+    if hi - lo <= 4 * needed + (1 << 20):
+        return _decode_heap(heap[lo:hi], begins - lo, ends - lo)
+
+    return np.array([heap[b:e].tostring() for b, e in zip(begins, ends)],
+                    dtype=object)
+
+
 def _convert_string_array(data, encoding, itemsize=None):
 
     # encode if needed
@@ -4306,11 +5329,42 @@ class Selection(object):
                 .format(where, ','.join(q.keys()))
             )
 
+    @property
+    def cache(self):
+        """ the query cache of the store (or None) """
+        return getattr(self.table.parent, '_cache', None)
+
+    @property
+    def cache_key(self):
+        """ return a hashable key of (pathname, where, start, stop) that
+        identifies this selection; the where is normalized to the expression
+        and its resolved condition and filter values, None if the selection
+        cannot be cached """
+        if self.coordinates is not None:
+            return None
+
+        where = None
+        if self.terms is not None:
+            try:
+                filters = None
+                if self.filter is not None:
+                    filters = tuple([(field, tuple(filt)) for field, op, filt
+                                     in self.filter.format()])
+            except (NotImplementedError, TypeError):
+                return None
+            condition = None
+            if self.condition is not None:
+                condition = self.condition.format()
+            where = (pprint_thing(self.terms.expr), condition, filters)
+        return (self.table.pathname, where, self.start, self.stop)
+
     def select(self):
         """
         generate the selection
         """
         if self.condition is not None:
+            if self.cache is not None:
+                return self.table.table.readCoordinates(self.select_coords())
             return self.table.table.readWhere(self.condition.format(),
                                               start=self.start, stop=self.stop)
         elif self.coordinates is not None:
@@ -4319,8 +5373,23 @@ class Selection(object):
 
     def select_coords(self):
         """
-        generate the selection
+        generate the selection, using the coordinates cache if we have one
         """
+        cache = self.cache
+        if cache is None or self.condition is None:
+            return self._select_coords()
+
+        key = self.cache_key
+        if key is None:
+            return self._select_coords()
+        key = (u('coordinates'),) + key
+        coords = cache.get(key)
+        if coords is None:
+            coords = self._select_coords()
+            cache.set(key, coords, coords.nbytes)
+        return coords
+
+    def _select_coords(self):
         start, stop = self.start, self.stop
         nrows = self.table.nrows
         if start is None:
@@ -4341,8 +5410,115 @@ class Selection(object):
 
         return np.arange(start, stop)
 
+
+class ColumnarSelection(Selection):
+
+    """
+    Carries out a selection operation on a ColumnarFrameTable. A condition
+    is evaluated with numexpr chunk-by-chunk, reading only the arrays it
+    references; the selected columns are then read at the coordinates.
+
+    """
+    chunksize = 100000
+
+    def select(self, axes):
+        """
+        return a dict of cname -> the selected values for these axes
+        """
+        read = self.table.read_values
+        if self.condition is None and self.coordinates is None:
+            return dict([(a.cname, read(a, start=self.start, stop=self.stop))
+                         for a in axes])
+
+        coords = self.select_coords()
+        return dict([(a.cname, read(a, coordinates=coords)) for a in axes])
+
+    def _select_coords(self):
+        if self.condition is None:
+            return super(ColumnarSelection, self)._select_coords()
+
+        # numexpr is a requirement of PyTables
+        import numexpr as ne
+
+        start, stop = self.start, self.stop
+        nrows = self.table.nrows
+        if start is None:
+            start = 0
+        elif start < 0:
+            start += nrows
+        if stop is None:
+            stop = nrows
+        elif stop < 0:
+            stop += nrows
+        stop = min(stop, nrows)
+
+        # the arrays that the condition references
+        condition = self.condition.format()
+        names = set(re.findall(r'[A-Za-z_]\w*', condition))
+        axes = [a for a in self.table.axes if a.cname in names]
+
+        coords = [np.array([], dtype=np.int64)]
+        for s in range(start, stop, self.chunksize):
+            e = min(s + self.chunksize, stop)
+            local_dict = dict([(a.cname, self.table.read_values(a, start=s,
+                                                                stop=e))
+                               for a in axes])
+
+            # numexpr compares fixed-width strings
+            for k, v in local_dict.items():
+                if v.dtype == np.object_:
+                    local_dict[k] = np.asarray(v, dtype=np.bytes_)
+            mask = ne.evaluate(condition, local_dict=local_dict)
+            coords.append(np.flatnonzero(mask).astype(np.int64) + s)
+
+        return np.concatenate(coords)
+
 # utilities ###
 
+def _file_stamp(path):
+    """ return the (modification time, size) of the file, or None """
+    try:
+        st = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return st.st_mtime, st.st_size
+
+
+def _get_metadata_snapshot(key):
+    """ return the cached metadata snapshot of the (path, stamp), or None
+    """
+    snapshot = _metadata_snapshots.pop(key, None)
+    if snapshot is not None:
+        # mark as most recently used
+        _metadata_snapshots[key] = snapshot
+    return snapshot
+
+
+def _set_metadata_snapshot(key, snapshot):
+    """ cache the metadata snapshot of the (path, stamp), evicting the
+    least recently used snapshots """
+    _metadata_snapshots.pop(key, None)
+    _metadata_snapshots[key] = snapshot
+    while len(_metadata_snapshots) > _MAX_METADATA_SNAPSHOTS:
+        _metadata_snapshots.popitem(last=False)
+
+
+def _absolute_key(key):
+    """ return the key as an absolute pathname """
+    if not key.startswith('/'):
+        key = '/' + key
+    return key
+
+
+def _estimate_nbytes(obj):
+    """ return an estimate of the bytes held by a pandas object """
+    nbytes = sum([getattr(ax, 'nbytes', 0) for ax in obj.axes])
+    data = getattr(obj, '_data', None)
+    if data is not None and hasattr(data, 'blocks'):
+        nbytes += sum([b.values.nbytes for b in data.blocks])
+    return nbytes
+
+
 def timeit(key, df, fn=None, remove=True, **kwargs):
     if fn is None:
         fn = 'timeit.h5'
@@ -0,0 +1,151 @@
+import nose
+
+import numpy as np
+
+import pandas.util.testing as tm
+from pandas import DataFrame, HDFStore, ChunkedFrame, date_range
+from pandas.util.testing import (assert_frame_equal, assert_series_equal,
+                                 assert_almost_equal)
+
+try:
+    import tables
+except ImportError:
+    raise nose.SkipTest('no pytables')
+
+from pandas.io.tests.test_pytables import ensure_clean_store
+
+
+class TestChunkedFrame(tm.TestCase):
+
+    def setUp(self):
+        self.path = '__%s__.h5' % tm.rands(10)
+        self.df = DataFrame({'A': np.random.randn(1000),
+                             'B': np.random.randn(1000),
+                             'C': np.random.randint(0, 100, 1000),
+                             'key': np.array(['foo', 'bar', 'baz',
+                                              'qux'] * 250, dtype=object)},
+                            index=date_range('20130101', periods=1000,
+                                             freq='T'))
+        self.df.ix[10:20, 'A'] = np.nan
+
+    def test_lazy_and_reductions(self):
+        df = self.df
+        with ensure_clean_store(self.path) as store:
+            store.append('df', df, data_columns=['C'])
+            cf = ChunkedFrame(store, 'df', chunksize=99)
+
+            self.assertRaises(TypeError, ChunkedFrame, store.filename, 'df')
+            store.put('fixed', df)
+            self.assertRaises(TypeError, ChunkedFrame, store, 'fixed')
+
+            # column selection only reads the columns
+            assert_frame_equal(cf[['A', 'B']].compute(), df[['A', 'B']])
+            self.assertEqual(cf[['A', 'B']].columns, ['A', 'B'])
+            assert_frame_equal(cf.head(150), df.head(150))
+
+            numeric = df[['A', 'B', 'C']]
+            assert_series_equal(cf[['A', 'B', 'C']].sum(), numeric.sum())
+            assert_series_equal(cf.count(), df.count())
+            assert_series_equal(cf[['A', 'B', 'C']].min(), numeric.min())
+            assert_series_equal(cf[['A', 'B', 'C']].max(), numeric.max())
+            assert_series_equal(cf.mean(), df.mean())
+            assert_almost_equal(cf['A'].sum(), df['A'].sum())
+            assert_almost_equal(cf['A'].mean(), df['A'].mean())
+            self.assertEqual(cf['A'].count(), df['A'].count())
+            assert_series_equal(cf['key'].value_counts().sort_index(),
+                                df['key'].value_counts().sort_index())
+            self.assertRaises(TypeError, cf.value_counts)
+
+            # elementwise operations and masks
+            result = (cf['A'] * 2 + cf['B']).abs()
+            assert_series_equal(result.compute(),
+                                (df['A'] * 2 + df['B']).abs())
+            result = cf[(cf['A'] > 0) & (cf['key'] != 'foo')]
+            assert_frame_equal(result.compute(),
+                               df[(df['A'] > 0) & (df['key'] != 'foo')])
+            assert_almost_equal((1 - cf['B']).sum(), (1 - df['B']).sum())
+            assert_series_equal(cf['A'].fillna(0).compute(),
+                                df['A'].fillna(0))
+
+            # where
+            c = 50
+            result = cf.select('C>c')
+            assert_frame_equal(result.compute(), df[df.C > 50])
+            assert_almost_equal(result['B'].sum(), df[df.C > 50].B.sum())
+            result = result.select(['C<75'], columns=['A', 'C'])
+            expected = df[(df.C > 50) & (df.C < 75)][['A', 'C']]
+            assert_frame_equal(result.compute(), expected)
+
+            # an empty selection
+            result = cf.select('C>1000')
+            assert_frame_equal(result.compute(), df.iloc[0:0])
+            self.assertEqual(result['A'].count(), 0)
+
+            # only the same selection can be combined
+            self.assertRaises(ValueError, lambda: cf['A'] +
+                              cf.select('C>50')['A'])
+
+    def test_groupby(self):
+        df = self.df
+        with ensure_clean_store(self.path) as store:
+            store.append('df', df)
+            cf = ChunkedFrame(store, 'df', chunksize=99)
+            g = df.groupby('key')
+
+            for how in ['sum', 'count', 'min', 'max', 'mean', 'first',
+                        'last', 'prod']:
+                result = getattr(cf.groupby('key')['A'], how)()
+                expected = getattr(g['A'], how)()
+                assert_series_equal(result, expected)
+            assert_series_equal(cf.groupby('key').size(), g.size())
+            assert_frame_equal(cf.groupby('key').sum(), g.sum())
+            assert_frame_equal(cf.groupby('key').mean(), g.mean())
+
+            result = cf.groupby(['key', 'C'])['B'].agg('sum')
+            assert_series_equal(result, df.groupby(['key', 'C'])['B'].sum())
+
+            result = cf.groupby('key').agg({'A': 'mean', 'C': 'max'})
+            expected = g.agg({'A': 'mean', 'C': 'max'})
+            assert_frame_equal(result, expected[result.columns])
+
+            # group by a lazy key
+            result = cf['B'].groupby(cf['C'] % 3).sum()
+            assert_series_equal(result, df['B'].groupby(df['C'] % 3).sum())
+
+            self.assertRaises(ValueError, cf.groupby('key').agg, 'std')
+
+    def test_to_hdf(self):
+        df = self.df
+        with ensure_clean_store(self.path) as store:
+            store.append('df', df)
+            cf = ChunkedFrame(store, 'df', chunksize=99)
+
+            result = cf[cf['A'] > 0][['A', 'B']] * 2
+            result.to_hdf(store, 'result')
+            expected = df[df['A'] > 0][['A', 'B']] * 2
+            assert_frame_equal(store.select('result'), expected)
+
+            # replaced, or appended to
+            result.to_hdf(store, 'result')
+            assert_frame_equal(store.select('result'), expected)
+            result.to_hdf(store, 'result', append=True)
+            assert_frame_equal(store.select('result'),
+                               expected.append(expected))
+
+            cf['B'].to_hdf(store, 'series')
+            assert_series_equal(store.select('series'), df['B'])
+
+            self.assertRaises(ValueError, cf.to_hdf, store, 'df')
+
+            # to another file
+            with tm.ensure_clean('__%s__.h5' % tm.rands(10)) as path:
+                cf.to_hdf(path, 'df')
+                other = HDFStore(path, mode='r')
+                try:
+                    assert_frame_equal(other.select('df'), df)
+                finally:
+                    other.close()
+
+if __name__ == '__main__':
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
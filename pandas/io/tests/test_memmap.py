@@ -0,0 +1,132 @@
+import os
+import json
+import shutil
+import tempfile
+
+import nose
+import numpy as np
+
+import pandas as pd
+import pandas.util.testing as tm
+from pandas import (DataFrame, Series, MultiIndex, Timestamp, date_range,
+                    read_mmap, isnull)
+import pandas.io.memmap as memmap
+from pandas.compat import u
+from pandas.util.testing import assert_frame_equal
+
+
+class TestMmap(tm.TestCase):
+    _multiprocess_can_split_ = True
+
+    def setUp(self):
+        self.dirpath = tempfile.mkdtemp()
+        self.path = os.path.join(self.dirpath, 'frame')
+
+    def tearDown(self):
+        shutil.rmtree(self.dirpath, ignore_errors=True)
+
+    def roundtrip(self, df, **kwargs):
+        df.to_mmap(self.path)
+        return read_mmap(self.path, **kwargs)
+
+    def test_numeric(self):
+        df = tm.makeDataFrame()
+        df['int'] = 1
+        df['bool'] = df['A'] > 0
+        df.index.name = 'foo'
+        df.columns.name = 'bar'
+        result = self.roundtrip(df)
+        assert_frame_equal(result, df)
+
+        # the blocks are memory-mapped views
+        for b in result._data.blocks:
+            self.assertIsInstance(b.values.base, np.memmap)
+
+        # copy-on-write, the file is not changed
+        result['A'] = 0.
+        assert_frame_equal(read_mmap(self.path), df)
+
+        # read-only
+        result = read_mmap(self.path, mode='r')
+        assert_frame_equal(result, df)
+        def f():
+            result._data.blocks[0].values[0, 0] = 1.
+        self.assertRaises(ValueError, f)
+        self.assertRaises(ValueError, read_mmap, self.path, mode='w')
+
+    def test_datelike_and_index(self):
+        df = DataFrame(dict(A=np.arange(5.),
+                            date=Timestamp('20130101'),
+                            ),
+                       index=date_range('20130101', periods=5,
+                                        tz='US/Eastern'))
+        df['td'] = df['date'] - Timestamp('20121201')
+        df.ix[2, 'date'] = np.nan
+        result = self.roundtrip(df)
+        assert_frame_equal(result, df)
+        self.assertEqual(result.index.tz, df.index.tz)
+        self.assertEqual(result.index.freq, df.index.freq)
+
+        df = DataFrame(np.random.randn(6, 2), columns=[1, 2],
+                       index=MultiIndex.from_tuples(
+                           [('a', 1), ('a', 2), ('b', 1), ('b', 2),
+                            ('c', 1), ('c', 2)], names=['x', 'y']))
+        assert_frame_equal(self.roundtrip(df), df)
+
+    def test_strings(self):
+        df = tm.makeDataFrame()
+        df['string'] = 'foo'
+        df['unicode'] = u('σ')
+        df.ix[3:5, 'string'] = np.nan
+        df['empty'] = ''
+        result = self.roundtrip(df)
+
+        # the strings are decoded on the first access of their block
+        blk = [b for b in result._data.blocks if b.dtype == object][0]
+        self.assertFalse(blk.is_decoded)
+        self.assertEqual(blk.shape, (3, len(df)))
+        assert_frame_equal(result, df)
+        self.assertTrue(blk.is_decoded)
+
+        # checking whether to consolidate does not decode the strings
+        with pd.option_context('mode.consolidation', 'lazy'):
+            result = read_mmap(self.path)
+            result['new'] = 1.
+            self.assertFalse(result._data.is_consolidated())
+            blk = [b for b in result._data.blocks if b.dtype == object][0]
+            self.assertFalse(blk.is_decoded)
+
+        # only the selected columns are read
+        result = self.roundtrip(df, columns=['unicode', 'B', 'A'])
+        assert_frame_equal(result, df[['unicode', 'B', 'A']])
+        self.assertRaises(KeyError, read_mmap, self.path, columns=['foo'])
+
+        # only strings are supported
+        df['obj'] = Series([1, 'a'] * 15, index=df.index)
+        self.assertRaises(TypeError, df.to_mmap, self.path)
+
+    def test_read_strings(self):
+        df = DataFrame({'A': ['foo', np.nan, u('σ'), '']})
+        df.to_mmap(self.path)
+        with open(os.path.join(self.path, memmap._SCHEMA)) as fh:
+            spec = json.load(fh)['blocks'][0]['arrays'][0]
+
+        heap = memmap._read_strings(self.path, spec, 'c')
+        self.assertIsInstance(heap.offsets, np.memmap)
+        self.assertIsInstance(heap.heap, np.memmap)
+        self.assertEqual(len(heap), 4)
+        self.assertEqual(heap[0], 'foo')
+        self.assertTrue(isnull(heap[1]))
+        self.assertEqual(heap[2], u('σ'))
+        self.assertEqual(heap[-1], '')
+        self.assertRaises(IndexError, heap.__getitem__, 4)
+        tm.assert_series_equal(Series(np.asarray(heap), name='A'), df['A'])
+
+    def test_empty(self):
+        df = DataFrame(columns=['A', 'B'], dtype='float64')
+        assert_frame_equal(self.roundtrip(df), df)
+
+
+if __name__ == '__main__':
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
@@ -93,6 +93,24 @@ class TestAPI(TestPackers):
         for i, result in enumerate(read_msgpack(s,iterator=True)):
             tm.assert_frame_equal(result,dfs[i])
 
+    def test_iterator_prefetch(self):
+
+        dfs = [ DataFrame(np.random.randn(10,2)) for i in range(5) ]
+        s = to_msgpack(None,*dfs)
+        results = list(read_msgpack(s,iterator=True,prefetch=2))
+        self.assertEqual(len(results), 5)
+        for i, result in enumerate(results):
+            tm.assert_frame_equal(result,dfs[i])
+
+        # stopped early
+        it = read_msgpack(s,iterator=True,prefetch=1)
+        for i, result in enumerate(it):
+            tm.assert_frame_equal(result,dfs[i])
+            if i == 1:
+                break
+        it.close()
+        self.assertIsNone(it._prefetcher)
+
 class TestNumpy(TestPackers):
 
     def test_numpy_scalar_float(self):
@@ -384,6 +402,14 @@ class TestNDFrame(TestPackers):
         result = self.encode_decode(df)
         assert_frame_equal(result, df)
 
+    def test_categorical_frame(self):
+
+        df = DataFrame({'A': pandas.Categorical.from_array(['b', 'a', 'b', 'c']),
+                        'B': [1, 2, 3, 4]})
+        result = self.encode_decode(df)
+        self.assertIsNotNone(result._data.get_categorical('A'))
+        assert_frame_equal(result, df)
+
 class TestSparse(TestPackers):
 
     def _check_roundtrip(self, obj, comparator, **kwargs):
@@ -1131,6 +1131,32 @@ baz,7,8,9
         tm.assert_frame_equal(chunks[1], df[2:4])
         tm.assert_frame_equal(chunks[2], df[4:])
 
+    def test_read_chunksize_prefetch(self):
+        df = self.read_csv(StringIO(self.data1), index_col=0)
+
+        reader = self.read_csv(StringIO(self.data1), index_col=0,
+                               chunksize=2, prefetch=2)
+        chunks = list(reader)
+        self.assertEqual(len(chunks), 3)
+        tm.assert_frame_equal(pd.concat(chunks), df)
+
+        # stopped early
+        reader = self.read_csv(StringIO(self.data1), index_col=0,
+                               chunksize=1, prefetch=1)
+        it = iter(reader)
+        tm.assert_frame_equal(next(it), df[:1])
+        reader.close()
+        self.assertIsNone(reader._prefetcher)
+
+        # errors are raised in the consumer
+        data = 'a,b\n1,2\n3,4,5\n6,7'
+        reader = self.read_csv(StringIO(data), chunksize=1, prefetch=2)
+        self.assertRaises(Exception, list, reader)
+
+        self.assertRaises(ValueError, list,
+                          self.read_csv(StringIO(self.data1), chunksize=2,
+                                        prefetch=0.5))
+
     def test_read_chunksize_named(self):
         reader = self.read_csv(
             StringIO(self.data1), index_col='index', chunksize=2)
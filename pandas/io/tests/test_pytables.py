@@ -3181,6 +3181,55 @@ class TestHDFStore(tm.TestCase):
             tm.assert_frame_equal(expected, result)
             self.assertEqual(len(result), 100)
 
+    def test_to_hdf_partition_on(self):
+
+        df = tm.makeTimeDataFrame(60)
+        df['symbol'] = ['foo', 'bar', 'baz'] * 20
+        df['flag'] = [True, False] * 30
+
+        # partitions as keys of a single file
+        with ensure_clean_path(self.path) as path:
+            df.to_hdf(path, 'df_{symbol}_{1}', partition_on=['symbol', 'flag'],
+                      format='table', threads=3, mode='w')
+            with get_store(path) as store:
+                self.assertEqual(len(store.keys()), 6)
+                for (symbol, flag), g in df.groupby(['symbol', 'flag']):
+                    key = 'df_%s_%s' % (symbol, flag)
+                    tm.assert_frame_equal(store.select(key), g)
+
+            # appended to
+            df.to_hdf(path, 'df_{symbol}_{1}', partition_on=['symbol', 'flag'],
+                      format='table', append=True)
+            with get_store(path) as store:
+                g = df[(df.symbol == 'foo') & df.flag]
+                tm.assert_frame_equal(store.select('df_foo_True'),
+                                      concat([g, g]))
+
+        # to an open store
+        with ensure_clean_store(self.path) as store:
+            df.to_hdf(store, 'df_{0}', partition_on='symbol')
+            self.assertEqual(sorted(store.keys()),
+                             ['/df_bar', '/df_baz', '/df_foo'])
+            tm.assert_frame_equal(store['df_bar'], df[df.symbol == 'bar'])
+            self.assertRaises(ValueError, df.to_hdf, store, 'df',
+                              partition_on='symbol')
+
+        # a file per partition, and a manifest
+        with ensure_clean_path(['foo.h5', 'bar.h5', 'baz.h5',
+                                'manifest.json']) as paths:
+            pattern = paths[0].replace('foo', '{symbol}')
+            df.to_hdf(pattern, 'df', partition_on='symbol', threads=2,
+                      manifest=paths[3])
+            for p, symbol in zip(paths[:3], ['foo', 'bar', 'baz']):
+                tm.assert_frame_equal(read_hdf(p, 'df'),
+                                      df[df.symbol == symbol])
+            import json
+            with open(paths[3]) as fh:
+                manifest = json.load(fh)
+            self.assertEqual(manifest['partition_on'], ['symbol'])
+            self.assertEqual([p['nrows'] for p in manifest['partitions']],
+                             [20, 20, 20])
+
     def test_select_iterator(self):
 
         # single table
@@ -3210,6 +3259,20 @@ class TestHDFStore(tm.TestCase):
             result = concat(results)
             tm.assert_frame_equal(result, expected)
 
+            # read ahead in a background thread
+            results = list(store.select('df',chunksize=100,prefetch=2))
+            self.assertEqual(len(results), 5)
+            tm.assert_frame_equal(concat(results), expected)
+
+            it = store.select('df',chunksize=100,prefetch=1)
+            for s in it:
+                break
+            it.close()
+            self.assertIsNone(it._prefetcher)
+            results = store.select('df',where='index>df.index[250]',
+                                   chunksize=100,prefetch=3)
+            tm.assert_frame_equal(concat(list(results)), expected[251:])
+
         with ensure_clean_path(self.path) as path:
 
             df = tm.makeTimeDataFrame(500)
@@ -3609,6 +3672,434 @@ class TestHDFStore(tm.TestCase):
             result = store.select_column('df3', 'string', start=-2, stop=2)
             tm.assert_almost_equal(result.values, df3['string'].values[-2:2])
 
+    def test_ctable(self):
+
+        df = tm.makeTimeDataFrame()
+        df['string'] = 'foo'
+        df.ix[4:6, 'string'] = np.nan
+        df['int'] = 1
+        df.ix[2:7, 'int'] = 2
+
+        with ensure_clean_store(self.path) as store:
+
+            # put / append
+            store.put('df', df[:10], format='ctable')
+            store.append('df', df[10:])
+            tm.assert_frame_equal(store.select('df'), df)
+            self.assertEqual(store.get_storer('df').format_type, 'ctable')
+            self.assertEqual(store.get_storer('df').nrows, len(df))
+
+            # a subset of the columns
+            result = store.select('df', columns=['B', 'string'])
+            tm.assert_frame_equal(result, df[['B', 'string']])
+
+            # where on the index and on columns
+            result = store.select('df', 'index>df.index[3] & A>0')
+            expected = df[(df.index > df.index[3]) & (df.A > 0)]
+            tm.assert_frame_equal(result, expected)
+
+            result = store.select('df', 'string="foo" & int=2',
+                                  columns=['A'])
+            expected = df.loc[(df.string == 'foo') & (df.int == 2), ['A']]
+            tm.assert_frame_equal(result, expected)
+
+            # start / stop / iterator
+            result = store.select('df', 'A>0', start=5, stop=20)
+            expected = df[5:20]
+            tm.assert_frame_equal(result, expected[expected.A > 0])
+
+            result = concat(list(store.select('df', 'A>0', chunksize=7)))
+            tm.assert_frame_equal(result, df[df.A > 0])
+
+            # coordinates
+            c = store.select_as_coordinates('df', 'A>0')
+            tm.assert_frame_equal(store.select('df', where=c), df[df.A > 0])
+            result = store.select('df', where=[7, 2, 2])
+            tm.assert_frame_equal(result, df.iloc[[7, 2, 2]])
+
+            # select_column
+            result = store.select_column('df', 'index')
+            tm.assert_almost_equal(result.values, Series(df.index).values)
+            result = store.select_column('df', 'string', start=2, stop=-2)
+            tm.assert_almost_equal(result.values, df['string'].values[2:-2])
+            self.assertRaises(KeyError, store.select_column, 'df', 'foo')
+
+            # longer strings are appended
+            df2 = df[:2].copy()
+            df2['string'] = 'foobar'
+            store.append('df', df2)
+            tm.assert_frame_equal(store.select('df'), concat([df, df2]))
+            self.assertEqual(store.get_storer('df').nrows, len(df) + 2)
+
+            # only an entire ctable can be removed
+            self.assertRaises(TypeError, store.remove, 'df', 'A>0')
+            store.remove('df')
+            self.assertNotIn('df', store)
+
+    def test_ctable_compression_and_invalid(self):
+
+        df = tm.makeDataFrame()
+
+        with ensure_clean_store(self.path, complevel=9,
+                                complib=_default_compressor) as store:
+            store.append('df', df, format='ctable')
+            tm.assert_frame_equal(store.select('df'), df)
+            tm.assert_frame_equal(store.select('df', columns=['C']),
+                                  df[['C']])
+
+        with ensure_clean_store(self.path) as store:
+
+            # frames only
+            self.assertRaises(TypeError, store.append, 's', df['A'],
+                              format='ctable')
+
+            # the column names are the array names
+            self.assertRaises(ValueError, store.append, 'df',
+                              DataFrame(np.random.randn(10, 2)),
+                              format='ctable')
+
+    def test_ctable_vlstrings(self):
+
+        df = tm.makeTimeDataFrame()
+        df['string'] = 'foo'
+        df.ix[3:6, 'string'] = 'a much longer string than foo'
+        df.ix[7:9, 'string'] = np.nan
+        df.ix[10, 'string'] = ''
+
+        with ensure_clean_store(self.path) as store:
+            store.append('df', df, format='ctable')
+
+            # the strings are stored as offsets into a heap
+            group = store.get_node('df')
+            self.assertIn('string_heap', group)
+            self.assertEqual(group.string.atom.dtype, np.int64)
+            self.assertEqual(group.string_heap.nrows,
+                             df.string.fillna('nan').str.len().sum())
+
+            tm.assert_frame_equal(store.select('df'), df)
+            tm.assert_frame_equal(store.select('df', start=4, stop=8),
+                                  df.iloc[4:8])
+            tm.assert_frame_equal(store.select('df', columns=['string']),
+                                  df[['string']])
+            tm.assert_series_equal(store.select_column('df', 'string'),
+                                   Series(df.string.values), check_names=False)
+
+            # selecting on the strings, and at coordinates
+            for where in ['string="foo"', 'string!="foo"',
+                          'string="a much longer string than foo"']:
+                result = store.select('df', where)
+                c = store.select_as_coordinates('df', where)
+                expected = df.iloc[c.values]
+                tm.assert_frame_equal(result, expected)
+            expected = df[df.string == 'foo']
+            tm.assert_frame_equal(store.select('df', 'string="foo"'),
+                                  expected)
+            tm.assert_frame_equal(store.select('df', 'A>0 & string="foo"'),
+                                  expected[expected.A > 0])
+            tm.assert_frame_equal(store.select('df', where=[10, 2, 5]),
+                                  df.iloc[[10, 2, 5]])
+
+            # appending longer strings is not limited by an itemsize
+            df2 = df.copy()
+            df2.index = df2.index + 100 * df2.index.freq
+            df2['string'] = 'x' * 1000
+            store.append('df', df2)
+            tm.assert_frame_equal(store.select('df'), concat([df, df2]))
+            tm.assert_frame_equal(store.select('df', 'string="foo"'),
+                                  expected)
+
+            # a column can not collide with a heap array
+            df3 = df.copy()
+            df3['string_heap'] = 1.
+            self.assertRaises(ValueError, store.append, 'df3', df3,
+                              format='ctable')
+
+    def test_query_cache(self):
+        df = tm.makeTimeDataFrame()
+        df['string'] = 'foo'
+        df.ix[4:6, 'string'] = 'bar'
+
+        with ensure_clean_path(self.path) as path:
+
+            self.assertRaises(ValueError, HDFStore, path, cache='foo')
+
+            store = HDFStore(path, mode='w', cache='results')
+            try:
+                self.assertEqual(store.cache_info()['hits'], 0)
+                store.append('df', df, data_columns=['A', 'string'])
+
+                # the first selection misses, the second is a hit
+                result = store.select('df', 'A>0 & string="foo"')
+                expected = df[(df.A > 0) & (df.string == 'foo')]
+                tm.assert_frame_equal(result, expected)
+                info = store.cache_info()
+                self.assertEqual(info['hits'], 0)
+                self.assertTrue(info['misses'] > 0)
+                self.assertTrue(info['nbytes'] > 0)
+
+                result = store.select('df', 'A>0 & string="foo"')
+                tm.assert_frame_equal(result, expected)
+                self.assertEqual(store.cache_info()['hits'], 1)
+
+                # a copy is returned
+                result['A'] = 0
+                result = store.select('df', 'A>0 & string="foo"')
+                tm.assert_frame_equal(result, expected)
+
+                # the where is keyed on its resolved values
+                v = 'bar'
+                result = store.select('df', 'string=v')
+                tm.assert_frame_equal(result, df[df.string == 'bar'])
+                v = 'foo'
+                result = store.select('df', 'string=v')
+                tm.assert_frame_equal(result, df[df.string == 'foo'])
+
+                # as are the columns, start and stop
+                result = store.select('df', 'A>0', columns=['A'])
+                tm.assert_frame_equal(result, df.ix[df.A > 0, ['A']])
+                result = store.select('df', 'A>0', columns=['B'])
+                tm.assert_frame_equal(result, df.ix[df.A > 0, ['B']])
+                result = store.select('df', 'A>0', start=5)
+                tail = df.iloc[5:]
+                tm.assert_frame_equal(result, tail[tail.A > 0])
+
+                # the coordinates are cached
+                c = store.select_as_coordinates('df', 'A>0')
+                self.assertTrue((c.values == np.flatnonzero(df.A > 0)).all())
+                hits = store.cache_info()['hits']
+                c = store.select_as_coordinates('df', 'A>0')
+                self.assertEqual(store.cache_info()['hits'], hits + 1)
+
+                # an append invalidates
+                store.append('df', df)
+                result = store.select('df', 'A>0 & string="foo"')
+                tm.assert_frame_equal(result,
+                                      concat([expected, expected]))
+
+                # as does a remove
+                store.remove('df', 'string="bar"')
+                result = store.select('df', 'string="bar"')
+                self.assertEqual(len(result), 0)
+
+                store.clear_cache()
+                self.assertEqual(store.cache_info()['entries'], 0)
+                self.assertEqual(store.cache_info()['nbytes'], 0)
+            finally:
+                store.close()
+
+        # the byte budget is honored
+        with ensure_clean_path(self.path) as path:
+            store = HDFStore(path, mode='w', cache='results', cache_size=1024)
+            try:
+                store.append('df', df, data_columns=['A'])
+                store.select('df', 'A>0')
+                self.assertTrue(store.cache_info()['nbytes'] <= 1024)
+            finally:
+                store.close()
+
+        # no cache
+        with ensure_clean_store(self.path) as store:
+            self.assertIsNone(store.cache_info())
+
+    def test_append_buffer(self):
+        df = tm.makeTimeDataFrame()
+        df['string'] = 'foo'
+
+        with ensure_clean_store(self.path) as store:
+
+            # the rows are written in batches
+            for i in range(0, 30, 3):
+                store.append('df', df.iloc[i:i + 3], buffer_rows=10,
+                             data_columns=['string'])
+            self.assertEqual(store.get_storer('df').nrows, 27)
+
+            # a read writes the buffered rows
+            store.append('df', df.iloc[30:], buffer_rows=10)
+            tm.assert_frame_equal(store.select('df'), df)
+            tm.assert_frame_equal(store.select('df', 'string="foo"'), df)
+
+            # a frame larger than the buffer is appended directly
+            _maybe_remove(store, 'df')
+            store.append('df', df.iloc[:3], buffer_rows=10)
+            store.append('df', df.iloc[3:], buffer_rows=10)
+            tm.assert_frame_equal(store['df'], df)
+
+            # the schema must match
+            _maybe_remove(store, 'df')
+            store.append('df', df.iloc[:3], buffer_rows=10)
+            self.assertRaises(ValueError, store.append, 'df',
+                              df.iloc[3:6, :2], buffer_rows=10)
+            self.assertRaises(ValueError, store.append, 'df',
+                              df.iloc[3:6].rename(columns={'A': 'a'}),
+                              buffer_rows=10)
+            self.assertRaises(TypeError, store.append, 'series',
+                              df['A'], buffer_rows=10)
+            self.assertRaises(ValueError, store.append, 'df2', df,
+                              buffer_rows=0)
+
+            # the buffered rows of a new key are written to be listed
+            store.append('df3', df.iloc[:3], buffer_rows=10)
+            self.assertIn('df3', store)
+            self.assertEqual(store.get_storer('df3').nrows, 3)
+            store.append('df4', df.iloc[:3], buffer_rows=10)
+            self.assertIn('/df4', store.keys())
+            store.append('df5', df.iloc[:3], buffer_rows=10)
+            self.assertIn('/df5', [g._v_pathname for g in store.groups()])
+
+            # a flush writes the buffered rows
+            store.flush()
+            self.assertEqual(store.get_storer('df').nrows, 3)
+
+            # an append with other arguments writes the buffered rows with
+            # their own arguments
+            _maybe_remove(store, 'df')
+            dfn = df.iloc[:6].copy()
+            dfn.iloc[1] = np.nan
+            dfn.iloc[4] = np.nan
+            store.append('df', dfn.iloc[:3], buffer_rows=10, dropna=True)
+            store.append('df', dfn.iloc[3:], buffer_rows=10, dropna=False)
+            self.assertEqual(store.get_storer('df').nrows, 2)
+            tm.assert_frame_equal(store['df'], dfn.drop(dfn.index[1]))
+
+            _maybe_remove(store, 'df')
+            store.append('df', df.iloc[:3], buffer_rows=10)
+            store.append('df', df.iloc[3:6], buffer_rows=20)
+            self.assertEqual(store.get_storer('df').nrows, 3)
+            self.assertEqual(store._buffers['/df'].buffer_rows, 20)
+            tm.assert_frame_equal(store['df'], df.iloc[:6])
+
+            # tz-aware index
+            _maybe_remove(store, 'df_tz')
+            df_tz = DataFrame(dict(A=np.arange(6.)),
+                              index=date_range('20130101', periods=6,
+                                               tz='US/Eastern'))
+            store.append('df_tz', df_tz.iloc[:3], buffer_rows=4)
+            store.append('df_tz', df_tz.iloc[3:], buffer_rows=4)
+            result = store['df_tz']
+            tm.assert_frame_equal(result, df_tz)
+
+        # a close writes the buffered rows
+        with ensure_clean_path(self.path) as path:
+            store = HDFStore(path, mode='w')
+            store.append('df', df.iloc[:5], buffer_rows=10)
+            store.close()
+            tm.assert_frame_equal(read_hdf(path, 'df'), df.iloc[:5])
+
+    def test_lock_and_metadata(self):
+        df = tm.makeTimeDataFrame()
+
+        with ensure_clean_path(self.path) as path:
+
+            with get_store(path, mode='w', lock=True) as store:
+                store.put('df', df)
+                store.append('dft', df, data_columns=['A'])
+                tm.assert_frame_equal(store['df'], df)
+                tm.assert_frame_equal(store.select('dft', 'A>0'),
+                                      df[df.A > 0])
+                store.remove('dft', 'A<0')
+                self.assertEqual(len(store.select('dft')),
+                                 (df.A >= 0).sum())
+                store.append('dft', df[df.A < 0])
+
+                meta = store.metadata()
+                self.assertEqual(list(meta.keys()), ['/df', '/dft'])
+                self.assertEqual(meta['/df']['format'], 'fixed')
+                self.assertEqual(meta['/dft']['format'], 'table')
+                self.assertEqual(meta['/dft']['table_type'],
+                                 'appendable_frame')
+                self.assertEqual(meta['/dft']['nrows'], len(df))
+
+            # a read-only store shares the snapshot of the file
+            with get_store(path, mode='r', lock=True) as store:
+                self.assertEqual(store.keys(), ['/df', '/dft'])
+                tm.assert_frame_equal(store['df'], df)
+                self.assertEqual(len(store.select('dft', 'A>0')),
+                                 (df.A > 0).sum())
+                tm.assert_frame_equal(
+                    store.select('dft', iterator=True, chunksize=7).get_values(),
+                    store.select('dft'))
+            skey = (os.path.abspath(path), pytables._file_stamp(path))
+            self.assertIn(skey, pytables._metadata_snapshots)
+
+            # a read-only store checks its keys against the snapshot
+            with get_store(path, mode='r', lock=True) as store:
+                self.assertRaises(KeyError, store.get, 'foo')
+                self.assertRaises(KeyError, store.select, 'foo')
+                self.assertIsNone(store.get_storer('foo'))
+                self.assertEqual(store.get_storer('dft').nrows, len(df))
+            self.assertRaises(KeyError, read_hdf, path, 'foo', mode='r')
+
+            result = read_hdf(path, 'df', lock=True)
+            tm.assert_frame_equal(result, df)
+
+            # the snapshot is invalidated by a modification of the file
+            with get_store(path, mode='a', lock=True) as store:
+                store.append('dft', df)
+            with get_store(path, mode='r', lock=True) as store:
+                self.assertEqual(store.metadata()['/dft']['nrows'],
+                                 2 * len(df))
+
+    def test_metadata_snapshots_bounded(self):
+        df = tm.makeTimeDataFrame()
+
+        orig = pytables._MAX_METADATA_SNAPSHOTS
+        pytables._MAX_METADATA_SNAPSHOTS = 2
+        try:
+            with ensure_clean_path(['a.h5', 'b.h5', 'c.h5']) as paths:
+                keys = []
+                for path in paths:
+                    df.to_hdf(path, 'df')
+                    with get_store(path, mode='r') as store:
+                        store.metadata()
+                    keys.append((os.path.abspath(path),
+                                 pytables._file_stamp(path)))
+
+                # the least recently used snapshot was evicted
+                self.assertTrue(len(pytables._metadata_snapshots) <= 2)
+                self.assertNotIn(keys[0], pytables._metadata_snapshots)
+                self.assertIn(keys[1], pytables._metadata_snapshots)
+                self.assertIn(keys[2], pytables._metadata_snapshots)
+        finally:
+            pytables._MAX_METADATA_SNAPSHOTS = orig
+
+    def test_lock_across_processes(self):
+        if pytables.fcntl is None:
+            raise nose.SkipTest('fcntl is not available')
+        import multiprocessing
+
+        df = tm.makeTimeDataFrame()
+        with ensure_clean_path(self.path) as path:
+
+            # another process cannot read while the store is writing
+            with get_store(path, mode='w', lock=True) as store:
+                store.append('dft', df)
+                queue = multiprocessing.Queue()
+                with store._locked(exclusive=True):
+                    p = multiprocessing.Process(target=_try_shared_lock,
+                                                args=(path, queue))
+                    p.start()
+                    p.join()
+                    self.assertFalse(queue.get())
+
+                p = multiprocessing.Process(target=_try_shared_lock,
+                                            args=(path, queue))
+                p.start()
+                p.join()
+                self.assertTrue(queue.get())
+
+            # an append by another process invalidates the snapshot
+            with get_store(path, mode='r', lock=True) as store:
+                self.assertEqual(store.metadata()['/dft']['nrows'], len(df))
+            p = multiprocessing.Process(target=_append_locked,
+                                        args=(path, 'dft', df))
+            p.start()
+            p.join()
+            self.assertEqual(p.exitcode, 0)
+            with get_store(path, mode='r', lock=True) as store:
+                self.assertEqual(store.metadata()['/dft']['nrows'],
+                                 2 * len(df))
+                self.assertEqual(len(store.select('dft')), 2 * len(df))
+
     def test_coordinates(self):
         df = tm.makeTimeDataFrame()
 
@@ -4223,6 +4714,34 @@ class TestHDFStore(tm.TestCase):
 
         compat_assert_produces_warning(PerformanceWarning,f)
 
+    def test_fixed_read_blocks(self):
+        if _np_version_under1p7:
+            raise nose.SkipTest("requires numpy >= 1.7")
+
+        # the blocks are read in place, as views of the final layout
+        df = tm.makeDataFrame()
+        df['int'] = 1
+        df['date'] = Timestamp('20130101')
+        df['td'] = df['date'] - Timestamp('20121201')
+        df.ix[3:5, 'date'] = np.nan
+        df.ix[3:5, 'td'] = np.nan
+
+        with ensure_clean_store(self.path) as store:
+            store.put('df', df)
+            result = store['df']
+            assert_frame_equal(result, df)
+
+            for blk in result._data.blocks:
+                self.assertEqual(blk.values.shape, (len(blk.items), len(df)))
+                self.assertFalse(blk.values.flags['OWNDATA'])
+            self.assertEqual(result['date'].dtype, 'M8[ns]')
+            self.assertEqual(result['td'].dtype, 'm8[ns]')
+
+        with ensure_clean_store(self.path, complevel=9,
+                                complib=_default_compressor) as store:
+            store.put('df', df)
+            assert_frame_equal(store['df'], df)
+
     def test_store_datetime_mixed(self):
 
         df = DataFrame(
@@ -4231,6 +4750,23 @@ class TestHDFStore(tm.TestCase):
         df['d'] = ts.index[:3]
         self._check_roundtrip(df, tm.assert_frame_equal)
 
+    def test_store_categorical(self):
+
+        df = DataFrame({'a': pandas.Categorical.from_array(['b', 'a', 'b', 'c']),
+                        'b': [1., 2., 3., 4.]})
+        with ensure_clean_store(self.path) as store:
+
+            # a fixed store keeps the codes and levels
+            for frame in [df, df.reindex(lrange(5))]:
+                store.put('df', frame)
+                result = store['df']
+                self.assertIsNotNone(result._data.get_categorical('a'))
+                tm.assert_frame_equal(result, frame)
+
+            # a table stores the values
+            store.append('df_table', df)
+            tm.assert_frame_equal(store.select('df_table'), df)
+
     # def test_cant_write_multiindex_table(self):
     #    # for now, #1848
     #    df = DataFrame(np.random.randn(10, 4),
@@ -4264,6 +4800,24 @@ class TestHDFStore(tm.TestCase):
         tm.assert_frame_equal(expected, result)
 
 
+def _try_shared_lock(path, queue):
+    """ put whether a shared lock on the file can be taken right away """
+    import fcntl
+    with open(path, 'rb') as fh:
+        try:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_SH | fcntl.LOCK_NB)
+        except IOError:
+            queue.put(False)
+        else:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+            queue.put(True)
+
+
+def _append_locked(path, key, value):
+    with get_store(path, mode='a', lock=True) as store:
+        store.append(key, value)
+
+
 def _test_sort(obj):
     if isinstance(obj, DataFrame):
         return obj.reindex(sorted(obj.index))
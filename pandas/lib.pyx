@@ -304,6 +304,23 @@ def list_to_object_array(list obj):
     return arr
 
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def memory_usage_of_objects(ndarray[object] arr):
+    '''
+    The bytes of the objects of an object array (not of the array itself);
+    an object referenced more than once is counted each time
+    '''
+    cdef:
+        Py_ssize_t i, n
+        int64_t result = 0
+
+    n = len(arr)
+    for i from 0 <= i < n:
+        result += arr[i].__sizeof__()
+    return result
+
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def fast_unique(ndarray[object] values):
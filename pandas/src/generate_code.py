@@ -1613,6 +1613,176 @@ def group_ohlc_%(name)s(ndarray[%(dest_type2)s, ndim=2] out,
             out[b, 3] = vclose
 """
 
+# Moving maximum / minimum code taken from Bottleneck under the terms
+# of its Simplified BSD license
+# https://github.com/kwgoodman/bottleneck
+
+roll_max_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def roll_max_%(name)s(ndarray[%(c_type)s] a, int window, int minp):
+    "Moving max of 1d array of dtype=%(name)s along axis=0 ignoring NaNs."
+    cdef np.%(c_type)s ai, aold
+    cdef Py_ssize_t count
+    cdef pairs* ring
+    cdef pairs* minpair
+    cdef pairs* end
+    cdef pairs* last
+    cdef Py_ssize_t i0
+    cdef np.npy_intp *dim
+    dim = PyArray_DIMS(a)
+    cdef Py_ssize_t n0 = dim[0]
+    cdef np.npy_intp *dims = [n0]
+    cdef np.ndarray[np.%(c_type)s, ndim=1] y = PyArray_EMPTY(1, dims,
+		NPY_%(name)s, 0)
+
+    if window < 1:
+        raise ValueError('Invalid window size %%d'
+                         %% (window))
+
+    if minp > window:
+        raise ValueError('Invalid min_periods size %%d greater than window %%d'
+                        %% (minp, window))
+
+    minp = _check_minp(window, minp, n0)
+
+    window = min(window, n0)
+
+    ring = <pairs*>stdlib.malloc(window * sizeof(pairs))
+    end = ring + window
+    last = ring
+
+    minpair = ring
+    ai = a[0]
+    if ai == ai:
+        minpair.value = ai
+    else:
+        minpair.value = MIN%(name)s
+    minpair.death = window
+
+    count = 0
+    for i0 in range(n0):
+        ai = a[i0]
+        if ai == ai:
+            count += 1
+        else:
+            ai = MIN%(name)s
+        if i0 >= window:
+            aold = a[i0 - window]
+            if aold == aold:
+                count -= 1
+        if minpair.death == i0:
+            minpair += 1
+            if minpair >= end:
+                minpair = ring
+        if ai >= minpair.value:
+            minpair.value = ai
+            minpair.death = i0 + window
+            last = minpair
+        else:
+            while last.value <= ai:
+                if last == ring:
+                    last = end
+                last -= 1
+            last += 1
+            if last == end:
+                last = ring
+            last.value = ai
+            last.death = i0 + window
+        if count >= minp:
+            y[i0] = minpair.value
+        else:
+            y[i0] = NaN
+
+    for i0 in range(minp - 1):
+        y[i0] = NaN
+
+    stdlib.free(ring)
+    return y
+"""
+
+roll_min_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def roll_min_%(name)s(ndarray[%(c_type)s] a, int window, int minp):
+    "Moving min of 1d array of dtype=%(name)s along axis=0 ignoring NaNs."
+    cdef np.%(c_type)s ai, aold
+    cdef Py_ssize_t count
+    cdef pairs* ring
+    cdef pairs* minpair
+    cdef pairs* end
+    cdef pairs* last
+    cdef Py_ssize_t i0
+    cdef np.npy_intp *dim
+    dim = PyArray_DIMS(a)
+    cdef Py_ssize_t n0 = dim[0]
+    cdef np.npy_intp *dims = [n0]
+    cdef np.ndarray[np.%(c_type)s, ndim=1] y = PyArray_EMPTY(1, dims,
+		NPY_%(name)s, 0)
+
+    if window < 1:
+        raise ValueError('Invalid window size %%d'
+                         %% (window))
+
+    if minp > window:
+        raise ValueError('Invalid min_periods size %%d greater than window %%d'
+                        %% (minp, window))
+
+    window = min(window, n0)
+
+    minp = _check_minp(window, minp, n0)
+
+    ring = <pairs*>stdlib.malloc(window * sizeof(pairs))
+    end = ring + window
+    last = ring
+
+    minpair = ring
+    ai = a[0]
+    if ai == ai:
+        minpair.value = ai
+    else:
+        minpair.value = MAX%(name)s
+    minpair.death = window
+
+    count = 0
+    for i0 in range(n0):
+        ai = a[i0]
+        if ai == ai:
+            count += 1
+        else:
+            ai = MAX%(name)s
+        if i0 >= window:
+            aold = a[i0 - window]
+            if aold == aold:
+                count -= 1
+        if minpair.death == i0:
+            minpair += 1
+            if minpair >= end:
+                minpair = ring
+        if ai <= minpair.value:
+            minpair.value = ai
+            minpair.death = i0 + window
+            last = minpair
+        else:
+            while last.value >= ai:
+                if last == ring:
+                    last = end
+                last -= 1
+            last += 1
+            if last == end:
+                last = ring
+            last.value = ai
+            last.death = i0 + window
+        if count >= minp:
+            y[i0] = minpair.value
+        else:
+            y[i0] = NaN
+
+    for i0 in range(minp - 1):
+        y[i0] = NaN
+
+    stdlib.free(ring)
+    return y
+"""
+
 arrmap_template = """@cython.wraparound(False)
 @cython.boundscheck(False)
 def arrmap_%(name)s(ndarray[%(c_type)s] index, object func):
@@ -2203,10 +2373,12 @@ def generate_take_template(template, exclude=None):
         ('int8', 'int8', 'int8_t', 'int8_t', '', '', True),
         ('int8', 'int32', 'int8_t', 'int32_t', '', '', False),
         ('int8', 'int64', 'int8_t', 'int64_t', '', '', False),
+        ('int8', 'float32', 'int8_t', 'float32_t', '', '', False),
         ('int8', 'float64', 'int8_t', 'float64_t', '', '', False),
         ('int16', 'int16', 'int16_t', 'int16_t', '', '', True),
         ('int16', 'int32', 'int16_t', 'int32_t', '', '', False),
         ('int16', 'int64', 'int16_t', 'int64_t', '', '', False),
+        ('int16', 'float32', 'int16_t', 'float32_t', '', '', False),
         ('int16', 'float64', 'int16_t', 'float64_t', '', '', False),
         ('int32', 'int32', 'int32_t', 'int32_t', '', '', True),
         ('int32', 'int64', 'int32_t', 'int64_t', '', '', False),
@@ -2289,6 +2461,9 @@ nobool_1d_templates = [left_join_unique_template,
                        outer_join_template2,
                        inner_join_template]
 
+rolls = [roll_max_template,
+         roll_min_template]
+
 take_templates = [take_1d_template,
                   take_2d_axis0_template,
                   take_2d_axis1_template,
@@ -2321,5 +2496,8 @@ def generate_take_cython_file(path='generated.pyx'):
         for template in nobool_1d_templates:
             print(generate_from_template(template, exclude=['bool']), file=f)
 
+        for template in rolls:
+            print(generate_put_template(template, use_ints = False), file=f)
+
 if __name__ == '__main__':
     generate_take_cython_file()
@@ -2312,6 +2312,25 @@ def take_1d_int8_int64(ndarray[int8_t] values,
         else:
             out[i] = values[idx]
 
+@cython.wraparound(False)
+def take_1d_int8_float32(ndarray[int8_t] values,
+                              ndarray[int64_t] indexer,
+                              ndarray[float32_t] out,
+                              fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, n, idx
+        float32_t fv
+
+    n = len(indexer)
+
+    fv = fill_value
+    for i from 0 <= i < n:
+        idx = indexer[i]
+        if idx == -1:
+            out[i] = fv
+        else:
+            out[i] = values[idx]
+
 @cython.wraparound(False)
 def take_1d_int8_float64(ndarray[int8_t] values,
                               ndarray[int64_t] indexer,
@@ -2388,6 +2407,25 @@ def take_1d_int16_int64(ndarray[int16_t] values,
         else:
             out[i] = values[idx]
 
+@cython.wraparound(False)
+def take_1d_int16_float32(ndarray[int16_t] values,
+                              ndarray[int64_t] indexer,
+                              ndarray[float32_t] out,
+                              fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, n, idx
+        float32_t fv
+
+    n = len(indexer)
+
+    fv = fill_value
+    for i from 0 <= i < n:
+        idx = indexer[i]
+        if idx == -1:
+            out[i] = fv
+        else:
+            out[i] = values[idx]
+
 @cython.wraparound(False)
 def take_1d_int16_float64(ndarray[int16_t] values,
                               ndarray[int64_t] indexer,
@@ -2804,6 +2842,51 @@ def take_2d_axis0_int8_int64(ndarray[int8_t, ndim=2] values,
             for j from 0 <= j < k:
                 out[i, j] = values[idx, j]
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def take_2d_axis0_int8_float32(ndarray[int8_t, ndim=2] values,
+                                    ndarray[int64_t] indexer,
+                                    ndarray[float32_t, ndim=2] out,
+                                    fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, j, k, n, idx
+        float32_t fv
+
+    n = len(indexer)
+    k = values.shape[1]
+
+    fv = fill_value
+
+    IF False:
+        cdef:
+            float32_t *v
+            float32_t *o
+
+        #GH3130
+        if (values.strides[1] == out.strides[1] and
+            values.strides[1] == sizeof(float32_t) and
+            sizeof(float32_t) * n >= 256):
+
+            for i from 0 <= i < n:
+                idx = indexer[i]
+                if idx == -1:
+                    for j from 0 <= j < k:
+                        out[i, j] = fv
+                else:
+                    v = &values[idx, 0]
+                    o = &out[i, 0]
+                    memmove(o, v, <size_t>(sizeof(float32_t) * k))
+            return
+
+    for i from 0 <= i < n:
+        idx = indexer[i]
+        if idx == -1:
+            for j from 0 <= j < k:
+                out[i, j] = fv
+        else:
+            for j from 0 <= j < k:
+                out[i, j] = values[idx, j]
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def take_2d_axis0_int8_float64(ndarray[int8_t, ndim=2] values,
@@ -2984,6 +3067,51 @@ def take_2d_axis0_int16_int64(ndarray[int16_t, ndim=2] values,
             for j from 0 <= j < k:
                 out[i, j] = values[idx, j]
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def take_2d_axis0_int16_float32(ndarray[int16_t, ndim=2] values,
+                                    ndarray[int64_t] indexer,
+                                    ndarray[float32_t, ndim=2] out,
+                                    fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, j, k, n, idx
+        float32_t fv
+
+    n = len(indexer)
+    k = values.shape[1]
+
+    fv = fill_value
+
+    IF False:
+        cdef:
+            float32_t *v
+            float32_t *o
+
+        #GH3130
+        if (values.strides[1] == out.strides[1] and
+            values.strides[1] == sizeof(float32_t) and
+            sizeof(float32_t) * n >= 256):
+
+            for i from 0 <= i < n:
+                idx = indexer[i]
+                if idx == -1:
+                    for j from 0 <= j < k:
+                        out[i, j] = fv
+                else:
+                    v = &values[idx, 0]
+                    o = &out[i, 0]
+                    memmove(o, v, <size_t>(sizeof(float32_t) * k))
+            return
+
+    for i from 0 <= i < n:
+        idx = indexer[i]
+        if idx == -1:
+            for j from 0 <= j < k:
+                out[i, j] = fv
+        else:
+            for j from 0 <= j < k:
+                out[i, j] = values[idx, j]
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def take_2d_axis0_int16_float64(ndarray[int16_t, ndim=2] values,
@@ -3675,6 +3803,54 @@ def take_2d_axis1_int8_int64(ndarray[int8_t, ndim=2] values,
             for i from 0 <= i < n:
                 out[i, j] = values[i, idx]
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def take_2d_axis1_int8_float32(ndarray[int8_t, ndim=2] values,
+                                    ndarray[int64_t] indexer,
+                                    ndarray[float32_t, ndim=2] out,
+                                    fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, j, k, n, idx
+        float32_t fv
+
+    n = len(values)
+    k = len(indexer)
+
+    if n == 0 or k == 0:
+        return
+
+    fv = fill_value
+
+    IF False:
+        cdef:
+            float32_t *v
+            float32_t *o
+
+        #GH3130
+        if (values.strides[0] == out.strides[0] and
+            values.strides[0] == sizeof(float32_t) and
+            sizeof(float32_t) * n >= 256):
+
+            for j from 0 <= j < k:
+                idx = indexer[j]
+                if idx == -1:
+                    for i from 0 <= i < n:
+                        out[i, j] = fv
+                else:
+                    v = &values[0, idx]
+                    o = &out[0, j]
+                    memmove(o, v, <size_t>(sizeof(float32_t) * n))
+            return
+
+    for j from 0 <= j < k:
+        idx = indexer[j]
+        if idx == -1:
+            for i from 0 <= i < n:
+                out[i, j] = fv
+        else:
+            for i from 0 <= i < n:
+                out[i, j] = values[i, idx]
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def take_2d_axis1_int8_float64(ndarray[int8_t, ndim=2] values,
@@ -3867,6 +4043,54 @@ def take_2d_axis1_int16_int64(ndarray[int16_t, ndim=2] values,
             for i from 0 <= i < n:
                 out[i, j] = values[i, idx]
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def take_2d_axis1_int16_float32(ndarray[int16_t, ndim=2] values,
+                                    ndarray[int64_t] indexer,
+                                    ndarray[float32_t, ndim=2] out,
+                                    fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, j, k, n, idx
+        float32_t fv
+
+    n = len(values)
+    k = len(indexer)
+
+    if n == 0 or k == 0:
+        return
+
+    fv = fill_value
+
+    IF False:
+        cdef:
+            float32_t *v
+            float32_t *o
+
+        #GH3130
+        if (values.strides[0] == out.strides[0] and
+            values.strides[0] == sizeof(float32_t) and
+            sizeof(float32_t) * n >= 256):
+
+            for j from 0 <= j < k:
+                idx = indexer[j]
+                if idx == -1:
+                    for i from 0 <= i < n:
+                        out[i, j] = fv
+                else:
+                    v = &values[0, idx]
+                    o = &out[0, j]
+                    memmove(o, v, <size_t>(sizeof(float32_t) * n))
+            return
+
+    for j from 0 <= j < k:
+        idx = indexer[j]
+        if idx == -1:
+            for i from 0 <= i < n:
+                out[i, j] = fv
+        else:
+            for i from 0 <= i < n:
+                out[i, j] = values[i, idx]
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def take_2d_axis1_int16_float64(ndarray[int16_t, ndim=2] values,
@@ -4488,6 +4712,34 @@ def take_2d_multi_int8_int64(ndarray[int8_t, ndim=2] values,
                 else:
                     out[i, j] = values[idx, idx1[j]]
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def take_2d_multi_int8_float32(ndarray[int8_t, ndim=2] values,
+                                    indexer,
+                                    ndarray[float32_t, ndim=2] out,
+                                    fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, j, k, n, idx
+        ndarray[int64_t] idx0 = indexer[0]
+        ndarray[int64_t] idx1 = indexer[1]
+        float32_t fv
+
+    n = len(idx0)
+    k = len(idx1)
+
+    fv = fill_value
+    for i from 0 <= i < n:
+        idx = idx0[i]
+        if idx == -1:
+            for j from 0 <= j < k:
+                out[i, j] = fv
+        else:
+            for j from 0 <= j < k:
+                if idx1[j] == -1:
+                    out[i, j] = fv
+                else:
+                    out[i, j] = values[idx, idx1[j]]
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def take_2d_multi_int8_float64(ndarray[int8_t, ndim=2] values,
@@ -4600,6 +4852,34 @@ def take_2d_multi_int16_int64(ndarray[int16_t, ndim=2] values,
                 else:
                     out[i, j] = values[idx, idx1[j]]
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def take_2d_multi_int16_float32(ndarray[int16_t, ndim=2] values,
+                                    indexer,
+                                    ndarray[float32_t, ndim=2] out,
+                                    fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, j, k, n, idx
+        ndarray[int64_t] idx0 = indexer[0]
+        ndarray[int64_t] idx1 = indexer[1]
+        float32_t fv
+
+    n = len(idx0)
+    k = len(idx1)
+
+    fv = fill_value
+    for i from 0 <= i < n:
+        idx = idx0[i]
+        if idx == -1:
+            for j from 0 <= j < k:
+                out[i, j] = fv
+        else:
+            for j from 0 <= j < k:
+                if idx1[j] == -1:
+                    out[i, j] = fv
+                else:
+                    out[i, j] = values[idx, idx1[j]]
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def take_2d_multi_int16_float64(ndarray[int16_t, ndim=2] values,
@@ -8888,3 +9168,329 @@ def inner_join_indexer_int64(ndarray[int64_t] left,
     return result, lindexer, rindexer
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def roll_max_float64(ndarray[float64_t] a, int window, int minp):
+    "Moving max of 1d array of dtype=float64 along axis=0 ignoring NaNs."
+    cdef np.float64_t ai, aold
+    cdef Py_ssize_t count
+    cdef pairs* ring
+    cdef pairs* minpair
+    cdef pairs* end
+    cdef pairs* last
+    cdef Py_ssize_t i0
+    cdef np.npy_intp *dim
+    dim = PyArray_DIMS(a)
+    cdef Py_ssize_t n0 = dim[0]
+    cdef np.npy_intp *dims = [n0]
+    cdef np.ndarray[np.float64_t, ndim=1] y = PyArray_EMPTY(1, dims,
+		NPY_float64, 0)
+
+    if window < 1:
+        raise ValueError('Invalid window size %d'
+                         % (window))
+
+    if minp > window:
+        raise ValueError('Invalid min_periods size %d greater than window %d'
+                        % (minp, window))
+
+    minp = _check_minp(window, minp, n0)
+
+    window = min(window, n0)
+
+    ring = <pairs*>stdlib.malloc(window * sizeof(pairs))
+    end = ring + window
+    last = ring
+
+    minpair = ring
+    ai = a[0]
+    if ai == ai:
+        minpair.value = ai
+    else:
+        minpair.value = MINfloat64
+    minpair.death = window
+
+    count = 0
+    for i0 in range(n0):
+        ai = a[i0]
+        if ai == ai:
+            count += 1
+        else:
+            ai = MINfloat64
+        if i0 >= window:
+            aold = a[i0 - window]
+            if aold == aold:
+                count -= 1
+        if minpair.death == i0:
+            minpair += 1
+            if minpair >= end:
+                minpair = ring
+        if ai >= minpair.value:
+            minpair.value = ai
+            minpair.death = i0 + window
+            last = minpair
+        else:
+            while last.value <= ai:
+                if last == ring:
+                    last = end
+                last -= 1
+            last += 1
+            if last == end:
+                last = ring
+            last.value = ai
+            last.death = i0 + window
+        if count >= minp:
+            y[i0] = minpair.value
+        else:
+            y[i0] = NaN
+
+    for i0 in range(minp - 1):
+        y[i0] = NaN
+
+    stdlib.free(ring)
+    return y
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def roll_max_float32(ndarray[float32_t] a, int window, int minp):
+    "Moving max of 1d array of dtype=float32 along axis=0 ignoring NaNs."
+    cdef np.float32_t ai, aold
+    cdef Py_ssize_t count
+    cdef pairs* ring
+    cdef pairs* minpair
+    cdef pairs* end
+    cdef pairs* last
+    cdef Py_ssize_t i0
+    cdef np.npy_intp *dim
+    dim = PyArray_DIMS(a)
+    cdef Py_ssize_t n0 = dim[0]
+    cdef np.npy_intp *dims = [n0]
+    cdef np.ndarray[np.float32_t, ndim=1] y = PyArray_EMPTY(1, dims,
+		NPY_float32, 0)
+
+    if window < 1:
+        raise ValueError('Invalid window size %d'
+                         % (window))
+
+    if minp > window:
+        raise ValueError('Invalid min_periods size %d greater than window %d'
+                        % (minp, window))
+
+    minp = _check_minp(window, minp, n0)
+
+    window = min(window, n0)
+
+    ring = <pairs*>stdlib.malloc(window * sizeof(pairs))
+    end = ring + window
+    last = ring
+
+    minpair = ring
+    ai = a[0]
+    if ai == ai:
+        minpair.value = ai
+    else:
+        minpair.value = MINfloat32
+    minpair.death = window
+
+    count = 0
+    for i0 in range(n0):
+        ai = a[i0]
+        if ai == ai:
+            count += 1
+        else:
+            ai = MINfloat32
+        if i0 >= window:
+            aold = a[i0 - window]
+            if aold == aold:
+                count -= 1
+        if minpair.death == i0:
+            minpair += 1
+            if minpair >= end:
+                minpair = ring
+        if ai >= minpair.value:
+            minpair.value = ai
+            minpair.death = i0 + window
+            last = minpair
+        else:
+            while last.value <= ai:
+                if last == ring:
+                    last = end
+                last -= 1
+            last += 1
+            if last == end:
+                last = ring
+            last.value = ai
+            last.death = i0 + window
+        if count >= minp:
+            y[i0] = minpair.value
+        else:
+            y[i0] = NaN
+
+    for i0 in range(minp - 1):
+        y[i0] = NaN
+
+    stdlib.free(ring)
+    return y
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def roll_min_float64(ndarray[float64_t] a, int window, int minp):
+    "Moving min of 1d array of dtype=float64 along axis=0 ignoring NaNs."
+    cdef np.float64_t ai, aold
+    cdef Py_ssize_t count
+    cdef pairs* ring
+    cdef pairs* minpair
+    cdef pairs* end
+    cdef pairs* last
+    cdef Py_ssize_t i0
+    cdef np.npy_intp *dim
+    dim = PyArray_DIMS(a)
+    cdef Py_ssize_t n0 = dim[0]
+    cdef np.npy_intp *dims = [n0]
+    cdef np.ndarray[np.float64_t, ndim=1] y = PyArray_EMPTY(1, dims,
+		NPY_float64, 0)
+
+    if window < 1:
+        raise ValueError('Invalid window size %d'
+                         % (window))
+
+    if minp > window:
+        raise ValueError('Invalid min_periods size %d greater than window %d'
+                        % (minp, window))
+
+    window = min(window, n0)
+
+    minp = _check_minp(window, minp, n0)
+
+    ring = <pairs*>stdlib.malloc(window * sizeof(pairs))
+    end = ring + window
+    last = ring
+
+    minpair = ring
+    ai = a[0]
+    if ai == ai:
+        minpair.value = ai
+    else:
+        minpair.value = MAXfloat64
+    minpair.death = window
+
+    count = 0
+    for i0 in range(n0):
+        ai = a[i0]
+        if ai == ai:
+            count += 1
+        else:
+            ai = MAXfloat64
+        if i0 >= window:
+            aold = a[i0 - window]
+            if aold == aold:
+                count -= 1
+        if minpair.death == i0:
+            minpair += 1
+            if minpair >= end:
+                minpair = ring
+        if ai <= minpair.value:
+            minpair.value = ai
+            minpair.death = i0 + window
+            last = minpair
+        else:
+            while last.value >= ai:
+                if last == ring:
+                    last = end
+                last -= 1
+            last += 1
+            if last == end:
+                last = ring
+            last.value = ai
+            last.death = i0 + window
+        if count >= minp:
+            y[i0] = minpair.value
+        else:
+            y[i0] = NaN
+
+    for i0 in range(minp - 1):
+        y[i0] = NaN
+
+    stdlib.free(ring)
+    return y
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def roll_min_float32(ndarray[float32_t] a, int window, int minp):
+    "Moving min of 1d array of dtype=float32 along axis=0 ignoring NaNs."
+    cdef np.float32_t ai, aold
+    cdef Py_ssize_t count
+    cdef pairs* ring
+    cdef pairs* minpair
+    cdef pairs* end
+    cdef pairs* last
+    cdef Py_ssize_t i0
+    cdef np.npy_intp *dim
+    dim = PyArray_DIMS(a)
+    cdef Py_ssize_t n0 = dim[0]
+    cdef np.npy_intp *dims = [n0]
+    cdef np.ndarray[np.float32_t, ndim=1] y = PyArray_EMPTY(1, dims,
+		NPY_float32, 0)
+
+    if window < 1:
+        raise ValueError('Invalid window size %d'
+                         % (window))
+
+    if minp > window:
+        raise ValueError('Invalid min_periods size %d greater than window %d'
+                        % (minp, window))
+
+    window = min(window, n0)
+
+    minp = _check_minp(window, minp, n0)
+
+    ring = <pairs*>stdlib.malloc(window * sizeof(pairs))
+    end = ring + window
+    last = ring
+
+    minpair = ring
+    ai = a[0]
+    if ai == ai:
+        minpair.value = ai
+    else:
+        minpair.value = MAXfloat32
+    minpair.death = window
+
+    count = 0
+    for i0 in range(n0):
+        ai = a[i0]
+        if ai == ai:
+            count += 1
+        else:
+            ai = MAXfloat32
+        if i0 >= window:
+            aold = a[i0 - window]
+            if aold == aold:
+                count -= 1
+        if minpair.death == i0:
+            minpair += 1
+            if minpair >= end:
+                minpair = ring
+        if ai <= minpair.value:
+            minpair.value = ai
+            minpair.death = i0 + window
+            last = minpair
+        else:
+            while last.value >= ai:
+                if last == ring:
+                    last = end
+                last -= 1
+            last += 1
+            if last == end:
+                last = ring
+            last.value = ai
+            last.death = i0 + window
+        if count >= minp:
+            y[i0] = minpair.value
+        else:
+            y[i0] = NaN
+
+    for i0 in range(minp - 1):
+        y[i0] = NaN
+
+    stdlib.free(ring)
+    return y
+
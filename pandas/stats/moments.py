@@ -305,7 +305,7 @@ def rolling_corr_pairwise(df1, df2=None, window=None, min_periods=None,
 
 
 def _rolling_moment(arg, window, func, minp, axis=0, freq=None, center=False,
-                    time_rule=None, args=(), kwargs={}, **kwds):
+                    time_rule=None, args=(), kwargs={}, float32=False, **kwds):
     """
     Rolling statistical measure using supplied function. Designed to be
     used with passed-in Cython array-based functions.
@@ -327,6 +327,8 @@ def _rolling_moment(arg, window, func, minp, axis=0, freq=None, center=False,
         Passed on to func
     kwargs : dict
         Passed on to func
+    float32 : boolean, default False
+        Whether func computes float32 values (exactly) in float32
 
     Returns
     -------
@@ -335,7 +337,7 @@ def _rolling_moment(arg, window, func, minp, axis=0, freq=None, center=False,
     arg = _conv_timerule(arg, freq, time_rule)
     calc = lambda x: func(x, window, minp=minp, args=args, kwargs=kwargs,
                           **kwds)
-    return_hook, values = _process_data_structure(arg)
+    return_hook, values = _process_data_structure(arg, float32=float32)
     # actually calculate the moment. Faster way to do this?
     if values.ndim > 1:
         result = np.apply_along_axis(calc, axis, values)
@@ -371,7 +373,7 @@ def _center_window(rs, window, axis):
     return rs
 
 
-def _process_data_structure(arg, kill_inf=True):
+def _process_data_structure(arg, kill_inf=True, float32=False):
     if isinstance(arg, DataFrame):
         return_hook = lambda v: type(arg)(v, index=arg.index,
                                           columns=arg.columns)
@@ -383,7 +385,10 @@ def _process_data_structure(arg, kill_inf=True):
         return_hook = lambda v: v
         values = arg
 
-    if not issubclass(values.dtype.type, float):
+    if float32 and _is_float32(values.dtype):
+        if values.dtype != np.float32:
+            values = values.astype(np.float32)
+    elif not issubclass(values.dtype.type, float):
         values = values.astype(float)
 
     if kill_inf:
@@ -392,6 +397,14 @@ def _process_data_structure(arg, kill_inf=True):
 
     return return_hook, values
 
+
+def _is_float32(dtype):
+    """ whether values of dtype are (exactly) kept as float32 """
+    # float32 holds the 8 and 16 bit integers exactly
+    return (dtype == np.float32 or
+            (pdcom._preserve_small_dtypes and dtype.kind in 'iu' and
+             dtype.itemsize <= 2))
+
 #------------------------------------------------------------------------------
 # Exponential moving moments
 
@@ -579,7 +592,7 @@ def _use_window(minp, window):
         return minp
 
 
-def _rolling_func(func, desc, check_minp=_use_window):
+def _rolling_func(func, desc, check_minp=_use_window, float32=False):
     @Substitution(desc, _unary_arg, _roll_kw, _type_of_input_retval, _roll_notes)
     @Appender(_doc_template)
     @wraps(func)
@@ -590,12 +603,13 @@ def _rolling_func(func, desc, check_minp=_use_window):
             return func(arg, window, minp, **kwds)
         return _rolling_moment(arg, window, call_cython, min_periods,
                                freq=freq, center=center,
-                               time_rule=time_rule, **kwargs)
+                               time_rule=time_rule, float32=float32,
+                               **kwargs)
 
     return f
 
-rolling_max = _rolling_func(algos.roll_max2, 'Moving maximum.')
-rolling_min = _rolling_func(algos.roll_min2, 'Moving minimum.')
+rolling_max = _rolling_func(algos.roll_max2, 'Moving maximum.', float32=True)
+rolling_min = _rolling_func(algos.roll_min2, 'Moving minimum.', float32=True)
 rolling_sum = _rolling_func(algos.roll_sum, 'Moving sum.')
 rolling_mean = _rolling_func(algos.roll_mean, 'Moving mean.')
 rolling_median = _rolling_func(algos.roll_median_cython, 'Moving median.')
@@ -812,7 +826,7 @@ def _pop_args(win_type, arg_names, kwargs):
     return all_args
 
 
-def _expanding_func(func, desc, check_minp=_use_window):
+def _expanding_func(func, desc, check_minp=_use_window, float32=False):
     @Substitution(desc, _unary_arg, _expanding_kw, _type_of_input_retval, "")
     @Appender(_doc_template)
     @wraps(func)
@@ -825,12 +839,15 @@ def _expanding_func(func, desc, check_minp=_use_window):
             return func(arg, window, minp, **kwds)
         return _rolling_moment(arg, window, call_cython, min_periods,
                                freq=freq, center=center,
-                               time_rule=time_rule, **kwargs)
+                               time_rule=time_rule, float32=float32,
+                               **kwargs)
 
     return f
 
-expanding_max = _expanding_func(algos.roll_max2, 'Expanding maximum.')
-expanding_min = _expanding_func(algos.roll_min2, 'Expanding minimum.')
+expanding_max = _expanding_func(algos.roll_max2, 'Expanding maximum.',
+                                float32=True)
+expanding_min = _expanding_func(algos.roll_min2, 'Expanding minimum.',
+                                float32=True)
 expanding_sum = _expanding_func(algos.roll_sum, 'Expanding sum.')
 expanding_mean = _expanding_func(algos.roll_mean, 'Expanding mean.')
 expanding_median = _expanding_func(
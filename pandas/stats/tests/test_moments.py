@@ -6,7 +6,8 @@ from datetime import datetime
 from numpy.random import randn
 import numpy as np
 
-from pandas import Series, DataFrame, bdate_range, isnull, notnull
+from pandas import (Series, DataFrame, bdate_range, isnull, notnull,
+                    option_context)
 from pandas.util.testing import (
     assert_almost_equal, assert_series_equal, assert_frame_equal
 )
@@ -215,6 +216,25 @@ class TestMoments(tm.TestCase):
         self.assertRaises(ValueError, mom.rolling_max, np.array([1,
                           2, 3]), window=3, min_periods=5)
 
+    def test_rolling_max_min_float32(self):
+        a = np.array([3, np.nan, 1, 4, 2], dtype='float32')
+        for result, expected in [(mom.rolling_max(a, 2, min_periods=1),
+                                  [3, 3, 1, 4, 4]),
+                                 (mom.rolling_min(a, 2, min_periods=1),
+                                  [3, 3, 1, 1, 2]),
+                                 (mom.expanding_max(a), [3, 3, 3, 4, 4])]:
+            self.assertEqual(result.dtype, np.float32)
+            assert_almost_equal(result, expected)
+
+        # the small integers only with the option
+        s = Series(np.array([3, 1, 4], dtype='int8'))
+        self.assertEqual(mom.rolling_max(s, 2).dtype, np.float64)
+        with option_context('mode.preserve_small_dtypes', True):
+            result = mom.rolling_max(s, 2)
+            self.assertEqual(result.dtype, np.float32)
+            assert_series_equal(result, Series([np.nan, 3, 4],
+                                               dtype='float32'))
+
     def test_rolling_quantile(self):
         qs = [.1, .5, .9]
 
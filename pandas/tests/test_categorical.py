@@ -10,8 +10,10 @@ import numpy as np
 from pandas.core.categorical import Categorical
 from pandas.core.index import Index, Int64Index, MultiIndex
 from pandas.core.frame import DataFrame
+from pandas.core.series import Series
 from pandas.util.testing import assert_almost_equal
 import pandas.core.common as com
+import pandas as pd
 
 import pandas.util.testing as tm
 
@@ -105,6 +107,18 @@ class TestCategorical(tm.TestCase):
                               'a', 'c', 'c', 'c'])
         self.assert_(factor.equals(self.factor))
 
+    def test_value_counts(self):
+        cat = Categorical.from_array(['b', 'a', 'b', 'c', 'b', 'a'])
+        values = np.asarray(cat)
+        tm.assert_series_equal(cat.value_counts(), pd.value_counts(values))
+        tm.assert_series_equal(pd.value_counts(cat, normalize=True),
+                               pd.value_counts(values, normalize=True))
+
+        # a missing value is not counted, an unobserved level is
+        cat = Categorical(np.array([0, -1, 0]), ['a', 'b'])
+        tm.assert_series_equal(cat.value_counts(sort=False),
+                               Series([2, 0], index=['a', 'b']))
+
     def test_describe(self):
         # string type
         desc = self.factor.describe()
@@ -2457,6 +2457,50 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
                        columns=['d', 'c', 'b', 'a'])
         assert_almost_equal(df.values, expected)
 
+    def test_constructor_dict_no_consolidate(self):
+        arrays = {'a': np.arange(5.), 'b': np.arange(5.) * 2,
+                  'c': np.arange(5), 'd': Series(np.ones(5))}
+        df = DataFrame(arrays, consolidate=False)
+        expected = DataFrame(arrays)
+        self.assertEqual(len(df._data.blocks), 4)
+        self.assertEqual(len(expected._data.blocks), 2)
+        assert_frame_equal(df, expected)
+
+        # the blocks are views of the arrays, unless copied
+        copied = DataFrame(arrays, copy=True, consolidate=False)
+        arrays['a'][0] = 10.
+        self.assertEqual(df['a'][0], 10.)
+        self.assertEqual(copied['a'][0], 0.)
+        self.assertEqual(expected['a'][0], 0.)
+
+        # and are consolidated lazily
+        result = df.fillna(0)
+        self.assertEqual(len(result._data.blocks), 4)
+        self.assertEqual(len(copied._data.blocks), 4)
+
+        # the arrays which are coerced, as when consolidating
+        uint = np.array([2 ** 64 - i for i in range(1, 6)], dtype=np.uint64)
+        tz = date_range('20130101', periods=5, tz='US/Eastern')
+        arrays = {'a': uint, 'b': tz, 'c': np.arange(5)}
+        df = DataFrame(arrays, consolidate=False)
+        expected = DataFrame(arrays)
+        self.assertEqual(df['a'].dtype, object)
+        assert_series_equal(df.dtypes, expected.dtypes)
+        assert_frame_equal(df, expected)
+
+        # the items of each array are placed by position, also with columns
+        # that are not in the arrays
+        arrays = dict(('c%d' % i, np.arange(3.) + i) for i in range(50))
+        columns = ['c%d' % i for i in range(49, -1, -1)] + ['x']
+        df = DataFrame(arrays, columns=columns, consolidate=False)
+        expected = DataFrame(arrays, columns=columns)
+        assert_frame_equal(df, expected)
+        for blk in df._data.blocks:
+            if blk.items[0] != 'x':
+                self.assertEqual(len(blk.items), 1)
+                self.assert_numpy_array_equal(blk.values[0],
+                                              arrays[blk.items[0]])
+
     def test_constructor_dict_cast(self):
         # cast float tests
         test_data = {
@@ -3756,6 +3800,60 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
         df = DataFrame(data={"Values": [1.0, 2.0, 3.0, np.nan]})
         self.assertRaises(ValueError, df.astype, np.int64)
 
+    def test_downcast(self):
+        df = DataFrame({'a': np.arange(5, dtype='int64'),
+                        'b': np.array([0, 300, 2, 3, 4], dtype='int64'),
+                        'c': np.arange(5, dtype='float64'),
+                        'd': [0.5, 1.5, np.nan, 2.5, 3.5],
+                        'e': [0.1, 0.2, 0.3, 0.4, 0.5],
+                        'f': list('abcde')},
+                       columns=list('abcdef'))
+
+        result = df.downcast()
+        expected = Series([np.dtype('int8'), np.dtype('int16'),
+                           np.dtype('int8'), np.dtype('float32'),
+                           np.dtype('float64'), np.dtype('object')],
+                          index=list('abcdef'))
+        assert_series_equal(result.dtypes, expected)
+        assert_frame_equal(result, df, check_dtype=False)
+
+        result = df.downcast(kind='integer')
+        self.assertEqual(result['c'].dtype, np.int8)
+        self.assertEqual(result['d'].dtype, np.float64)
+
+        result = df.downcast(kind='float')
+        self.assertEqual(result['a'].dtype, np.int64)
+        self.assertEqual(result['c'].dtype, np.float32)
+        self.assertEqual(result['d'].dtype, np.float32)
+
+        # the original is untouched
+        self.assertEqual(df['a'].dtype, np.int64)
+
+        self.assertRaises(ValueError, df.downcast, kind='complex')
+
+    def test_preserve_small_dtypes(self):
+        df = DataFrame({'a': np.arange(5, dtype='int8'),
+                        'b': np.arange(5, dtype='int32')})
+        result = df.reindex(lrange(7))
+        self.assertEqual(result['a'].dtype, np.float64)
+
+        with pd.option_context('mode.preserve_small_dtypes', True):
+            self.assertTrue(com._preserve_small_dtypes)
+            result = df.reindex(lrange(7))
+            self.assertEqual(result['a'].dtype, np.float32)
+            self.assertEqual(result['b'].dtype, np.float64)
+            assert_frame_equal(result, df.astype('float64').reindex(lrange(7)),
+                               check_dtype=False)
+
+        # groupby selections stay in float32 for the small ints
+        df = DataFrame({'key': [1, 1, 2, 2],
+                        'a': np.array([1, 5, 3, 2], dtype='int8')})
+        result = df.groupby('key').max()
+        self.assertEqual(result['a'].dtype, np.int8)
+        assert_series_equal(result['a'],
+                            Series([5, 3], index=Index([1, 2], name='key'),
+                                   name='a', dtype='int8'))
+
     def test_array_interface(self):
         result = np.sqrt(self.frame)
         tm.assert_isinstance(result, type(self.frame))
@@ -6066,6 +6164,61 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
                 rs = read_csv(filename,index_col=0)
                 assert_frame_equal(rs, aa)
 
+    def test_to_csv_partition_on(self):
+        import os
+        import json
+        import shutil
+        import tempfile
+
+        df = DataFrame({'symbol': ['a', 'b', 'c', 'a', 'b', 'a'],
+                        'date': [datetime(2014, 1, 1)] * 3 +
+                                [datetime(2014, 1, 2)] * 3,
+                        'value': np.arange(6.)})
+        dirpath = tempfile.mkdtemp()
+        try:
+            pattern = os.path.join(dirpath, '{date:%Y%m%d}', '{symbol}.csv')
+            manifest = os.path.join(dirpath, 'manifest.json')
+            for threads in [None, 3]:
+                df.to_csv(pattern, partition_on=['date', 'symbol'],
+                          threads=threads, manifest=manifest, index=False)
+
+                for (date, symbol), g in df.groupby(['date', 'symbol']):
+                    path = pattern.format(date=date, symbol=symbol)
+                    result = read_csv(path, parse_dates=['date'])
+                    expected = g.reset_index(drop=True)
+                    assert_frame_equal(result, expected[result.columns])
+
+                with open(manifest) as fh:
+                    partitions = json.load(fh)['partitions']
+                self.assertEqual(len(partitions), 5)
+                self.assertEqual(sum(p['nrows'] for p in partitions), 6)
+                self.assertEqual(partitions[0]['values'],
+                                 {'date': '2014-01-01T00:00:00',
+                                  'symbol': 'a'})
+
+            # by position, on a single column
+            pattern = os.path.join(dirpath, 'by_symbol_{0}.csv')
+            df.to_csv(pattern, partition_on='symbol')
+            result = read_csv(pattern.format('a'), index_col=0,
+                              parse_dates=['date'])
+            assert_frame_equal(result, df[df.symbol == 'a'])
+
+            self.assertRaises(ValueError, df.to_csv,
+                              os.path.join(dirpath, 'foo.csv'),
+                              partition_on='symbol')
+            self.assertRaises(ValueError, df.to_csv,
+                              os.path.join(dirpath, 'foo{{0}}.csv'),
+                              partition_on='symbol')
+            self.assertRaises(ValueError, df.to_csv,
+                              os.path.join(dirpath, '{0}.csv'),
+                              partition_on='symbol', threads=0)
+            self.assertRaises(KeyError, df.to_csv, pattern,
+                              partition_on='foo')
+            self.assertRaises(ValueError, df.to_csv, StringIO(),
+                              partition_on='symbol')
+        finally:
+            shutil.rmtree(dirpath, ignore_errors=True)
+
     def test_to_csv_bug(self):
         f1 = StringIO('a,1.0\nb,2.0')
         df = DataFrame.from_csv(f1, header=None)
@@ -6261,6 +6414,41 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
             name = '%d    %d non-null %s' % (i, n, dtype)
             assert name in res
 
+    def test_memory_usage(self):
+        df = DataFrame({'a': np.arange(10, dtype='int64'),
+                        'b': np.random.randn(10),
+                        'c': ['foo%d' % i for i in range(10)]})
+        df['d'] = 1.
+
+        result = df.memory_usage()
+        expected = Series([df.index.memory_usage(), 80, 80, 80, 80],
+                          index=['Index', 'a', 'b', 'c', 'd'])
+        assert_series_equal(result, expected)
+        assert_series_equal(df.memory_usage(index=False), expected[1:])
+
+        # the strings are counted
+        result = df.memory_usage(deep=True)
+        self.assertEqual(result['c'],
+                         80 + sum(sys.getsizeof(x) for x in df['c']))
+        assert_series_equal(result[['a', 'b', 'd']], expected[['a', 'b', 'd']])
+
+        # duplicate columns
+        dups = df.rename(columns={'d': 'c'})
+        self.assert_numpy_array_equal(
+            dups.memory_usage(index=False, deep=True).values,
+            result.values[1:])
+
+        self.assertEqual(df['c'].memory_usage(deep=True),
+                         result['c'] + df.index.memory_usage(deep=True))
+        self.assertEqual(df['a'].memory_usage(index=False), 80)
+
+        buf = StringIO()
+        df.info(buf=buf)
+        self.assertIn('memory usage: ', buf.getvalue())
+        buf = StringIO()
+        df.info(buf=buf, memory_usage=False)
+        self.assertNotIn('memory usage: ', buf.getvalue())
+
     def test_dtypes(self):
         self.mixed_frame['bool'] = self.mixed_frame['A'] > 0
         result = self.mixed_frame.dtypes
@@ -11807,6 +11995,435 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
         _ = self.frame.as_matrix()
         self.assert_(self.frame._data.is_consolidated())
 
+    def test_consolidation_policy(self):
+        import pandas.core.internals as internals
+        self.assertRaises(ValueError, pd.set_option, 'mode.consolidation',
+                          'foo')
+
+        # the policy is kept up to date by the option callback
+        for mode in ['lazy', 'never']:
+            with pd.option_context('mode.consolidation', mode):
+                self.assertEqual(internals._consolidation_mode, mode)
+        self.assertEqual(internals._consolidation_mode, 'eager')
+
+        for mode in ['lazy', 'never']:
+            with pd.option_context('mode.consolidation', mode):
+                df = self.frame.copy()
+                df['E'] = 7.
+                df['F'] = 'foo'
+
+                # reindexing and filling do not consolidate
+                result = df.reindex(df.index[::-1]).fillna(0)
+                self.assertEqual(len(result._data.blocks), 3)
+                self.assertEqual(len(df._data.blocks), 3)
+                assert_frame_equal(result.sort_index(), df.fillna(0))
+
+                # mixed values are interleaved, without consolidating
+                expected = df.copy().consolidate().values
+                assert_almost_equal(df.values, expected)
+                self.assertFalse(df._data.is_consolidated())
+
+                # a single dtype needs a single block
+                del df['F']
+                df.values[5] = 5
+                self.assertTrue(df._data.is_consolidated())
+                self.assertTrue((df.values[5] == 5).all())
+
+        # many small blocks are merged lazily, but not never
+        for mode in ['lazy', 'never']:
+            with pd.option_context('mode.consolidation', mode):
+                df = DataFrame(index=lrange(10))
+                for i in range(250):
+                    df[i] = 1.
+                nblocks = len(df._data.blocks)
+                if mode == 'lazy':
+                    self.assertTrue(nblocks <= 102)
+                else:
+                    self.assertEqual(nblocks, 250)
+
+    def test_copy_on_write(self):
+        import pandas.core.internals as internals
+
+        # the flag is kept up to date by the option callback
+        with pd.option_context('mode.copy_on_write', True):
+            self.assertTrue(internals._copy_on_write)
+        self.assertFalse(internals._copy_on_write)
+
+        df = DataFrame(np.random.randn(10, 4), columns=list('ABCD'))
+        df['E'] = 'foo'
+        original = df.copy()
+
+        def f1(copy):
+            copy.iloc[0, 0] = 100.
+
+        def f2(copy):
+            copy.set_value(1, 'B', 100.)
+
+        def f3(copy):
+            copy.replace(copy.iloc[0, 0], 0., inplace=True)
+
+        def f4(copy):
+            copy['C'] = 100.
+
+        def f5(copy):
+            copy.loc[3, 'E'] = 'bar'
+
+        def f6(copy):
+            # a cached column is detached from the frame
+            copy['A'][2] = 100.
+
+        with pd.option_context('mode.copy_on_write', True):
+            for f in [f1, f2, f3, f4, f5, f6]:
+                copy = df.copy()
+                self.assertTrue(np.may_share_memory(copy['A'].values,
+                                                    df['A'].values))
+
+                # the shared memory is read-only
+                self.assertFalse(copy['A'].values.flags.writeable)
+                self.assertRaises((ValueError, RuntimeError),
+                                  copy['A'].values.__setitem__, 0, 100.)
+
+                f(copy)
+                assert_frame_equal(df, original)
+                if f is f6:
+                    assert_frame_equal(copy, original)
+                else:
+                    self.assertFalse(copy.equals(original))
+
+            # series are copied
+            s = df['A'].copy()
+            self.assertFalse(np.may_share_memory(s.values, df['A'].values))
+
+            # every accessor hands out read-only views of shared memory
+            dfd = DataFrame(np.random.randn(5, 3), columns=['A', 'A', 'B'])
+            copy = dfd.copy()
+            mgr = copy._data
+            self.assertFalse(mgr.iget(0).flags.writeable)
+            self.assertFalse(mgr.fast_xs(1)[0].flags.writeable)
+            self.assertFalse(copy.iloc[:, 2].values.flags.writeable)
+            self.assertRaises((ValueError, RuntimeError),
+                              mgr.iget(0).__setitem__, 0, 100.)
+            self.assertTrue(mgr.fast_xs(1, copy=True)[0].flags.writeable)
+
+    def test_compact_strings(self):
+        from pandas.core.internals import StringBlock, ObjectBlock
+        data = {'a': ['foo%d' % (i % 4) for i in range(10)],
+                'b': lrange(10),
+                'c': ['bar'] * 9 + [np.nan]}
+        expected = DataFrame(data)
+
+        with pd.option_context('mode.compact_strings', True):
+            df = DataFrame(data)
+            klasses = dict((b.items[0], type(b)) for b in df._data.blocks
+                           if not b.is_numeric)
+            self.assertEqual(klasses, {'a': StringBlock, 'c': ObjectBlock})
+            self.assertIn(df._data.get_dtypes()[0].kind, ['S', 'U'])
+
+            # handed out as objects
+            import pandas.core.internals as internals
+            self.assertTrue(internals._compact_strings)
+            self.assertEqual(df['a'].dtype, np.object_)
+            self.assertEqual(df.values.dtype, np.object_)
+            self.assertEqual(df[['a']].values.dtype, np.object_)
+            self.assertEqual(df[['a']].iloc[0].dtype, np.object_)
+            assert_frame_equal(df, expected)
+            self.assertTrue(df.memory_usage(deep=True)['a'] <
+                            expected.memory_usage(deep=True)['a'])
+
+            # vectorized comparisons and null checks
+            assert_series_equal(df['a'] == 'foo1', expected['a'] == 'foo1')
+            assert_series_equal(df['a'] != 'foo1', expected['a'] != 'foo1')
+            assert_series_equal(df['a'] == 1, expected['a'] == 1)
+            assert_frame_equal(df[['a']] == 'foo1', expected[['a']] == 'foo1')
+            self.assertFalse(df['a'].isnull().any())
+
+            # factorizing and grouping
+            labels, uniques = pd.factorize(df['a'])
+            elabels, euniques = pd.factorize(expected['a'])
+            self.assert_numpy_array_equal(labels, elabels)
+            self.assert_numpy_array_equal(uniques, euniques)
+            assert_series_equal(df.groupby('a')['b'].sum(),
+                                expected.groupby('a')['b'].sum())
+
+            # taking keeps the strings, filling with nulls makes objects
+            result = df.take([3, 1])
+            self.assertTrue(result._data.blocks[0].is_string or
+                            result._data.blocks[1].is_string)
+            assert_frame_equal(result, expected.take([3, 1]))
+            result = df.reindex(lrange(12))
+            self.assertEqual(result['a'].dtype, np.object_)
+            assert_frame_equal(result, expected.reindex(lrange(12)))
+
+            # a string which does not fit makes objects
+            is_string = lambda: any(b.is_string for b in df._data.blocks)
+            df['a'] = df['a']
+            self.assertTrue(is_string())
+            df.loc[1, 'a'] = 'fo'
+            self.assertTrue(is_string())
+            df.loc[0, 'a'] = 'a longer string'
+            self.assertFalse(is_string())
+            expected.loc[1, 'a'] = 'fo'
+            expected.loc[0, 'a'] = 'a longer string'
+            assert_frame_equal(df, expected)
+
+    def test_integer_na_mask(self):
+        df = DataFrame({'a': np.arange(5, dtype='int32'),
+                        'b': [True, False, True, True, False]})
+        expected = df.reindex(lrange(7))
+        self.assertFalse(any(b.is_masked for b in expected._data.blocks))
+
+        with pd.option_context('mode.integer_na', 'mask'):
+            import pandas.core.internals as internals
+            self.assertEqual(internals._integer_na, 'mask')
+            result = df.reindex(lrange(7))
+
+            # the values keep their dtype, with a mask of the missing rows
+            blocks = dict((b.items[0], b) for b in result._data.blocks)
+            self.assertTrue(blocks['a'].is_masked)
+            self.assertTrue(blocks['b'].is_masked)
+            self.assertEqual(blocks['a'].values.dtype, np.int32)
+            self.assertEqual(blocks['b'].values.dtype, np.bool_)
+            self.assertTrue(result.memory_usage(index=False)['a'] <
+                            expected.memory_usage(index=False)['a'])
+
+            # extracted (and compared) as the upcast values
+            assert_frame_equal(result, expected)
+            self.assertTrue(np.isnan(result.iloc[5, 0]))
+            assert_series_equal(result.iloc[1], expected.iloc[1])
+
+            # taking and reindexing keep the mask
+            assert_frame_equal(result.take([6, 0, 5]),
+                               expected.take([6, 0, 5]))
+            assert_frame_equal(result.reindex(lrange(-1, 8)),
+                               expected.reindex(lrange(-1, 8)))
+            self.assertTrue(result.reindex([6, 0])._data.blocks[0].is_masked)
+            self.assertFalse(result.reindex([1, 0])._data.blocks[0].is_masked)
+
+            # filling with an integer gives back the integers
+            filled = result[['a']].fillna(-1)
+            self.assertEqual(filled['a'].dtype, np.int32)
+            self.assert_numpy_array_equal(filled['a'].values,
+                                          [0, 1, 2, 3, 4, -1, -1])
+            assert_frame_equal(result.fillna(0.5), expected.fillna(0.5))
+
+            # arithmetic with a scalar and reductions skip the masked values
+            ints = result[['a']]
+            assert_frame_equal(ints * 2, expected[['a']] * 2)
+            self.assertTrue((ints * 2)._data.blocks[0].is_masked)
+            assert_frame_equal(ints > 2, expected[['a']] > 2)
+
+            # comparisons are boolean, with the nulls compared as a nan is
+            for op in [operator.gt, operator.eq, operator.ne]:
+                for col in ['a', 'b']:
+                    compared = op(result[[col]], 1)
+                    assert_frame_equal(compared, op(expected[[col]], 1))
+                    self.assertEqual(compared[col].dtype, np.bool_)
+            for f in ['sum', 'mean', 'min', 'max', 'median', 'std']:
+                assert_series_equal(getattr(ints, f)(),
+                                    getattr(expected[['a']], f)(),
+                                    check_dtype=False)
+            self.assertTrue(np.isnan(ints.sum(skipna=False)['a']))
+
+            # grouping, concatenating and setting operate on the upcast values
+            assert_frame_equal(result.groupby('b').sum(),
+                               expected.groupby('b').sum())
+            both = DataFrame({'a': lrange(5), 'c': lrange(5)}).reindex(lrange(7))
+            self.assertTrue(both._data.blocks[0].is_masked)
+            assert_frame_equal(both.groupby([0, 0], axis=1).sum(),
+                               both.astype(float).groupby([0, 0], axis=1).sum())
+            assert_frame_equal(pd.concat([result, result]),
+                               pd.concat([expected, expected]))
+            result.iloc[6, 0] = 6
+            expected.iloc[6, 0] = 6
+            assert_frame_equal(result, expected)
+
+            # setting a column of a masked block keeps the others
+            both = DataFrame({'a': lrange(5), 'c': lrange(5)}).reindex(lrange(7))
+            self.assertEqual(len(both._data.blocks), 1)
+            both['a'] = 1.5
+            self.assertTrue(np.isnan(both['c'][6]))
+            self.assertEqual(both['c'][4], 4)
+
+            # shifting and setting a value of the dtype (or a null) keep the
+            # mask
+            ints = DataFrame({'a': np.arange(5)}).reindex(lrange(7))
+            expected = ints.astype(float)
+            for periods in [2, -1]:
+                shifted = ints.shift(periods)
+                self.assertTrue(shifted._data.blocks[0].is_masked)
+                assert_frame_equal(shifted, expected.shift(periods))
+
+            ints.iloc[5, 0] = 5
+            ints.iloc[0, 0] = np.nan
+            expected.iloc[5, 0] = 5
+            expected.iloc[0, 0] = np.nan
+            ints[ints > 3] = 0
+            expected[expected > 3] = 0
+            blk = ints._data.blocks[0]
+            self.assertTrue(blk.is_masked)
+            self.assertEqual(blk.values.dtype, np.int64)
+            assert_frame_equal(ints, expected)
+
+            # a row is upcast on its own
+            assert_series_equal(ints.iloc[1], expected.iloc[1])
+
+    def test_min_max_int_extremes(self):
+        # the fill of the masked integers does not apply to plain integers
+        big, small = np.iinfo(np.int64).max, np.iinfo(np.int64).min
+        df = DataFrame({'a': np.array([big, 0, -5], dtype=np.int64),
+                        'b': np.array([1, 2, small], dtype=np.int64)})
+        assert_series_equal(df.min(), Series([-5, small], index=['a', 'b']),
+                            check_dtype=False)
+        assert_series_equal(df.max(), Series([big, 2], index=['a', 'b']),
+                            check_dtype=False)
+        self.assertEqual(df['a'].max(), big)
+        self.assertEqual(df['b'].min(), small)
+
+        df = DataFrame({'a': np.array([-128, 127, 0], dtype=np.int8)})
+        self.assertEqual(df.min()['a'], -128)
+        self.assertEqual(df.max()['a'], 127)
+
+    def test_cache_null_mask(self):
+        df = DataFrame({'a': [1., np.nan, 3., np.nan],
+                        'b': ['x', None, 'y', 'z'],
+                        'c': lrange(4)})
+        expected = df.copy()
+
+        with pd.option_context('mode.cache_null_mask', True):
+            import pandas.core.internals as internals
+            self.assertTrue(internals._cache_null_mask)
+            assert_series_equal(df.count(), Series([2, 3, 4],
+                                                   index=list('abc')))
+            assert_series_equal(df.count(1), Series([3, 1, 3, 2]))
+
+            # the masks (and counts) are kept on the blocks
+            for block in df._data.blocks:
+                self.assertIs(block.null_mask(), block.null_mask())
+            assert_frame_equal(df.isnull(), expected.isnull())
+            assert_frame_equal(df.dropna(), expected.dropna())
+            assert_series_equal(df[['a', 'c']].sum(),
+                                expected[['a', 'c']].sum())
+            self.assertEqual(df['a'].mean(), 2.)
+
+            # modifying the values drops them
+            df.loc[0, 'b'] = None
+            df['a'][1] = 2.
+            df.iloc[3, 2] = np.nan
+            self.assertEqual(df['a'].mean(), 2.)
+            assert_series_equal(df.count(), Series([3, 2, 3],
+                                                   index=list('abc')))
+            df.fillna(0, inplace=True)
+            assert_series_equal(df.count(), Series([4, 4, 4],
+                                                   index=list('abc')))
+
+            # the result of isnull can be modified
+            result = df.isnull()
+            result.iloc[0, 0] = True
+            self.assertFalse(df.isnull().iloc[0, 0])
+
+        assert_series_equal(expected.count(), Series([2, 3, 4],
+                                                     index=list('abc')))
+
+    def test_categorical_block(self):
+        cat = pd.Categorical.from_array(['b', 'a', 'b', 'c', 'b'])
+        df = DataFrame({'a': cat, 'b': lrange(5)})
+        expected = DataFrame({'a': ['b', 'a', 'b', 'c', 'b'], 'b': lrange(5)})
+
+        # the codes and levels are stored, and the values given back
+        blocks = dict((b.items[0], b) for b in df._data.blocks)
+        self.assertTrue(blocks['a'].is_categorical)
+        self.assertTrue(blocks['a'].levels.equals(Index(['a', 'b', 'c'])))
+        self.assertEqual(df.dtypes['a'], np.object_)
+        assert_frame_equal(df, expected)
+        assert_series_equal(df.iloc[3], expected.iloc[3])
+
+        # taking, reindexing and shifting act on the codes
+        for result, exp in [(df.take([4, 0, 3]), expected.take([4, 0, 3])),
+                            (df.reindex(lrange(-1, 6)),
+                             expected.reindex(lrange(-1, 6))),
+                            (df.shift(2), expected.shift(2))]:
+            self.assertIsNotNone(result._data.get_categorical('a'))
+            assert_frame_equal(result, exp)
+
+        # comparisons with a scalar act on the levels
+        assert_frame_equal(df[['a']] == 'b', expected[['a']] == 'b')
+
+        # filling with a value adds it to the levels
+        result = df[['a']].reindex(lrange(7)).fillna('d')
+        self.assertTrue(result._data.get_categorical('a').levels.equals(
+            Index(['a', 'b', 'c', 'd'])))
+        assert_frame_equal(result,
+                           expected[['a']].reindex(lrange(7)).fillna('d'))
+
+        # concatenating takes the union of the levels
+        other = DataFrame({'a': pd.Categorical.from_array(['d', 'a']),
+                           'b': [5, 6]}, index=[5, 6])
+        result = pd.concat([df, other])
+        self.assertTrue(result._data.get_categorical('a').levels.equals(
+            Index(['a', 'b', 'c', 'd'])))
+        assert_frame_equal(result, pd.concat(
+            [expected, DataFrame({'a': ['d', 'a'], 'b': [5, 6]},
+                                 index=[5, 6])]))
+
+        # grouping by a categorical column uses the codes
+        assert_series_equal(df.groupby('a')['b'].sum(),
+                            expected.groupby('a')['b'].sum())
+
+        # setting a Categorical keeps it, setting other values replaces it
+        df['c'] = cat
+        self.assertIsNotNone(df._data.get_categorical('c'))
+        df['a'] = 1
+        self.assertIsNone(df._data.get_categorical('a'))
+        self.assertEqual(df['c'][3], 'c')
+
+    def test_compress(self):
+        df = DataFrame({'a': np.repeat([1.5, 2.5], 500),
+                        'b': np.arange(1000),
+                        'c': ['x'] * 1000,
+                        'd': date_range('20130101', periods=1000)},
+                       columns=list('abcd'))
+
+        result = df.compress(chunksize=100, compress='zlib')
+        blocks = dict((b.items[0], b) for b in result._data.blocks)
+        for col in ['a', 'b', 'd']:
+            self.assertTrue(blocks[col].is_compressed)
+        self.assertFalse(blocks['c'].is_compressed)
+        self.assertTrue(result.memory_usage(index=False)['a'] * 3 <
+                        df.memory_usage(index=False)['a'])
+        assert_series_equal(result.dtypes, df.dtypes)
+        assert_frame_equal(result, df)
+
+        # accessing decompresses the values
+        self.assertEqual(result['b'][250], 250)
+        self.assertEqual(result.get_value(750, 'a'), 2.5)
+        assert_frame_equal(result.iloc[490:510], df.iloc[490:510])
+        assert_series_equal(result.iloc[501], df.iloc[501])
+        assert_series_equal(result.sum(), df.sum())
+        assert_frame_equal(result[['a', 'b']] * 2, df[['a', 'b']] * 2)
+        assert_frame_equal(result.fillna(0), df.fillna(0))
+
+        # setting replaces the compressed values
+        result['b'] = 1
+        self.assertEqual(result['b'].sum(), 1000)
+
+        # some of the columns
+        result = df.compress(['a'])
+        self.assertEqual(sum(b.is_compressed for b in result._data.blocks), 1)
+        self.assertRaises(KeyError, df.compress, ['e'])
+
+        result = df.compress().decompress()
+        self.assertFalse(any(b.is_compressed for b in result._data.blocks))
+        assert_frame_equal(result, df)
+
+        # the masked values are not compressed
+        with pd.option_context('mode.integer_na', 'mask'):
+            masked = df[['b']].reindex(lrange(1005))
+            self.assertTrue(masked._data.blocks[0].is_masked)
+            result = masked.compress()
+            self.assertFalse(result._data.blocks[0].is_compressed)
+            assert_frame_equal(result, masked)
+            self.assertTrue(isnull(result['b'][1000:]).all())
+
     def test_modify_values(self):
         self.frame.values[5] = 5
         self.assert_((self.frame.values[5] == 5).all())
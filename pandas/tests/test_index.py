@@ -2,6 +2,7 @@
 
 from datetime import datetime, timedelta
 from pandas.compat import range, lrange, lzip, u, zip
+import sys
 import operator
 import pickle
 import re
@@ -12,8 +13,8 @@ import os
 import numpy as np
 from numpy.testing import assert_array_equal
 
-from pandas.core.index import (Index, Float64Index, Int64Index, MultiIndex,
-                               InvalidIndexError)
+from pandas.core.index import (Index, Float64Index, Int64Index, RangeIndex,
+                               MultiIndex, InvalidIndexError)
 from pandas.tseries.index import DatetimeIndex
 from pandas.core.frame import DataFrame
 from pandas.core.series import Series
@@ -576,6 +577,23 @@ class TestIndex(tm.TestCase):
         self.assertIn('~:{range}:0', result)
         self.assertIn('{other}%s', result)
 
+    def test_memory_usage(self):
+        for name, index in compat.iteritems(self.indices):
+            result = index.memory_usage()
+            self.assertEqual(result, index.view(np.ndarray).nbytes)
+
+            # the engine is populated by a lookup
+            deep = index.memory_usage(deep=True)
+            if len(index):
+                index.get_loc(index[0])
+                self.assertTrue(index.memory_usage(deep=True) > deep)
+            self.assertTrue(deep >= result)
+
+        # the strings are counted
+        result = self.strIndex.memory_usage(deep=True)
+        self.assertTrue(result >= self.strIndex.memory_usage() +
+                        sum(sys.getsizeof(x) for x in self.strIndex))
+
     def test_format(self):
         self._check_method_works(Index.format)
 
@@ -963,6 +981,70 @@ class TestInt64Index(tm.TestCase):
         i_view = i.view()
         self.assertEqual(i_view.name, 'Foo')
 
+    def test_shared_engine(self):
+        values = np.arange(20000)[::-1]
+        index = Int64Index(values)
+        self.assertEqual(index.get_loc(19999), 0)
+        self.assertFalse(index.is_monotonic)
+
+        # copies, views, renames and equal indexes share the engine
+        for other in [index.copy(), index.view(), index.rename('foo'),
+                      Int64Index(values.copy())]:
+            self.assertIs(other._engine, index._engine)
+            self.assertEqual(other.get_loc(0), 19999)
+
+        # but not the different indexes
+        other = Int64Index(np.arange(20000)[::-1] * 2)
+        self.assertIsNot(other._engine, index._engine)
+        self.assertEqual(other.get_loc(2), 19998)
+        other = Float64Index(values.astype(float))
+        self.assertIsNot(other._engine, index._engine)
+
+        # nor the small indexes, or when disabled
+        small = Int64Index([1, 2, 3])
+        self.assertIsNot(small._engine, Int64Index([1, 2, 3])._engine)
+        with cf.option_context('mode.share_index_engines', False):
+            other = Int64Index(values.copy())
+            self.assertIsNot(other._engine, index._engine)
+
+    def test_sorted_search(self):
+        # monotonic indexes look up a few values without a hash table
+        index = Int64Index(np.arange(0, 2000, 2))
+        self.assertTrue(index.is_unique)
+        self.assertEqual(index.get_loc(10), 5)
+        self.assertRaises(KeyError, index.get_loc, 11)
+        self.assertRaises(KeyError, index.get_loc, 2000)
+        self.assertTrue(1998 in index)
+        self.assertFalse(-2 in index)
+        target = Int64Index([-2, 0, 5, 10, 1998, 2000])
+        expected = np.array([-1, 0, -1, 5, 999, -1])
+        self.assert_numpy_array_equal(index.get_indexer(target), expected)
+        self.assertEqual(index._engine.sizeof(), 0)
+
+        # but build it to look up many
+        target = Int64Index(np.arange(-1, 2001))
+        expected = np.where(target % 2 == 0, target // 2, -1)
+        expected[-1] = -1
+        self.assert_numpy_array_equal(index.get_indexer(target), expected)
+        self.assertTrue(index._engine.sizeof() > 0)
+
+        # non-unique
+        index = Int64Index([0, 1, 1, 1, 3, 3, 5])
+        self.assertFalse(index.is_unique)
+        self.assertEqual(index.get_loc(1), slice(1, 4))
+        indexer, missing = index.get_indexer_non_unique([3, 2, 1, 6, 0])
+        self.assert_numpy_array_equal(indexer,
+                                      np.array([4, 5, -1, 1, 2, 3, -1, 0]))
+        self.assert_numpy_array_equal(missing, np.array([1, 3]))
+        self.assertEqual(index._engine.sizeof(), 0)
+
+        index = DatetimeIndex(start='2000-01-01', periods=100, freq='D')
+        target = DatetimeIndex(['1999-12-31', '2000-01-02', '2000-04-09'])
+        self.assert_numpy_array_equal(index.get_indexer(target),
+                                      np.array([-1, 1, 99]))
+        self.assertEqual(index.get_loc(index[50]), 50)
+        self.assertEqual(index._engine.sizeof(), 0)
+
     def test_coerce_list(self):
         # coerce things
         arr = Index([1, 2, 3, 4])
@@ -1318,6 +1400,167 @@ class TestInt64Index(tm.TestCase):
         self.assertEqual(idx.name, idx[1:].name)
 
 
+class TestRangeIndex(tm.TestCase):
+    _multiprocess_can_split_ = True
+
+    def setUp(self):
+        self.index = RangeIndex(0, 20, 2, name='foo')
+
+    def test_constructor(self):
+        index = RangeIndex(5)
+        self.assert_numpy_array_equal(index, np.arange(5))
+        self.assertEqual(index.dtype, np.int64)
+
+        index = RangeIndex(10, 0, -3)
+        self.assert_numpy_array_equal(index, [10, 7, 4, 1])
+        self.assertEqual(index._stop, -2)
+
+        self.assertRaises(TypeError, RangeIndex, 1.5)
+        self.assertRaises(ValueError, RangeIndex, 0, 10, 0)
+
+    def test_default_index(self):
+        self.assertIsInstance(Series([1, 2, 3]).index, RangeIndex)
+        df = DataFrame(np.random.randn(3, 2))
+        self.assertIsInstance(df.index, RangeIndex)
+        self.assertIsInstance(df.columns, RangeIndex)
+
+        df = DataFrame({'A': [1, 2, 3]}, index=['a', 'b', 'c'])
+        self.assertIsInstance(df.reset_index().index, RangeIndex)
+        result = pd.concat([df, df], ignore_index=True)
+        self.assertIsInstance(result.index, RangeIndex)
+        self.assert_numpy_array_equal(result.index, np.arange(6))
+
+        result = pd.read_csv(compat.StringIO('a,b\n1,2\n3,4'))
+        self.assertIsInstance(result.index, RangeIndex)
+
+    def test_get_loc(self):
+        index = self.index
+        self.assertEqual(index.get_loc(4), 2)
+        self.assertEqual(index.get_loc(18), 9)
+        self.assertEqual(index.get_loc(4.0), 2)
+        self.assertRaises(KeyError, index.get_loc, 5)
+        self.assertRaises(KeyError, index.get_loc, 20)
+        self.assertRaises(KeyError, index.get_loc, -2)
+        self.assertRaises(KeyError, index.get_loc, 4.5)
+        self.assertRaises(KeyError, index.get_loc, 'a')
+        self.assertTrue(4 in index)
+        self.assertFalse(5 in index)
+        self.assertTrue(index.is_unique)
+        self.assertTrue(index.is_monotonic)
+        self.assertFalse(RangeIndex(10, 0, -1).is_monotonic)
+
+        # no hash table is built
+        self.assertEqual(index._engine.sizeof(), 0)
+
+        s = Series(np.arange(10.), index=index)
+        self.assertEqual(s[6], 3.)
+        s[6] = 10.
+        self.assertEqual(s[6], 10.)
+
+    def test_get_indexer(self):
+        target = Int64Index([-2, 0, 3, 4, 18, 20])
+        indexer = self.index.get_indexer(target)
+        self.assert_numpy_array_equal(indexer, [-1, 0, -1, 2, 9, -1])
+
+        indexer = RangeIndex(10, 0, -2).get_indexer(target)
+        self.assert_numpy_array_equal(indexer, [-1, -1, -1, 3, -1, -1])
+
+        # float targets, only the integral ones can match
+        target = np.array([-2., 0., 3., 4., 4.5, 18., 20., np.nan, np.inf,
+                           -np.inf, 1e20])
+        engine = self.index._engine
+        indexer = engine.get_indexer(target)
+        self.assert_numpy_array_equal(
+            indexer, [-1, 0, -1, 2, -1, 9, -1, -1, -1, -1, -1])
+        self.assert_numpy_array_equal(
+            indexer, [engine._get_loc(v) for v in target])
+        self.assertEqual(indexer.dtype, np.int64)
+
+        indexer = self.index.get_indexer(target, method='pad')
+        self.assert_numpy_array_equal(indexer, [-1, 0, 1, 2, 9, 9])
+
+        indexer = self.index.get_indexer(target, method='backfill')
+        self.assert_numpy_array_equal(indexer, [0, 0, 2, 2, 9, -1])
+
+        expected = Int64Index(self.index.values).get_indexer(
+            target, method='pad', limit=1)
+        indexer = self.index.get_indexer(target, method='pad', limit=1)
+        self.assert_numpy_array_equal(indexer, expected)
+
+    def test_slice(self):
+        index = self.index
+        for slobj in [slice(2, 7), slice(None, None, 3), slice(None, None, -1),
+                      slice(8, 1, -2), slice(5, 5)]:
+            result = index[slobj]
+            self.assertIsInstance(result, RangeIndex)
+            self.assert_numpy_array_equal(result, index.values[slobj])
+            self.assertEqual(result.name, 'foo')
+            self.assertTrue(result.equals(Int64Index(index.values[slobj])))
+
+        result = index[1:][::2]
+        self.assertIsInstance(result, RangeIndex)
+        self.assertEqual(result.get_loc(6), 1)
+
+        # not ranges anymore
+        for result in [index[[1, 3, 4]], index[index.values > 8], index * 2,
+                       index.repeat(2)]:
+            self.assertNotIsInstance(result, RangeIndex)
+
+    def test_take(self):
+        result = self.index.take([3, 0, -1])
+        self.assertNotIsInstance(result, RangeIndex)
+        self.assert_numpy_array_equal(result, [6, 0, 18])
+        self.assertEqual(result.name, 'foo')
+        self.assertRaises(IndexError, self.index.take, [10])
+
+    def test_equals(self):
+        self.assertTrue(self.index.equals(RangeIndex(0, 19, 2)))
+        self.assertTrue(self.index.equals(Int64Index(np.arange(0, 20, 2))))
+        self.assertTrue(Int64Index(np.arange(0, 20, 2)).equals(self.index))
+        self.assertFalse(self.index.equals(RangeIndex(0, 20)))
+        self.assertTrue(RangeIndex(3, 4).equals(RangeIndex(3, 10, 7)))
+        self.assertTrue(RangeIndex(0).equals(RangeIndex(5, 5)))
+
+    def test_union(self):
+        cases = [(RangeIndex(0, 10), RangeIndex(5, 15), True),
+                 (RangeIndex(0, 10), RangeIndex(10, 15), True),
+                 (RangeIndex(0, 10, 2), RangeIndex(1, 10, 2), False),
+                 (RangeIndex(0, 10, 2), RangeIndex(20, 12, -2), False),
+                 (RangeIndex(0, 10, 2), RangeIndex(18, 8, -2), True),
+                 (RangeIndex(3, 4), RangeIndex(4, 5), True),
+                 (RangeIndex(0, 10), Int64Index([3, 20]), False)]
+        for left, right, is_range in cases:
+            result = left.union(right)
+            expected = Int64Index(left.values).union(Int64Index(right.values))
+            self.assert_numpy_array_equal(result, expected)
+            self.assertEqual(isinstance(result, RangeIndex), is_range)
+
+    def test_intersection(self):
+        cases = [(RangeIndex(0, 10), RangeIndex(5, 15)),
+                 (RangeIndex(0, 10), RangeIndex(10, 15)),
+                 (RangeIndex(0, 10, 2), RangeIndex(1, 10, 2)),
+                 (RangeIndex(0, 10, 2), RangeIndex(18, 2, -2))]
+        for left, right in cases:
+            result = left.intersection(right)
+            self.assertIsInstance(result, RangeIndex)
+            expected = Int64Index(left.values).intersection(
+                Int64Index(right.values))
+            self.assert_numpy_array_equal(result, np.sort(expected))
+
+    def test_copy_and_pickle(self):
+        for index in [self.index, RangeIndex(0), RangeIndex(5, -5, -3)]:
+            for result in [index.copy(), index.copy(deep=True),
+                           pickle.loads(pickle.dumps(index))]:
+                self.assertIsInstance(result, RangeIndex)
+                self.assertTrue(result.equals(index))
+                self.assertEqual(result.name, index.name)
+
+        result = self.index.copy(name='bar')
+        self.assertEqual(result.name, 'bar')
+        self.assertEqual(self.index.name, 'foo')
+        self.assertIsInstance(self.index.copy(dtype=object), Index)
+
+
 class TestMultiIndex(tm.TestCase):
     _multiprocess_can_split_ = True
 
@@ -1830,6 +2073,19 @@ class TestMultiIndex(tm.TestCase):
         # MultiIndex is never numeric
         self.assert_(not self.index.is_numeric())
 
+    def test_memory_usage(self):
+        index = self.index.copy()
+        result = index.memory_usage()
+        expected = (sum(lev.nbytes for lev in index.levels) +
+                    sum(lab.nbytes for lab in index.labels))
+        self.assertEqual(result, expected)
+
+        # the tuples are cached by a lookup
+        deep = index.memory_usage(deep=True)
+        index.get_loc(('foo', 'one'))
+        self.assertIsNotNone(index._tuples)
+        self.assertTrue(index.memory_usage(deep=True) > deep)
+
     def test_getitem(self):
         # scalar
         self.assertEquals(self.index[2], ('bar', 'one'))
@@ -2085,6 +2341,60 @@ class TestMultiIndex(tm.TestCase):
                            " uniquely valued Index objects",
                            idx1.get_indexer, idx2)
 
+    def test_engine_on_labels(self):
+        index = MultiIndex.from_arrays([['a', 'a', 'b', 'b', np.nan],
+                                        [1, 2, 1, 2, 1]])
+        self.assertEqual(index.get_loc(('b', 1)), 2)
+        self.assertEqual(index.get_loc((np.nan, 1)), 4)
+        self.assertRaises(KeyError, index.get_loc, ('c', 1))
+        self.assertRaises(KeyError, index.get_loc, ('a', 3))
+        self.assertTrue(('a', 2) in index)
+        self.assertFalse(('a', 3) in index)
+        self.assertFalse(('a', 2, 3) in index)
+        self.assertTrue(index.is_unique)
+
+        target = MultiIndex.from_arrays([['b', 'c', 'a', np.nan],
+                                         [2, 1, 1, 1]])
+        self.assert_numpy_array_equal(index.get_indexer(target),
+                                      [3, -1, 0, 4])
+        self.assert_numpy_array_equal(
+            index.get_indexer([('b', 2), ('c', 1), ('a', 1), (np.nan, 1)]),
+            [3, -1, 0, 4])
+
+        s = Series(np.arange(5.), index=index)
+        self.assertEqual(s[('b', 2)], 3.)
+        result = s.reindex(target)
+        assert_almost_equal(result.values, [3., np.nan, 0., 4.])
+
+        # the tuples of the rows are not built
+        self.assertIsNone(index._tuples)
+
+        # joins of sorted indexes
+        left = MultiIndex.from_product([['a', 'b'], [1, 2]],
+                                       names=['x', 'y'])
+        right = MultiIndex.from_arrays([['a', 'b', 'c'], [2, 1, 1]],
+                                       names=['x', 'y'])
+        join_index, lidx, ridx = left.join(right, how='left',
+                                           return_indexers=True)
+        self.assertTrue(join_index.equals(left))
+        self.assertIsNone(lidx)
+        self.assert_numpy_array_equal(ridx, [-1, 0, 1, -1])
+
+        join_index, lidx, ridx = left.join(right, how='right',
+                                           return_indexers=True)
+        self.assertTrue(join_index.equals(right))
+        self.assert_numpy_array_equal(lidx, [1, 2, -1])
+        self.assertIsNone(ridx)
+
+        join_index, lidx, ridx = left.join(right, how='inner',
+                                           return_indexers=True)
+        self.assertTrue(join_index.equals(left[1:3]))
+        self.assert_numpy_array_equal(lidx, [1, 2])
+        self.assert_numpy_array_equal(ridx, [0, 1])
+
+        self.assertIsNone(left._tuples)
+        self.assertIsNone(right._tuples)
+
     def test_format(self):
         self.index.format()
         self.index[:0].format()
@@ -357,6 +357,80 @@ class TestBlockManager(tm.TestCase):
         mgr2.set('quux', randn(N))
         self.assertEqual(mgr2.get('quux').dtype, np.float_)
 
+    def test_placement(self):
+        # the placement is maintained through set, insert and delete
+        df = DataFrame(np.random.randn(5, 20),
+                       columns=['c%d' % i for i in range(20)])
+        expected = df.copy()
+        mgr = df._data
+        self.assertIsNotNone(mgr._get_placement())
+
+        df['new'] = 1.
+        df.insert(3, 'inserted', 'foo')
+        df['c5'] = 'bar'
+        del df['c0']
+        del df['c10']
+        del df['c11']
+        df['c12'] = np.arange(5)
+        expected['new'] = 1.
+        expected.insert(3, 'inserted', 'foo')
+        expected['c5'] = 'bar'
+        expected = expected.drop(['c0', 'c10', 'c11'], axis=1)
+        expected['c12'] = np.arange(5)
+
+        self.assertIs(df._data, mgr)
+        self.assertIsNotNone(mgr._get_placement())
+        for item in mgr.items:
+            block, j = mgr._locate(item)
+            self.assertIn(block, mgr.blocks)
+            self.assertEqual(block.items[j], item)
+        assert_frame_equal(df, expected)
+        self.assertNotIn('c0', mgr)
+        self.assertRaises(KeyError, mgr.get, 'c0')
+
+        # not kept for duplicate items
+        df.insert(0, 'c1', 2., allow_duplicates=True)
+        self.assertIsNone(df._data._get_placement())
+        self.assertEqual(len(df['c1'].columns), 2)
+
+    def test_placement_positions(self):
+        # deleting finds the position of the item through the placement,
+        # without hashing the new items of each insert and delete
+        columns = ['c%d' % i for i in range(300)]
+        df = DataFrame(index=range(3))
+        for i, c in enumerate(columns):
+            df[c] = float(i)
+        mgr = df._data
+        for c in columns[::3]:
+            del df[c]
+        self.assertNotIn('_engine', getattr(mgr.items, '_cache', None) or {})
+
+        placement = mgr._get_placement()
+        self.assertIsNotNone(placement)
+        self.assertTrue(len(placement.moved) + len(placement.deleted) <=
+                        max(len(mgr.items), 100))
+        for i, item in enumerate(mgr.items):
+            self.assertEqual(placement.get_position(item, mgr.items), i)
+
+        expected = DataFrame(dict((c, float(i)) for i, c in
+                                  enumerate(columns) if i % 3),
+                             index=range(3), columns=[c for i, c in
+                                                      enumerate(columns)
+                                                      if i % 3])
+        assert_frame_equal(df, expected)
+
+        # inserting and setting a new dtype
+        df.insert(0, 'first', 'x')
+        df['c1'] = 'y'
+        expected.insert(0, 'first', 'x')
+        expected['c1'] = 'y'
+        assert_frame_equal(df, expected)
+        mgr = df._data
+        for item in mgr.items:
+            block, j = mgr._locate(item)
+            self.assertEqual(block.items[j], item)
+            self.assertEqual(mgr.items[block.ref_locs[j]], item)
+
     def test_copy(self):
         shallow = self.mgr.copy(deep=False)
 
@@ -604,6 +678,41 @@ class TestBlockManager(tm.TestCase):
         bm2 = BlockManager([block2, block1], [index, np.arange(block1.shape[1])])
         self.assertTrue(bm1.equals(bm2))
 
+
+class TestCompressedArray(tm.TestCase):
+
+    def test_chunks(self):
+        from pandas.core.compressed import CompressedArray, _chunk_cache
+
+        values = np.arange(1000, dtype='int64').reshape(1, 1000)
+        arr = CompressedArray(values, compress='zlib', chunksize=64)
+        self.assertEqual(arr.shape, (1, 1000))
+        self.assertEqual(arr.dtype, np.int64)
+        self.assertEqual(len(arr._chunks), 16)
+        self.assertTrue(arr.nbytes < values.nbytes)
+
+        _chunk_cache.clear()
+        tm.assert_numpy_array_equal(arr.flat_slice(10, 20), values[0, 10:20])
+        self.assertEqual(len(_chunk_cache), 1)
+        tm.assert_numpy_array_equal(arr.flat_slice(60, 200),
+                                    values[0, 60:200])
+        self.assertEqual(len(_chunk_cache), 4)
+        tm.assert_numpy_array_equal(arr.flat_slice(990, None),
+                                    values[0, 990:])
+        self.assertEqual(len(arr.flat_slice(5, 5)), 0)
+
+        result = arr.get_values()
+        tm.assert_numpy_array_equal(result, values)
+        result[0, 0] = -1
+        self.assertEqual(arr.flat_slice(0, 1)[0], 0)
+
+        self.assertTrue(arr.equals(CompressedArray(values, compress='zlib')))
+        self.assertFalse(arr.equals(CompressedArray(values + 1)))
+        self.assertRaises(TypeError, CompressedArray,
+                          np.array(['a', 'b'], dtype=object))
+        self.assertRaises(ValueError, CompressedArray, values,
+                          compress='lzma')
+
 if __name__ == '__main__':
     import nose
     nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
@@ -6,7 +6,7 @@ import types
 import numpy as np
 from pandas.compat import range, long, lrange, lzip, zip
 import pandas.compat as compat
-from pandas.core.categorical import Categorical
+from pandas.core.categorical import Categorical, _concat_categoricals
 from pandas.core.frame import DataFrame, _merge_doc
 from pandas.core.generic import NDFrame
 from pandas.core.groupby import get_group_index
@@ -19,7 +19,7 @@ from pandas.core.internals import (TimeDeltaBlock, IntBlock, BoolBlock, BlockMan
 from pandas.util.decorators import cache_readonly, Appender, Substitution
 from pandas.core.common import (PandasError, ABCSeries,
                                 is_timedelta64_dtype, is_datetime64_dtype,
-                                is_integer_dtype, isnull)
+                                is_integer_dtype, isnull, _default_index)
 
 import pandas.core.common as com
 
@@ -1083,7 +1083,7 @@ class _Concatenator(object):
         return data
 
     def _get_fresh_axis(self):
-        return Index(np.arange(len(self._get_concat_axis())))
+        return _default_index(len(self._get_concat_axis()))
 
     def _prepare_blocks(self):
         reindexed_data = self._get_reindexed_data()
@@ -1153,8 +1153,14 @@ class _Concatenator(object):
 
     def _concat_blocks(self, blocks):
 
-        values_list = [b.get_values() for b in blocks if b is not None]
-        concat_values = com._concat_compat(values_list, axis=self.axis)
+        if self.axis > 0 and all(b is not None and b.is_categorical
+                                 for b in blocks):
+            # the codes, into the union of the levels
+            concat_values = _concat_categoricals(
+                [b.values for b in blocks], name=blocks[0].values.name)
+        else:
+            values_list = [b.get_values() for b in blocks if b is not None]
+            concat_values = com._concat_compat(values_list, axis=self.axis)
 
         if self.axis > 0:
             # Not safe to remove this check, need to profile
@@ -1197,6 +1203,14 @@ class _Concatenator(object):
 
     def _concat_single_item(self, objs, item):
         # this is called if we don't have consistent dtypes in a row-wise append
+
+        # an item categorical in all of the objects stays categorical
+        categoricals = [data.get_categorical(item) if item in orig else None
+                        for data, orig in zip(objs, self.objs)]
+        if all(cat is not None for cat in categoricals):
+            return _concat_categoricals(categoricals,
+                                        name=categoricals[0].name)
+
         all_values = []
         dtypes = []
         alls = set()
@@ -1252,6 +1266,12 @@ class _Concatenator(object):
             empty_dtype, fill_value = np.object_, np.nan
         elif 'other' in alls:
             empty_dtype, fill_value = np.float64, np.nan
+
+            # keep float32 if every present value promotes to it
+            present = [v for v in all_values if v is not None]
+            if present and all(com._maybe_promote(v.dtype)[0] == np.float32
+                               for v in present):
+                empty_dtype = np.float32
         elif 'datetime' in alls:
             empty_dtype, fill_value = 'M8[ns]', tslib.iNaT
         elif 'timedelta' in alls:
@@ -482,6 +482,14 @@ def assert_index_equal(left, right):
                                                                               right.dtype))
 
 
+def _index_type(idx):
+    """the type of idx for the index type checks (a RangeIndex is only a
+    more compact Int64Index)"""
+    if isinstance(idx, index.RangeIndex):
+        return index.Int64Index
+    return type(idx)
+
+
 def assert_attr_equal(attr, left, right):
     """checks attributes are equal. Both objects must have attribute."""
     left_attr = getattr(left, attr)
@@ -517,7 +525,7 @@ def assert_series_equal(left, right, check_dtype=True,
     else:
         assert_index_equal(left.index, right.index)
     if check_index_type:
-        assert_isinstance(left.index, type(right.index))
+        assert_isinstance(left.index, _index_type(right.index))
         assert_attr_equal('dtype', left.index, right.index)
         assert_attr_equal('inferred_type', left.index, right.index)
 
@@ -566,11 +574,11 @@ def assert_frame_equal(left, right, check_dtype=True,
                                 check_exact=check_exact)
 
     if check_index_type:
-        assert_isinstance(left.index, type(right.index))
+        assert_isinstance(left.index, _index_type(right.index))
         assert_attr_equal('dtype', left.index, right.index)
         assert_attr_equal('inferred_type', left.index, right.index)
     if check_column_type:
-        assert_isinstance(left.columns, type(right.columns))
+        assert_isinstance(left.columns, _index_type(right.columns))
         assert_attr_equal('dtype', left.columns, right.columns)
         assert_attr_equal('inferred_type', left.columns, right.columns)
     if check_names:
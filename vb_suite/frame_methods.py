@@ -213,6 +213,35 @@ def f(K=100):
 
 frame_insert_100_columns_begin = Benchmark('f()', setup, start_date=datetime(2011, 1, 1))
 
+# very wide frames, built column by column
+
+setup = common_setup + """
+N = 100
+
+def f(K=10000):
+    df = DataFrame(index=range(N))
+    new_col = np.random.randn(N)
+    for i in range(K):
+        df['col%d' % i] = new_col
+"""
+
+frame_insert_10000_columns_end = Benchmark('f()', setup,
+                                           start_date=datetime(2014, 4, 1))
+
+setup = common_setup + """
+N = 100
+df = DataFrame(np.random.randn(N, 10000),
+               columns=['col%d' % i for i in range(10000)])
+
+def f(K=1000):
+    result = df.copy()
+    for i in range(K):
+        del result['col%d' % i]
+"""
+
+frame_delete_1000_columns_wide = Benchmark('f()', setup,
+                                           start_date=datetime(2014, 4, 1))
+
 #----------------------------------------------------------------------
 # strings methods, #2602
 